@@ -0,0 +1,181 @@
+"""Benchmarks of writing each mock interface to HDF5 and Zarr, at scales from a test fixture to a real session."""
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import h5py
+import zarr
+
+from neuroconv.tools.testing.mock_interfaces import (
+    MockEventsInterface,
+    MockIcephysInterface,
+    MockImagingInterface,
+    MockPoseEstimationInterface,
+    MockRecordingInterface,
+    MockSegmentationInterface,
+    MockSortingInterface,
+)
+
+# The "quick" profile runs the smallest scale only, which keeps a CI run to a few minutes
+if os.environ.get("NEUROCONV_BENCHMARK_PROFILE", "full") == "quick":
+    SCALES = ["small"]
+else:
+    SCALES = ["small", "medium", "large"]
+BACKENDS = ["hdf5", "zarr"]
+
+
+def get_size_on_disk_in_bytes(path: Path) -> int:
+    """The size of a file, or of every file in a folder such as a Zarr store."""
+    if path.is_dir():
+        return sum(file_path.stat().st_size for file_path in path.rglob("*") if file_path.is_file())
+
+    return path.stat().st_size
+
+
+def get_data_size_in_bytes(path: Path) -> int:
+    """The uncompressed size of every dataset in an NWB file, the amount of data a conversion wrote."""
+    if path.is_dir():
+        arrays = list()
+        zarr.open_group(store=str(path), mode="r").visititems(
+            lambda _, item: arrays.append(item) if isinstance(item, zarr.Array) else None
+        )
+        return sum(array.nbytes for array in arrays)
+
+    datasets = list()
+    with h5py.File(name=path, mode="r") as file:
+        file.visititems(lambda _, item: datasets.append(item.nbytes) if isinstance(item, h5py.Dataset) else None)
+    return sum(datasets)
+
+
+class _ConversionBenchmark:
+    """
+    Write one mock interface at each scale to each backend.
+
+    Subclasses name the interface and the keyword arguments that build it at each scale. Wall time and peak memory
+    are measured by asv itself; throughput and output size are tracked as values of their own.
+    """
+
+    interface_class: type = None
+    interface_kwargs_per_scale: dict[str, dict] = dict()
+
+    params = (SCALES, BACKENDS)
+    param_names = ["scale", "backend"]
+    timeout = 1800
+
+    def setup(self, scale: str, backend: str):
+        self.interface = self.interface_class(**self.interface_kwargs_per_scale[scale])
+        self.metadata = self.interface.get_metadata()
+
+        self.folder_path = Path(tempfile.mkdtemp())
+        suffix = ".nwb" if backend == "hdf5" else ".nwb.zarr"
+        self.nwbfile_path = self.folder_path / f"{self.interface_class.__name__}{suffix}"
+
+    def teardown(self, scale: str, backend: str):
+        shutil.rmtree(self.folder_path, ignore_errors=True)
+
+    def run_conversion(self, backend: str):
+        self.interface.run_conversion(
+            nwbfile_path=self.nwbfile_path, metadata=self.metadata, backend=backend, overwrite=True
+        )
+
+    def time_run_conversion(self, scale: str, backend: str):
+        self.run_conversion(backend=backend)
+
+    def peakmem_run_conversion(self, scale: str, backend: str):
+        self.run_conversion(backend=backend)
+
+    def track_throughput(self, scale: str, backend: str) -> float:
+        start_time = time.perf_counter()
+        self.run_conversion(backend=backend)
+        elapsed_seconds = time.perf_counter() - start_time
+
+        return get_data_size_in_bytes(path=self.nwbfile_path) / 1e6 / elapsed_seconds
+
+    track_throughput.unit = "MB/s"
+
+    def track_output_size(self, scale: str, backend: str) -> float:
+        self.run_conversion(backend=backend)
+
+        return get_size_on_disk_in_bytes(path=self.nwbfile_path) / 1e6
+
+    track_output_size.unit = "MB"
+
+
+class Recording(_ConversionBenchmark):
+    """An electrophysiology recording, from 16 channels over a second to a 384 channel probe."""
+
+    interface_class = MockRecordingInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_channels=16, durations=(1.0,)),
+        medium=dict(num_channels=64, durations=(10.0,)),
+        large=dict(num_channels=384, durations=(10.0,)),
+    )
+
+
+class Sorting(_ConversionBenchmark):
+    """Spike trains, from 10 units to 1,000 units over ten minutes."""
+
+    interface_class = MockSortingInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_units=10, durations=(10.0,)),
+        medium=dict(num_units=100, durations=(60.0,)),
+        large=dict(num_units=1_000, durations=(600.0,)),
+    )
+
+
+class Imaging(_ConversionBenchmark):
+    """A two-photon imaging series, from a test fixture to 1,000 frames of 512 by 512 pixels."""
+
+    interface_class = MockImagingInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_samples=30, num_rows=64, num_columns=64),
+        medium=dict(num_samples=1_000, num_rows=256, num_columns=256),
+        large=dict(num_samples=1_000, num_rows=512, num_columns=512),
+    )
+
+
+class Segmentation(_ConversionBenchmark):
+    """ROI masks and their traces, from 10 ROIs to 500 ROIs over 10,000 frames."""
+
+    interface_class = MockSegmentationInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_rois=10, num_samples=100, num_rows=64, num_columns=64),
+        medium=dict(num_rois=100, num_samples=1_000, num_rows=128, num_columns=128),
+        large=dict(num_rois=500, num_samples=10_000, num_rows=256, num_columns=256),
+    )
+
+
+class Events(_ConversionBenchmark):
+    """Two event types, from a hundred events to a million."""
+
+    interface_class = MockEventsInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_event_types=2, num_events=100),
+        medium=dict(num_event_types=2, num_events=10_000),
+        large=dict(num_event_types=2, num_events=1_000_000),
+    )
+
+
+class PoseEstimation(_ConversionBenchmark):
+    """Pose estimation, from 3 keypoints over 1,000 frames to 20 over a million."""
+
+    interface_class = MockPoseEstimationInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_samples=1_000, num_nodes=3),
+        medium=dict(num_samples=100_000, num_nodes=10),
+        large=dict(num_samples=1_000_000, num_nodes=20),
+    )
+
+
+class Icephys(_ConversionBenchmark):
+    """Current clamp sweeps of a second each, from 3 sweeps to 300."""
+
+    interface_class = MockIcephysInterface
+    interface_kwargs_per_scale = dict(
+        small=dict(num_sweeps=3),
+        medium=dict(num_sweeps=30),
+        large=dict(num_sweeps=300),
+    )
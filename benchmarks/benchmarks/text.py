@@ -0,0 +1,43 @@
+"""Benchmarks of building a table of time intervals from a DataFrame, as the CSV and Excel interfaces do."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from neuroconv.tools.text import convert_df_to_time_intervals
+
+# The "quick" profile runs the smallest table only, which keeps a CI run to a few minutes
+if os.environ.get("NEUROCONV_BENCHMARK_PROFILE", "full") == "quick":
+    NUMBERS_OF_ROWS = [10**3]
+else:
+    NUMBERS_OF_ROWS = [10**3, 10**4, 10**5, 10**6]
+
+
+class TimeIntervalsSuite:
+    """Convert a table of trials with numeric, text, categorical and ragged columns."""
+
+    params = NUMBERS_OF_ROWS
+    param_names = ["number_of_rows"]
+    timeout = 600
+
+    def setup(self, number_of_rows: int):
+        random_number_generator = np.random.default_rng(seed=0)
+        start_times = np.cumsum(random_number_generator.uniform(low=0.5, high=1.5, size=number_of_rows))
+        self.df = pd.DataFrame(
+            dict(
+                start_time=start_times,
+                stop_time=start_times + 0.4,
+                correct=random_number_generator.random(size=number_of_rows) > 0.5,
+                response_time=random_number_generator.uniform(size=number_of_rows),
+                condition=random_number_generator.choice(["left", "right", "catch"], size=number_of_rows),
+                stimulus=pd.Categorical(random_number_generator.choice(["A", "B"], size=number_of_rows)),
+                lick_times=[start_time + np.arange(index % 4) * 0.1 for index, start_time in enumerate(start_times)],
+            )
+        )
+
+    def time_convert_df_to_time_intervals(self, number_of_rows: int):
+        convert_df_to_time_intervals(self.df)
+
+    def peakmem_convert_df_to_time_intervals(self, number_of_rows: int):
+        convert_df_to_time_intervals(self.df)
@@ -0,0 +1,43 @@
+"""Microbenchmarks of the validation of source data and metadata, run before every conversion."""
+
+from datetime import datetime
+
+from neuroconv import NWBConverter
+from neuroconv.tools.testing.mock_interfaces import (
+    MockImagingInterface,
+    MockRecordingInterface,
+    MockSortingInterface,
+)
+
+
+class MockConverter(NWBConverter):
+    """A converter over one interface of each kind the mock interfaces cover."""
+
+    data_interface_classes = dict(
+        Recording=MockRecordingInterface,
+        Sorting=MockSortingInterface,
+        Imaging=MockImagingInterface,
+    )
+
+
+class ValidationSuite:
+    """Validate the source data and metadata of a converter over three mock interfaces."""
+
+    def setup(self):
+        self.source_data = dict(
+            Recording=dict(num_channels=4, durations=(1.0,)),
+            Sorting=dict(num_units=4),
+            Imaging=dict(num_samples=10),
+        )
+        self.converter = MockConverter(source_data=self.source_data)
+        self.metadata = self.converter.get_metadata()
+        self.metadata["NWBFile"]["session_start_time"] = datetime(2020, 1, 1)
+
+    def time_validate_source(self):
+        MockConverter.validate_source(source_data=self.source_data)
+
+    def time_validate_metadata(self):
+        self.converter.validate_metadata(metadata=self.metadata)
+
+    def time_get_conversion_options_schema(self):
+        self.converter.get_conversion_options_schema()
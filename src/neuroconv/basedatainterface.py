@@ -1,25 +1,28 @@
-import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
-from jsonschema.validators import validate
 from pydantic import FilePath, validate_call
 from pynwb import NWBFile
 
 from .tools.nwb_helpers import (
     BACKEND_NWB_IO,
+    ConversionPlan,
     HDF5BackendConfiguration,
+    WriteProgressEvent,
     ZarrBackendConfiguration,
     configure_backend,
     get_default_backend_configuration,
     get_default_nwbfile_metadata,
     make_nwbfile_from_metadata,
+    plan_nwbfile_write,
 )
+from .tools.nwb_helpers._memory_budget import use_memory_budget
 from .tools.nwb_helpers._metadata_and_file_helpers import (
     _fetch_backend_from_nwbfile_on_disk,
     configure_and_write_nwbfile,
 )
+from .tools.nwb_helpers._write_progress import set_write_progress_destinations, use_write_progress_monitor
 from .utils import (
     get_json_schema_from_method_signature,
     load_dict_from_file,
@@ -29,6 +32,7 @@ from .utils.dict import DeepDict
 from .utils.json_schema import (
     _metadata_uses_old_list_format,
     _NWBSourceDataEncoder,
+    _validate_instance,
     validate_metadata,
 )
 
@@ -58,15 +62,9 @@ class BaseDataInterface(ABC):
         """Validate source_data against Converter source_schema."""
         cls._validate_source_data(source_data=source_data, verbose=verbose)
 
-    def _validate_source_data(self, source_data: dict, verbose: bool = False):
-
-        encoder = _NWBSourceDataEncoder()
-        # The encoder produces a serialized object, so we deserialized it for comparison
-
-        serialized_source_data = encoder.encode(source_data)
-        decoded_source_data = json.loads(serialized_source_data)
-        source_schema = self.get_source_schema()
-        validate(instance=decoded_source_data, schema=source_schema)
+    @classmethod
+    def _validate_source_data(cls, source_data: dict, verbose: bool = False):
+        _validate_instance(instance=source_data, schema=cls.get_source_schema(), encoder=_NWBSourceDataEncoder())
         if verbose:
             print("Source data is valid!")
 
@@ -213,6 +211,12 @@ class BaseDataInterface(ABC):
         backend: Literal["hdf5", "zarr"] | None = None,
         backend_configuration: HDF5BackendConfiguration | ZarrBackendConfiguration | None = None,
         append_on_disk_nwbfile: bool = False,
+        dataset_cache_folder_path: str | Path | None = None,
+        memory_budget_gb: float | None = None,
+        max_write_workers: int = 1,
+        integrity_manifest_file_path: str | Path | None = None,
+        checkpoint_folder_path: str | Path | None = None,
+        progress_callback: Callable[[WriteProgressEvent], None] | None = None,
         **conversion_options,
     ):
         """
@@ -243,6 +247,36 @@ class BaseDataInterface(ABC):
         append_on_disk_nwbfile : bool, default: False
             Whether to append to an existing NWBFile on disk. If True, the `nwbfile` parameter must be None.
             This is useful for appending data to an existing file without overwriting it.
+        dataset_cache_folder_path : str or Path, optional
+            A folder in which to keep every dataset written, so that running the conversion again, after fixing
+            the metadata or adding an interface, copies the datasets whose source and settings are unchanged from
+            there rather than reading and compressing them anew. See `configure_and_write_nwbfile`.
+            Only supported for the HDF5 backend, and cannot be combined with `append_on_disk_nwbfile=True`.
+        memory_budget_gb : float, optional
+            The memory, in gigabytes, that the buffers of all data chunk iterators may hold at once while the file
+            is written. Each iterator reads its buffers in pieces of at most its share of the budget, and of half the
+            memory available at the time. Defaults to the ``NEUROCONV_MEMORY_BUDGET_GB`` environment variable, and
+            to no budget when that is unset. See `MemoryBudget`.
+        max_write_workers : int, default: 1
+            The number of threads reading and compressing the series fed by data chunk iterators, such as those of
+            each probe of a multi-stream converter or of each segment of a recording, at once. See
+            `configure_and_write_nwbfile`. Only supported for the HDF5 backend, and not when appending on disk.
+        integrity_manifest_file_path : str or Path, optional
+            Where to write a JSON manifest of the hash of every chunk of every numeric dataset of the file, taken as
+            the data is written so that archiving the file does not need a pass reading it back. Check the file
+            against it with `verify_integrity_manifest`. Cannot be combined with `append_on_disk_nwbfile=True`.
+        checkpoint_folder_path : str or Path, optional
+            A folder in which to checkpoint the series fed by data chunk iterators buffer by buffer, so that running
+            the conversion again with the same folder after it was interrupted, by running out of memory or by the
+            preemption of its node, reads only the buffers not yet written. See `configure_and_write_nwbfile`.
+            Running it again needs `overwrite=True`, as the partial file exists, and the same metadata, including
+            an explicit ``identifier``, whose default is new on every call. Cannot be combined with
+            `append_on_disk_nwbfile=True`.
+        progress_callback : callable, optional
+            Called with a `WriteProgressEvent` each time a buffer of a data chunk iterator is written: the dataset,
+            the buffers written of its total, the bytes read and written, the throughput and the time remaining.
+            Events also go to any `WriteProgressMonitor` in effect, and, when there is none, to the JSON-lines file
+            named by the ``NEUROCONV_PROGRESS_EVENTS_FILE_PATH`` environment variable, if set.
         """
 
         appending_to_in_memory_nwbfile = nwbfile is not None
@@ -278,28 +312,126 @@ class BaseDataInterface(ABC):
                 "instead, which derives the configuration after the data is added."
             )
 
+        if dataset_cache_folder_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot use a dataset cache while appending to an existing file on disk; the datasets the file "
+                "already holds are not written again."
+            )
+
+        if max_write_workers > 1 and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot write with several workers while appending to an existing file on disk; the file is "
+                "written in place by HDMF."
+            )
+
+        if integrity_manifest_file_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot write an integrity manifest while appending to an existing file on disk; the datasets the "
+                "file already holds are not written again."
+            )
+
+        if checkpoint_folder_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot checkpoint a conversion appending to an existing file on disk; the file is written in place "
+                "by HDMF."
+            )
+
         if metadata is None:
             metadata = self._get_metadata_for_writing()
         self.validate_metadata(metadata=metadata, append_mode=append_on_disk_nwbfile)
 
         writing_new_file = not append_on_disk_nwbfile
 
-        if writing_new_file:
-            self._write_nwbfile(
-                nwbfile_path=nwbfile_path,
-                nwbfile=nwbfile,
-                metadata=metadata,
-                backend=backend,
-                backend_configuration=backend_configuration,
-                conversion_options=conversion_options,
+        with (
+            use_memory_budget(budget_gb=memory_budget_gb) as memory_budget,
+            use_write_progress_monitor(progress_callback=progress_callback),
+        ):
+            if writing_new_file:
+                self._write_nwbfile(
+                    nwbfile_path=nwbfile_path,
+                    nwbfile=nwbfile,
+                    metadata=metadata,
+                    backend=backend,
+                    backend_configuration=backend_configuration,
+                    conversion_options=conversion_options,
+                    dataset_cache_folder_path=dataset_cache_folder_path,
+                    max_write_workers=max_write_workers,
+                    integrity_manifest_file_path=integrity_manifest_file_path,
+                    checkpoint_folder_path=checkpoint_folder_path,
+                )
+            else:
+                self._append_nwbfile(
+                    nwbfile_path=nwbfile_path,
+                    metadata=metadata,
+                    backend=backend,
+                    backend_configuration=backend_configuration,
+                    conversion_options=conversion_options,
+                )
+
+        if memory_budget is not None and getattr(self, "verbose", False):
+            print(
+                f"Buffers held at most {memory_budget.high_water_mark_in_bytes / 1e9:.3f} GB at once "
+                f"of a {memory_budget.budget_in_bytes / 1e9:.3f} GB budget"
             )
-        else:
-            self._append_nwbfile(
-                nwbfile_path=nwbfile_path,
-                metadata=metadata,
-                backend=backend,
+
+    def plan_conversion(
+        self,
+        metadata: dict | None = None,
+        backend: Literal["hdf5", "zarr"] | None = None,
+        backend_configuration: HDF5BackendConfiguration | ZarrBackendConfiguration | None = None,
+        memory_budget_gb: float | None = None,
+        max_write_workers: int = 1,
+        number_of_samples: int = 3,
+        **conversion_options,
+    ) -> ConversionPlan:
+        """
+        Project the file size, wall time and peak memory of `run_conversion`, without writing the file.
+
+        The in-memory NWBFile and its backend configuration are built as `run_conversion` builds them, and a few
+        chunks of each dataset are read through its source, the data chunk iterators included, and compressed as
+        configured. See `plan_nwbfile_write`.
+
+        Parameters
+        ----------
+        metadata : dict, optional
+            Metadata dictionary with information used to create the NWBFile.
+        backend : {"hdf5", "zarr"}, optional
+            The type of backend the file would be written with. Defaults to "hdf5", or to the type of the
+            `backend_configuration`.
+        backend_configuration : HDF5BackendConfiguration or ZarrBackendConfiguration, optional
+            The configuration the file would be written with. Defaults to the default configuration.
+        memory_budget_gb : float, optional
+            The memory budget the conversion would run under, which bounds the buffers of the data chunk iterators.
+            See `run_conversion`.
+        max_write_workers : int, default: 1
+            The number of threads the conversion would write the iterative datasets with. See `run_conversion`.
+        number_of_samples : int, default: 3
+            The number of chunks to sample from each dataset.
+        **conversion_options
+            Additional keyword arguments to pass to the `.add_to_nwbfile` method.
+
+        Returns
+        -------
+        ConversionPlan
+            The projected size, write time and memory of each dataset and of the file; print it for a summary.
+        """
+        if metadata is None:
+            metadata = self._get_metadata_for_writing()
+        self.validate_metadata(metadata=metadata)
+
+        with use_memory_budget(budget_gb=memory_budget_gb):
+            nwbfile = self.create_nwbfile(metadata=metadata, **conversion_options)
+            if backend_configuration is None:
+                backend_configuration = self.get_default_backend_configuration(
+                    nwbfile=nwbfile, backend=backend or "hdf5"
+                )
+                backend_configuration.apply_timestamp_linking(nwbfile=nwbfile)
+
+            return plan_nwbfile_write(
+                nwbfile=nwbfile,
                 backend_configuration=backend_configuration,
-                conversion_options=conversion_options,
+                number_of_samples=number_of_samples,
+                max_workers=max_write_workers,
             )
 
     def _write_nwbfile(
@@ -310,6 +442,10 @@ class BaseDataInterface(ABC):
         backend: Literal["hdf5", "zarr"],
         backend_configuration: dict,
         conversion_options: dict,
+        dataset_cache_folder_path: str | Path | None = None,
+        max_write_workers: int = 1,
+        integrity_manifest_file_path: str | Path | None = None,
+        checkpoint_folder_path: str | Path | None = None,
     ) -> None:
         """
         Write NWBFile to a file path on disk.
@@ -327,6 +463,10 @@ class BaseDataInterface(ABC):
             nwbfile_path=nwbfile_path,
             backend=backend,
             backend_configuration=backend_configuration,
+            dataset_cache_folder_path=dataset_cache_folder_path,
+            max_workers=max_write_workers,
+            integrity_manifest_file_path=integrity_manifest_file_path,
+            checkpoint_folder_path=checkpoint_folder_path,
         )
 
     def _append_nwbfile(
@@ -357,6 +497,9 @@ class BaseDataInterface(ABC):
                 backend_configuration = self.get_default_backend_configuration(nwbfile=nwbfile, backend=backend)
 
             configure_backend(nwbfile=nwbfile, backend_configuration=backend_configuration)
+            set_write_progress_destinations(
+                nwbfile=nwbfile, backend_configuration=backend_configuration, nwbfile_path=Path(nwbfile_path)
+            )
 
             io.write(nwbfile)
 
@@ -11,6 +11,7 @@ from pynwb.file import NWBFile
 
 from ....basetemporalalignmentinterface import BaseTemporalAlignmentInterface
 from ....tools import get_module
+from ....tools._table_cache import read_csv_columns
 from ....utils import DeepDict, calculate_regular_series_rate
 
 
@@ -248,9 +249,7 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         metadata: dict, optional
             metadata info for constructing the nwb file.
         """
-        import pandas as pd
-
-        fictrac_data_df = pd.read_csv(self.file_path, sep=",", header=None, names=self.columns_in_dat_file)
+        fictrac_columns = self._read_dat_file_columns()
 
         # Get the timestamps
         timestamps = self.get_timestamps()
@@ -280,7 +279,7 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
                 spatial_series_kwargs["comments"] = comments
 
             column_in_dat_file = data_dict["column_in_dat_file"]
-            data = fictrac_data_df[column_in_dat_file].to_numpy()
+            data = np.column_stack([fictrac_columns[column] for column in column_in_dat_file])
             if self.radius is not None:
                 spatial_series_kwargs["conversion"] = self.radius
                 units = "meters"
@@ -303,6 +302,11 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         processing_module = get_module(nwbfile=nwbfile, name="behavior", description="processed behavioral data")
         processing_module.add(position_container)
 
+    def _read_dat_file_columns(self) -> dict[str, np.ndarray]:
+        """Read every column of the .dat file, parsed once for both the timestamps and the data."""
+        # Every column FicTrac writes is numeric, so the types need not be inferred
+        return read_csv_columns(self.file_path, sep=",", header=None, names=self.columns_in_dat_file, dtype="float64")
+
     def get_original_timestamps(self):
         """
         Retrieve and correct timestamps from a FicTrac data file.
@@ -340,13 +344,8 @@ class FicTracDataInterface(BaseTemporalAlignmentInterface):
         https://github.com/rjdmoore/fictrac/issues/29
         """
 
-        import pandas as pd
-
-        fictrac_data_df = pd.read_csv(self.file_path, sep=",", header=None, usecols=[self.timestamps_column])
-
-        # Explicitly convert to numpy for HDMF compatibility with pandas 3.0+
-        # See https://github.com/hdmf-dev/hdmf/issues/1384
-        timestamps = fictrac_data_df[self.timestamps_column].to_numpy(dtype="float64") / 1000.0  # Transform to seconds
+        timestamp_column_name = self.columns_in_dat_file[self.timestamps_column]
+        timestamps = self._read_dat_file_columns()[timestamp_column_name] / 1000.0  # Transform to seconds
 
         # Correct for the case when only the first timestamp was replaced by system time
         first_difference = timestamps[1] - timestamps[0]
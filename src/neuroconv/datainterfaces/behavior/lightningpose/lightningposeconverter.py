@@ -9,6 +9,7 @@ from neuroconv.datainterfaces import LightningPoseDataInterface
 from neuroconv.datainterfaces.behavior.video.externalvideointerface import (
     ExternalVideoInterface,
 )
+from neuroconv.nwbconverter import _time_interface_metadata
 from neuroconv.utils import (
     DeepDict,
     dict_deep_update,
@@ -77,19 +78,21 @@ class LightningPoseConverter(BaseDataInterface):
                 video_name=self.labeled_video_name,
             )
 
-    def get_metadata(self, *, use_new_metadata_format: bool = True) -> DeepDict:
-        pose_estimation_interface = self.data_interface_objects["PoseEstimation"]
-        metadata = pose_estimation_interface.get_metadata(use_new_metadata_format=use_new_metadata_format)
-        original_video_interface = self.data_interface_objects["OriginalVideo"]
-        original_videos_metadata = original_video_interface.get_metadata()
+    def get_metadata(self, *, use_new_metadata_format: bool = True, max_workers: int = 1) -> DeepDict:
+        interfaces_metadata, _ = _time_interface_metadata(
+            data_interface_objects=self.data_interface_objects,
+            use_new_metadata_format=use_new_metadata_format,
+            max_workers=max_workers,
+        )
+        metadata = interfaces_metadata["PoseEstimation"]
+        original_videos_metadata = interfaces_metadata["OriginalVideo"]
         original_videos_metadata["Behavior"]["ExternalVideos"]["original_video"].update(
             description="The original video used for pose estimation.",
         )
         metadata = dict_deep_update(metadata, original_videos_metadata)
 
-        if "LabeledVideo" in self.data_interface_objects:
-            labeled_video_interface = self.data_interface_objects["LabeledVideo"]
-            labeled_videos_metadata = labeled_video_interface.get_metadata()
+        if "LabeledVideo" in interfaces_metadata:
+            labeled_videos_metadata = interfaces_metadata["LabeledVideo"]
             labeled_videos_metadata["Behavior"]["ExternalVideos"]["labeled_video"].update(
                 description="The video recorded by camera with the pose estimation labels.",
             )
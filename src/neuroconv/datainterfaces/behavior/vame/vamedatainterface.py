@@ -12,9 +12,29 @@ from pynwb import NWBFile
 
 from ....basetemporalalignmentinterface import BaseTemporalAlignmentInterface
 from ....tools import get_module
+from ....tools.hdmf import SliceableDataChunkIterator
+from ....tools.nwb_helpers._neurodata_type_index import get_neurodata_objects_by_name
 from ....utils import DeepDict, calculate_regular_series_rate, load_dict_from_file
 
 
+class _CastingDataChunkIterator(SliceableDataChunkIterator):
+    """Write a memory-mapped array a buffer at a time, casting each buffer to ``dtype`` as it is read."""
+
+    def __init__(self, data, dtype: np.dtype, **kwargs):
+        self._cast_dtype = np.dtype(dtype)
+        super().__init__(data=data, **kwargs)
+
+    def _get_dtype(self) -> np.dtype:
+        return self._cast_dtype
+
+    def __getitem__(self, selection):
+        """Enable array-like slicing, casting the slice of the wrapped data array."""
+        return np.asarray(super().__getitem__(selection)).astype(self._cast_dtype)
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        return np.asarray(super()._get_data(selection)).astype(self._cast_dtype)
+
+
 class VameInterface(BaseTemporalAlignmentInterface):
     """DataInterface for VAME behavioral segmentation data using the ndx-vame NWB extension.
 
@@ -579,7 +599,8 @@ class VameInterface(BaseTemporalAlignmentInterface):
                 "Provide at least one of motif_labels_file_paths, latent_vectors_file_path, or "
                 "community_labels_file_paths, or call set_aligned_timestamps()."
             )
-        num_frames = np.load(reference_file).shape[0]
+        # Only the header of the file is read
+        num_frames = np.load(reference_file, mmap_mode="r").shape[0]
         time_window = self._vame_config.get("time_window", 0)
         offset_frames = int(time_window // 2)
         starting_time = offset_frames / self._sampling_frequency_hz
@@ -612,9 +633,9 @@ class VameInterface(BaseTemporalAlignmentInterface):
 
     @staticmethod
     def _get_pose_estimation(nwbfile: NWBFile, name: str):
-        pose_estimation_containers = {
-            obj.name: obj for obj in nwbfile.all_children() if type(obj).__name__ == "PoseEstimation"
-        }
+        pose_estimation_containers = get_neurodata_objects_by_name(
+            nwbfile=nwbfile, neurodata_type="PoseEstimation", required_name=name
+        )
         if name in pose_estimation_containers:
             return pose_estimation_containers[name]
         if pose_estimation_containers:
@@ -630,7 +651,7 @@ class VameInterface(BaseTemporalAlignmentInterface):
 
     @staticmethod
     def _get_image_series(nwbfile: NWBFile, name: str):
-        image_series = {obj.name: obj for obj in nwbfile.all_children() if type(obj).__name__ == "ImageSeries"}
+        image_series = get_neurodata_objects_by_name(nwbfile=nwbfile, neurodata_type="ImageSeries", required_name=name)
         if name in image_series:
             return image_series[name]
         if image_series:
@@ -796,7 +817,9 @@ class VameInterface(BaseTemporalAlignmentInterface):
         if self._latent_vectors_file_path is not None and latent_series_metadata is not None:
             latent_meta = dict(latent_series_metadata)
             latent_meta.pop("vame_project_metadata_key", None)
-            latent_data = np.load(self._latent_vectors_file_path)[:n_frames].astype(np.float32)
+            # The latent vectors are written a buffer at a time from the memory-mapped file
+            latent_vectors = np.load(self._latent_vectors_file_path, mmap_mode="r")[:n_frames]
+            latent_data = _CastingDataChunkIterator(data=latent_vectors, dtype=np.float32)
             latent_series = LatentSpaceSeries(data=latent_data, **latent_meta, **timing_kwargs)
 
         # MotifSeries — one per run key, keyed by its flat-registry metadata key
@@ -807,7 +830,7 @@ class VameInterface(BaseTemporalAlignmentInterface):
             motif_meta = dict(motif_registry.get(motif_key, {}))
             motif_meta.pop("vame_project_metadata_key", None)
             motif_meta.pop("latent_space_metadata_key", None)
-            motif_data = np.load(file_path)[:n_frames].astype(np.int32)
+            motif_data = np.load(file_path, mmap_mode="r")[:n_frames].astype(np.int32)
             motif_data_by_run[run_key] = motif_data
             motif_kwargs: dict = dict(data=motif_data, **motif_meta, **timing_kwargs)
             if latent_series is not None:
@@ -822,7 +845,7 @@ class VameInterface(BaseTemporalAlignmentInterface):
             community_meta = dict(community_registry.get(community_key, {}))
             community_meta.pop("vame_project_metadata_key", None)
             motif_link_key = community_meta.pop("motif_series_metadata_key", None)
-            community_data = np.load(file_path)[:n_frames].astype(np.int32)
+            community_data = np.load(file_path, mmap_mode="r")[:n_frames].astype(np.int32)
             community_data_by_run[run_key] = community_data
             community_kwargs: dict = dict(data=community_data, **community_meta, **timing_kwargs)
             if motif_link_key is not None:
@@ -1,7 +1,10 @@
+import json
+
 import numpy as np
 from pydantic import FilePath
 from tqdm import tqdm
 
+from neuroconv.tools._dataset_fingerprint import get_file_identity, hash_text
 from neuroconv.tools.hdmf import GenericDataChunkIterator
 from neuroconv.tools.iterative_write import (
     get_image_series_buffer_shape,
@@ -261,6 +264,7 @@ class VideoDataChunkIterator(GenericDataChunkIterator):
         progress_bar_options: dict | None = None,
         stub_test: bool = False,
     ):
+        self.video_file = video_file
         self.video_capture_ob = VideoCaptureContext(video_file)
         if stub_test:
             self.video_capture_ob.frame_count = 10
@@ -289,6 +293,10 @@ class VideoDataChunkIterator(GenericDataChunkIterator):
             progress_bar_options=progress_bar_options,
         )
 
+    def _get_source_fingerprint(self) -> str | None:
+        description = dict(file=get_file_identity(path=self.video_file), num_samples=self._num_samples)
+        return hash_text(text=json.dumps(description))
+
     def _get_default_chunk_shape(self, chunk_mb):
         """This is how the data is chunked for reading."""
 
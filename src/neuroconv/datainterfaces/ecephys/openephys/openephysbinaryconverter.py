@@ -1,4 +1,3 @@
-import inspect
 import re
 from pathlib import Path
 
@@ -133,7 +132,7 @@ class OpenEphysBinaryConverter(ConverterPipe):
 
         super().__init__(data_interfaces=data_interfaces, verbose=verbose)
 
-    def get_metadata(self, *, use_new_metadata_format: bool = True) -> DeepDict:
+    def get_metadata(self, *, use_new_metadata_format: bool = True, max_workers: int = 1) -> DeepDict:
         """
         Aggregate the metadata of every stream interface.
 
@@ -144,6 +143,8 @@ class OpenEphysBinaryConverter(ConverterPipe):
             ``ElectricalSeries`` entry is named after its stream, so several streams can be written to one
             NWB file. The interfaces themselves cannot do this: each one only knows that it is "the"
             Open Ephys recording, so they all name their series ``"ElectricalSeries"``.
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. See `NWBConverter.get_metadata`.
 
         Returns
         -------
@@ -151,14 +152,11 @@ class OpenEphysBinaryConverter(ConverterPipe):
             The metadata of all interfaces, merged.
         """
         if not use_new_metadata_format:
-            return super().get_metadata(use_new_metadata_format=False)
+            return super().get_metadata(use_new_metadata_format=False, max_workers=max_workers)
 
         metadata = get_default_nwbfile_metadata()
-        for interface in self.data_interface_objects.values():
-            if "use_new_metadata_format" in inspect.signature(interface.get_metadata).parameters:
-                interface_metadata = interface.get_metadata(use_new_metadata_format=True)
-            else:
-                interface_metadata = interface.get_metadata()
+        interfaces_metadata = self._gather_interface_metadata(use_new_metadata_format=True, max_workers=max_workers)
+        for interface_metadata in interfaces_metadata.values():
             metadata = dict_deep_update(metadata, interface_metadata)
 
         electrical_series_metadata = metadata["Ecephys"]["ElectricalSeries"]
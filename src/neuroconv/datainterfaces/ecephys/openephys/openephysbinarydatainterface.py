@@ -4,6 +4,11 @@ import warnings
 from pydantic import DirectoryPath
 
 from ..baserecordingextractorinterface import BaseRecordingExtractorInterface
+from ....tools.remote_sources import (
+    RemoteFilePath,
+    _mirror_remote_folder,
+    is_remote_path,
+)
 from ....utils import DeepDict, get_json_schema_from_method_signature
 
 
@@ -33,6 +38,19 @@ class OpenEphysBinaryRecordingInterface(BaseRecordingExtractorInterface):
         self.extractor_kwargs.pop("es_key", None)
         self.extractor_kwargs.pop("stub_test", None)
 
+        # A remote folder is parsed from a local mirror of everything but its .dat files, read from the URL
+        folder_path = self.extractor_kwargs["folder_path"]
+        if is_remote_path(path=folder_path):
+            from ....tools.spikeinterface._remote_neo_recording import RemoteNeoRecording
+
+            neo_kwargs = {key: value for key, value in self.extractor_kwargs.items() if key != "folder_path"}
+            return RemoteNeoRecording(
+                url=folder_path,
+                extractor_name=self.get_extractor_class().__name__,
+                extractor_kwargs=neo_kwargs,
+                placeholder_suffixes=[".dat"],
+            )
+
         extractor_class = self.get_extractor_class()
         extractor_instance = extractor_class(**self.extractor_kwargs)
         return extractor_instance
@@ -81,7 +99,7 @@ class OpenEphysBinaryRecordingInterface(BaseRecordingExtractorInterface):
 
     def __init__(
         self,
-        folder_path: DirectoryPath,
+        folder_path: DirectoryPath | RemoteFilePath,
         *args,  # TODO: change to * (keyword only) on or after August 2026
         stream_name: str | None = None,
         block_index: int | None = None,
@@ -95,8 +113,10 @@ class OpenEphysBinaryRecordingInterface(BaseRecordingExtractorInterface):
 
         Parameters
         ----------
-        folder_path: DirectoryPath
-            Path to directory containing OpenEphys binary files.
+        folder_path: DirectoryPath or str
+            Path to directory containing OpenEphys binary files, or the URL of one on a remote filesystem, such as
+            ``s3://bucket/session``. Every file of a remote folder but its continuous.dat files is downloaded, and
+            those are read through the active :py:class:`~neuroconv.tools.remote_sources.RemoteBlockCache`.
         stream_name : str, optional
             The name of the recording stream to load; only required if there is more than one stream detected.
             Call `OpenEphysRecordingInterface.get_stream_names(folder_path=...)` to see what streams are available.
@@ -144,9 +164,14 @@ class OpenEphysBinaryRecordingInterface(BaseRecordingExtractorInterface):
 
         from ._openephys_utils import _read_settings_xml
 
-        self._xml_root = _read_settings_xml(folder_path)
+        # The settings and the streams of a remote folder are read from its local mirror
+        local_folder_path = folder_path
+        if is_remote_path(path=folder_path):
+            local_folder_path = _mirror_remote_folder(url=folder_path, placeholder_suffixes=(".dat",))
+
+        self._xml_root = _read_settings_xml(local_folder_path)
 
-        available_streams = self.get_stream_names(folder_path=folder_path)
+        available_streams = self.get_stream_names(folder_path=local_folder_path)
         if len(available_streams) > 1 and stream_name is None:
             raise ValueError(
                 "More than one stream is detected! "
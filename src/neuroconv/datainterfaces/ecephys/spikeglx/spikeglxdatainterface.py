@@ -8,6 +8,7 @@ import numpy as np
 from pydantic import DirectoryPath, validate_call
 
 from ..baserecordingextractorinterface import BaseRecordingExtractorInterface
+from ....tools.remote_sources import RemoteFilePath, is_remote_path
 from ....utils import DeepDict, get_json_schema_from_method_signature
 
 
@@ -48,6 +49,18 @@ class SpikeGLXRecordingInterface(BaseRecordingExtractorInterface):
         self.extractor_kwargs["folder_path"] = self.folder_path
         self.extractor_kwargs["stream_id"] = self.stream_id
 
+        # A remote folder is parsed from a local mirror of its .meta files, and its .bin files read from the URL
+        if is_remote_path(path=self.folder_path):
+            from ....tools.spikeinterface._remote_neo_recording import RemoteNeoRecording
+
+            neo_kwargs = {key: value for key, value in self.extractor_kwargs.items() if key != "folder_path"}
+            return RemoteNeoRecording(
+                url=self.folder_path,
+                extractor_name=self.get_extractor_class().__name__,
+                extractor_kwargs=neo_kwargs,
+                placeholder_suffixes=[".bin"],
+            )
+
         extractor_class = self.get_extractor_class()
         extractor_instance = extractor_class(**self.extractor_kwargs)
         return extractor_instance
@@ -55,7 +68,7 @@ class SpikeGLXRecordingInterface(BaseRecordingExtractorInterface):
     @validate_call
     def __init__(
         self,
-        folder_path: DirectoryPath,
+        folder_path: DirectoryPath | RemoteFilePath,
         *args,  # TODO: change to * (keyword only) on or after August 2026
         stream_id: str,
         verbose: bool = False,
@@ -65,8 +78,11 @@ class SpikeGLXRecordingInterface(BaseRecordingExtractorInterface):
         """
         Parameters
         ----------
-        folder_path : DirectoryPath
-            Folder path containing the binary files of the SpikeGLX recording.
+        folder_path : DirectoryPath or str
+            Folder path containing the binary files of the SpikeGLX recording, or the URL of one on a remote
+            filesystem, such as ``s3://bucket/session_g0/session_g0_imec0``. The .meta files of a remote folder are
+            downloaded and its .bin files read through the active
+            :py:class:`~neuroconv.tools.remote_sources.RemoteBlockCache`.
         stream_id : str
             Stream ID of the SpikeGLX recording.
             Examples are 'imec0.ap', 'imec0.lf', 'imec1.ap', 'imec1.lf', etc.
@@ -119,7 +135,7 @@ class SpikeGLXRecordingInterface(BaseRecordingExtractorInterface):
             )
 
         self.stream_id = stream_id
-        self.folder_path = Path(folder_path)
+        self.folder_path = folder_path if is_remote_path(path=folder_path) else Path(folder_path)
 
         super().__init__(
             folder_path=folder_path,
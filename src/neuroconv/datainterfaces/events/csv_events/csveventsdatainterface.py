@@ -10,6 +10,7 @@ from pydantic import FilePath, validate_call
 from neuroconv.utils import DeepDict
 
 from ..baseeventsinterface import BaseEventsInterface, _EventsData
+from ....tools._table_cache import read_csv_dataframe
 
 _TIME_UNIT_TO_DIVISOR = {"seconds": 1.0, "milliseconds": 1e3, "microseconds": 1e6}
 
@@ -176,7 +177,7 @@ class CSVEventsInterface(BaseEventsInterface):
             "keep_default_na": False,
             **self._read_kwargs,
         }
-        dataframe = pd.read_csv(self.source_data["file_path"], **read_kwargs)
+        dataframe = read_csv_dataframe(self.source_data["file_path"], **read_kwargs)
         # Coerce the numeric columns directly: keep_default_na=False leaves a blank cell as the literal
         # '', so recover the missing values here (blank or non-numeric -> NaN) independent of the na
         # settings the label / value columns rely on.
@@ -5,6 +5,7 @@ from pydantic import FilePath, validate_call
 from neuroconv.utils import DeepDict
 
 from ..baseeventsinterface import BaseEventsInterface, _EventsData
+from ....tools._table_cache import read_csv_columns
 from ....tools.events import (
     _get_event_type_source_ids,
     _resolve_detection_plan,
@@ -17,6 +18,12 @@ from ....tools.signal_processing import (
 )
 
 
+def _read_header_rows(file_path) -> tuple[list, list]:
+    """Return the ``(group, name)`` header rows of a DoricStudio CSV, as two lists of equal length."""
+    header_columns = read_csv_columns(file_path, header=None, nrows=2, dtype=str).values()
+    return [column[0] for column in header_columns], [column[1] for column in header_columns]
+
+
 class DoricCSVEventsInterface(BaseEventsInterface):
     """Convert discrete events from a Doric Neuroscience Studio CSV export to NWB.
 
@@ -116,10 +123,12 @@ class DoricCSVEventsInterface(BaseEventsInterface):
         """
         import pandas as pd
 
-        header_rows = pd.read_csv(file_path, header=None, nrows=2, dtype=str)  # the (group, name) header rows
-        data = pd.read_csv(file_path, header=None, skiprows=2)  # data only -> no header/data length mismatch
+        header_rows = _read_header_rows(file_path)  # the (group, name) header rows
+        # data only -> no header/data length mismatch; parsed once however many times the interface reads it
+        data_columns = read_csv_columns(file_path, header=None, skiprows=2)
+        data = pd.DataFrame(data_columns)
         width = data.shape[1]
-        data.columns = pd.MultiIndex.from_arrays([header_rows.iloc[0, :width], header_rows.iloc[1, :width]])
+        data.columns = pd.MultiIndex.from_arrays([header_rows[0][:width], header_rows[1][:width]])
         return data
 
     @staticmethod
@@ -131,10 +140,8 @@ class DoricCSVEventsInterface(BaseEventsInterface):
         Analog columns (``Analog In.``/``Analog Out.``) and the trailing empty column are ignored. Each
         digital column's name (e.g. ``DI/O-1``) is its ``event_type_source_id`` (identity-in-header).
         """
-        import pandas as pd
-
-        header_rows = pd.read_csv(file_path, header=None, nrows=2, dtype=str)  # header only -> no length warning
-        columns = list(zip(header_rows.iloc[0], header_rows.iloc[1]))
+        header_rows = _read_header_rows(file_path)  # header only -> no length warning
+        columns = list(zip(header_rows[0], header_rows[1]))
         time_columns = [column for column in columns if "time" in str(column[1]).lower()]
         digital_columns = [column for column in columns if "digital" in str(column[0]).lower()]
         time_column = time_columns[0] if time_columns else None
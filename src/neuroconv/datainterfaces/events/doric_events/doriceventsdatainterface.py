@@ -14,6 +14,7 @@ from ....tools.events import (
     _resolve_detection_plan,
     _validate_detection_configuration,
 )
+from ....tools.remote_sources import RemoteFilePath, open_hdf5_file
 from ....tools.signal_processing import (
     _condition_signal,
     _detect_events,
@@ -50,7 +51,7 @@ class DoricEventsInterface(BaseEventsInterface):
     @validate_call
     def __init__(
         self,
-        file_path: FilePath,
+        file_path: FilePath | RemoteFilePath,
         *,
         detection_configuration: dict | None = None,
         metadata_key: str | None = None,
@@ -60,8 +61,10 @@ class DoricEventsInterface(BaseEventsInterface):
 
         Parameters
         ----------
-        file_path : FilePath
-            Path to the ``.doric`` HDF5 file.
+        file_path : FilePath or str
+            Path to the ``.doric`` HDF5 file, or the URL of one on a remote filesystem, such as
+            ``s3://bucket/session.doric``, read through the active
+            :py:class:`~neuroconv.tools.remote_sources.RemoteBlockCache`.
         detection_configuration : dict, optional
             Which digital lines to read and how, keyed by the line's ``signal_source_id`` (its
             ``DigitalIO`` dataset key, e.g. ``{"Camera1": [{"signal_conditioning": {"binarize":
@@ -119,9 +122,8 @@ class DoricEventsInterface(BaseEventsInterface):
         ``DI--O-1``), and the layout is what makes every discovered signal a digital line, settled
         structurally with no data read.
         """
-        import h5py
 
-        with h5py.File(file_path, "r") as f:
+        with open_hdf5_file(file_path=file_path) as f:
             if "DataAcquisition" in f:
                 return DoricEventsInterface._discover_signals_in_root_is_data_acquisition_format(f)
             if "Traces" in f:
@@ -195,9 +197,8 @@ class DoricEventsInterface(BaseEventsInterface):
 
     def _get_session_start_time(self) -> datetime | None:
         """Parse the session start time from the file's ``Created`` attribute, if present."""
-        import h5py
 
-        with h5py.File(self.source_data["file_path"], "r") as f:
+        with open_hdf5_file(file_path=self.source_data["file_path"]) as f:
             session_start_time_string = f.attrs.get("Created", "")
         if not session_start_time_string:
             return None
@@ -254,15 +255,13 @@ class DoricEventsInterface(BaseEventsInterface):
         if self._events_data_dict is not None:
             return self._events_data_dict
 
-        import h5py
-
         # Built here rather than held on the interface: the configuration is the source of truth, and the
         # plan is pure and cheap to rebuild. Grouped by signal, so a signal is read once however many
         # event types it yields.
         detection_plan = _resolve_detection_plan(self._detection_configuration)
 
         events_data_dict = {}
-        with h5py.File(self.source_data["file_path"], "r") as f:
+        with open_hdf5_file(file_path=self.source_data["file_path"]) as f:
             for signal_source_id, detection_specs in detection_plan.items():
                 paths = self._available_signals[signal_source_id]
                 data = np.asarray(f[paths["data_path"]][:], dtype="float64")
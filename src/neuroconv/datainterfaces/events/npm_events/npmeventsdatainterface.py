@@ -1,9 +1,9 @@
 from typing import Literal
 
-import pandas as pd
 from pydantic import FilePath, validate_call
 
 from ..csv_events.csveventsdatainterface import CSVEventsInterface
+from ....tools._table_cache import read_csv_columns
 
 
 class NPMEventsInterface(CSVEventsInterface):
@@ -70,7 +70,7 @@ class NPMEventsInterface(CSVEventsInterface):
         # separate 5-column Digital IOs log, without specifying that the second column is the type, not a
         # value. This is a convention matched to our examples, not a documented guarantee; do not treat
         # it as gospel.
-        number_of_columns = pd.read_csv(file_path, header=None, nrows=1).shape[1]
+        number_of_columns = len(read_csv_columns(file_path, header=None, nrows=1))
         if number_of_columns > 2:
             raise ValueError(
                 f"NPMEventsInterface expects a headerless two-column CSV (onset time, event type), but "
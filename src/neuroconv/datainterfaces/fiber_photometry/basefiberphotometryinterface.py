@@ -14,6 +14,9 @@ Child interfaces implement only the format-reading seam:
 * ``get_available_streams(...)`` — discover atomic source streams (a classmethod/staticmethod so a
   converter can be authored before construction).
 * ``_get_stream_data(stream_name)`` — return time-major data for one stream.
+* ``_get_lazy_stream_data(stream_name, stream_file)`` — optionally, the same data as an array read only
+  where it is sliced, such as an ``h5py.Dataset``; the response series is written from it a buffer at a time.
+  ``_open_stream_file`` opens the file it is sliced from, which the iterator of the series closes once written.
 * ``_get_stream_timestamps(stream_name)`` — return the timestamps for one stream.
 * ``get_metadata`` — enrich the base metadata with whatever the format embeds (e.g. session start time).
 """
@@ -33,6 +36,7 @@ from ...tools.fiber_photometry import (
     add_fiber_photometry_lab_metadata,
     get_fiber_photometry_table_region,
 )
+from ...tools.hdmf import GenericDataChunkIterator
 from ...tools.nwb_helpers import get_module
 from ...utils import DeepDict, dict_deep_update, get_base_schema
 from ...utils.checks import calculate_regular_series_rate
@@ -40,6 +44,92 @@ from ...utils.checks import calculate_regular_series_rate
 __all__ = ["BaseFiberPhotometryInterface"]
 
 
+class _StackedStreamsDataChunkIterator(GenericDataChunkIterator):
+    """Column-stack time-major streams a buffer at a time, reading only the columns kept from each stream."""
+
+    def __init__(
+        self,
+        stream_arrays: list,
+        column_indices: list[int] | None = None,
+        num_samples: int | None = None,
+        stream_file=None,
+        **kwargs,
+    ):
+        """
+        Parameters
+        ----------
+        stream_arrays : list of array-like
+            The time-major streams, each shaped ``(num_samples,)`` or ``(num_samples, num_columns)`` and
+            sliceable without being loaded whole, such as an ``h5py.Dataset``.
+        column_indices : list of int, optional
+            The columns of the column-stacked streams to keep. All of them by default.
+        num_samples : int, optional
+            The number of samples to keep from the start of the streams. All of them by default.
+        stream_file : optional
+            The open file the streams are sliced from, closed once every buffer has been read.
+        """
+        stream_lengths = {len(stream_array) for stream_array in stream_arrays}
+        if len(stream_lengths) > 1:
+            raise ValueError(
+                f"The streams of a response series must have the same number of samples, got {sorted(stream_lengths)}."
+            )
+
+        self._stream_arrays = stream_arrays
+        self._stream_file = stream_file
+        # Each column of the stacked streams, as the stream it comes from and its column within that stream
+        stacked_columns = [
+            (stream_index, column_index)
+            for stream_index, stream_array in enumerate(stream_arrays)
+            for column_index in range(1 if stream_array.ndim == 1 else stream_array.shape[1])
+        ]
+        self._columns = stacked_columns if column_indices is None else [stacked_columns[i] for i in column_indices]
+        total_samples = stream_lengths.pop()
+        self._num_samples = total_samples if num_samples is None else min(num_samples, total_samples)
+        super().__init__(**kwargs)
+
+    def __next__(self):
+        try:
+            return super().__next__()
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the file the streams are sliced from, if any."""
+        if self._stream_file is not None:
+            self._stream_file.close()
+            self._stream_file = None
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        time_selection = selection[0]
+        columns = self._columns if len(selection) == 1 else self._columns[selection[1]]
+
+        # Each stream is read once per buffer, over the span of the columns kept from it
+        data = np.empty(
+            shape=(len(range(*time_selection.indices(self._num_samples))), len(columns)), dtype=self._get_dtype()
+        )
+        for stream_index in dict.fromkeys(stream_index for stream_index, _ in columns):
+            stream_array = self._stream_arrays[stream_index]
+            output_positions = [position for position, column in enumerate(columns) if column[0] == stream_index]
+            stream_columns = [columns[position][1] for position in output_positions]
+            if stream_array.ndim == 1:
+                data[:, output_positions] = np.asarray(stream_array[time_selection])[:, np.newaxis]
+            else:
+                first_column, last_column = min(stream_columns), max(stream_columns)
+                column_span = np.asarray(stream_array[time_selection, first_column : last_column + 1])
+                data[:, output_positions] = column_span[:, [column - first_column for column in stream_columns]]
+
+        return data[:, 0] if len(selection) == 1 else data
+
+    def _get_dtype(self) -> np.dtype:
+        return np.result_type(*(stream_array.dtype for stream_array in self._stream_arrays))
+
+    def _get_maxshape(self) -> tuple[int, ...]:
+        if len(self._columns) == 1:
+            return (self._num_samples,)
+        return (self._num_samples, len(self._columns))
+
+
 class BaseFiberPhotometryInterface(BaseTemporalAlignmentInterface):
     """Base class for single-series fiber photometry interfaces (one ``FiberPhotometryResponseSeries``)."""
 
@@ -103,6 +193,22 @@ class BaseFiberPhotometryInterface(BaseTemporalAlignmentInterface):
         """
         raise NotImplementedError
 
+    def _open_stream_file(self):
+        """Open the file :meth:`_get_lazy_stream_data` slices the streams from, or return None when there is none.
+
+        Each response series iterator opens its own and closes it once the series is written.
+        """
+        return None
+
+    def _get_lazy_stream_data(self, *, stream_name: str, stream_file=None):
+        """Return the data of a single atomic source stream as an array read only where it is sliced.
+
+        Formats whose streams are held in a file that can be read in pieces, such as an HDF5 dataset,
+        override this, and :meth:`_open_stream_file`, so that the response series is written a buffer at a time.
+        By default, the stream as :meth:`_get_stream_data` reads it.
+        """
+        return np.asarray(self._get_stream_data(stream_name=stream_name))
+
     @abstractmethod
     def _get_stream_timestamps(self, *, stream_name: str) -> np.ndarray:
         """Return the timestamps (shape ``(num_samples,)``) for a single atomic source stream."""
@@ -186,12 +292,9 @@ class BaseFiberPhotometryInterface(BaseTemporalAlignmentInterface):
         return dict_deep_update(metadata, dict(FiberPhotometry={self.metadata_key: series_metadata}))
 
     def _get_number_of_traces(self) -> int:
-        """Return how many traces this interface's response series carries, one per table row.
-
-        Reads the data to measure it. Formats that can answer from a header should override this.
-        """
-        data = self._read_response_data()
-        return 1 if data.ndim == 1 else data.shape[1]
+        """Return how many traces this interface's response series carries, one per table row."""
+        maxshape = self._get_response_data_iterator().maxshape
+        return 1 if len(maxshape) == 1 else maxshape[1]
 
     def get_metadata_template(self) -> DeepDict:
         """Return the full fiber photometry provenance chain, sized to this interface's traces.
@@ -317,23 +420,33 @@ class BaseFiberPhotometryInterface(BaseTemporalAlignmentInterface):
     # NWB conversion
     # ------------------------------------------------------------------
 
+    def _get_response_data_iterator(self, num_samples: int | None = None) -> _StackedStreamsDataChunkIterator:
+        """Return this interface's stream(s), column-stacked, as an iterator reading a buffer at a time.
+
+        ``stream_indices`` (if set) selects which columns of the stacked streams to keep, and only those
+        columns are read.
+        """
+        stream_file = self._open_stream_file()
+        stream_arrays = [
+            self._get_lazy_stream_data(stream_name=stream_name, stream_file=stream_file)
+            for stream_name in self.stream_names
+        ]
+        return _StackedStreamsDataChunkIterator(
+            stream_arrays=stream_arrays,
+            column_indices=self.stream_indices,
+            num_samples=num_samples,
+            stream_file=stream_file,
+        )
+
     def _read_response_data(self) -> np.ndarray:
         """Read and column-stack this interface's stream(s) into one time-major data array.
 
         ``stream_indices`` (if set) selects which columns of the stacked array to keep.
         """
-        arrays = []
-        for stream_name in self.stream_names:
-            data = np.asarray(self._get_stream_data(stream_name=stream_name))
-            if data.ndim == 1:
-                data = data[:, np.newaxis]
-            arrays.append(data)
-        combined = np.concatenate(arrays, axis=1)
-        if self.stream_indices is not None:
-            combined = combined[:, self.stream_indices]
-        if combined.shape[1] == 1:
-            combined = combined[:, 0]
-        return combined
+        iterator = self._get_response_data_iterator()
+        data = iterator._get_data(selection=tuple(slice(0, axis_length) for axis_length in iterator.maxshape))
+        iterator.close()
+        return data
 
     @staticmethod
     def _timing_kwargs_from_timestamps(timestamps: np.ndarray, always_write_timestamps: bool) -> dict:
@@ -466,7 +579,7 @@ class BaseFiberPhotometryInterface(BaseTemporalAlignmentInterface):
             )
 
         # Add this interface's single response series.
-        data = stub(self._read_response_data())
+        data = self._get_response_data_iterator(num_samples=stub_samples if stub_test else None)
         timestamps = stub(self.alignment[self.metadata_key].get_times())
         timing_kwargs = self._timing_kwargs_from_timestamps(timestamps, always_write_timestamps)
 
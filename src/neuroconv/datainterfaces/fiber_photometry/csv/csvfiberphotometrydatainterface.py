@@ -9,6 +9,7 @@ from pydantic import FilePath, validate_call
 
 from ._demux import ColumnDemux, DemuxConfiguration, StrideDemux
 from ..basefiberphotometryinterface import BaseFiberPhotometryInterface
+from ....tools._table_cache import read_csv_columns, read_csv_dataframe
 
 _TIME_UNIT_TO_DIVISOR = {"seconds": 1.0, "milliseconds": 1e3, "microseconds": 1e6}
 
@@ -145,9 +146,10 @@ class CSVFiberPhotometryInterface(BaseFiberPhotometryInterface):
         """Read a CSV through this interface's resolved ``read_kwargs``, plus any per-call overrides.
 
         The single ``pandas.read_csv`` entry point for the interface, so every read -- the data reads and
-        the up-front column checks alike -- parses the file with the same dialect.
+        the up-front column checks alike -- parses the file with the same dialect. Reads go through the
+        shared table cache, so the data and timestamps of every channel come from one parse of the file.
         """
-        return pd.read_csv(file_path, **{**self._read_kwargs, **call_kwargs})
+        return read_csv_dataframe(file_path, **{**self._read_kwargs, **call_kwargs})
 
     def _assert_columns_present(self, file_path: str, columns: list[str | int]) -> None:
         """Assert that a CSV file contains all of ``columns`` (by header name, or by 0-based position)."""
@@ -182,7 +184,7 @@ class CSVFiberPhotometryInterface(BaseFiberPhotometryInterface):
             ``skiprows``) so the header is parsed with the same dialect the interface will read the file
             with. Pass the same value you would give the interface's ``read_kwargs``. Default is None.
         """
-        return list(pd.read_csv(file_path, nrows=0, **(read_kwargs or dict())).columns)
+        return list(read_csv_columns(file_path, nrows=0, **(read_kwargs or dict())))
 
     def _read_dataframe(self, *, file_path: str, columns: list[str | int]) -> pd.DataFrame:
         """Read the given columns of a CSV file into a DataFrame, demultiplexed to this channel.
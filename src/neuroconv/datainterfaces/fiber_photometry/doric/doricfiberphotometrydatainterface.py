@@ -10,6 +10,7 @@ from pydantic import FilePath, validate_call
 from neuroconv.utils import DeepDict
 
 from ..basefiberphotometryinterface import BaseFiberPhotometryInterface
+from ....tools.remote_sources import RemoteFilePath, open_hdf5_file
 
 _DORIC_CREATED_FMT = "%a %b %d %H:%M:%S %Y"
 _CSV_TIME_COLUMN_CANDIDATES = ("time", "time(s)")
@@ -47,7 +48,7 @@ class DoricFiberPhotometryInterface(BaseFiberPhotometryInterface):
     def __init__(
         self,
         *,
-        file_path: FilePath,
+        file_path: FilePath | RemoteFilePath,
         stream_names: str | list[str],
         metadata_key: str | None = None,
         stream_indices: list[int] | None = None,
@@ -57,8 +58,10 @@ class DoricFiberPhotometryInterface(BaseFiberPhotometryInterface):
 
         Parameters
         ----------
-        file_path : FilePath
-            Path to the ``.doric`` HDF5 file or DoricStudio ``.csv`` export.
+        file_path : FilePath or str
+            Path to the ``.doric`` HDF5 file or DoricStudio ``.csv`` export, or the URL of one on a remote
+            filesystem, such as ``s3://bucket/session.doric``, which is read through the active
+            :py:class:`~neuroconv.tools.remote_sources.RemoteBlockCache` rather than downloaded whole.
         stream_names : str or list of str
             The input stream(s) whose samples are assembled into this interface's single
             ``FiberPhotometryResponseSeries``. Call :meth:`get_available_streams` to discover them.
@@ -112,9 +115,8 @@ class DoricFiberPhotometryInterface(BaseFiberPhotometryInterface):
         """
         if cls._is_csv(file_path):
             return cls._discover_csv_streams(file_path)
-        import h5py
 
-        with h5py.File(file_path, "r") as f:
+        with open_hdf5_file(file_path=file_path) as f:
             return cls._discover_hdf5_streams(f) or cls._discover_hdf5_streams_legacy(f)
 
     @staticmethod
@@ -242,9 +244,7 @@ class DoricFiberPhotometryInterface(BaseFiberPhotometryInterface):
         if self._is_csv(file_path):
             return None
 
-        import h5py
-
-        with h5py.File(file_path, "r") as f:
+        with open_hdf5_file(file_path=file_path) as f:
             created_str = f.attrs.get("Created", "")
         if not created_str:
             return None
@@ -284,18 +284,29 @@ class DoricFiberPhotometryInterface(BaseFiberPhotometryInterface):
             df = self._read_csv_dataframe(info["header_row"])
             return np.asarray(df[info["data_column"]].values)
 
-        import h5py
-
-        with h5py.File(self.source_data["file_path"], "r") as f:
+        with open_hdf5_file(file_path=self.source_data["file_path"]) as f:
             return np.asarray(f[info["data_path"]][:])
 
+    def _open_stream_file(self):
+        if self._is_csv(self.source_data["file_path"]):
+            return None
+
+        # The file stays open with the iterator of the response series, which reads it a buffer at a time as it
+        # is written rather than loaded whole, and closes it once done
+        return open_hdf5_file(file_path=self.source_data["file_path"])
+
+    def _get_lazy_stream_data(self, *, stream_name: str, stream_file=None):
+        info = self._streams[stream_name]
+        if info["format"] == "csv":
+            return super()._get_lazy_stream_data(stream_name=stream_name)
+
+        return stream_file[info["data_path"]]
+
     def _get_stream_timestamps(self, *, stream_name: str) -> np.ndarray:
         info = self._streams[stream_name]
         if info["format"] == "csv":
             df = self._read_csv_dataframe(info["header_row"])
             return np.asarray(df[info["time_column"]].values)
 
-        import h5py
-
-        with h5py.File(self.source_data["file_path"], "r") as f:
+        with open_hdf5_file(file_path=self.source_data["file_path"]) as f:
             return np.asarray(f[info["time_path"]][:])
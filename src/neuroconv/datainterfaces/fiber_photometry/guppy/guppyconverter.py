@@ -388,16 +388,17 @@ class GuppyConverter(ConverterPipe):
             interfaces[events_spec["interface_name"]] = interface
         return interfaces
 
-    def get_metadata(self):
+    def get_metadata(self, *, max_workers: int = 1):
         """Merge sub-interface metadata into a single coherent fiber photometry conversion.
 
         Gives each acquisition series a distinct default name and keeps only the behavioral event
         stores GuPPy listed.
 
         The ``FiberPhotometry`` chain itself (devices, indicators, table rows, per-series regions) is
-        the user's to supply, exactly as for a bare acquisition interface.
+        the user's to supply, exactly as for a bare acquisition interface. ``max_workers`` is the number
+        of threads asking the interfaces for their metadata at once, as in ``NWBConverter.get_metadata``.
         """
-        metadata = super().get_metadata()
+        metadata = super().get_metadata(max_workers=max_workers)
 
         # Every single-series scaffold defaults to the same "FiberPhotometryResponseSeries" name; suffix
         # each one with its role so the two series do not collide in nwbfile.acquisition.
@@ -17,6 +17,7 @@ from ..csv.csvfiberphotometrydatainterface import CSVFiberPhotometryInterface
 from ..npm.npmfiberphotometrydatainterface import NPMFiberPhotometryInterface
 from ...events.csv_events.csveventsdatainterface import CSVEventsInterface
 from ...events.npm_events.npmeventsdatainterface import NPMEventsInterface
+from ....tools._table_cache import read_csv_columns
 
 ASSOCIATED_SUFFIXES = tuple(
     dict.fromkeys(NPMFiberPhotometryInterface.associated_suffixes + NPMEventsInterface.associated_suffixes)
@@ -34,9 +35,7 @@ _NPM_EXCITATION_BITS = 0b111
 
 def _npm_column_count(file_path) -> int:
     """Return how many columns a CSV has, which is how GuPPy tells an NPM event file from a data file."""
-    import pandas
-
-    return int(pandas.read_csv(file_path, header=None, nrows=1).shape[1])
+    return len(read_csv_columns(file_path, header=None, nrows=1))
 
 
 def _parses_as_float(value) -> bool:
@@ -127,8 +126,6 @@ def npm_store_to_demux(folder_path: DirectoryPath, store_id: str, *, number_of_c
     on-disk signature; a file carrying a state column derives its own and ignores the argument, just
     as GuPPy does.
     """
-    import pandas
-
     match = _NPM_STORE_PATTERN.match(store_id)
     assert (
         match is not None
@@ -143,8 +140,8 @@ def npm_store_to_demux(folder_path: DirectoryPath, store_id: str, *, number_of_c
     )
     file_path = source_files[file_index]
 
-    dataframe = pandas.read_csv(file_path, index_col=False, nrows=12)
-    headerless = any(_parses_as_float(column) for column in dataframe.columns)
+    columns = list(read_csv_columns(file_path, index_col=False, nrows=12))
+    headerless = any(_parses_as_float(column) for column in columns)
     if headerless:
         # The legacy layout has no state column at all: channels cycle by row parity alone, and the
         # cycle length is whatever the GuPPy run was told it was.
@@ -162,13 +159,13 @@ def npm_store_to_demux(folder_path: DirectoryPath, store_id: str, *, number_of_c
             state_value=None,
         )
 
-    column_by_lowercase_name = {str(column).lower(): column for column in dataframe.columns}
+    column_by_lowercase_name = {str(column).lower(): column for column in columns}
     state_column = column_by_lowercase_name.get("flags") or column_by_lowercase_name.get("ledstate")
     assert state_column is not None, (
         f"'{file_path}' has a header but no 'Flags' or 'LedState' column, so GuPPy could not have "
         f"demultiplexed it into '{store_id}'."
     )
-    state = pandas.read_csv(file_path, index_col=False)[state_column].to_numpy().astype(int)
+    state = read_csv_columns(file_path, index_col=False)[state_column].astype(int)
     unique_states = numpy.unique(state[2:12])
     assert slot_ordinal < len(unique_states), (
         f"Store '{store_id}' names channel slot '{slot}' (index {slot_ordinal}), but '{file_path}' "
@@ -178,8 +175,8 @@ def npm_store_to_demux(folder_path: DirectoryPath, store_id: str, *, number_of_c
 
     # Reproduce GuPPy's column trimming: the canonical timestamps column replaces the several it
     # found (only when there are several), then FrameCounter and the state column go.
-    timestamp_columns = [column for column in dataframe.columns if "timestamp" in str(column).lower()]
-    remaining = list(dataframe.columns)
+    timestamp_columns = [column for column in columns if "timestamp" in str(column).lower()]
+    remaining = list(columns)
     if len(timestamp_columns) > 1:
         remaining.insert(1, "Timestamp")
         remaining = [column for column in remaining if column not in timestamp_columns]
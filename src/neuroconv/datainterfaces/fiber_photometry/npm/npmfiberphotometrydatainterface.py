@@ -24,6 +24,7 @@ import pandas as pd
 from pydantic import FilePath, validate_call
 
 from ..csv.csvfiberphotometrydatainterface import CSVFiberPhotometryInterface
+from ....tools._table_cache import read_csv_dataframe
 
 # The three lowest bits of a Flags/LedState word are one flag per excitation LED; the higher bits are
 # digital TTL lines. A wavelength's rows are those whose word has that wavelength's bit set, whatever
@@ -237,7 +238,11 @@ class NPMFiberPhotometryInterface(CSVFiberPhotometryInterface):
         first row, with all three excitation bits set -- which leaves a genuine simultaneous-excitation
         frame later in the recording untouched.
         """
-        state = pd.read_csv(file_path, usecols=[state_column], **(read_kwargs or dict()))[state_column]
+        # Read with the dialect the interface reads its data with, so the state column comes from the same parse
+        resolved_read_kwargs = CSVFiberPhotometryInterface._resolve_read_kwargs(
+            timestamps_column=state_column, read_kwargs=read_kwargs
+        )
+        state = read_csv_dataframe(file_path, usecols=[state_column], **resolved_read_kwargs)[state_column]
         # ``& _EXCITATION_BITS`` masks off the TTL bits, leaving just the three excitation flags;
         # comparing that to _EXCITATION_BITS asks whether all three are set. So 7 (0b111) and 23
         # (0b10111, one TTL line high) both read as a startup frame, while 6 (0b110) -- a genuine
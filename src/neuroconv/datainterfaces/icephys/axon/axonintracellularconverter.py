@@ -35,10 +35,10 @@ class AxonIntracellularConverter(ConverterPipe):
     associated_suffixes = AxonIntracellularInterface.associated_suffixes
     info = "Combines several AxonIntracellularInterface instances (dual patch, multi-file) into one icephys hierarchy."
 
-    def get_metadata(self) -> dict:
+    def get_metadata(self, *, max_workers: int = 1) -> dict:
         interfaces = list(self.data_interface_objects.values())
         self._assign_run_identities(interfaces)  # before super(), which builds each interface's metadata
-        metadata = super().get_metadata()
+        metadata = super().get_metadata(max_workers=max_workers)
         if interfaces:
             session_start_datetime, _ = self._compute_alignment(interfaces)
             if session_start_datetime is not None:
@@ -7,7 +7,7 @@ import numpy as np
 from pydantic import FilePath, validate_call
 
 from ..baseicephysinterface import BaseIcephysInterface
-from ....tools.icephys import _IcephysSeriesData
+from ....tools.icephys import _IcephysSeriesData, _read_sweeps
 from ....utils import (
     DeepDict,
     get_conversion_from_unit,
@@ -275,10 +275,10 @@ class AxonIntracellularInterface(BaseIcephysInterface):
 
     # ------------------------------------------------------------------ writing
 
-    def _get_icephys_series_data(self):
+    def _get_icephys_series_data(self, max_workers: int = 1):
         """Map the ABF response and optional stimulus into the base writer representation."""
         data, timestamps, sweep_sample_ranges = self._concatenate_channel_sweeps(
-            self._reader, self._response_channel_index, self._num_sweeps, self._sampling_rate
+            self._reader, self._response_channel_index, self._num_sweeps, self._sampling_rate, max_workers=max_workers
         )
         timestamps = timestamps + self._starting_time_shift
         channel = self._signal_channels[self._response_channel_index]
@@ -290,7 +290,9 @@ class AxonIntracellularInterface(BaseIcephysInterface):
         )
         stimulus_data = None
         if self._has_stimulus:
-            stimulus_data = self._get_stimulus_data(self._reader, timestamps, self._sampling_rate, self._num_sweeps)
+            stimulus_data = self._get_stimulus_data(
+                self._reader, timestamps, self._sampling_rate, self._num_sweeps, max_workers=max_workers
+            )
         return response_data, stimulus_data, sweep_sample_ranges
 
     def _get_stimulus_type(self) -> str:
@@ -342,7 +344,7 @@ class AxonIntracellularInterface(BaseIcephysInterface):
 
     # ------------------------------------------------------------------ writing helpers
 
-    def _concatenate_channel_sweeps(self, reader, channel_index, num_sweeps, sampling_rate):
+    def _concatenate_channel_sweeps(self, reader, channel_index, num_sweeps, sampling_rate, max_workers=1):
         """Read one ADC channel across all sweeps into preallocated arrays; return
         ``(data, timestamps, [(start_index, count), ...])``.
 
@@ -365,9 +367,12 @@ class AxonIntracellularInterface(BaseIcephysInterface):
             cursor += num_sweep_samples
         total_samples = cursor
 
-        # 2. Data: read each sweep's chunk into its slice, keeping the raw on-disk dtype.
+        # 2. Data: read each sweep's chunk into its slice, keeping the raw on-disk dtype. The slices are disjoint,
+        # so up to `max_workers` threads fill them at once.
         data = np.empty(total_samples, dtype=self._signal_channels[channel_index]["dtype"])
-        for segment_index, (start_index, count) in enumerate(sweep_sample_ranges):
+
+        def read_sweep(segment_index: int) -> None:
+            start_index, count = sweep_sample_ranges[segment_index]
             chunk = np.asarray(
                 reader.get_analogsignal_chunk(
                     block_index=self._BLOCK_INDEX, seg_index=segment_index, channel_indexes=[channel_index]
@@ -375,6 +380,8 @@ class AxonIntracellularInterface(BaseIcephysInterface):
             ).reshape(-1)
             data[start_index : start_index + count] = chunk
 
+        _read_sweeps(read_sweep=read_sweep, num_sweeps=num_sweeps, max_workers=max_workers)
+
         # 3. Timestamps: each sweep starts at its segment's t_start, then advances at the sampling rate.
         # neo makes one segment per ABF episode (sweep) from the file's SynchArray (one (offset, len) entry per
         # episode), and each segment's t_start is that recorded offset. So multiple segments reflect the episodic
@@ -391,7 +398,7 @@ class AxonIntracellularInterface(BaseIcephysInterface):
 
         return data, timestamps, sweep_sample_ranges
 
-    def _get_stimulus_data(self, reader, timestamps, sampling_rate, num_sweeps):
+    def _get_stimulus_data(self, reader, timestamps, sampling_rate, num_sweeps, max_workers=1):
         """Map the ABF stimulus source into the base writer representation."""
         if self._stimulus_command is not None:
             dac_index = self._command_name_to_index(self._stimulus_command)
@@ -406,7 +413,9 @@ class AxonIntracellularInterface(BaseIcephysInterface):
             offset = 0.0
         else:
             stimulus_channel_index = self._channel_name_to_index(self._stimulus_channel_name)
-            data, _, _ = self._concatenate_channel_sweeps(reader, stimulus_channel_index, num_sweeps, sampling_rate)
+            data, _, _ = self._concatenate_channel_sweeps(
+                reader, stimulus_channel_index, num_sweeps, sampling_rate, max_workers=max_workers
+            )
             channel = self._signal_channels[stimulus_channel_index]
             conversion = float(channel["gain"]) * get_conversion_from_unit(channel["units"])
             offset = float(channel["offset"]) * get_conversion_from_unit(channel["units"])
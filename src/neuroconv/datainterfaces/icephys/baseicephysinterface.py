@@ -21,8 +21,19 @@ class BaseIcephysInterface(BaseDataInterface):
     The hierarchy above those rows remains a converter responsibility, once every interface has contributed.
     """
 
-    def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict | None = None) -> None:
-        """Write this interface's response, optional stimulus, and sweep rows to an NWB file."""
+    def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict | None = None, *, max_workers: int = 1) -> None:
+        """
+        Write this interface's response, optional stimulus, and sweep rows to an NWB file.
+
+        Parameters
+        ----------
+        nwbfile : NWBFile
+            The NWB file to write to.
+        metadata : dict, optional
+            Metadata dictionary. If None, uses ``get_metadata()``.
+        max_workers : int, default: 1
+            The number of threads reading sweeps from the source at once.
+        """
         if metadata is None:
             metadata = self.get_metadata()
 
@@ -33,7 +44,7 @@ class BaseIcephysInterface(BaseDataInterface):
             metadata=metadata,
             electrode_metadata_key=response_metadata["electrode_metadata_key"],
         )
-        response_data, stimulus_data, sweep_sample_ranges = self._get_icephys_series_data()
+        response_data, stimulus_data, sweep_sample_ranges = self._get_icephys_series_data(max_workers=max_workers)
         response_series = _add_patch_clamp_series_to_nwbfile(
             nwbfile=nwbfile,
             metadata=metadata,
@@ -69,8 +80,13 @@ class BaseIcephysInterface(BaseDataInterface):
         )
 
     @abstractmethod
-    def _get_icephys_series_data(self) -> tuple[_IcephysSeriesData, _IcephysSeriesData | None, list[tuple[int, int]]]:
-        """Return response, optional stimulus, and sweep ranges in the standard internal representation."""
+    def _get_icephys_series_data(
+        self, max_workers: int = 1
+    ) -> tuple[_IcephysSeriesData, _IcephysSeriesData | None, list[tuple[int, int]]]:
+        """Return response, optional stimulus, and sweep ranges in the standard internal representation.
+
+        The sweeps are read by up to ``max_workers`` threads at once and concatenated, in order, into one series.
+        """
 
     def _get_stimulus_type(self) -> str | None:
         """Return the run's source-described stimulus type, if any."""
@@ -35,10 +35,10 @@ class BrukerVoltageRecordingConverter(ConverterPipe):
     associated_suffixes = BrukerVoltageRecordingInterface.associated_suffixes
     info = "Combines several BrukerVoltageRecordingInterface instances into one icephys hierarchy."
 
-    def get_metadata(self) -> dict:
+    def get_metadata(self, *, max_workers: int = 1) -> dict:
         interfaces = list(self.data_interface_objects.values())
         self._assign_run_identities(interfaces)  # before super(), which builds each interface's metadata
-        metadata = super().get_metadata()
+        metadata = super().get_metadata(max_workers=max_workers)
         if interfaces:
             session_start_datetime, _ = self._compute_alignment(interfaces)
             metadata["NWBFile"]["session_start_time"] = session_start_datetime
@@ -12,7 +12,7 @@ from ._bruker_voltage_recording_readers import (
     _read_signal_column,
 )
 from ..baseicephysinterface import BaseIcephysInterface
-from ....tools.icephys import _IcephysSeriesData
+from ....tools.icephys import _IcephysSeriesData, _read_sweeps
 from ....utils import (
     DeepDict,
     get_conversion_from_unit,
@@ -311,9 +311,9 @@ class BrukerVoltageRecordingInterface(BaseIcephysInterface):
 
     # ------------------------------------------------------------------ writing
 
-    def _get_icephys_series_data(self):
+    def _get_icephys_series_data(self, max_workers: int = 1):
         """Map the PrairieView response into the base writer representation."""
-        data, timestamps, sweep_sample_ranges = self._concatenate_cycles()
+        data, timestamps, sweep_sample_ranges = self._concatenate_cycles(max_workers=max_workers)
         timestamps = timestamps + self._starting_time_shift
         signal = self._response_signal
         conversion = (signal.multiplier / signal.divisor) * get_conversion_from_unit(signal.unit_name)
@@ -346,7 +346,7 @@ class BrukerVoltageRecordingInterface(BaseIcephysInterface):
 
     # ------------------------------------------------------------------ writing helpers
 
-    def _concatenate_cycles(self):
+    def _concatenate_cycles(self, max_workers: int = 1):
         """Read the response signal across every cycle and lay them end to end on one timeline; return
         ``(data, timestamps, [(start_index, count), ...])``.
 
@@ -355,7 +355,12 @@ class BrukerVoltageRecordingInterface(BaseIcephysInterface):
         are real dead time, so they show up as gaps in the timestamps rather than being closed up.
         """
         origin = self._recording_start_datetime
-        cycle_arrays = [_read_signal_column(header, self._response_signal_name) for header in self._cycle_headers]
+
+        # Each cycle is a CSV of its own, so up to `max_workers` threads parse them at once
+        def read_cycle(cycle_index: int) -> np.ndarray:
+            return _read_signal_column(self._cycle_headers[cycle_index], self._response_signal_name)
+
+        cycle_arrays = _read_sweeps(read_sweep=read_cycle, num_sweeps=len(self._cycle_headers), max_workers=max_workers)
 
         sweep_sample_ranges = []
         cursor = 0
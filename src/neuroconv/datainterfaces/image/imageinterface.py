@@ -1,16 +1,27 @@
 """Interface for converting single or multiple images to NWB format."""
 
+import json
+import threading
 import warnings
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
 import numpy as np
+from hdmf.common import DynamicTable, VectorData
 from hdmf.data_utils import AbstractDataChunkIterator, DataChunk
 from pynwb import NWBFile
 from pynwb.base import Images
 from pynwb.image import GrayscaleImage, RGBAImage, RGBImage
 
 from ...basedatainterface import BaseDataInterface
+from ...tools._dataset_fingerprint import get_file_identity, hash_text
+from ...tools.hdmf import GenericDataChunkIterator
+from ...tools.iterative_write import (
+    get_image_series_buffer_shape,
+    get_image_series_chunk_shape,
+)
 from ...utils import DeepDict
 
 # Map PIL image mode -> numpy dtype, for modes supported by ImageInterface.
@@ -23,12 +34,117 @@ _PIL_MODE_TO_NUMPY_DTYPE = {
 }
 
 
+def _la_to_rgba(la_image: np.ndarray) -> np.ndarray:
+    """Convert a Luminance-Alpha (LA) image to RGBA format without losing information."""
+    if len(la_image.shape) != 3 or la_image.shape[2] != 2:
+        raise ValueError("Input must be an LA image with shape (height, width, 2)")
+
+    height, width, _ = la_image.shape
+    rgba_image = np.zeros((height, width, 4), dtype=la_image.dtype)
+
+    # Copy the L channel to the R, G and B channels, and A to alpha
+    rgba_image[..., :3] = la_image[..., :1]
+    rgba_image[..., 3] = la_image[..., 1]
+
+    return rgba_image
+
+
+def _read_image(file_path: Path) -> np.ndarray:
+    """Decode an image file into an array, converting LA images to RGBA as the NWB image types require."""
+    from PIL import Image
+
+    with Image.open(file_path) as image:
+        image_mode = image.mode
+        data = np.asarray(image)
+
+    if image_mode == "LA":
+        data = _la_to_rgba(data)
+
+    return data
+
+
+class _ImageDecoder:
+    """
+    Decode image files on a pool of threads, ahead of the writer asking for them.
+
+    Decoding a PNG, JPEG or TIFF happens in C with the GIL released, so threads decode in parallel while the
+    writer compresses and writes what was decoded before. At most `num_prefetched` images are decoded and not yet
+    handed over at any time, which bounds the memory held ahead of the writer. Images are decoded in the order
+    of `file_paths`; an image asked for out of that order, or again, is decoded on demand.
+
+    The iterators sharing the decoder register with it, and its threads stop once every one of them was written
+    to the end, or when the decoder is garbage collected. Images asked for afterwards, such as by a reader of the
+    in-memory file, start the threads again.
+    """
+
+    def __init__(self, file_paths: list[Path], max_workers: int, num_prefetched: int | None = None):
+        self._file_paths = list(file_paths)
+        self._max_workers = max_workers
+        self._num_prefetched = num_prefetched or 2 * max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._shutdown_executor: weakref.finalize | None = None
+        self._futures: dict[Path, Future] = dict()
+        self._next_position = 0
+        self._iterators_writing: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _submit(self, file_path: Path) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            self._shutdown_executor = weakref.finalize(self, self._executor.shutdown, wait=False)
+        if file_path not in self._futures:
+            self._futures[file_path] = self._executor.submit(_read_image, file_path)
+
+    def _prefetch(self) -> None:
+        while len(self._futures) < self._num_prefetched and self._next_position < len(self._file_paths):
+            self._submit(self._file_paths[self._next_position])
+            self._next_position += 1
+
+    def read(self, file_paths: list[Path]) -> list[np.ndarray]:
+        """Return the decoded images of `file_paths`, in order, topping the prefetched images back up."""
+        with self._lock:
+            for file_path in file_paths:
+                self._submit(file_path)
+            futures = [self._futures[file_path] for file_path in file_paths]
+            self._prefetch()
+
+        images = [future.result() for future in futures]
+
+        with self._lock:
+            for file_path in file_paths:
+                self._futures.pop(file_path, None)
+            self._prefetch()
+
+        return images
+
+    def register(self, iterator: AbstractDataChunkIterator) -> None:
+        """Keep the threads running until `iterator` was written to the end."""
+        with self._lock:
+            self._iterators_writing.add(id(iterator))
+
+    def release(self, iterator: AbstractDataChunkIterator) -> None:
+        """Record that `iterator` was written to the end, stopping the threads when it was the last one."""
+        with self._lock:
+            self._iterators_writing.discard(id(iterator))
+            if not self._iterators_writing:
+                self._close()
+
+    def _close(self) -> None:
+        if self._executor is not None:
+            self._shutdown_executor()
+            self._executor = None
+            self._futures.clear()
+
+
 class SingleImageIterator(AbstractDataChunkIterator):
     """Simple iterator to return a single image. This avoids loading the entire image into memory at initializing
     and instead loads it at writing time one by one"""
 
-    def __init__(self, file_path: str | Path):
+    def __init__(self, file_path: str | Path, decoder: _ImageDecoder | None = None):
         self._file_path = Path(file_path)
+        self._decoder = decoder
+        if self._decoder is not None:
+            self._decoder.register(self)
         from PIL import Image
 
         # Get image information without loading the full image
@@ -55,23 +171,7 @@ class SingleImageIterator(AbstractDataChunkIterator):
 
     def _la_to_rgba(self, la_image: np.ndarray) -> np.ndarray:
         """Convert a Luminance-Alpha (LA) image to RGBA format without losing information."""
-        if len(la_image.shape) != 3 or la_image.shape[2] != 2:
-            raise ValueError("Input must be an LA image with shape (height, width, 2)")
-
-        height, width, _ = la_image.shape
-        rgba_image = np.zeros((height, width, 4), dtype=la_image.dtype)
-
-        # Extract L and A channels
-        l_channel = la_image[..., 0]
-        a_channel = la_image[..., 1]
-
-        # Copy L channel to R, G, and B channels
-        rgba_image[..., 0] = l_channel  # Red
-        rgba_image[..., 1] = l_channel  # Green
-        rgba_image[..., 2] = l_channel  # Blue
-        rgba_image[..., 3] = a_channel  # Alpha
-
-        return rgba_image
+        return _la_to_rgba(la_image)
 
     def __iter__(self):
         """Return the iterator object"""
@@ -79,19 +179,18 @@ class SingleImageIterator(AbstractDataChunkIterator):
 
     def __next__(self):
         """Return the DataChunk with the single full image"""
-        from PIL import Image
-
         if self._images_returned == 0:
-            data = np.asarray(Image.open(self._file_path))
-
-            # Transform LA to RGBA if needed
-            if self.image_mode == "LA":
-                data = self._la_to_rgba(data)
+            if self._decoder is not None:
+                (data,) = self._decoder.read(file_paths=[self._file_path])
+            else:
+                data = _read_image(self._file_path)
 
             selection = (slice(None),) * data.ndim
             self._images_returned += 1
             return DataChunk(data=data, selection=selection)
         else:
+            if self._decoder is not None:
+                self._decoder.release(self)
             raise StopIteration
 
     def recommended_chunk_shape(self):
@@ -130,6 +229,65 @@ class SingleImageIterator(AbstractDataChunkIterator):
         }
 
 
+class _StackedImagesIterator(GenericDataChunkIterator):
+    """Iterate over images of one shape and data type stacked along a new first axis, decoding a buffer at a time."""
+
+    def __init__(
+        self,
+        file_paths: list[Path],
+        image_shape: tuple[int, ...],
+        dtype: np.dtype,
+        decoder: _ImageDecoder | None = None,
+        buffer_gb: float = 1.0,
+        chunk_mb: float = 10.0,
+    ):
+        self._file_paths = list(file_paths)
+        self._image_shape = tuple(image_shape)
+        self._dtype = np.dtype(dtype)
+        self._decoder = decoder
+        if self._decoder is not None:
+            self._decoder.register(self)
+
+        chunk_shape = get_image_series_chunk_shape(
+            num_samples=len(self._file_paths), sample_shape=self._image_shape, dtype=self._dtype, chunk_mb=chunk_mb
+        )
+        buffer_shape = get_image_series_buffer_shape(
+            chunk_shape=chunk_shape,
+            sample_shape=self._image_shape,
+            series_shape=self._get_maxshape(),
+            dtype=self._dtype,
+            buffer_gb=buffer_gb,
+        )
+        super().__init__(buffer_shape=buffer_shape, chunk_shape=chunk_shape)
+
+    def __next__(self):
+        try:
+            return super().__next__()
+        except StopIteration:
+            if self._decoder is not None:
+                self._decoder.release(self)
+            raise
+
+    def _get_source_fingerprint(self) -> str | None:
+        description = dict(files=[get_file_identity(path=file_path) for file_path in self._file_paths])
+        return hash_text(text=json.dumps(description))
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        file_paths = self._file_paths[selection[0]]
+        if self._decoder is not None:
+            images = self._decoder.read(file_paths=file_paths)
+        else:
+            images = [_read_image(file_path) for file_path in file_paths]
+
+        return np.stack(images)[(slice(None),) + tuple(selection[1:])]
+
+    def _get_dtype(self) -> np.dtype:
+        return self._dtype
+
+    def _get_maxshape(self) -> tuple[int, ...]:
+        return (len(self._file_paths),) + self._image_shape
+
+
 class ImageInterface(BaseDataInterface):
     """Interface for converting single or multiple images to NWB format."""
 
@@ -343,6 +501,9 @@ class ImageInterface(BaseDataInterface):
         self,
         nwbfile: NWBFile,
         metadata: DeepDict | None = None,
+        *,
+        max_workers: int = 1,
+        stack_images: bool = False,
     ) -> None:
         """
         Add the image data to an NWB file.
@@ -353,6 +514,16 @@ class ImageInterface(BaseDataInterface):
             The NWB file to add the images to
         metadata : dict, optional
             Metadata for the images
+        max_workers : int, default: 1
+            The number of threads decoding images ahead of the writer. Decoding is otherwise done one image at a
+            time, as each is written.
+        stack_images : bool, default: False
+            Write the images as stacks rather than one dataset per image: each group of images sharing a shape and
+            a data type becomes a table whose ``image`` column holds them along its first axis, chunked across
+            images, next to ``image_name`` and ``file_name`` columns naming each one. Folders of thousands of
+            small images are written far faster this way, and the file holds a few datasets instead of one
+            per image. The table is named after the container, suffixed with the image shape and data type
+            when the images do not all share one.
         """
 
         if metadata is None:
@@ -365,37 +536,120 @@ class ImageInterface(BaseDataInterface):
         name = container_metadata.get("name", self.metadata_key)
 
         description = container_metadata.get("description", "Images loaded through ImageInterface")
-
-        # Create Images container
-        images_container = Images(
-            name=name,
-            description=description,
-        )
-
-        # Process each image
         images_metadata_dict = container_metadata.get("images", {})
-        for file_path in self.file_paths:
-            # Create iterator for memory-efficient loading
-            iterator = SingleImageIterator(file_path)
-            # Validate mode and get image class
+
+        # Reading the header of each image is cheap next to decoding it, so every image is validated up front
+        decoder = None
+        if max_workers > 1 and not stack_images:
+            decoder = _ImageDecoder(file_paths=self.file_paths, max_workers=max_workers)
+        iterators = [SingleImageIterator(file_path, decoder=decoder) for file_path in self.file_paths]
+        for file_path, iterator in zip(self.file_paths, iterators):
             if iterator.image_mode not in self.IMAGE_MODE_TO_NWB_TYPE_MAP:
                 raise ValueError(f"Unsupported image mode: {iterator.image_mode} for image {file_path.name}")
 
-            # Build the Image
-            nwb_image_class = self.IMAGE_MODE_TO_NWB_TYPE_MAP[iterator.image_mode]
-            image_kwargs = dict(data=iterator)
-            image_metadata = images_metadata_dict.get(str(file_path), {})
-            image_kwargs.update(image_metadata)
-            # If name is not available use the file stem
-            image_kwargs["name"] = image_kwargs.get("name", Path(file_path).stem)
+        if stack_images:
+            image_containers = self._get_image_stacks(
+                name=name,
+                description=description,
+                iterators=iterators,
+                images_metadata_dict=images_metadata_dict,
+                max_workers=max_workers,
+            )
+        else:
+            images_container = Images(name=name, description=description)
+            for file_path, iterator in zip(self.file_paths, iterators):
+                # Build the Image
+                nwb_image_class = self.IMAGE_MODE_TO_NWB_TYPE_MAP[iterator.image_mode]
+                image_kwargs = dict(data=iterator)
+                image_metadata = images_metadata_dict.get(str(file_path), {})
+                image_kwargs.update(image_metadata)
+                # If name is not available use the file stem
+                image_kwargs["name"] = image_kwargs.get("name", Path(file_path).stem)
+
+                nwb_image = nwb_image_class(**image_kwargs)
+
+                # Add to images container
+                images_container.add_image(nwb_image)
+            image_containers = [images_container]
 
-            nwb_image = nwb_image_class(**image_kwargs)
+        # Add images container to nwb file
+        for image_container in image_containers:
+            if self.images_location == "acquisition":
+                nwbfile.add_acquisition(image_container)
+            else:
+                nwbfile.add_stimulus(image_container)
 
-            # Add to images container
-            images_container.add_image(nwb_image)
+    def _get_image_stacks(
+        self,
+        name: str,
+        description: str,
+        iterators: list[SingleImageIterator],
+        images_metadata_dict: dict,
+        max_workers: int,
+    ) -> list[DynamicTable]:
+        """Group the images by shape and data type, and build a table stacking the images of each group."""
+        file_paths_by_group: dict[tuple, list[Path]] = dict()
+        for file_path, iterator in zip(self.file_paths, iterators):
+            group = (iterator.recommended_data_shape(), iterator.dtype)
+            file_paths_by_group.setdefault(group, []).append(file_path)
+
+        # The stacks are written one after the other, so that is the order to decode the images in
+        decoder = None
+        if max_workers > 1:
+            file_paths_in_write_order = [path for file_paths in file_paths_by_group.values() for path in file_paths]
+            decoder = _ImageDecoder(file_paths=file_paths_in_write_order, max_workers=max_workers)
+
+        tables = list()
+        for (image_shape, dtype), file_paths in file_paths_by_group.items():
+            table_name = name
+            if len(file_paths_by_group) > 1:
+                table_name = f"{name}_{'x'.join(str(length) for length in image_shape)}_{dtype}"
+
+            image_metadata = [images_metadata_dict.get(str(file_path), {}) for file_path in file_paths]
+            columns = [
+                VectorData(
+                    name="image_name",
+                    description="The name of each image.",
+                    data=[
+                        metadata.get("name", file_path.stem) for metadata, file_path in zip(image_metadata, file_paths)
+                    ],
+                ),
+                VectorData(
+                    name="file_name",
+                    description="The name of the file each image was read from.",
+                    data=[file_path.name for file_path in file_paths],
+                ),
+            ]
+            if any("description" in metadata for metadata in image_metadata):
+                columns.append(
+                    VectorData(
+                        name="description",
+                        description="The description of each image.",
+                        data=[metadata.get("description", "") for metadata in image_metadata],
+                    )
+                )
+            if any("resolution" in metadata for metadata in image_metadata):
+                columns.append(
+                    VectorData(
+                        name="resolution",
+                        description="Pixel resolution of each image, in pixels per cm; NaN where not stated.",
+                        data=[float(metadata.get("resolution", np.nan)) for metadata in image_metadata],
+                    )
+                )
+            columns.append(
+                VectorData(
+                    name="image",
+                    description=(
+                        "The images, stacked along the first axis: (image, height, width) for grayscale images and "
+                        "(image, height, width, channel) for RGB and RGBA images."
+                    ),
+                    data=_StackedImagesIterator(
+                        file_paths=file_paths, image_shape=image_shape, dtype=dtype, decoder=decoder
+                    ),
+                )
+            )
+            tables.append(
+                DynamicTable(name=table_name, description=description, columns=columns, id=list(range(len(file_paths))))
+            )
 
-        # Add images container to nwb file
-        if self.images_location == "acquisition":
-            nwbfile.add_acquisition(images_container)
-        else:
-            nwbfile.add_stimulus(images_container)
+        return tables
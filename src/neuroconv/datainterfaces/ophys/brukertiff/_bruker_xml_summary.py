@@ -0,0 +1,286 @@
+"""Read the Bruker PrairieView configuration XML once per folder, in one streaming pass, into a compact summary."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from xml.etree import ElementTree
+
+import numpy as np
+
+from ....tools._dataset_fingerprint import get_file_identity
+
+# A converter reads one folder through many interfaces; a process converting many sessions keeps only the last few
+_MAXIMUM_CACHED_SUMMARIES = 4
+
+_cached_summaries: OrderedDict[tuple, "_BrukerXmlSummary"] = OrderedDict()
+_cache_lock = threading.Lock()
+
+# As ``BrukerTiffImagingExtractor`` reads the type of the first ``<Sequence>``
+_IS_SERIES_TYPE_VOLUMETRIC = {
+    "TSeries ZSeries Element": True,  # XYZT
+    "TSeries Timed Element": False,  # XYT
+    "ZSeries": True,  # ZT (not a time series)
+    "Single": False,  # Single image (not a time series)
+    "BrightnessOverTime": False,  # XYT (not a volumetric series)
+    "TSeries Brightness Over Time Element": False,  # XYT
+}
+
+
+@dataclass(frozen=True)
+class _BrukerXmlSummary:
+    """
+    What the Bruker interfaces read from the configuration XML, without its tree.
+
+    A long T-series XML is hundreds of megabytes, and parsed into a tree it takes gigabytes. The summary keeps one
+    value per ``<Frame>`` and per ``<File>`` in NumPy arrays, in document order, and the handful of acquisition-wide
+    values the interfaces write as metadata.
+
+    ``frame_z_positions`` holds the ``ZAxis`` readings of each frame's ``positionCurrent``, one column per z device,
+    padded with NaN; a frame that records no z position is a row of NaN. ``file_frame_indices`` is the position of
+    the frame that lists each file, so the files of frame ``k`` are those where it equals ``k``.
+    """
+
+    xml_file_path: Path
+    attributes: dict[str, str]
+    system_identity: dict[str, str]
+    channel_names: list[str]
+    sequence_types: list[str]
+    default_positions: dict[str, tuple[float, ...]]
+    z_device_index: int | None
+    frame_sequence_indices: np.ndarray
+    frame_relative_times: np.ndarray
+    frame_absolute_times: np.ndarray
+    frame_z_positions: np.ndarray
+    file_frame_indices: np.ndarray
+    file_channels: np.ndarray
+    file_channel_names: list[str]
+    file_names: list[str]
+    file_pages: np.ndarray
+
+    @property
+    def num_frames(self) -> int:
+        return len(self.frame_sequence_indices)
+
+    @property
+    def is_volumetric(self) -> bool:
+        """Whether the recording is volumetric, from the type of the first ``<Sequence>``."""
+        if not self.sequence_types:
+            raise ValueError(f"No <Sequence> elements found in '{self.xml_file_path}'.")
+        series_type = self.sequence_types[0]
+        if series_type not in _IS_SERIES_TYPE_VOLUMETRIC:
+            raise ValueError(
+                f"Unknown series type: {series_type}, please raise an issue in the roiextractor repository"
+            )
+
+        return _IS_SERIES_TYPE_VOLUMETRIC[series_type]
+
+    @property
+    def num_planes(self) -> int:
+        """The number of depth planes: a volumetric recording stores each volume as one ``<Sequence>`` of planes."""
+        if not self.is_volumetric:
+            return 1
+
+        return int(np.count_nonzero(self.frame_sequence_indices == 0))
+
+    def get_frame_z_positions(self, frame_index: int) -> list[float] | None:
+        """The ``ZAxis`` readings of one frame, or None when the frame records no z position."""
+        z_positions = self.frame_z_positions[frame_index]
+        if np.all(np.isnan(z_positions)):
+            return None
+
+        return z_positions[~np.isnan(z_positions)].tolist()
+
+    def find_first_frame(self, *, file_name_part: str | None = None, channel_name: str | None = None) -> int | None:
+        """The first frame listing a file of the given channel, or whose file name contains the given text."""
+        for file_index, file_name in enumerate(self.file_names):
+            if channel_name is not None and self.file_channel_names[file_index] == channel_name:
+                return int(self.file_frame_indices[file_index])
+            if file_name_part is not None and file_name_part in file_name:
+                return int(self.file_frame_indices[file_index])
+
+        return None
+
+    def get_plane_depths(self) -> list[float]:
+        """
+        Return the ordered, unique focal depths (micrometers) of the acquisition's z-planes.
+
+        The active z device is read from ``zDevice`` (a piezo stage, an electrically tunable lens, etc.); its
+        ``positionCurrent`` is collected across frames and the distinct depths are returned in acquisition order,
+        matching ``select_plane``'s plane ordering. When ``zDevice`` is absent, falls back to the z sub-device whose
+        value moves away from the reference.
+        """
+        default_z_values = list(self.default_positions.get("ZAxis", ()))
+
+        ordered_depths: list[float] = []
+        for frame_index in range(self.num_frames):
+            z_values = self.get_frame_z_positions(frame_index=frame_index)
+            if z_values is None:
+                continue
+            if self.z_device_index is not None and self.z_device_index < len(z_values):
+                depth = z_values[self.z_device_index]
+            else:
+                moving = [
+                    z
+                    for index, z in enumerate(z_values)
+                    if index >= len(default_z_values) or default_z_values[index] != z
+                ]
+                if not moving:
+                    continue
+                depth = moving[0]
+            if depth not in ordered_depths:
+                ordered_depths.append(depth)
+
+        return ordered_depths
+
+
+def _read_sub_indexed_values(element: ElementTree.Element) -> dict[str, tuple[float, ...]]:
+    """The values of a ``PVStateValue`` such as ``positionCurrent``, by the index of each ``SubindexedValues``."""
+    return {
+        sub_indexed_values.attrib["index"]: tuple(float(value.attrib["value"]) for value in sub_indexed_values)
+        for sub_indexed_values in element.findall("SubindexedValues")
+    }
+
+
+def _parse_bruker_xml(xml_file_path: Path) -> _BrukerXmlSummary:
+    """
+    Summarize the configuration XML in one ``iterparse`` pass.
+
+    Each ``<Frame>`` is read when it closes and then cleared, and each ``<Sequence>`` is cleared when it closes, so
+    memory holds a single frame of the tree at a time rather than the whole document.
+    """
+    attributes = dict()
+    system_identity = dict()
+    channel_number_to_name = dict()
+    sequence_types = list()
+    default_positions = None
+    z_device_index = None
+
+    frame_sequence_indices = list()
+    frame_relative_times = list()
+    frame_absolute_times = list()
+    frame_z_positions = list()
+    file_frame_indices = list()
+    file_channels = list()
+    file_channel_names = list()
+    file_names = list()
+    file_pages = list()
+
+    # Only closing tags: every element is complete by then, and a frame belongs to the sequence after those closed
+    for _, element in ElementTree.iterparse(xml_file_path, events=("end",)):
+        tag = element.tag
+        if tag == "PVStateValue":
+            # The first in document order, as ``find(".//PVStateValue[@key=...]")`` on the tree returns: the
+            # acquisition-wide state that opens the file, ahead of every frame
+            key = element.attrib.get("key")
+            if key == "positionCurrent" and default_positions is None:
+                default_positions = _read_sub_indexed_values(element=element)
+            elif key == "zDevice" and z_device_index is None and "value" in element.attrib:
+                z_device_index = int(element.attrib["value"])
+        elif tag == "SystemIDs":
+            if "SystemID" in element.attrib:
+                system_identity["system_id"] = element.attrib["SystemID"]
+            system_id_element = element.find("SystemID")
+            if system_id_element is not None:
+                if "SystemID" in system_id_element.attrib:
+                    system_identity["system_number"] = system_id_element.attrib["SystemID"]
+                description = system_id_element.attrib.get("Description", "")
+                if description:
+                    system_identity["system_description"] = description
+        elif tag == "Frame":
+            frame_index = len(frame_sequence_indices)
+            frame_sequence_indices.append(len(sequence_types))
+            frame_relative_times.append(float(element.attrib.get("relativeTime", "nan")))
+            frame_absolute_times.append(float(element.attrib.get("absoluteTime", "nan")))
+
+            z_values = ()
+            position_element = element.find(".//PVStateValue[@key='positionCurrent']")
+            if position_element is not None:
+                z_values = _read_sub_indexed_values(element=position_element).get("ZAxis", ())
+            frame_z_positions.append(z_values)
+
+            for file_element in element.findall("File"):
+                channel = int(file_element.attrib["channel"])
+                channel_name = file_element.attrib["channelName"]
+                channel_number_to_name[channel] = channel_name
+                file_frame_indices.append(frame_index)
+                file_channels.append(channel)
+                file_channel_names.append(channel_name)
+                file_names.append(file_element.attrib["filename"])
+                file_pages.append(int(file_element.attrib.get("page", "1")))
+
+            element.clear()
+        elif tag == "Sequence":
+            sequence_types.append(element.attrib.get("type"))
+            element.clear()
+        elif tag == "PVScan":
+            attributes = dict(element.attrib)
+
+    maximum_z_devices = max((len(z_values) for z_values in frame_z_positions), default=0)
+    frame_z_position_array = np.full((len(frame_z_positions), maximum_z_devices), np.nan, dtype="float64")
+    for frame_index, z_values in enumerate(frame_z_positions):
+        frame_z_position_array[frame_index, : len(z_values)] = z_values
+
+    arrays = dict(
+        frame_sequence_indices=np.asarray(frame_sequence_indices, dtype="int64"),
+        frame_relative_times=np.asarray(frame_relative_times, dtype="float64"),
+        frame_absolute_times=np.asarray(frame_absolute_times, dtype="float64"),
+        frame_z_positions=frame_z_position_array,
+        file_frame_indices=np.asarray(file_frame_indices, dtype="int64"),
+        file_channels=np.asarray(file_channels, dtype="int64"),
+        file_pages=np.asarray(file_pages, dtype="int64"),
+    )
+    # Shared by every interface reading the folder
+    for array in arrays.values():
+        array.flags.writeable = False
+
+    return _BrukerXmlSummary(
+        xml_file_path=xml_file_path,
+        attributes=attributes,
+        system_identity=system_identity,
+        channel_names=[channel_number_to_name[number] for number in sorted(channel_number_to_name)],
+        sequence_types=sequence_types,
+        default_positions=default_positions or dict(),
+        z_device_index=z_device_index,
+        file_channel_names=file_channel_names,
+        file_names=file_names,
+        **arrays,
+    )
+
+
+def get_bruker_xml_summary(folder_path: str | Path) -> _BrukerXmlSummary:
+    """
+    Summarize the configuration XML of a Bruker folder, parsing it once for every interface and converter reading it.
+
+    The summary is cached by the path, size and modification time of the XML, so an XML rewritten in the meantime is
+    parsed again. Treat it as read-only: it is shared by every caller.
+
+    Parameters
+    ----------
+    folder_path : str or Path
+        Folder containing Bruker .ome.tif files and the matching configuration .xml, named after the folder.
+
+    Returns
+    -------
+    _BrukerXmlSummary
+    """
+    folder_path = Path(folder_path)
+    xml_file_path = folder_path / f"{folder_path.name}.xml"
+    if not xml_file_path.is_file():
+        raise FileNotFoundError(f"Bruker XML configuration file not found at '{xml_file_path}'.")
+
+    key = tuple(get_file_identity(path=xml_file_path))
+    with _cache_lock:
+        if key in _cached_summaries:
+            _cached_summaries.move_to_end(key)
+            return _cached_summaries[key]
+
+    # Parsed outside the lock, so that different folders are parsed at the same time
+    summary = _parse_bruker_xml(xml_file_path=xml_file_path)
+
+    with _cache_lock:
+        _cached_summaries[key] = summary
+        while len(_cached_summaries) > _MAXIMUM_CACHED_SUMMARIES:
+            _cached_summaries.popitem(last=False)
+
+    return summary
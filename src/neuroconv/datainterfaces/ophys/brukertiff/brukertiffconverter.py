@@ -4,6 +4,7 @@ from typing import Literal
 from pydantic import DirectoryPath, validate_call
 from pynwb import NWBFile
 
+from ._bruker_xml_summary import get_bruker_xml_summary
 from ... import (
     BrukerTiffImagingInterface,
     BrukerTiffMultiPlaneImagingInterface,
@@ -61,13 +62,11 @@ class BrukerTiffConverter(ConverterPipe):
             Has no effect on single-plane (planar) acquisitions.
         verbose : bool, default: False
         """
-        channel_names = BrukerTiffImagingInterface.get_available_channels(folder_path=folder_path)
+        # Channels and plane count are folder-level, and read from the XML summary the interfaces share
+        xml_summary = get_bruker_xml_summary(folder_path=folder_path)
+        channel_names = xml_summary.channel_names
         single_channel = len(channel_names) == 1
-
-        # Plane count is folder-level; probe once with the full (unsliced) extractor.
-        probe_channel = None if single_channel else channel_names[0]
-        probe = BrukerTiffImagingInterface(folder_path=folder_path, channel_name=probe_channel, verbose=verbose)
-        num_planes = probe._bruker_extractor.get_num_planes() if probe.imaging_extractor.is_volumetric else 1
+        num_planes = xml_summary.num_planes
         disjoint = plane_separation_type == "disjoint" and num_planes > 1
 
         data_interfaces: dict[str, BrukerTiffImagingInterface] = {}
@@ -170,10 +169,23 @@ class BrukerTiffMultiPlaneConverter(BaseDataInterface):
                             stream_name=plane_stream,
                         )
 
-    def get_metadata(self) -> DeepDict:
+    def get_metadata(self, *, max_workers: int = 1) -> DeepDict:
+        """
+        Get the metadata of every plane or channel interface, merged.
+
+        Parameters
+        ----------
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. See `NWBConverter.get_metadata`.
+
+        Returns
+        -------
+        DeepDict
+            The metadata of every interface, merged.
+        """
         metadata = DeepDict()
-        for interface in self.data_interface_objects.values():
-            interface_metadata = interface.get_metadata()
+        interfaces_metadata = self._gather_interface_metadata(use_new_metadata_format=None, max_workers=max_workers)
+        for interface_metadata in interfaces_metadata.values():
             metadata = dict_deep_update(metadata, interface_metadata)
         return metadata
 
@@ -268,10 +280,23 @@ class BrukerTiffSinglePlaneConverter(BaseDataInterface):
                     stream_name=channel_stream_name,
                 )
 
-    def get_metadata(self) -> DeepDict:
+    def get_metadata(self, *, max_workers: int = 1) -> DeepDict:
+        """
+        Get the metadata of every plane or channel interface, merged.
+
+        Parameters
+        ----------
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. See `NWBConverter.get_metadata`.
+
+        Returns
+        -------
+        DeepDict
+            The metadata of every interface, merged.
+        """
         metadata = DeepDict()
-        for interface in self.data_interface_objects.values():
-            interface_metadata = interface.get_metadata()
+        interfaces_metadata = self._gather_interface_metadata(use_new_metadata_format=None, max_workers=max_workers)
+        for interface_metadata in interfaces_metadata.values():
             metadata = dict_deep_update(metadata, interface_metadata)
         return metadata
 
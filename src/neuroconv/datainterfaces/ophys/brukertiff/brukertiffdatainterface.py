@@ -1,10 +1,10 @@
 import warnings
-from pathlib import Path
 from typing import Literal
 
 from dateutil.parser import parse as dateparse
 from pydantic import DirectoryPath, validate_call
 
+from ._bruker_xml_summary import get_bruker_xml_summary
 from ..baseimagingextractorinterface import BaseImagingExtractorInterface
 from ....utils import DeepDict
 
@@ -51,7 +51,8 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         attribute of each ``<File>`` element), which is authoritative and present for every
         PrairieView version. This mirrors ``BrukerTiffImagingExtractor`` and avoids the OME-XML
         path, which fails on PrairieView 5.8+ ``BinaryOnly`` packaging where the ``.ome.tif``
-        files carry no ``<Pixels>`` block.
+        files carry no ``<Pixels>`` block. The XML is read in one streaming pass, shared with
+        the interfaces built over the same folder.
 
         Parameters
         ----------
@@ -63,18 +64,7 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         list[str]
             Channel labels in acquisition order (e.g. ``["Ch1", "Ch2"]``).
         """
-        from xml.etree import ElementTree
-
-        folder_path = Path(folder_path)
-        xml_file_path = folder_path / f"{folder_path.name}.xml"
-        if not xml_file_path.is_file():
-            raise FileNotFoundError(f"Bruker XML configuration file not found at '{xml_file_path}'.")
-
-        xml_root = ElementTree.parse(xml_file_path).getroot()
-        channel_number_to_name = {
-            int(elem.attrib["channel"]): elem.attrib["channelName"] for elem in xml_root.iter("File")
-        }
-        return [channel_number_to_name[number] for number in sorted(channel_number_to_name)]
+        return list(get_bruker_xml_summary(folder_path=folder_path).channel_names)
 
     @validate_call
     def __init__(
@@ -140,6 +130,11 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         """
         return self._full_imaging_extractor
 
+    @property
+    def _xml_summary(self):
+        """The summary of the Bruker configuration XML, shared by every interface over this folder."""
+        return get_bruker_xml_summary(folder_path=self.source_data["folder_path"])
+
     def _read_system_identity(self) -> dict[str, str]:
         """Read the acquisition system's identity from the ``SystemIDs`` element of the Bruker ``.xml``.
 
@@ -148,29 +143,13 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         free-text site label. Both identify the microscope rather than the acquisition, and they do
         distinguish rigs (our own fixtures carry 4886, 4842 and 4503).
 
-        Read from the XML tree here rather than from the extractor's parsed metadata, which collects
+        Read from the XML summary here rather than from the extractor's parsed metadata, which collects
         only the root attributes and the ``PVStateValue`` elements, so this element never reaches it.
         Returns an empty dict for files written before the element existed.
         """
         # TODO: move this parsing into roiextractors' `_parse_bruker_xml_metadata`, which should expose
         # `system_id`, `system_number` and `system_description`, and reduce this method to reading them.
-        system_ids_element = self._bruker_extractor._xml_root.find("SystemIDs")
-        if system_ids_element is None:
-            return {}
-
-        system_identity = {}
-        if "SystemID" in system_ids_element.attrib:
-            system_identity["system_id"] = system_ids_element.attrib["SystemID"]
-
-        system_id_element = system_ids_element.find("SystemID")
-        if system_id_element is not None:
-            if "SystemID" in system_id_element.attrib:
-                system_identity["system_number"] = system_id_element.attrib["SystemID"]
-            description = system_id_element.attrib.get("Description", "")
-            if description:
-                system_identity["system_description"] = description
-
-        return system_identity
+        return dict(self._xml_summary.system_identity)
 
     def get_metadata(self) -> DeepDict:
         """Return metadata in the new dict-based format only.
@@ -283,7 +262,7 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         grid_spacing: tuple[float, ...] = (y_size_meters, x_size_meters)
         field_of_view: tuple[float, ...] = (y_size_meters * frame_shape[1], x_size_meters * frame_shape[0])
         if is_volumetric:
-            depths = self._determine_plane_depths(xml_root=self._bruker_extractor._xml_root)
+            depths = self._xml_summary.get_plane_depths()
             if len(depths) >= 2:
                 # grid_spacing z is the inter-plane step; field_of_view z is the total depth extent.
                 step_meters = abs(depths[1] - depths[0]) / 1e6
@@ -299,22 +278,16 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
         When this interface is pinned to a single depth plane (``plane_index`` is set), the z value
         is that plane's own focal position, so each disjoint ``ImagingPlane`` gets its true depth.
         """
-        xml_root = self._bruker_extractor._xml_root
-        default_position_element = xml_root.find(".//PVStateValue[@key='positionCurrent']")
-        if default_position_element is None:
+        default_positions = self._xml_summary.default_positions
+        if not default_positions:
             return [0.0, 0.0]
 
         position_values: list[float] = []
         for axis in ["YAxis", "XAxis"]:
-            sub_indexed_values = default_position_element.find(f"./SubindexedValues[@index='{axis}']")
-            if sub_indexed_values is None:
-                position_values.append(0.0)
-                continue
-            for sub_indexed_value in sub_indexed_values:
-                position_values.append(float(sub_indexed_value.attrib["value"]))
+            position_values.extend(default_positions.get(axis, (0.0,)))
 
         if self.plane_index is not None:
-            depths = self._determine_plane_depths(xml_root=xml_root)
+            depths = self._xml_summary.get_plane_depths()
             if self.plane_index < len(depths):
                 position_values.append(depths[self.plane_index])
             return position_values
@@ -323,49 +296,11 @@ class BrukerTiffImagingInterface(BaseImagingExtractorInterface):
             return position_values
 
         # Volumetric (contiguous): the imaging plane's origin z is the first plane's focal depth.
-        depths = self._determine_plane_depths(xml_root=xml_root)
+        depths = self._xml_summary.get_plane_depths()
         if depths:
             position_values.append(depths[0])
         return position_values
 
-    def _determine_plane_depths(self, xml_root) -> list[float]:
-        """Return the ordered, unique focal depths (micrometers) of the acquisition's z-planes.
-
-        The active z device is read from ``zDevice`` (a piezo stage, an electrically tunable lens,
-        etc.); its ``positionCurrent`` is collected across frames and the distinct depths are
-        returned in acquisition order, matching ``select_plane``'s plane ordering. When ``zDevice``
-        is absent, falls back to the z sub-device whose value moves away from the reference.
-        """
-        z_device_element = xml_root.find(".//PVStateValue[@key='zDevice']")
-        z_device_index = int(z_device_element.attrib["value"]) if z_device_element is not None else None
-
-        default_z_element = xml_root.find(".//PVStateValue[@key='positionCurrent']/SubindexedValues[@index='ZAxis']")
-        default_z_values = (
-            [float(v.attrib["value"]) for v in default_z_element] if default_z_element is not None else []
-        )
-
-        ordered_depths: list[float] = []
-        for frame in xml_root.findall(".//Frame"):
-            z_values_element = frame.find(".//PVStateValue[@key='positionCurrent']/SubindexedValues[@index='ZAxis']")
-            if z_values_element is None:
-                continue
-            z_values = [float(v.attrib["value"]) for v in z_values_element]
-            if z_device_index is not None and z_device_index < len(z_values):
-                depth = z_values[z_device_index]
-            else:
-                moving = [
-                    z
-                    for index, z in enumerate(z_values)
-                    if index >= len(default_z_values) or default_z_values[index] != z
-                ]
-                if not moving:
-                    continue
-                depth = moving[0]
-            if depth not in ordered_depths:
-                ordered_depths.append(depth)
-
-        return ordered_depths
-
 
 # ---------------------------------------------------------------------------
 # Deprecated interfaces. Will be removed on or after February 2027.
@@ -504,44 +439,23 @@ class BrukerTiffMultiPlaneImagingInterface(BaseImagingExtractorInterface):
         """
         Returns y, x, and z position values. The unit of values is in the microscope reference frame.
         """
-        from roiextractors.extractors.tiffimagingextractors.brukertiffimagingextractor import (
-            _parse_xml,
-        )
-
         streams = self.get_streams(folder_path=self.folder_path)
         channel_stream_name = streams["channel_streams"][0]
         plane_streams_per_channel = streams["plane_streams"][channel_stream_name]
 
         # general positionCurrent
+        xml_summary = get_bruker_xml_summary(folder_path=self.folder_path)
         position_values = []
-        xml_root_element = _parse_xml(folder_path=self.folder_path)
-        default_position_element = xml_root_element.find(".//PVStateValue[@key='positionCurrent']")
-
         for index_value in ["YAxis", "XAxis"]:
-            position_sub_indexed_values = default_position_element.find(f"./SubindexedValues[@index='{index_value}']")
-            for position_sub_indexed_value in position_sub_indexed_values:
-                position_values.append(float(position_sub_indexed_value.attrib["value"]))
+            position_values.extend(xml_summary.default_positions[index_value])
 
+        z_positions = xml_summary.default_positions["ZAxis"]
         z_plane_values = []
         for plane_stream in plane_streams_per_channel:
-            frames_per_stream = [
-                frame
-                for frame in xml_root_element.findall(".//Frame")
-                for file in frame.findall("File")
-                if plane_stream in file.attrib["filename"]
-            ]
-
             # The frames for each plane will have the same positionCurrent values
-            position_element = frames_per_stream[0].find(".//PVStateValue[@key='positionCurrent']")
-            default_z_position_values = default_position_element.find("./SubindexedValues[@index='ZAxis']")
-            z_positions = []
-            for z_sub_indexed_value in default_z_position_values:
-                z_value = float(z_sub_indexed_value.attrib["value"])
-                z_positions.append(z_value)
-
-            z_position_values = position_element.find("./SubindexedValues[@index='ZAxis']")
-            for z_device_ind, z_position_value in enumerate(z_position_values):
-                z_value = float(z_position_value.attrib["value"])
+            frame_index = xml_summary.find_first_frame(file_name_part=plane_stream)
+            z_position_values = xml_summary.get_frame_z_positions(frame_index=frame_index)
+            for z_device_ind, z_value in enumerate(z_position_values):
                 # find the changing z position value
                 if z_positions[z_device_ind] != z_value:
                     z_plane_values.append(z_value)
@@ -736,48 +650,29 @@ class BrukerTiffSinglePlaneImagingInterface(BaseImagingExtractorInterface):
         Returns y, x, and z position values. The unit of values is in the microscope reference frame.
         """
         stream_name = self.imaging_extractor.stream_name
-        frames_per_stream = [
-            frame
-            for frame in self.imaging_extractor._xml_root.findall(".//Frame")
-            for file in frame.findall("File")
-            if stream_name == file.attrib["channelName"]
-        ]
+        xml_summary = get_bruker_xml_summary(folder_path=self.folder_path)
+        frame_index = xml_summary.find_first_frame(channel_name=stream_name)
 
-        if len(frames_per_stream) == 0:
+        if frame_index is None:
             # If no frames, fall back to the old logic which matches by file name
             # At the moment this is used because the stream name is not only for channels
             # But also for planes in the case of multi-plane imaging with disjoint planes
             # For this case, the stream name for the plane is made-up from the file name
             # And we need to match the stream (e.g.  "Ch2_000001") to the file name instead.
-            frames_per_stream = [
-                frame
-                for frame in self.imaging_extractor._xml_root.findall(".//Frame")
-                for file in frame.findall("File")
-                if stream_name in file.attrib["filename"]
-            ]
+            frame_index = xml_summary.find_first_frame(file_name_part=stream_name)
 
         # general positionCurrent
         position_values = []
-        default_position_element = self.imaging_extractor._xml_root.find(".//PVStateValue[@key='positionCurrent']")
-
         for index_value in ["YAxis", "XAxis"]:
-            position_sub_indexed_values = default_position_element.find(f"./SubindexedValues[@index='{index_value}']")
-            for position_sub_indexed_value in position_sub_indexed_values:
-                position_values.append(float(position_sub_indexed_value.attrib["value"]))
+            position_values.extend(xml_summary.default_positions[index_value])
 
         # The frames for each plane will have the same positionCurrent values
-        position_element = frames_per_stream[0].find(".//PVStateValue[@key='positionCurrent']")
-        if position_element is None:
+        z_position_values = xml_summary.get_frame_z_positions(frame_index=frame_index)
+        if z_position_values is None:
             return position_values
 
-        default_z_position_values = default_position_element.find("./SubindexedValues[@index='ZAxis']")
-        z_positions = []
-        for z_sub_indexed_value in default_z_position_values:
-            z_positions.append(float(z_sub_indexed_value.attrib["value"]))
-
-        z_position_values = position_element.find("./SubindexedValues[@index='ZAxis']")
-        for z_device_ind, z_position_value in enumerate(z_position_values):
-            z_value = float(z_position_value.attrib["value"])
+        z_positions = xml_summary.default_positions["ZAxis"]
+        for z_device_ind, z_value in enumerate(z_position_values):
             # find the changing z position value
             if z_positions[z_device_ind] != z_value:
                 position_values.append(z_value)
@@ -9,14 +9,31 @@ V3 Miniscope support (``settings_and_notes.dat``, ``timestamp.dat``) is not
 covered here; the current neuroconv test fixtures are V4-only.
 """
 
+import itertools
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 
 from ....tools import get_package
+from ....tools._dataset_fingerprint import get_file_identity
+from ....tools._table_cache import read_csv_columns
+
+# The videos of a session are opened, and decoded, this many at a time; each is a file of its own, and OpenCV
+# releases the GIL while it reads one
+_MAXIMUM_CONCURRENT_VIDEOS = 4
+
+# Enough for the device folders of a few sessions, while a process converting many sessions does not keep them all
+_MAXIMUM_CACHED_FOLDERS = 16
+
+_cached_video_indices: OrderedDict[tuple, "_MiniscopeVideoIndex"] = OrderedDict()
+_cached_fused_timestamps: OrderedDict[tuple, np.ndarray] = OrderedDict()
+_cache_lock = threading.Lock()
 
 
 def _raise_if_miniscope_v3_format(folder_path: str) -> None:
@@ -163,6 +180,21 @@ def _get_recording_start_times(folder_path: str) -> list[datetime]:
     return get_recording_start_times_for_multi_recordings(folder_path=folder_path)
 
 
+def _get_from_cache(cache: OrderedDict, key: tuple):
+    with _cache_lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def _add_to_cache(cache: OrderedDict, key: tuple, value) -> None:
+    with _cache_lock:
+        cache[key] = value
+        while len(cache) > _MAXIMUM_CACHED_FOLDERS:
+            cache.popitem(last=False)
+
+
 def _get_fused_timestamps(folder_path: str, file_pattern: str) -> np.ndarray:
     """Concatenate ``timeStamps.csv`` rows across subfolders into one array.
 
@@ -170,19 +202,29 @@ def _get_fused_timestamps(folder_path: str, file_pattern: str) -> np.ndarray:
     ``recording_start_times[i] - recording_start_times[0]``, producing a
     continuous timeline across back-to-back recordings.
 
-    ``file_pattern`` is matched with ``rglob`` under ``folder_path``.
+    ``file_pattern`` is matched with ``rglob`` under ``folder_path``. The result is cached by the
+    identity of the timestamp and configuration files, so the interfaces of a converter read them once.
     """
     natsort = get_package(package_name="natsort", installation_instructions="pip install natsort")
 
     timestamps_file_paths = natsort.natsorted(list(Path(folder_path).rglob(file_pattern)))
     assert timestamps_file_paths, f"The Miniscope timestamps are missing from '{folder_path}'."
 
+    configuration_file_paths = sorted(Path(folder_path).glob("*/metaData.json"))
+    key = (
+        file_pattern,
+        tuple(tuple(get_file_identity(path=file_path)) for file_path in timestamps_file_paths),
+        tuple(tuple(get_file_identity(path=file_path)) for file_path in configuration_file_paths),
+    )
+    fused_timestamps = _get_from_cache(cache=_cached_fused_timestamps, key=key)
+    if fused_timestamps is not None:
+        return fused_timestamps.copy()
+
     recording_start_times = _get_recording_start_times(folder_path=folder_path)
 
     timestamps = []
     for file_index, file_path in enumerate(timestamps_file_paths):
-        timestamps_per_file = pd.read_csv(file_path)["Time Stamp (ms)"].values.astype(float)
-        timestamps_per_file /= 1000
+        timestamps_per_file = read_csv_columns(file_path, usecols=["Time Stamp (ms)"])["Time Stamp (ms)"] / 1000
         if timestamps_per_file[0] < 0.0:
             timestamps_per_file += abs(timestamps_per_file[0])
 
@@ -192,7 +234,10 @@ def _get_fused_timestamps(folder_path: str, file_pattern: str) -> np.ndarray:
 
         timestamps.extend(timestamps_per_file)
 
-    return np.array(timestamps)
+    fused_timestamps = np.array(timestamps)
+    _add_to_cache(cache=_cached_fused_timestamps, key=key, value=fused_timestamps)
+
+    return fused_timestamps.copy()
 
 
 def _get_device_folder_timestamps(folder_path: str) -> np.ndarray:
@@ -205,7 +250,59 @@ def _get_device_folder_timestamps(folder_path: str) -> np.ndarray:
     timestamps_file_path = Path(folder_path) / "timeStamps.csv"
     assert timestamps_file_path.is_file(), f"The timestamps file is missing from '{folder_path}'."
 
-    return pd.read_csv(timestamps_file_path)["Time Stamp (ms)"].to_numpy(dtype=float) / 1000.0
+    return read_csv_columns(timestamps_file_path, usecols=["Time Stamp (ms)"])["Time Stamp (ms)"] / 1000.0
+
+
+@dataclass(frozen=True)
+class _MiniscopeVideoIndex:
+    """The videos of a Miniscope folder in recording order, and the number of frames each holds."""
+
+    video_file_paths: tuple[Path, ...]
+    frame_counts: tuple[int, ...]
+
+    @property
+    def starting_frames(self) -> list[int]:
+        """The index, in the series of all the videos, of the first frame of each."""
+        return [0, *itertools.accumulate(self.frame_counts)][:-1]
+
+    @property
+    def number_of_frames(self) -> int:
+        return sum(self.frame_counts)
+
+
+def _count_video_frames(video_file_path: Path) -> int:
+    cv2 = get_package(package_name="cv2", installation_instructions="pip install opencv-python-headless")
+
+    video_capture = cv2.VideoCapture(str(video_file_path))
+    try:
+        return int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        video_capture.release()
+
+
+def _get_video_index(folder_path: str, video_file_pattern: str) -> _MiniscopeVideoIndex:
+    """Index the ``.avi`` files matching ``video_file_pattern`` in ``folder_path``, opening each once.
+
+    A session is often hundreds of one-minute videos, whose headers are read a few at a time. The index
+    is cached by the path, size and modification time of the videos, so the imaging and behavior camera
+    interfaces of a converter, and the conversions run again in the same process, share it.
+    """
+    natsort = get_package(package_name="natsort", installation_instructions="pip install natsort")
+
+    video_file_paths = natsort.natsorted(list(Path(folder_path).glob(video_file_pattern)))
+    assert video_file_paths, f"Could not find the video files in '{folder_path}'."
+
+    key = tuple(tuple(get_file_identity(path=video_file_path)) for video_file_path in video_file_paths)
+    video_index = _get_from_cache(cache=_cached_video_indices, key=key)
+    if video_index is not None:
+        return video_index
+
+    with ThreadPoolExecutor(max_workers=min(_MAXIMUM_CONCURRENT_VIDEOS, len(video_file_paths))) as executor:
+        frame_counts = list(executor.map(_count_video_frames, video_file_paths))
+    video_index = _MiniscopeVideoIndex(video_file_paths=tuple(video_file_paths), frame_counts=tuple(frame_counts))
+    _add_to_cache(cache=_cached_video_indices, key=key, value=video_index)
+
+    return video_index
 
 
 def _get_starting_frames(folder_path: str, video_file_pattern: str) -> list[int]:
@@ -215,16 +312,4 @@ def _get_starting_frames(folder_path: str, video_file_pattern: str) -> list[int]
     counts of all preceding files, so the list can be passed as
     ``starting_frame`` to an NWB ``ImageSeries`` with external files.
     """
-    cv2 = get_package(package_name="cv2", installation_instructions="pip install opencv-python-headless")
-    natsort = get_package(package_name="natsort", installation_instructions="pip install natsort")
-
-    behavior_video_file_paths = natsort.natsorted(list(Path(folder_path).glob(video_file_pattern)))
-    assert behavior_video_file_paths, f"Could not find the video files in '{folder_path}'."
-
-    starting_frames = [0]
-    for video_file_path in behavior_video_file_paths[:-1]:
-        video_capture = cv2.VideoCapture(str(video_file_path))
-        num_frames = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
-        starting_frames.append(starting_frames[-1] + num_frames)
-
-    return starting_frames
+    return _get_video_index(folder_path=folder_path, video_file_pattern=video_file_pattern).starting_frames
@@ -533,11 +533,24 @@ class MiniscopeConverter(ConverterPipe):
                 aligned_timestamps = ho_interface.get_timestamps() + time_offset
                 ho_interface.set_aligned_timestamps(aligned_timestamps)
 
-    def get_metadata(self) -> DeepDict:
+    def get_metadata(self, *, max_workers: int = 1) -> DeepDict:
+        """
+        Get the metadata of every recording and behavior camera, merged.
+
+        Parameters
+        ----------
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. See `NWBConverter.get_metadata`.
+
+        Returns
+        -------
+        DeepDict
+            The metadata of the whole conversion.
+        """
         if self._user_configuration_file_path is None:
-            return self._get_legacy_metadata()
+            return self._get_legacy_metadata(max_workers=max_workers)
 
-        metadata = self._get_ophys_metadata()
+        metadata = self._get_ophys_metadata(max_workers=max_workers)
         self._add_behavior_video_metadata(metadata=metadata)
         return metadata
 
@@ -589,7 +602,7 @@ class MiniscopeConverter(ConverterPipe):
             for interface_info in self._imaging_interfaces.values()
         }
 
-    def _get_ophys_metadata(self) -> DeepDict:
+    def _get_ophys_metadata(self, *, max_workers: int = 1) -> DeepDict:
         """Assemble the dict-based metadata of the User Config mode.
 
         One ``Devices`` entry and one ``Ophys.ImagingPlanes`` entry per Miniscope, shared by all of its
@@ -600,11 +613,9 @@ class MiniscopeConverter(ConverterPipe):
         )
 
         metadata = get_default_nwbfile_metadata()
-        for interface in self.data_interface_objects.values():
-            if isinstance(interface, MiniscopeImagingInterface):
-                interface_metadata = interface.get_metadata(use_new_metadata_format=True)
-            else:
-                interface_metadata = interface.get_metadata()
+        # Only the imaging interfaces take the argument; the other interfaces are asked without it
+        interfaces_metadata = self._gather_interface_metadata(use_new_metadata_format=True, max_workers=max_workers)
+        for interface_metadata in interfaces_metadata.values():
             # Entries are keyed, so a later interface sharing a key carries the same content and should
             # replace it. Appending would also dedupe a device's ``ROI``, and a square sensor's
             # ``[600, 600]`` would reach the file as ``[600]``.
@@ -714,14 +725,14 @@ class MiniscopeConverter(ConverterPipe):
                     f"differ across the recordings of this device: {varying_settings}."
                 )
 
-    def _get_legacy_metadata(self) -> DeepDict:
+    def _get_legacy_metadata(self, *, max_workers: int = 1) -> DeepDict:
         """Assemble the old list-based metadata of the deprecated folder-discovery mode."""
         from neuroconv.tools.roiextractors.roiextractors_pending_deprecation import (
             _get_default_ophys_metadata_old_metadata_list,
         )
 
         default_ophys_metadata = _get_default_ophys_metadata_old_metadata_list()
-        metadata = super().get_metadata()
+        metadata = super().get_metadata(max_workers=max_workers)
 
         # Use the minimum session start time if it was calculated during alignment
         metadata["NWBFile"]["session_start_time"] = self._converter_session_start_time
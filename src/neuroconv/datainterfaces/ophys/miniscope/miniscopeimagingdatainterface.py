@@ -8,6 +8,7 @@ from pydantic import DirectoryPath, validate_call
 from pynwb import NWBFile
 
 from ._miniscope_readers import (
+    _MAXIMUM_CONCURRENT_VIDEOS,
     _config_to_miniscope_device_metadata,
     _config_to_miniscope_device_model_metadata,
 )
@@ -561,9 +562,14 @@ class MiniscopeImagingInterface(BaseImagingExtractorInterface):
 
             add_miniscope_device(nwbfile=nwbfile, device_metadata=metadata["Ophys"]["Device"][0])
 
+        # A buffer of frames usually spans several of the one-minute videos, which are decoded at once
+        iterator_options = dict(max_read_workers=_MAXIMUM_CONCURRENT_VIDEOS)
+        iterator_options.update(kwargs.pop("iterator_options", None) or dict())
+
         super().add_to_nwbfile(
             nwbfile=nwbfile,
             metadata=metadata,
             photon_series_type=photon_series_type,
+            iterator_options=iterator_options,
             **kwargs,
         )
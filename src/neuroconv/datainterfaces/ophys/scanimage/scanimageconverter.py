@@ -84,21 +84,26 @@ class ScanImageConverter(ConverterPipe):
 
         super().__init__(data_interfaces=data_interfaces, verbose=verbose)
 
-    def get_metadata(self) -> DeepDict:
+    def get_metadata(self, *, max_workers: int = 1) -> DeepDict:
         """
         Get metadata for every channel of the acquisition.
 
+        Parameters
+        ----------
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. See `NWBConverter.get_metadata`.
+
         Returns
         -------
         DeepDict
             The metadata of every channel, merged.
         """
         metadata = get_default_nwbfile_metadata()
-        for interface in self.data_interface_objects.values():
+        interfaces_metadata = self._gather_interface_metadata(use_new_metadata_format=True, max_workers=max_workers)
+        for interface_metadata in interfaces_metadata.values():
             # The old list-based format addresses a photon series by its position in a list and so cannot
             # name one entry per channel unambiguously. This converter has only ever spoken the dict-based
             # format, so it states the argument rather than relying on the default.
-            interface_metadata = self._get_interface_metadata(interface=interface, use_new_metadata_format=True)
             # Entries are keyed per channel, so a list inside one of them describes that channel and is
             # not something to merge across interfaces. Appending would also dedupe the repeated values
             # of a symmetric field, and a square field of view's [x, x] would reach the file as [x].
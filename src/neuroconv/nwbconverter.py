@@ -1,29 +1,34 @@
 """Contains core class definitions for the NWBConverter and ConverterPipe."""
 
 import inspect
-import json
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Callable, Literal
 
-from jsonschema import validate
 from pydantic import FilePath, validate_call
 from pynwb import NWBFile
 
 from .basedatainterface import BaseDataInterface
 from .tools.nwb_helpers import (
     BACKEND_NWB_IO,
+    ConversionPlan,
     HDF5BackendConfiguration,
+    WriteProgressEvent,
     ZarrBackendConfiguration,
     configure_and_write_nwbfile,
     configure_backend,
     get_default_backend_configuration,
     get_default_nwbfile_metadata,
     make_nwbfile_from_metadata,
+    plan_nwbfile_write,
 )
+from .tools.nwb_helpers._memory_budget import use_memory_budget
 from .tools.nwb_helpers._metadata_and_file_helpers import (
     _fetch_backend_from_nwbfile_on_disk,
 )
+from .tools.nwb_helpers._write_progress import set_write_progress_destinations, use_write_progress_monitor
 from .utils import (
     dict_deep_update,
     fill_defaults,
@@ -37,10 +42,42 @@ from .utils.json_schema import (
     _metadata_uses_old_list_format,
     _NWBConversionOptionsEncoder,
     _NWBSourceDataEncoder,
+    _validate_instance,
     validate_metadata,
 )
 
 
+def _time_interface_metadata(
+    data_interface_objects: dict[str, BaseDataInterface],
+    *,
+    use_new_metadata_format: bool | None = True,
+    max_workers: int = 1,
+) -> tuple[dict[str, DeepDict], dict[str, float]]:
+    """
+    Ask each interface for its metadata on up to ``max_workers`` threads, timing each.
+
+    Shared by ``NWBConverter`` and the converters built on ``BaseDataInterface`` that hold interfaces of their own.
+    Both returned dictionaries are keyed by interface name, in the order of ``data_interface_objects``.
+    """
+
+    def get_interface_metadata(interface_name: str) -> tuple[DeepDict, float]:
+        start_time = time.perf_counter()
+        interface_metadata = NWBConverter._get_interface_metadata(
+            interface=data_interface_objects[interface_name], use_new_metadata_format=use_new_metadata_format
+        )
+        return interface_metadata, time.perf_counter() - start_time
+
+    if max_workers > 1 and len(data_interface_objects) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(get_interface_metadata, data_interface_objects))
+    else:
+        results = [get_interface_metadata(interface_name) for interface_name in data_interface_objects]
+
+    interfaces_metadata = {name: metadata for name, (metadata, _) in zip(data_interface_objects, results)}
+    latencies = {name: latency for name, (_, latency) in zip(data_interface_objects, results)}
+    return interfaces_metadata, latencies
+
+
 class NWBConverter:
     """Primary class for all NWB conversion classes."""
 
@@ -77,14 +114,9 @@ class NWBConverter:
         """Validate source_data against Converter source_schema."""
         cls._validate_source_data(source_data=source_data, verbose=verbose)
 
-    def _validate_source_data(self, source_data: dict[str, dict], verbose: bool = False):
-
-        # We do this to ensure that python objects are in string format for the JSON schema
-        encoder = _NWBSourceDataEncoder()
-        encoded_source_data = encoder.encode(source_data)
-        decoded_source_data = json.loads(encoded_source_data)
-
-        validate(instance=decoded_source_data, schema=self.get_source_schema())
+    @classmethod
+    def _validate_source_data(cls, source_data: dict[str, dict], verbose: bool = False):
+        _validate_instance(instance=source_data, schema=cls.get_source_schema(), encoder=_NWBSourceDataEncoder())
         if verbose:
             print("Source data is valid!")
 
@@ -105,6 +137,7 @@ class NWBConverter:
 
         """
         self.verbose = verbose
+        self.metadata_latencies: dict[str, float] = dict()
 
         # Only initialize interfaces that are present in the source_data dictionary.
         # This enables the NWBConverter class to flexibly handle multi-session scenarios
@@ -140,7 +173,7 @@ class NWBConverter:
         fill_defaults(metadata_schema, default_values)
         return metadata_schema
 
-    def get_metadata(self, *, use_new_metadata_format: bool = True) -> DeepDict:
+    def get_metadata(self, *, use_new_metadata_format: bool = True, max_workers: int = 1) -> DeepDict:
         """
         Auto-fill as much of the metadata as possible. Must comply with metadata schema.
 
@@ -149,29 +182,61 @@ class NWBConverter:
         use_new_metadata_format : bool, default: True
             Ask each interface for the dict-based format. Interfaces that emit only that format ignore the
             argument, so a converter mixing the two kinds returns one consistently dict-based dictionary.
+        max_workers : int, default: 1
+            The number of threads asking the interfaces for their metadata at once. Most interfaces read their
+            metadata from file headers, which on network storage spends most of its time waiting, so gathering
+            it concurrently hides that latency. The results are merged in the order of the interfaces whatever
+            order they arrive in, so the metadata is the same as with one thread.
 
         Returns
         -------
         DeepDict
             The metadata dictionary containing auto-filled metadata from all interfaces.
+
+        Notes
+        -----
+        The time each interface took is kept in ``metadata_latencies``, in seconds by interface name, and printed
+        when the converter is verbose.
         """
         metadata = get_default_nwbfile_metadata()
-        for interface in self.data_interface_objects.values():
-            interface_metadata = self._get_interface_metadata(
-                interface=interface, use_new_metadata_format=use_new_metadata_format
-            )
+        interfaces_metadata = self._gather_interface_metadata(
+            use_new_metadata_format=use_new_metadata_format, max_workers=max_workers
+        )
+        for interface_metadata in interfaces_metadata.values():
             metadata = dict_deep_update(metadata, interface_metadata)
+
         return metadata
 
+    def _gather_interface_metadata(
+        self, *, use_new_metadata_format: bool | None = True, max_workers: int = 1
+    ) -> dict[str, DeepDict]:
+        """
+        Ask every interface for its metadata, on up to ``max_workers`` threads, keyed in the order of the interfaces.
+
+        ``get_metadata`` and the overrides of the converters merging the metadata of their interfaces their own way
+        all gather it here, so that every converter takes ``max_workers``. The time each interface took is kept in
+        ``metadata_latencies``. With ``use_new_metadata_format=None`` every interface is asked without the argument.
+        """
+        interfaces_metadata, self.metadata_latencies = _time_interface_metadata(
+            data_interface_objects=self.data_interface_objects,
+            use_new_metadata_format=use_new_metadata_format,
+            max_workers=max_workers,
+        )
+        if self.verbose:
+            for interface_name, latency in self.metadata_latencies.items():
+                print(f"Metadata of '{interface_name}' gathered in {latency:.3f} s")
+
+        return interfaces_metadata
+
     @staticmethod
-    def _get_interface_metadata(interface, *, use_new_metadata_format: bool) -> DeepDict:
+    def _get_interface_metadata(interface, *, use_new_metadata_format: bool | None) -> DeepDict:
         """Ask an interface for a format it understands: only some of them take the argument."""
         takes_the_argument = "use_new_metadata_format" in inspect.signature(interface.get_metadata).parameters
-        if takes_the_argument:
+        if takes_the_argument and use_new_metadata_format is not None:
             return interface.get_metadata(use_new_metadata_format=use_new_metadata_format)
         return interface.get_metadata()
 
-    def _get_metadata_for_writing(self) -> DeepDict:
+    def _get_metadata_for_writing(self, *, max_workers: int = 1) -> DeepDict:
         """
         Return the metadata used when the caller passes none.
 
@@ -182,8 +247,17 @@ class NWBConverter:
         Remove this method, and the signature check in ``_get_interface_metadata``, when the old
         list-based format is removed: every ``get_metadata`` returns the dict format by then and the
         callers go back to ``metadata or self.get_metadata()``.
+
+        ``max_workers`` is passed on to the converters whose ``get_metadata`` takes it, which every converter of
+        the library does.
         """
-        return self._get_interface_metadata(interface=self, use_new_metadata_format=True)
+        get_metadata_parameters = inspect.signature(self.get_metadata).parameters
+        get_metadata_kwargs = dict()
+        if "use_new_metadata_format" in get_metadata_parameters:
+            get_metadata_kwargs["use_new_metadata_format"] = True
+        if "max_workers" in get_metadata_parameters:
+            get_metadata_kwargs["max_workers"] = max_workers
+        return self.get_metadata(**get_metadata_kwargs)
 
     def _get_metadata_schema_for_old_list_format(self) -> dict:
         """Merge the schemas the interfaces use for the old list-based format (see ``BaseDataInterface``)."""
@@ -241,11 +315,11 @@ class NWBConverter:
 
         conversion_options = conversion_options or dict()
 
-        # We do this to ensure that python objects are in string format for the JSON schema
-        encoded_conversion_options = _NWBConversionOptionsEncoder().encode(conversion_options)
-        decoded_conversion_options = json.loads(encoded_conversion_options)
-
-        validate(instance=decoded_conversion_options, schema=self.get_conversion_options_schema())
+        _validate_instance(
+            instance=conversion_options,
+            schema=self.get_conversion_options_schema(),
+            encoder=_NWBConversionOptionsEncoder(),
+        )
         if self.verbose:
             print("conversion_options is valid!")
 
@@ -311,6 +385,13 @@ class NWBConverter:
         backend_configuration: HDF5BackendConfiguration | ZarrBackendConfiguration | None = None,
         conversion_options: dict | None = None,
         append_on_disk_nwbfile: bool = False,
+        dataset_cache_folder_path: str | Path | None = None,
+        memory_budget_gb: float | None = None,
+        max_write_workers: int = 1,
+        integrity_manifest_file_path: str | Path | None = None,
+        checkpoint_folder_path: str | Path | None = None,
+        progress_callback: Callable[[WriteProgressEvent], None] | None = None,
+        max_metadata_workers: int = 1,
     ) -> None:
         """
         Run the NWB conversion over all the instantiated data interfaces.
@@ -344,6 +425,39 @@ class NWBConverter:
         append_on_disk_nwbfile : bool, default: False
             Whether to append to an existing NWBFile on disk. If True, the `nwbfile` parameter must be None.
             This is useful for appending data to an existing file without overwriting it.
+        dataset_cache_folder_path : str or Path, optional
+            A folder in which to keep every dataset written, so that running the conversion again, after fixing
+            the metadata or adding an interface, copies the datasets whose source and settings are unchanged from
+            there rather than reading and compressing them anew. See `configure_and_write_nwbfile`.
+            Only supported for the HDF5 backend, and cannot be combined with `append_on_disk_nwbfile=True`.
+        memory_budget_gb : float, optional
+            The memory, in gigabytes, that the buffers of all data chunk iterators may hold at once while the file
+            is written. Each iterator reads its buffers in pieces of at most its share of the budget, and of half the
+            memory available at the time. Defaults to the ``NEUROCONV_MEMORY_BUDGET_GB`` environment variable, and
+            to no budget when that is unset. See `MemoryBudget`.
+        max_write_workers : int, default: 1
+            The number of threads reading and compressing the series fed by data chunk iterators, such as those of
+            each probe of a multi-stream converter or of each segment of a recording, at once. See
+            `configure_and_write_nwbfile`. Only supported for the HDF5 backend, and not when appending on disk.
+        integrity_manifest_file_path : str or Path, optional
+            Where to write a JSON manifest of the hash of every chunk of every numeric dataset of the file, taken as
+            the data is written so that archiving the file does not need a pass reading it back. Check the file
+            against it with `verify_integrity_manifest`. Cannot be combined with `append_on_disk_nwbfile=True`.
+        checkpoint_folder_path : str or Path, optional
+            A folder in which to checkpoint the series fed by data chunk iterators buffer by buffer, so that running
+            the conversion again with the same folder after it was interrupted, by running out of memory or by the
+            preemption of its node, reads only the buffers not yet written. See `configure_and_write_nwbfile`.
+            Running it again needs `overwrite=True`, as the partial file exists, and the same metadata, including
+            an explicit ``identifier``, whose default is new on every call. Cannot be combined with
+            `append_on_disk_nwbfile=True`.
+        progress_callback : callable, optional
+            Called with a `WriteProgressEvent` each time a buffer of a data chunk iterator is written: the dataset,
+            the buffers written of its total, the bytes read and written, the throughput and the time remaining.
+            Events also go to any `WriteProgressMonitor` in effect, and, when there is none, to the JSON-lines file
+            named by the ``NEUROCONV_PROGRESS_EVENTS_FILE_PATH`` environment variable, if set.
+        max_metadata_workers : int, default: 1
+            When no `metadata` is passed, the number of threads asking the interfaces for their metadata at once.
+            See `get_metadata`.
         """
 
         appending_to_in_memory_nwbfile = nwbfile is not None
@@ -379,8 +493,32 @@ class NWBConverter:
                 "instead, which derives the configuration after the data is added."
             )
 
+        if dataset_cache_folder_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot use a dataset cache while appending to an existing file on disk; the datasets the file "
+                "already holds are not written again."
+            )
+
+        if max_write_workers > 1 and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot write with several workers while appending to an existing file on disk; the file is "
+                "written in place by HDMF."
+            )
+
+        if integrity_manifest_file_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot write an integrity manifest while appending to an existing file on disk; the datasets the "
+                "file already holds are not written again."
+            )
+
+        if checkpoint_folder_path is not None and append_on_disk_nwbfile:
+            raise ValueError(
+                "Cannot checkpoint a conversion appending to an existing file on disk; the file is written in place "
+                "by HDMF."
+            )
+
         if metadata is None:
-            metadata = self._get_metadata_for_writing()
+            metadata = self._get_metadata_for_writing(max_workers=max_metadata_workers)
 
         self.validate_metadata(metadata=metadata, append_mode=append_on_disk_nwbfile)
         self.validate_conversion_options(conversion_options=conversion_options)
@@ -388,22 +526,101 @@ class NWBConverter:
 
         writing_new_file = not append_on_disk_nwbfile
 
-        if writing_new_file:
-            self._write_nwbfile(
-                nwbfile_path=nwbfile_path,
-                nwbfile=nwbfile,
-                metadata=metadata,
-                backend=backend,
-                backend_configuration=backend_configuration,
-                conversion_options=conversion_options,
+        with (
+            use_memory_budget(budget_gb=memory_budget_gb) as memory_budget,
+            use_write_progress_monitor(progress_callback=progress_callback),
+        ):
+            if writing_new_file:
+                self._write_nwbfile(
+                    nwbfile_path=nwbfile_path,
+                    nwbfile=nwbfile,
+                    metadata=metadata,
+                    backend=backend,
+                    backend_configuration=backend_configuration,
+                    conversion_options=conversion_options,
+                    dataset_cache_folder_path=dataset_cache_folder_path,
+                    max_write_workers=max_write_workers,
+                    integrity_manifest_file_path=integrity_manifest_file_path,
+                    checkpoint_folder_path=checkpoint_folder_path,
+                )
+            else:
+                self._append_nwbfile(
+                    nwbfile_path=nwbfile_path,
+                    metadata=metadata,
+                    backend=backend,
+                    backend_configuration=backend_configuration,
+                    conversion_options=conversion_options,
+                )
+
+        if memory_budget is not None and getattr(self, "verbose", False):
+            print(
+                f"Buffers held at most {memory_budget.high_water_mark_in_bytes / 1e9:.3f} GB at once "
+                f"of a {memory_budget.budget_in_bytes / 1e9:.3f} GB budget"
             )
-        else:
-            self._append_nwbfile(
-                nwbfile_path=nwbfile_path,
-                metadata=metadata,
-                backend=backend,
+
+    def plan_conversion(
+        self,
+        metadata: dict | None = None,
+        backend: Literal["hdf5", "zarr"] | None = None,
+        backend_configuration: HDF5BackendConfiguration | ZarrBackendConfiguration | None = None,
+        conversion_options: dict | None = None,
+        memory_budget_gb: float | None = None,
+        max_write_workers: int = 1,
+        number_of_samples: int = 3,
+    ) -> ConversionPlan:
+        """
+        Project the file size, wall time and peak memory of `run_conversion`, without writing the file.
+
+        The in-memory NWBFile and its backend configuration are built as `run_conversion` builds them, and a few
+        chunks of each dataset are read through its source, the data chunk iterators included, and compressed as
+        configured. Use it to size storage and choose nodes before converting many sessions. See
+        `plan_nwbfile_write`.
+
+        Parameters
+        ----------
+        metadata : dict, optional
+            Metadata dictionary with information used to create the NWBFile.
+        backend : {"hdf5", "zarr"}, optional
+            The type of backend the file would be written with. Defaults to "hdf5", or to the type of the
+            `backend_configuration`.
+        backend_configuration : HDF5BackendConfiguration or ZarrBackendConfiguration, optional
+            The configuration the file would be written with. Defaults to the default configuration.
+        conversion_options : dict, optional
+            Similar to source_data, a dictionary containing keywords for each interface for which non-default
+            conversion specification is requested.
+        memory_budget_gb : float, optional
+            The memory budget the conversion would run under, which bounds the buffers of the data chunk iterators.
+            See `run_conversion`.
+        max_write_workers : int, default: 1
+            The number of threads the conversion would write the iterative datasets with. See `run_conversion`.
+        number_of_samples : int, default: 3
+            The number of chunks to sample from each dataset.
+
+        Returns
+        -------
+        ConversionPlan
+            The projected size, write time and memory of each dataset and of the file; print it for a summary.
+        """
+        if metadata is None:
+            metadata = self._get_metadata_for_writing()
+
+        self.validate_metadata(metadata=metadata)
+        self.validate_conversion_options(conversion_options=conversion_options)
+        self.temporally_align_data_interfaces(metadata=metadata, conversion_options=conversion_options)
+
+        with use_memory_budget(budget_gb=memory_budget_gb):
+            nwbfile = self.create_nwbfile(metadata=metadata, conversion_options=conversion_options)
+            if backend_configuration is None:
+                backend_configuration = self.get_default_backend_configuration(
+                    nwbfile=nwbfile, backend=backend or "hdf5"
+                )
+                backend_configuration.apply_timestamp_linking(nwbfile=nwbfile)
+
+            return plan_nwbfile_write(
+                nwbfile=nwbfile,
                 backend_configuration=backend_configuration,
-                conversion_options=conversion_options,
+                number_of_samples=number_of_samples,
+                max_workers=max_write_workers,
             )
 
     def _write_nwbfile(
@@ -414,6 +631,10 @@ class NWBConverter:
         backend: Literal["hdf5", "zarr"],
         backend_configuration: dict,
         conversion_options: dict,
+        dataset_cache_folder_path: str | Path | None = None,
+        max_write_workers: int = 1,
+        integrity_manifest_file_path: str | Path | None = None,
+        checkpoint_folder_path: str | Path | None = None,
     ) -> None:
         """
         Write NWBFile to a file path on disk.
@@ -431,6 +652,10 @@ class NWBConverter:
             nwbfile_path=nwbfile_path,
             backend=backend,
             backend_configuration=backend_configuration,
+            dataset_cache_folder_path=dataset_cache_folder_path,
+            max_workers=max_write_workers,
+            integrity_manifest_file_path=integrity_manifest_file_path,
+            checkpoint_folder_path=checkpoint_folder_path,
         )
 
     def _append_nwbfile(
@@ -461,6 +686,9 @@ class NWBConverter:
                 backend_configuration = self.get_default_backend_configuration(nwbfile=nwbfile, backend=backend)
 
             configure_backend(nwbfile=nwbfile, backend_configuration=backend_configuration)
+            set_write_progress_destinations(
+                nwbfile=nwbfile, backend_configuration=backend_configuration, nwbfile_path=Path(nwbfile_path)
+            )
 
             io.write(nwbfile)
 
@@ -504,6 +732,7 @@ class ConverterPipe(NWBConverter):
 
     def __init__(self, data_interfaces: list[BaseDataInterface] | dict[str, BaseDataInterface], verbose=False):
         self.verbose = verbose
+        self.metadata_latencies: dict[str, float] = dict()
         if isinstance(data_interfaces, list):
             # Create unique names for each interface
             counter = {interface.__class__.__name__: 0 for interface in data_interfaces}
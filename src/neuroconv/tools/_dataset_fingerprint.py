@@ -0,0 +1,114 @@
+"""Fingerprints identifying the source of a dataset without reading it, used to reuse datasets already written."""
+
+import hashlib
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+import h5py
+import numpy as np
+
+
+def hash_text(text: str) -> str:
+    """The hexadecimal BLAKE2 digest of a string."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def get_file_identity(path: str | Path) -> list:
+    """
+    Identify the current state of a file, or of every file in a folder, by path, size and modification time.
+
+    The same test `make` and `rsync` rely on: a file rewritten in place, even to the same size, gets a new
+    modification time, so a source that changed since it was last fingerprinted does not fingerprint the same.
+    """
+    path = Path(path).resolve()
+    if path.is_dir():
+        return [get_file_identity(path=file_path) for file_path in sorted(path.rglob("*")) if file_path.is_file()]
+
+    stat = path.stat()
+    return [str(path), stat.st_size, stat.st_mtime_ns]
+
+
+def get_file_identities_in_description(description: Any) -> list:
+    """
+    Identify every file or folder on disk named by an absolute path anywhere in a nested description of a source.
+
+    Relative strings are skipped: a channel id such as ``"0"`` or an empty annotation names whatever happens to sit
+    in the working directory, not a file of the source, and the descriptions of sources state their paths absolute.
+    """
+    if isinstance(description, dict):
+        return [get_file_identities_in_description(description=value) for _, value in sorted(description.items())]
+    if isinstance(description, (list, tuple)):
+        return [get_file_identities_in_description(description=value) for value in description]
+    if (
+        isinstance(description, (str, Path))
+        and len(str(description)) < 4096
+        and Path(description).is_absolute()
+        and Path(description).exists()
+    ):
+        return get_file_identity(path=description)
+
+    return list()
+
+
+def describe_value_for_fingerprint(value: Any) -> Any:
+    """
+    Turn a value `json.dumps` cannot serialize into one it can, for use as its ``default``.
+
+    Arrays are described by a digest of their bytes rather than by their text, which numpy abbreviates with ``...``
+    past a thousand elements, so that a change anywhere in a large array changes the fingerprint.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == "O":
+            return dict(items=value.tolist(), shape=list(value.shape))
+        content = hashlib.blake2b(np.ascontiguousarray(value).data, digest_size=20).hexdigest()
+        return dict(content=content, shape=list(value.shape), dtype=str(value.dtype))
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return str(value)
+
+
+def get_source_fingerprint(data: Any) -> str | None:
+    """
+    Fingerprint the source of a dataset, or return None when it cannot be identified without reading all of it.
+
+    Data held in a file (an `h5py.Dataset` or a whole `numpy.memmap`) is identified by the state of that file, so
+    fingerprinting it reads nothing. Arrays and lists held in memory are hashed, which is far cheaper than compressing them.
+    Data chunk iterators identify their own source through `_get_source_fingerprint`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray, list, h5py.Dataset or GenericDataChunkIterator
+        The data a neurodata object holds for one of its datasets.
+
+    Returns
+    -------
+    str or None
+        A digest that changes whenever the values the source yields could have changed.
+    """
+    if hasattr(data, "_get_source_fingerprint"):
+        return data._get_source_fingerprint()
+    if isinstance(data, list):  # Such as the columns of a table built row by row
+        data = np.asarray(data)
+
+    if isinstance(data, h5py.Dataset) and data.file.driver == "fileobj":
+        # Opened from a file object, which h5py names by its representation; a `RemoteFile` names its URL and version
+        description = dict(file=data.file.filename, name=data.name)
+    elif isinstance(data, h5py.Dataset):
+        description = dict(file=get_file_identity(path=data.file.filename), name=data.name)
+    # Only a memmap over its whole mapping has an offset that describes it; views of one are hashed below
+    elif isinstance(data, np.memmap) and isinstance(data.base, mmap.mmap) and data.filename is not None:
+        description = dict(
+            file=get_file_identity(path=data.filename),
+            offset=data.offset,
+            strides=data.strides,
+        )
+    elif isinstance(data, np.ndarray) and data.dtype.kind != "O":
+        description = dict(content=hashlib.blake2b(np.ascontiguousarray(data).data, digest_size=20).hexdigest())
+    else:
+        return None
+
+    description.update(shape=list(data.shape), dtype=str(data.dtype))
+    return hash_text(text=json.dumps(description, sort_keys=True))
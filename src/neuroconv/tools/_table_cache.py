@@ -0,0 +1,125 @@
+"""Parse each text table once per conversion, shared by every interface and method that reads it."""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ._dataset_fingerprint import get_file_identity
+from .importing import is_package_installed
+
+# Enough for the handful of tables one session reads, while a long-running process converting many sessions
+# does not keep every table it ever read
+_MAXIMUM_CACHED_TABLES = 8
+
+_cached_tables: OrderedDict[tuple, dict[object, np.ndarray]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _freeze(value):
+    """A hashable form of a `pandas.read_csv` keyword argument, so that different arguments key different tables."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.dtype):
+        return str(value)
+
+    return value if isinstance(value, (str, int, float, bool, type(None))) else repr(value)
+
+
+def _parse_csv(file_path: Path, read_kwargs: dict):
+    """
+    Parse a CSV with the multithreaded pyarrow engine when every column is given a ``dtype`` and pyarrow is
+    installed, and with the pandas C engine otherwise.
+
+    The two engines infer the types of columns differently (integers holding missing values, or dates, for
+    instance), so pyarrow only parses tables whose types the caller states, where both give the same columns. It
+    also does not support every option of the C engine (``nrows`` or a callable ``skiprows``, for instance), and
+    rejects a header naming more columns than the data holds; pandas raises a ValueError for both, and those reads
+    fall back to the C engine.
+    """
+    types_every_column = "dtype" in read_kwargs and not isinstance(read_kwargs["dtype"], dict)
+    if types_every_column and "engine" not in read_kwargs and is_package_installed(package_name="pyarrow"):
+        try:
+            return pd.read_csv(file_path, engine="pyarrow", **read_kwargs)
+        except ValueError:
+            pass
+
+    return pd.read_csv(file_path, **read_kwargs)
+
+
+def read_csv_columns(file_path: str | Path, **read_kwargs) -> dict[object, np.ndarray]:
+    """
+    Read a CSV as a dictionary of NumPy columns, keyed by column label in file order, parsing it once.
+
+    The columns are cached by the path, size and modification time of the file together with the keyword arguments
+    of the read, so the several methods and interfaces reading a table during a conversion share one parse, and a
+    file rewritten in the meantime is parsed again. Pass a single ``dtype`` when the types of the columns are known:
+    the engine then skips inferring them, and the table is parsed on several threads when pyarrow is installed. The arrays are shared by every caller and so are read-only; copy one before
+    changing it in place.
+
+    Parameters
+    ----------
+    file_path : str or Path
+        The CSV file to read.
+    **read_kwargs
+        Keyword arguments forwarded to ``pandas.read_csv``.
+
+    Returns
+    -------
+    dict
+        One read-only NumPy array per column.
+    """
+    file_path = Path(file_path)
+    key = (*get_file_identity(path=file_path), _freeze(read_kwargs))
+    with _cache_lock:
+        if key in _cached_tables:
+            _cached_tables.move_to_end(key)
+            return _cached_tables[key]
+
+    # Parsed outside the lock, so that different tables are parsed at the same time
+    table = _parse_csv(file_path=file_path, read_kwargs=read_kwargs)
+    columns = dict()
+    for column in table.columns:
+        array = table[column].to_numpy()
+        array.flags.writeable = False
+        columns[column] = array
+
+    with _cache_lock:
+        _cached_tables[key] = columns
+        while len(_cached_tables) > _MAXIMUM_CACHED_TABLES:
+            _cached_tables.popitem(last=False)
+
+    return columns
+
+
+def read_csv_dataframe(file_path: str | Path, usecols: list | None = None, **read_kwargs) -> pd.DataFrame:
+    """
+    Read a CSV into a new DataFrame through the cache of `read_csv_columns`, optionally keeping only ``usecols``.
+
+    The columns are selected from the whole parsed table rather than by the parser, so readers of different columns
+    of one file, such as the channels of an interleaved photometry recording, share a single parse. As with
+    ``pandas.read_csv``, ``usecols`` names columns by label or by position, and the columns are kept in file order.
+    """
+    columns = read_csv_columns(file_path, **read_kwargs)
+    labels = list(columns)
+    if usecols is not None:
+        missing_columns = [
+            column
+            for column in usecols
+            if column not in labels and not (isinstance(column, int) and column < len(labels))
+        ]
+        if missing_columns:
+            raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing_columns}")
+        labels = [label for position, label in enumerate(labels) if label in usecols or position in usecols]
+
+    return pd.DataFrame({label: columns[label] for label in labels}, columns=labels)
+
+
+def clear_table_cache() -> None:
+    """Release every table parsed so far."""
+    with _cache_lock:
+        _cached_tables.clear()
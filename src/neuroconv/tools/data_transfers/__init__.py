@@ -1,9 +1,10 @@
 """Collection of helper functions for assessing and performing automated data transfers."""
 
-from ._dandi import automatic_dandi_upload
+from ._dandi import DandiUploadPipeline, automatic_dandi_upload
 from ._globus import get_globus_dataset_content_sizes, transfer_globus_content
 
 __all__ = [
+    "DandiUploadPipeline",
     "automatic_dandi_upload",
     "get_globus_dataset_content_sizes",
     "transfer_globus_content",
@@ -1,14 +1,16 @@
 """Collection of helper functions for assessing and performing automated data transfers for the DANDI archive."""
 
 import os
+import queue
+import threading
 from pathlib import Path
 from shutil import rmtree
 from tempfile import mkdtemp
 from typing import Literal
 from warnings import warn
 
-from pydantic import DirectoryPath
-from pynwb import NWBHDF5IO
+from pydantic import DirectoryPath, FilePath
+from pynwb import NWBHDF5IO, validate
 
 
 def automatic_dandi_upload(
@@ -62,10 +64,206 @@ def automatic_dandi_upload(
     instance : str, default = "dandi"
         The DANDI instance to use. Either "dandi" (default), "ember", or an explicit URL.
     """
-    from dandi.download import download as dandi_download
-    from dandi.organize import organize as dandi_organize
-    from dandi.upload import upload as dandi_upload
+    url_base, dandi_instance = _resolve_dandi_instance(instance=instance, sandbox=sandbox)
+
+    dandiset_folder_path = (
+        Path(mkdtemp(dir=nwb_folder_path.parent)) if dandiset_folder_path is None else dandiset_folder_path
+    )
+    # Odd big of logic upstream: https://github.com/dandi/dandi-cli/blob/master/dandi/cli/cmd_upload.py#L92-L96
+    if number_of_threads is not None and number_of_threads > 1 and number_of_jobs is None:
+        number_of_jobs = -1
+
+    dandiset_path = _download_dandiset(
+        dandiset_id=dandiset_id, dandiset_folder_path=dandiset_folder_path, url_base=url_base, version=version
+    )
+    organized_nwbfiles = _organize_nwbfiles(
+        nwb_path=nwb_folder_path, dandiset_path=dandiset_path, number_of_jobs=number_of_jobs
+    )
+    organized_nwbfiles = [str(x) for x in organized_nwbfiles]
+
+    assert len(list(dandiset_path.iterdir())) > 1, "DANDI organize failed!"
+
+    _upload_nwbfiles(
+        nwbfile_paths=organized_nwbfiles,
+        dandi_instance=dandi_instance,
+        number_of_jobs=number_of_jobs,
+        number_of_threads=number_of_threads,
+    )
+
+    # Cleanup should be confirmed manually; Windows especially can complain
+    if cleanup:
+        try:
+            rmtree(path=dandiset_folder_path)
+            rmtree(path=nwb_folder_path)
+        except PermissionError:  # pragma: no cover
+            warn("Unable to clean up source files and dandiset! Please manually delete them.")
+
+    return organized_nwbfiles
+
+
+class DandiUploadPipeline:
+    """
+    Validate, organize and upload NWB files to a Dandiset in the background, each as soon as it is written.
+
+    `automatic_dandi_upload` starts once every session is converted, so the upload, bound by the network, never
+    overlaps the conversion, bound by the CPU, and every file sits on disk until the last is written. Within this
+    context, each file submitted is validated against the NWB schema, organized into the layout of the Dandiset and
+    uploaded by a thread of its own while the next sessions convert. The files waiting are held in a queue of at
+    most ``max_queued_files``, and submitting another blocks until there is room, so with ``remove_uploaded_files``
+    at most that many files, plus the one uploading and the one converting, are on disk at any time.
+
+    An error in the background stops the uploads, and is raised by the next `submit` or on leaving the context, so
+    the conversion of later sessions stops with it. The files already queued when the conversion raises are uploaded
+    before the error propagates.
+
+    Requires the API key of the instance to be set, as for `automatic_dandi_upload`.
+
+    Parameters
+    ----------
+    dandiset_id : str
+        Six-digit string identifier for the Dandiset the NWB files will be uploaded to.
+    dandiset_folder_path : folder path, optional
+        The folder within which to download the Dandiset and organize the files. Place it on the same filesystem
+        as the files, so that organizing them links rather than copies them. Defaults to a temporary folder.
+    version : str, default: "draft"
+        The version of the Dandiset to download the metadata of.
+    sandbox : bool, default: False
+        Is the Dandiset hosted on the sandbox server?
+    instance : str, default: "dandi"
+        The DANDI instance to use. Either "dandi" (default), "ember", or an explicit URL.
+    max_queued_files : int, default: 1
+        The most files waiting to be uploaded at once.
+    remove_uploaded_files : bool, default: False
+        Whether to remove each file, and its organized copy, once it is uploaded, and the Dandiset folder at the end.
+    number_of_jobs : int, optional
+        The number of jobs to use in the DANDI upload process.
+    number_of_threads : int, optional
+        The number of threads to use in the DANDI upload process.
+
+    Examples
+    --------
+    >>> with DandiUploadPipeline(dandiset_id="123456", remove_uploaded_files=True) as upload_pipeline:
+    ...     for session_id, converter in converters.items():
+    ...         nwbfile_path = output_folder_path / f"{session_id}.nwb"
+    ...         converter.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata[session_id])
+    ...         upload_pipeline.submit(nwbfile_path=nwbfile_path)
+    >>> upload_pipeline.uploaded_file_paths
+    """
+
+    def __init__(
+        self,
+        dandiset_id: str,
+        dandiset_folder_path: DirectoryPath | None = None,
+        version: str = "draft",
+        sandbox: bool = False,
+        instance: Literal["dandi", "ember"] | str = "dandi",
+        max_queued_files: int = 1,
+        remove_uploaded_files: bool = False,
+        number_of_jobs: int | None = None,
+        number_of_threads: int | None = None,
+    ):
+        if max_queued_files < 1:
+            raise ValueError(f"At least one file must be allowed to wait for upload, but {max_queued_files=}.")
+
+        # Raised here, before any session is converted, rather than by the thread once the first one is
+        self.url_base, self.dandi_instance = _resolve_dandi_instance(instance=instance, sandbox=sandbox)
 
+        self.dandiset_id = dandiset_id
+        self.version = version
+        self.remove_uploaded_files = remove_uploaded_files
+        # Odd big of logic upstream: https://github.com/dandi/dandi-cli/blob/master/dandi/cli/cmd_upload.py#L92-L96
+        if number_of_threads is not None and number_of_threads > 1 and number_of_jobs is None:
+            number_of_jobs = -1
+        self.number_of_jobs = number_of_jobs
+        self.number_of_threads = number_of_threads
+
+        self._is_temporary_dandiset_folder = dandiset_folder_path is None
+        self.dandiset_folder_path = Path(mkdtemp()) if dandiset_folder_path is None else Path(dandiset_folder_path)
+        self.uploaded_file_paths: list[Path] = list()
+
+        self._queue: queue.Queue[Path | None] = queue.Queue(maxsize=max_queued_files)
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def __enter__(self) -> "DandiUploadPipeline":
+        self._dandiset_path = self._download_dandiset()
+        self._thread = threading.Thread(target=self._upload_queued_files, name="DandiUploadPipeline", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+        if self.remove_uploaded_files and self._is_temporary_dandiset_folder and self._error is None:
+            try:
+                rmtree(path=self.dandiset_folder_path)
+            except PermissionError:  # pragma: no cover
+                warn("Unable to clean up the dandiset folder! Please manually delete it.")
+        if exc_type is None:
+            self._raise_error()
+
+    def submit(self, nwbfile_path: FilePath) -> None:
+        """Queue a written NWB file for upload, waiting for room in the queue when it is full."""
+        self._raise_error()
+        if self._thread is None:
+            raise RuntimeError("Files can only be submitted within the context of the pipeline.")
+
+        self._queue.put(Path(nwbfile_path))
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Uploading to the Dandiset failed; see the error above.") from self._error
+
+    def _upload_queued_files(self) -> None:
+        while (nwbfile_path := self._queue.get()) is not None:
+            # After an error the remaining files are only taken off the queue, so that no submit waits forever
+            if self._error is not None:
+                continue
+            try:
+                self._upload_file(nwbfile_path=nwbfile_path)
+            except BaseException as exception:
+                self._error = exception
+
+    def _upload_file(self, nwbfile_path: Path) -> None:
+        validation_errors = validate(path=str(nwbfile_path))
+        if validation_errors:
+            error_list = "\n".join(f"  {error}" for error in validation_errors)
+            raise ValueError(f"'{nwbfile_path}' does not validate against the NWB schema:\n{error_list}")
+
+        organized_nwbfiles = self._organize_nwbfile(nwbfile_path=nwbfile_path)
+        self._upload_nwbfiles(nwbfile_paths=organized_nwbfiles)
+        self.uploaded_file_paths.extend(organized_nwbfiles)
+
+        if self.remove_uploaded_files:
+            for path in [nwbfile_path, *organized_nwbfiles]:
+                path.unlink(missing_ok=True)
+
+    # The three steps that reach DANDI, which a stand-in for the archive overrides
+    def _download_dandiset(self) -> Path:
+        return _download_dandiset(
+            dandiset_id=self.dandiset_id,
+            dandiset_folder_path=self.dandiset_folder_path,
+            url_base=self.url_base,
+            version=self.version,
+        )
+
+    def _organize_nwbfile(self, nwbfile_path: Path) -> list[Path]:
+        return _organize_nwbfiles(
+            nwb_path=nwbfile_path, dandiset_path=self._dandiset_path, number_of_jobs=self.number_of_jobs
+        )
+
+    def _upload_nwbfiles(self, nwbfile_paths: list[Path]) -> None:
+        _upload_nwbfiles(
+            nwbfile_paths=nwbfile_paths,
+            dandi_instance=self.dandi_instance,
+            number_of_jobs=self.number_of_jobs,
+            number_of_threads=self.number_of_threads,
+        )
+
+
+def _resolve_dandi_instance(instance: str, sandbox: bool) -> tuple[str, str]:
+    """The base URL and the name of a DANDI instance, after checking the API key it needs is set."""
     # Validate instance parameter first
     if instance not in ["dandi", "ember"] and not instance.startswith("https://"):
         message = "The 'instance' parameter must be either 'dandi', 'ember', or a full URL starting with 'https://'."
@@ -108,26 +306,35 @@ def automatic_dandi_upload(
             )
             raise KeyError(message)
 
-    dandiset_folder_path = (
-        Path(mkdtemp(dir=nwb_folder_path.parent)) if dandiset_folder_path is None else dandiset_folder_path
-    )
-    dandiset_path = dandiset_folder_path / dandiset_id
-    # Odd big of logic upstream: https://github.com/dandi/dandi-cli/blob/master/dandi/cli/cmd_upload.py#L92-L96
-    if number_of_threads is not None and number_of_threads > 1 and number_of_jobs is None:
-        number_of_jobs = -1
+    return url_base, dandi_instance
+
+
+def _download_dandiset(dandiset_id: str, dandiset_folder_path: Path, url_base: str, version: str) -> Path:
+    """Download the metadata of a Dandiset, its dandiset.yaml, which organizing files into it requires."""
+    from dandi.download import download as dandi_download
 
     dandiset_url = f"{url_base}/dandiset/{dandiset_id}/{version}"
     dandi_download(urls=dandiset_url, output_dir=str(dandiset_folder_path), get_metadata=True, get_assets=False)
+    dandiset_path = dandiset_folder_path / dandiset_id
     assert dandiset_path.exists(), "DANDI download failed!"
 
+    return dandiset_path
+
+
+def _organize_nwbfiles(nwb_path: Path, dandiset_path: Path, number_of_jobs: int | None = None) -> list[Path]:
+    """Organize an NWB file, or a folder of them, into the layout of a Dandiset, returning the files it organized."""
+    from dandi.organize import organize as dandi_organize
+
+    nwbfiles_already_organized = set(dandiset_path.rglob("*.nwb"))
     # TODO: need PR on DANDI to expose number of jobs
     dandi_organize(
-        paths=str(nwb_folder_path), dandiset_path=str(dandiset_path), devel_debug=True if number_of_jobs == 1 else False
+        paths=str(nwb_path), dandiset_path=str(dandiset_path), devel_debug=True if number_of_jobs == 1 else False
     )
-    organized_nwbfiles = dandiset_path.rglob("*.nwb")
+    organized_nwbfiles = [path for path in dandiset_path.rglob("*.nwb") if path not in nwbfiles_already_organized]
 
     # DANDI has yet to implement forcing of session_id inclusion in organize step
     # This manually enforces it when only a single session per subject is organized
+    corrected_nwbfiles = list()
     for organized_nwbfile in organized_nwbfiles:
         if "ses" not in organized_nwbfile.stem:
             with NWBHDF5IO(path=organized_nwbfile, mode="r") as io:
@@ -137,26 +344,24 @@ def automatic_dandi_upload(
             dandi_stem_split = dandi_stem.split("_")
             dandi_stem_split.insert(1, f"ses-{session_id}")
             corrected_name = "_".join(dandi_stem_split) + ".nwb"
-            organized_nwbfile.rename(organized_nwbfile.parent / corrected_name)
-
-    organized_nwbfiles = [str(x) for x in dandiset_path.rglob("*.nwb")]
+            organized_nwbfile = organized_nwbfile.rename(organized_nwbfile.parent / corrected_name)
+        corrected_nwbfiles.append(organized_nwbfile)
     # The above block can be removed once they add the feature
 
-    assert len(list(dandiset_path.iterdir())) > 1, "DANDI organize failed!"
+    return corrected_nwbfiles
+
+
+def _upload_nwbfiles(
+    nwbfile_paths: list[str | Path],
+    dandi_instance: str,
+    number_of_jobs: int | None = None,
+    number_of_threads: int | None = None,
+) -> None:
+    from dandi.upload import upload as dandi_upload
 
     dandi_upload(
-        paths=organized_nwbfiles,
+        paths=[str(nwbfile_path) for nwbfile_path in nwbfile_paths],
         dandi_instance=dandi_instance,
         jobs=number_of_jobs,
         jobs_per_file=number_of_threads,
     )
-
-    # Cleanup should be confirmed manually; Windows especially can complain
-    if cleanup:
-        try:
-            rmtree(path=dandiset_folder_path)
-            rmtree(path=nwb_folder_path)
-        except PermissionError:  # pragma: no cover
-            warn("Unable to clean up source files and dandiset! Please manually delete them.")
-
-    return organized_nwbfiles
@@ -1,7 +1,9 @@
 """Collection of modifications of HDMF functions that are to be tested/used on this repo until propagation upstream."""
 
+import itertools
 import math
 import warnings
+from collections import deque
 
 import numpy as np
 from hdmf.build import BuildManager
@@ -9,14 +11,57 @@ from hdmf.build.builders import (
     BaseBuilder,
     LinkBuilder,
 )
+from hdmf.data_utils import DataChunk
 from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
 from hdmf.utils import get_data_shape
 from pynwb import NWBFile, get_manager
 
+from ._dataset_fingerprint import get_source_fingerprint
+from .remote_sources import prefetch_selection
+
+
+class BufferHook:
+    """
+    Observes, and may divide, the buffers a `GenericDataChunkIterator` reads as it is written.
+
+    Register one with `GenericDataChunkIterator.add_buffer_hook` before the iterator is first read. The memory budget,
+    the progress events and the hashes of the integrity manifest of a conversion are each a hook. Every method does
+    nothing by default.
+    """
+
+    def iteration_started(self, iterator: "GenericDataChunkIterator") -> None:
+        """Called just before the first buffer is read."""
+
+    def split_buffer(
+        self, iterator: "GenericDataChunkIterator", selection: tuple[slice, ...]
+    ) -> list[tuple[slice, ...]]:
+        """The selections to read a buffer in, one after another; the whole buffer by default."""
+        return [selection]
+
+    def buffer_read(self, iterator: "GenericDataChunkIterator", selection: tuple[slice, ...], data: np.ndarray) -> None:
+        """Called with each selection read and its data, before the writer receives them."""
+
+    def buffer_written(
+        self, iterator: "GenericDataChunkIterator", selection: tuple[slice, ...], was_resumed: bool = False
+    ) -> None:
+        """
+        Called with each whole buffer once the writer has taken every selection it was split in.
+
+        ``was_resumed`` marks a buffer a resumed write skips, having written it before it was interrupted.
+        """
+
+    def iteration_finished(self, iterator: "GenericDataChunkIterator") -> None:
+        """Called once the iterator is exhausted."""
+
 
 class GenericDataChunkIterator(HDMFGenericDataChunkIterator):  # noqa: D101
 
     def __init__(self, **kwargs):
+        self._buffer_hooks: list[BufferHook] = []
+        self._buffer_hooks_started = False
+        self._buffer_hooks_finished = False
+        self._buffer_being_written: tuple[slice, ...] | None = None
+        self._pending_selections: deque[tuple[slice, ...]] = deque()
         super().__init__(**kwargs)
 
         # Add the size in bytes of chunk and buffer for easy access
@@ -24,6 +69,112 @@ class GenericDataChunkIterator(HDMFGenericDataChunkIterator):  # noqa: D101
         self._chunk_size_mb = math.prod(self.chunk_shape) * self._get_dtype().itemsize / 1e6
         self._buffer_size_gb = math.prod(self.buffer_shape) * self._get_dtype().itemsize / 1e9
 
+    def add_buffer_hook(self, buffer_hook: BufferHook) -> None:
+        """Call a hook on each buffer this iterator reads, after the hooks added before it."""
+        if buffer_hook not in self._buffer_hooks:
+            self._buffer_hooks.append(buffer_hook)
+
+    def __next__(self) -> DataChunk:
+        self._start_buffer_hooks()
+        if not self._pending_selections:
+            # The writer asks for the next buffer once it has written every selection of the last
+            if self._buffer_being_written is not None:
+                self._record_buffer_written(selection=self._buffer_being_written)
+                self._buffer_being_written = None
+            try:
+                buffer_selection = next(self.buffer_selection_generator)
+            except StopIteration:
+                self._finish_buffer_hooks()
+                # Allow text to be written to new lines after completion
+                if self.display_progress:
+                    self.progress_bar.write("\n")
+                raise StopIteration
+
+            if self.display_progress:
+                self.progress_bar.update(n=1)
+            self._buffer_being_written = buffer_selection
+            self._pending_selections.extend(self._split_buffer(selection=buffer_selection))
+
+        selection = self._pending_selections.popleft()
+        return DataChunk(data=self._read_buffer(selection=selection), selection=selection)
+
+    # The steps of `__next__`, for the writers that choose the buffers to read themselves, such as a resumed write
+    def _start_buffer_hooks(self) -> None:
+        if not self._buffer_hooks_started:
+            self._buffer_hooks_started = True
+            for buffer_hook in self._buffer_hooks:
+                buffer_hook.iteration_started(iterator=self)
+
+    def _split_buffer(self, selection: tuple[slice, ...]) -> list[tuple[slice, ...]]:
+        selections = [selection]
+        for buffer_hook in self._buffer_hooks:
+            selections = [
+                piece
+                for selection in selections
+                for piece in buffer_hook.split_buffer(iterator=self, selection=selection)
+            ]
+        return selections
+
+    def _read_buffer(self, selection: tuple[slice, ...]) -> np.ndarray:
+        data = self._get_data(selection=selection)
+        for buffer_hook in self._buffer_hooks:
+            buffer_hook.buffer_read(iterator=self, selection=selection, data=data)
+        return data
+
+    def _record_buffer_written(self, selection: tuple[slice, ...], was_resumed: bool = False) -> None:
+        for buffer_hook in self._buffer_hooks:
+            buffer_hook.buffer_written(iterator=self, selection=selection, was_resumed=was_resumed)
+
+    def _finish_buffer_hooks(self) -> None:
+        if not self._buffer_hooks_finished:
+            self._buffer_hooks_finished = True
+            for buffer_hook in self._buffer_hooks:
+                buffer_hook.iteration_finished(iterator=self)
+
+    def _set_buffer_shape(self, chunk_shape: tuple[int, ...], buffer_shape: tuple[int, ...]) -> None:
+        """
+        Iterate over buffers of another shape, aligned to the chunks of another shape, before the first is read.
+
+        Used by `configure_backend` to apply the chunk and buffer shapes of a dataset configuration, so that each
+        buffer written covers whole chunks.
+        """
+        if self._buffer_hooks_started:
+            raise RuntimeError("The buffer shape of an iterator cannot be changed once it has started iterating.")
+        if any(
+            buffer_axis % chunk_axis != 0
+            for chunk_axis, buffer_axis, maxshape_axis in zip(chunk_shape, buffer_shape, self.maxshape)
+            if buffer_axis != maxshape_axis
+        ):
+            raise ValueError(f"The chunk shape {chunk_shape} does not evenly divide the buffer shape {buffer_shape}!")
+
+        self.chunk_shape = tuple(int(axis) for axis in chunk_shape)
+        self.buffer_shape = tuple(int(axis) for axis in buffer_shape)
+        self._chunk_size_mb = math.prod(self.chunk_shape) * self._get_dtype().itemsize / 1e6
+        self._buffer_size_gb = math.prod(self.buffer_shape) * self._get_dtype().itemsize / 1e9
+
+        buffer_starts_per_axis = [
+            range(0, maxshape_axis, buffer_axis) for maxshape_axis, buffer_axis in zip(self.maxshape, self.buffer_shape)
+        ]
+        self.num_buffers = math.prod(len(buffer_starts) for buffer_starts in buffer_starts_per_axis)
+        self.buffer_selection_generator = (
+            tuple(
+                slice(start, min(start + buffer_axis, maxshape_axis))
+                for start, buffer_axis, maxshape_axis in zip(buffer_starts, self.buffer_shape, self.maxshape)
+            )
+            for buffer_starts in itertools.product(*buffer_starts_per_axis)
+        )
+        if self.display_progress:
+            self.progress_bar.total = self.num_buffers
+            self.progress_bar.refresh()
+
+    def _get_source_fingerprint(self) -> str | None:
+        """
+        Identify the source this iterator reads from, without reading it, for reusing a dataset already written.
+
+        Returns None unless a subclass knows its source; see `neuroconv.tools._dataset_fingerprint`.
+        """
+        return None
+
     def _convert_index_to_slices(self, selection) -> tuple[slice, ...]:
         """Normalize an indexing selection into a tuple of resolved slice(start, stop) objects.
 
@@ -208,6 +359,9 @@ class SliceableDataChunkIterator(GenericDataChunkIterator):
     def _get_dtype(self) -> np.dtype:
         return self.data.dtype
 
+    def _get_source_fingerprint(self) -> str | None:
+        return get_source_fingerprint(data=self.data)
+
     @property
     def shape(self):
         """Return the shape of the wrapped data array."""
@@ -231,6 +385,8 @@ class SliceableDataChunkIterator(GenericDataChunkIterator):
         return self.data[resolved]
 
     def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        # A dataset of a remote HDF5 file is fetched a buffer at a time, rather than a chunk at a time as HDF5 reads it
+        prefetch_selection(data=self.data, selection=selection)
         return self.data[selection]
 
 
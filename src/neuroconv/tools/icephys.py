@@ -1,7 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Callable
 
 import numpy as np
+from hdmf.common import Data, DynamicTable
 from pynwb import NWBFile, TimeSeries
+from pynwb.base import TimeSeriesReferenceVectorData
 from pynwb.epoch import TimeIntervals
 from pynwb.icephys import (
     CurrentClampSeries,
@@ -77,6 +81,56 @@ def _add_patch_clamp_series_to_nwbfile(
     return series
 
 
+def _read_sweeps(read_sweep: Callable[[int], np.ndarray | None], num_sweeps: int, max_workers: int = 1) -> list:
+    """Call ``read_sweep`` on every sweep index, in order, with up to ``max_workers`` threads reading at once.
+
+    Threads rather than processes, since a sweep read is file I/O or parsing that releases the GIL (a memmap
+    slice, a C CSV parser) and its result has to land in the parent's arrays anyway. The results come back in
+    sweep order however the reads interleave.
+    """
+    if max_workers > 1 and num_sweeps > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(read_sweep, range(num_sweeps)))
+    return [read_sweep(sweep_index) for sweep_index in range(num_sweeps)]
+
+
+def _extend_table(table: DynamicTable, columns: dict[str, list]) -> None:
+    """Append rows to a table a whole column at a time.
+
+    ``DynamicTable.add_row`` validates and appends each cell through docval, which for the thousands of rows of
+    a long protocol costs far more than the conversion itself. Each column here is extended once instead. A
+    ragged column takes one list per row: its values are appended to its target and its index grows through
+    ``VectorIndex.add_vector``, which keeps the index dtype wide enough for the offsets it holds. The values are
+    trusted to match the column types, so callers write the first row through the validated path when the
+    values come from outside.
+
+    Parameters
+    ----------
+    table : DynamicTable
+        The table to extend, still in memory.
+    columns : dict of str to list
+        The values of every column of the table, one per new row.
+    """
+    if set(columns) != set(table.colnames):
+        raise ValueError(f"Expected values for the columns {list(table.colnames)}, got {list(columns)}.")
+    num_rows = {len(values) for values in columns.values()}
+    if len(num_rows) != 1:
+        raise ValueError("Every column must have the same number of rows.")
+    (num_rows,) = num_rows
+
+    columns_by_name = {column.name: column for column in table.columns}
+    for name, values in columns.items():
+        index = columns_by_name.get(f"{name}_index")
+        if index is None:
+            Data.extend(columns_by_name[name], values)
+            continue
+        for row_values in values:
+            Data.extend(columns_by_name[name], row_values)
+            index.add_vector([])
+
+    Data.extend(table.id, range(len(table.id), len(table.id) + num_rows))
+
+
 # NWB requires a `stimulus_type` on every SequentialRecordings entry, so a source that describes none still has
 # to put a string there. It is written only at that level: an interface with nothing to say omits the column from
 # the recordings table entirely rather than filling every row with a placeholder.
@@ -282,7 +336,7 @@ def _add_intracellular_recordings_to_nwbfile(
                 data=[_UNSTATED_RUN_LEVEL_VALUE] * len(table),
             )
 
-    for start_index, count in sweep_sample_ranges:
+    def add_intracellular_recording(start_index: int, count: int) -> None:
         keyword_arguments = dict(
             electrode=electrode,
             response=response_series,
@@ -296,6 +350,38 @@ def _add_intracellular_recordings_to_nwbfile(
         keyword_arguments.update(columns)
         nwbfile.add_intracellular_recording(**keyword_arguments)
 
+    if len(sweep_sample_ranges) == 0:
+        return
+
+    # The first sweep goes through pynwb, which validates the electrode, series and ranges of the run; the sweeps
+    # after it only differ in their range, so they are appended a column at a time.
+    add_intracellular_recording(*sweep_sample_ranges[0])
+    remaining_sweep_sample_ranges = sweep_sample_ranges[1:]
+
+    category_column_names = {name: category.colnames for name, category in table.category_tables.items()}
+    expected_category_column_names = dict(electrodes=("electrode",), stimuli=("stimulus",), responses=("response",))
+    if category_column_names != expected_category_column_names or set(table.colnames) != set(columns):
+        # Columns added to the table by hand have no value to extend with here, so pynwb reports them per row
+        for start_index, count in remaining_sweep_sample_ranges:
+            add_intracellular_recording(start_index=start_index, count=count)
+        return
+
+    # NWB stores a missing stimulus as a reference to the response with a (-1, -1) range
+    time_series_reference = TimeSeriesReferenceVectorData.TIME_SERIES_REFERENCE_TUPLE
+    num_sweeps = len(remaining_sweep_sample_ranges)
+    responses = [time_series_reference(start, count, response_series) for start, count in remaining_sweep_sample_ranges]
+    if stimulus_series is not None:
+        stimuli = [
+            time_series_reference(start, count, stimulus_series) for start, count in remaining_sweep_sample_ranges
+        ]
+    else:
+        stimuli = [time_series_reference(-1, -1, response_series)] * num_sweeps
+
+    _extend_table(table=table.category_tables["electrodes"], columns=dict(electrode=[electrode] * num_sweeps))
+    _extend_table(table=table.category_tables["stimuli"], columns=dict(stimulus=stimuli))
+    _extend_table(table=table.category_tables["responses"], columns=dict(response=responses))
+    _extend_table(table=table, columns={name: [value] * num_sweeps for name, value in columns.items()})
+
 
 def _disambiguate_run_labels(paths: list) -> dict:
     """Map each path to the shortest trailing path-suffix that is unique among ``paths``.
@@ -361,18 +447,17 @@ def _build_icephys_hierarchical_tables(nwbfile: NWBFile) -> None:
         return
 
     column_names = intracellular_recordings.colnames
-    responses = intracellular_recordings["responses"]["response"]
-    sequences = intracellular_recordings["sequence"]
-    stimulus_types = intracellular_recordings["stimulus_type"] if "stimulus_type" in column_names else None
-    repetitions = intracellular_recordings["repetition"] if "repetition" in column_names else None
-    conditions = intracellular_recordings["condition"] if "condition" in column_names else None
+    sweep_intervals = _get_sweep_intervals(intracellular_recordings=intracellular_recordings)
+    sequences = intracellular_recordings["sequence"][:]
+    stimulus_types = intracellular_recordings["stimulus_type"][:] if "stimulus_type" in column_names else None
+    repetitions = intracellular_recordings["repetition"][:] if "repetition" in column_names else None
+    conditions = intracellular_recordings["condition"][:] if "condition" in column_names else None
 
     # First pass: per sequence (in first-seen order), its timing groups and its run-level attributes.
     sequence_order: list = []
     timing_groups_by_sequence: dict = {}
     attributes_by_sequence: dict = {}
-    for row_index in range(len(intracellular_recordings)):
-        sequence_value = sequences[row_index]
+    for row_index, sequence_value in enumerate(sequences):
         if sequence_value not in timing_groups_by_sequence:
             sequence_order.append(sequence_value)
             timing_groups_by_sequence[sequence_value] = {}
@@ -381,29 +466,40 @@ def _build_icephys_hierarchical_tables(nwbfile: NWBFile) -> None:
                 repetition=repetitions[row_index] if repetitions is not None else None,
                 condition=conditions[row_index] if conditions is not None else None,
             )
-        response_reference = responses[row_index]
-        timing_key = _get_sweep_start_and_stop_time(
-            series=response_reference.timeseries,
-            start_index=response_reference.idx_start,
-            count=response_reference.count,
-        )
+        timing_key = sweep_intervals[row_index]
         timing_groups_by_sequence[sequence_value].setdefault(timing_key, []).append(row_index)
 
-    # Simultaneous + sequential: one sequential per sequence.
-    sequential_index_by_sequence: dict = {}
+    # Simultaneous + sequential: one sequential per sequence. Each table is filled in one call from its columns,
+    # its new rows numbered on from those already there.
+    simultaneous_recordings_table = nwbfile.get_icephys_simultaneous_recordings()
+    recordings_per_simultaneous = []
+    simultaneous_recordings_per_sequential = []
+    stimulus_type_per_sequential = []
     for sequence_value in sequence_order:
         timing_groups = timing_groups_by_sequence[sequence_value]
-        simultaneous_indices = [
-            nwbfile.add_icephys_simultaneous_recording(recordings=timing_groups[timing_key])
-            for timing_key in sorted(timing_groups)
-        ]
-        stimulus_type = attributes_by_sequence[sequence_value]["stimulus_type"]
-        sequential_index_by_sequence[sequence_value] = nwbfile.add_icephys_sequential_recording(
-            simultaneous_recordings=simultaneous_indices,
-            # A run that stated none reaches here as `None` (no column at all) or as the unstated value (a
-            # sibling run forced the column); both mean the same thing and get the one readable placeholder.
-            stimulus_type=stimulus_type if stimulus_type else _UNDESCRIBED_STIMULUS_TYPE,
+        first_simultaneous_index = len(simultaneous_recordings_table) + len(recordings_per_simultaneous)
+        recordings_per_simultaneous.extend(timing_groups[timing_key] for timing_key in sorted(timing_groups))
+        simultaneous_recordings_per_sequential.append(
+            list(range(first_simultaneous_index, len(simultaneous_recordings_table) + len(recordings_per_simultaneous)))
         )
+        stimulus_type = attributes_by_sequence[sequence_value]["stimulus_type"]
+        # A run that stated none reaches here as `None` (no column at all) or as the unstated value (a sibling
+        # run forced the column); both mean the same thing and get the one readable placeholder.
+        stimulus_type_per_sequential.append(stimulus_type if stimulus_type else _UNDESCRIBED_STIMULUS_TYPE)
+
+    sequential_recordings_table = nwbfile.get_icephys_sequential_recordings()
+    first_sequential_index = len(sequential_recordings_table)
+    _extend_table(table=simultaneous_recordings_table, columns=dict(recordings=recordings_per_simultaneous))
+    _extend_table(
+        table=sequential_recordings_table,
+        columns=dict(
+            simultaneous_recordings=simultaneous_recordings_per_sequential,
+            stimulus_type=stimulus_type_per_sequential,
+        ),
+    )
+    sequential_index_by_sequence = {
+        sequence_value: first_sequential_index + position for position, sequence_value in enumerate(sequence_order)
+    }
 
     # The repetitions level is built when it was requested (a `repetition` column) or when `condition` needs a
     # rung beneath it. Absent both, the hierarchy terminates at SequentialRecordings.
@@ -426,11 +522,16 @@ def _build_icephys_hierarchical_tables(nwbfile: NWBFile) -> None:
             condition_by_repetition[repetition_key] = attributes["condition"]
         sequentials_by_repetition[repetition_key].append(sequential_index_by_sequence[sequence_value])
 
-    repetition_index_by_key: dict = {}
-    for repetition_key in repetition_order:
-        repetition_index_by_key[repetition_key] = nwbfile.add_icephys_repetition(
-            sequential_recordings=sequentials_by_repetition[repetition_key]
-        )
+    repetitions_table = nwbfile.get_icephys_repetitions()
+    repetition_index_by_key = {
+        repetition_key: len(repetitions_table) + position for position, repetition_key in enumerate(repetition_order)
+    }
+    _extend_table(
+        table=repetitions_table,
+        columns=dict(
+            sequential_recordings=[sequentials_by_repetition[repetition_key] for repetition_key in repetition_order]
+        ),
+    )
 
     if conditions is None:
         return
@@ -445,8 +546,10 @@ def _build_icephys_hierarchical_tables(nwbfile: NWBFile) -> None:
             repetitions_by_condition[condition_value] = []
         repetitions_by_condition[condition_value].append(repetition_index_by_key[repetition_key])
 
-    for condition_value in condition_order:
-        nwbfile.add_icephys_experimental_condition(repetitions=repetitions_by_condition[condition_value])
+    _extend_table(
+        table=nwbfile.get_icephys_experimental_conditions(),
+        columns=dict(repetitions=[repetitions_by_condition[condition_value] for condition_value in condition_order]),
+    )
 
 
 def _get_sweep_start_and_stop_time(series: TimeSeries, start_index: int, count: int) -> tuple[float, float]:
@@ -471,6 +574,42 @@ def _get_sweep_start_and_stop_time(series: TimeSeries, start_index: int, count:
     )
 
 
+def _get_sweep_intervals(intracellular_recordings) -> list[tuple[float, float]]:
+    """Return the ``(start_time, stop_time)`` of every row's response, as :func:`_get_sweep_start_and_stop_time`.
+
+    The rows addressing one series are resolved together, with one array operation over their ranges, since a run
+    of thousands of sweeps otherwise spends most of its aggregation time computing two values at a time. The
+    values are the same floats the scalar path returns, so grouping on them agrees with it exactly.
+    """
+    response_references = intracellular_recordings.category_tables["responses"]["response"][:]
+
+    rows_by_series: dict = {}
+    for row_index, response_reference in enumerate(response_references):
+        series = response_reference.timeseries
+        rows_by_series.setdefault(id(series), (series, []))[1].append(row_index)
+
+    sweep_intervals = [None] * len(response_references)
+    for series, row_indices in rows_by_series.values():
+        first_indices = np.array([response_references[row_index].idx_start for row_index in row_indices])
+        last_indices = first_indices + np.array([response_references[row_index].count for row_index in row_indices]) - 1
+        if series.timestamps is None:
+            start_times = series.starting_time + first_indices / series.rate
+            stop_times = series.starting_time + last_indices / series.rate
+        elif isinstance(series.timestamps, np.ndarray):
+            start_times = series.timestamps[first_indices]
+            stop_times = series.timestamps[last_indices]
+        else:  # Timestamps still on disk are read two values at a time rather than loaded whole
+            start_times = [float(series.timestamps[index]) for index in first_indices]
+            stop_times = [float(series.timestamps[index]) for index in last_indices]
+
+        for row_index, start_time, stop_time in zip(
+            row_indices, np.asarray(start_times).tolist(), np.asarray(stop_times).tolist()
+        ):
+            sweep_intervals[row_index] = (start_time, stop_time)
+
+    return sweep_intervals
+
+
 def _add_sweep_time_intervals_to_nwbfile(nwbfile: NWBFile, name: str = "sweeps") -> None:
     """
     Add a ``TimeIntervals`` table holding the start and stop time of every sweep in the file.
@@ -500,18 +639,12 @@ def _add_sweep_time_intervals_to_nwbfile(nwbfile: NWBFile, name: str = "sweeps")
     if intracellular_recordings is None or len(intracellular_recordings) == 0:
         return
 
-    responses = intracellular_recordings["responses"]["response"]
+    sweep_intervals = _get_sweep_intervals(intracellular_recordings=intracellular_recordings)
     has_sequence_column = "sequence" in intracellular_recordings.colnames
-    sequences = intracellular_recordings["sequence"] if has_sequence_column else None
+    sequences = intracellular_recordings["sequence"][:] if has_sequence_column else None
 
     sequence_by_interval: dict = {}
-    for row_index in range(len(intracellular_recordings)):
-        response_reference = responses[row_index]
-        interval = _get_sweep_start_and_stop_time(
-            series=response_reference.timeseries,
-            start_index=response_reference.idx_start,
-            count=response_reference.count,
-        )
+    for row_index, interval in enumerate(sweep_intervals):
         if interval not in sequence_by_interval:
             sequence_by_interval[interval] = sequences[row_index] if has_sequence_column else None
 
@@ -521,12 +654,13 @@ def _add_sweep_time_intervals_to_nwbfile(nwbfile: NWBFile, name: str = "sweeps")
     )
     if has_sequence_column:
         sweeps.add_column(name="sequence", description="Run the sweep belongs to (from the recordings table).")
-    for start_time, stop_time in sorted(sequence_by_interval):
-        row = dict(start_time=start_time, stop_time=stop_time)
-        if has_sequence_column:
-            row["sequence"] = sequence_by_interval[(start_time, stop_time)]
-        # check_ragged=False: hdmf rescans the whole column on every add_row, making this quadratic in the
-        # number of sweeps. Every cell here is a scalar, so the check can only ever return False.
-        sweeps.add_row(**row, check_ragged=False)
+    sorted_intervals = sorted(sequence_by_interval)
+    columns = dict(
+        start_time=[start_time for start_time, _ in sorted_intervals],
+        stop_time=[stop_time for _, stop_time in sorted_intervals],
+    )
+    if has_sequence_column:
+        columns["sequence"] = [sequence_by_interval[interval] for interval in sorted_intervals]
+    _extend_table(table=sweeps, columns=columns)
 
     nwbfile.add_time_intervals(sweeps)
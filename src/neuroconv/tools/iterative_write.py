@@ -167,3 +167,174 @@ def get_electrical_series_chunk_shape(
     chunk_frames = min(chunk_frames, number_of_frames)
 
     return (chunk_frames, chunk_channels)
+
+
+def _get_expected_chunks_per_axis(read_length: int, chunk_lengths: np.ndarray, axis_length: int) -> np.ndarray:
+    """
+    The expected number of chunks a read of `read_length` touches along one axis, for each candidate chunk length.
+
+    A read starting at a uniformly random position spans one chunk plus one more for every chunk boundary it crosses,
+    which is `1 + (read_length - 1) / chunk_length` on average, and never more than the axis holds.
+    """
+    number_of_chunks_along_axis = np.ceil(axis_length / chunk_lengths)
+    if read_length >= axis_length:
+        return number_of_chunks_along_axis
+
+    return np.minimum(1 + (read_length - 1) / chunk_lengths, number_of_chunks_along_axis)
+
+
+def estimate_read_pattern_cost(
+    *,
+    chunk_shape: tuple[int, ...],
+    full_shape: tuple[int, ...],
+    dtype: np.dtype,
+    read_patterns: list,
+    request_latency_in_seconds: float = 0.05,
+    bandwidth_in_mb_per_second: float = 100.0,
+) -> float:
+    """
+    Estimate the expected time of one read, weighted across the declared read patterns, for a given chunk shape.
+
+    Each read pays a fixed latency for every chunk it touches and transfers every touched chunk in full, which is
+    the cost model of streaming a chunked dataset from cloud object storage.
+
+    Parameters
+    ----------
+    chunk_shape : tuple[int, ...]
+        The chunk shape to evaluate.
+    full_shape : tuple[int, ...]
+        The shape of the dataset.
+    dtype : np.dtype
+        The data type of the dataset.
+    read_patterns : list of neuroconv.tools.nwb_helpers.ReadPattern
+        The ways the dataset is expected to be read, each with a relative weight.
+    request_latency_in_seconds : float, default: 0.05
+        The fixed cost of requesting one chunk.
+    bandwidth_in_mb_per_second : float, default: 100.0
+        The rate at which chunk bytes are transferred once requested.
+
+    Returns
+    -------
+    float
+        The expected time in seconds of one read drawn from the patterns in proportion to their weights.
+    """
+    costs = _get_read_pattern_costs(
+        candidate_chunk_lengths=[np.array([chunk_axis]) for chunk_axis in chunk_shape],
+        full_shape=full_shape,
+        dtype=dtype,
+        read_patterns=read_patterns,
+        request_latency_in_seconds=request_latency_in_seconds,
+        bandwidth_in_mb_per_second=bandwidth_in_mb_per_second,
+    )
+    return float(costs.flat[0])
+
+
+def _get_read_pattern_costs(
+    *,
+    candidate_chunk_lengths: list[np.ndarray],
+    full_shape: tuple[int, ...],
+    dtype: np.dtype,
+    read_patterns: list,
+    request_latency_in_seconds: float,
+    bandwidth_in_mb_per_second: float,
+) -> np.ndarray:
+    """Evaluate the weighted read cost over the grid spanned by the candidate chunk lengths of every axis."""
+    number_of_axes = len(full_shape)
+    for read_pattern in read_patterns:
+        if len(read_pattern.selection_shape) != number_of_axes:
+            raise ValueError(
+                f"The read pattern {read_pattern.selection_shape} has {len(read_pattern.selection_shape)} axes but "
+                f"the dataset of shape {full_shape} has {number_of_axes}!"
+            )
+
+    # Reshape each axis' candidates so that they broadcast against one another into the full grid
+    broadcast_chunk_lengths = [
+        candidate_lengths.astype("float64").reshape([-1 if axis == axis_index else 1 for axis in range(number_of_axes)])
+        for axis_index, candidate_lengths in enumerate(candidate_chunk_lengths)
+    ]
+    chunk_size_in_bytes = math.prod(broadcast_chunk_lengths) * dtype.itemsize
+    seconds_per_chunk = request_latency_in_seconds + chunk_size_in_bytes / (bandwidth_in_mb_per_second * 1e6)
+
+    total_weight = sum(read_pattern.weight for read_pattern in read_patterns)
+    costs = np.zeros(shape=chunk_size_in_bytes.shape)
+    for read_pattern in read_patterns:
+        expected_chunks = 1.0
+        for axis_index, read_length in enumerate(read_pattern.selection_shape):
+            axis_length = full_shape[axis_index]
+            read_length = axis_length if read_length is None else min(read_length, axis_length)
+            expected_chunks = expected_chunks * _get_expected_chunks_per_axis(
+                read_length=read_length,
+                chunk_lengths=broadcast_chunk_lengths[axis_index],
+                axis_length=axis_length,
+            )
+        costs = costs + read_pattern.weight / total_weight * expected_chunks * seconds_per_chunk
+
+    return costs
+
+
+def get_read_pattern_chunk_shape(
+    *,
+    full_shape: tuple[int, ...],
+    dtype: np.dtype,
+    read_patterns: list,
+    chunk_mb: float = 10.0,
+    request_latency_in_seconds: float = 0.05,
+    bandwidth_in_mb_per_second: float = 100.0,
+) -> tuple[int, ...]:
+    """
+    Choose the chunk shape that minimizes the expected cost of the declared read patterns.
+
+    Unlike the shape-based estimates above, which keep the aspect ratio of the data, this weighs how the data will be
+    read afterwards: a dataset read one channel at a time over a whole session is best chunked long and narrow, and
+    one read a second at a time across all channels short and wide. Every combination of power-of-two (or full)
+    lengths along each axis that fits within `chunk_mb` is scored with :py:func:`estimate_read_pattern_cost`.
+
+    Parameters
+    ----------
+    full_shape : tuple[int, ...]
+        The shape of the dataset.
+    dtype : np.dtype
+        The data type of the dataset.
+    read_patterns : list of neuroconv.tools.nwb_helpers.ReadPattern
+        The ways the dataset is expected to be read, each with a relative weight.
+    chunk_mb : float, default: 10.0
+        The upper bound on size in megabytes (MB) of a chunk.
+    request_latency_in_seconds : float, default: 0.05
+        The fixed cost of requesting one chunk.
+    bandwidth_in_mb_per_second : float, default: 100.0
+        The rate at which chunk bytes are transferred once requested.
+
+    Returns
+    -------
+    tuple[int, ...]
+        The chunk shape; among shapes of equal cost, the one holding the most bytes.
+    """
+    assert chunk_mb > 0, f"chunk_mb ({chunk_mb}) must be greater than zero!"
+    assert len(read_patterns) > 0, "At least one read pattern must be declared!"
+
+    candidate_chunk_lengths = list()
+    for axis_length in full_shape:
+        powers_of_two = 2 ** np.arange(int(math.log2(axis_length)) + 1) if axis_length > 0 else np.array([1])
+        candidate_chunk_lengths.append(np.unique(np.append(powers_of_two[powers_of_two < axis_length], axis_length)))
+
+    costs = _get_read_pattern_costs(
+        candidate_chunk_lengths=candidate_chunk_lengths,
+        full_shape=full_shape,
+        dtype=dtype,
+        read_patterns=read_patterns,
+        request_latency_in_seconds=request_latency_in_seconds,
+        bandwidth_in_mb_per_second=bandwidth_in_mb_per_second,
+    )
+    chunk_size_in_bytes = np.ones(shape=costs.shape) * dtype.itemsize
+    for axis_index, candidate_lengths in enumerate(candidate_chunk_lengths):
+        axis_shape = [-1 if axis == axis_index else 1 for axis in range(len(full_shape))]
+        chunk_size_in_bytes = chunk_size_in_bytes * candidate_lengths.reshape(axis_shape)
+    costs[chunk_size_in_bytes > chunk_mb * 1e6] = np.inf
+
+    # Prefer the largest chunk among those within floating point noise of the lowest cost; fewer chunks in a file
+    # means less metadata to read when it is opened
+    minimal_cost = costs.min()
+    is_minimal = costs <= minimal_cost * (1 + 1e-9)
+    best_index = np.unravel_index(np.argmax(np.where(is_minimal, chunk_size_in_bytes, -1)), costs.shape)
+
+    return tuple(int(candidate_chunk_lengths[axis][index]) for axis, index in enumerate(best_index))
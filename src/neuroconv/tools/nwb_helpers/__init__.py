@@ -12,7 +12,11 @@ from ._backend_configuration import (
 from ._configuration_models import DATASET_IO_CONFIGURATIONS
 from ._configuration_models._base_backend import BackendConfiguration
 from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configuration_models._compression_benchmark import CompressionBenchmark
+from ._configuration_models._conversion_plan import ConversionPlan, DatasetWritePlan
 from ._configuration_models._hdf5_backend import HDF5BackendConfiguration
+from ._configuration_models._read_pattern import ReadPattern
+from ._configuration_models._write_progress_event import WriteProgressEvent
 from ._configuration_models._hdf5_dataset_io import (
     AVAILABLE_HDF5_COMPRESSION_METHODS,
     HDF5DatasetIOConfiguration,
@@ -23,6 +27,11 @@ from ._configuration_models._zarr_dataset_io import (
     ZarrDatasetIOConfiguration,
 )
 from ._configure_backend import configure_backend
+from ._conversion_plan import plan_nwbfile_write
+from ._integrity_manifest import verify_integrity_manifest
+from ._memory_budget import MemoryBudget
+from ._read_pattern_replay import replay_read_patterns
+from ._write_progress import WriteProgressMonitor
 from ._dataset_configuration import get_default_dataset_io_configurations, get_existing_dataset_io_configurations
 from ._metadata_and_file_helpers import (
     _add_device_model_to_nwbfile,
@@ -44,9 +53,16 @@ __all__ = [
     "DATASET_IO_CONFIGURATIONS",
     "BACKEND_NWB_IO",
     "BackendConfiguration",
+    "CompressionBenchmark",
+    "ConversionPlan",
+    "DatasetWritePlan",
     "HDF5BackendConfiguration",
     "ZarrBackendConfiguration",
     "DatasetIOConfiguration",
+    "MemoryBudget",
+    "ReadPattern",
+    "WriteProgressEvent",
+    "WriteProgressMonitor",
     "HDF5DatasetIOConfiguration",
     "ZarrDatasetIOConfiguration",
     "get_default_backend_configuration",
@@ -54,6 +70,8 @@ __all__ = [
     "get_existing_backend_configuration",
     "get_existing_dataset_io_configurations",
     "configure_backend",
+    "plan_nwbfile_write",
+    "replay_read_patterns",
     "get_default_dataset_io_configurations",
     "get_default_backend_configuration",
     "add_device_from_metadata",
@@ -64,4 +82,5 @@ __all__ = [
     "make_nwbfile_from_metadata",
     "make_or_load_nwbfile",
     "repack_nwbfile",
+    "verify_integrity_manifest",
 ]
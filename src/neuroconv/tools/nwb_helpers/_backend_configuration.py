@@ -6,6 +6,7 @@ from hdmf_zarr import NWBZarrIO
 from pynwb import NWBHDF5IO, NWBFile
 
 from ._configuration_models._hdf5_backend import HDF5BackendConfiguration
+from ._configuration_models._read_pattern import ReadPattern
 from ._configuration_models._zarr_backend import ZarrBackendConfiguration
 
 BACKEND_CONFIGURATIONS = dict(hdf5=HDF5BackendConfiguration, zarr=ZarrBackendConfiguration)
@@ -13,12 +14,31 @@ BACKEND_NWB_IO = dict(hdf5=NWBHDF5IO, zarr=NWBZarrIO)
 
 
 def get_default_backend_configuration(
-    nwbfile: NWBFile, backend: Literal["hdf5", "zarr"]
+    nwbfile: NWBFile,
+    backend: Literal["hdf5", "zarr"],
+    read_patterns: dict[str, list[ReadPattern]] | None = None,
 ) -> HDF5BackendConfiguration | ZarrBackendConfiguration:
-    """Fill a default backend configuration to serve as a starting point for further customization."""
+    """
+    Fill a default backend configuration to serve as a starting point for further customization.
+
+    Parameters
+    ----------
+    nwbfile : NWBFile
+        The in-memory NWBFile to derive the configuration from.
+    backend : "hdf5" or "zarr"
+        The backend the file will be written with.
+    read_patterns : dict, optional
+        A mapping from the location of a dataset in the file (e.g. 'acquisition/ElectricalSeries/data') to a list of
+        `ReadPattern` describing how it is expected to be read after it is written. Datasets named here are chunked
+        to minimize the expected cost of those reads rather than by their shape alone.
 
+    Returns
+    -------
+    HDF5BackendConfiguration | ZarrBackendConfiguration
+        The default backend configuration.
+    """
     BackendConfigurationClass = BACKEND_CONFIGURATIONS[backend]
-    return BackendConfigurationClass.from_nwbfile_with_defaults(nwbfile=nwbfile)
+    return BackendConfigurationClass.from_nwbfile_with_defaults(nwbfile=nwbfile, read_patterns=read_patterns)
 
 
 def get_existing_backend_configuration(nwbfile: NWBFile) -> HDF5BackendConfiguration | ZarrBackendConfiguration:
@@ -0,0 +1,373 @@
+"""Write the iterative datasets of an NWB file with a journal of their buffers, from which an interrupted write resumes."""
+
+import json
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import h5py
+import zarr
+from hdmf.build import BuildManager
+from hdmf.build.builders import BaseBuilder, DatasetBuilder, LinkBuilder, ReferenceBuilder
+from hdmf.common import Data
+from hdmf.container import DataIO
+from hdmf.data_utils import AbstractDataChunkIterator
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from pynwb import NWBFile, get_manager
+
+from ._configuration_models._base_backend import BackendConfiguration
+from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configure_backend import _replace_dataset
+from ._staged_write import StagedDataset, _get_buffer_selections, _get_empty_data_io, write_staged_datasets
+from .._dataset_fingerprint import describe_value_for_fingerprint, get_source_fingerprint, hash_text
+from ..hdmf import GenericDataChunkIterator
+
+# The journal of the file itself, recording that everything but the checkpointed datasets was written
+_NWBFILE_JOURNAL_NAME = "nwbfile.journal"
+
+# Set anew each time an NWBFile is created, so left out of what identifies the rest of the file
+_FIELDS_SET_ON_CREATION = ("object_id", "file_create_date")
+
+
+@dataclass
+class _Checkpoint:
+    """A dataset created empty in the file and filled from its iterator, and the journal of the buffers it holds."""
+
+    neurodata_object: Any
+    dataset_configuration: DatasetIOConfiguration
+    iterator: HDMFGenericDataChunkIterator
+    journal_file_path: Path
+
+    def get_journal_header(self) -> dict:
+        """What the dataset was created for; a file created for anything else is written again."""
+        return dict(
+            location_in_file=self.dataset_configuration.location_in_file,
+            shape=list(self.iterator.maxshape),
+            dtype=self.iterator.dtype.str,
+            buffer_shape=list(self.iterator.buffer_shape),
+            storage_fingerprint=self.dataset_configuration.get_storage_fingerprint(),
+            source_fingerprint=get_source_fingerprint(data=self.iterator),
+        )
+
+
+def _read_completed_buffers(checkpoint: _Checkpoint) -> set[tuple[tuple[int, int], ...]]:
+    """
+    The buffers the journal records as written.
+
+    A line cut short by the interruption is ignored, as the buffer it was recording.
+    """
+    if not checkpoint.journal_file_path.exists():
+        return set()
+
+    completed_buffers = set()
+    for line in checkpoint.journal_file_path.read_text(encoding="utf-8").splitlines():
+        try:
+            completed_buffers.add(tuple(tuple(axis) for axis in json.loads(line)))
+        except json.JSONDecodeError:
+            continue
+
+    return completed_buffers
+
+
+def _describe_builder_value(value: Any) -> Any:
+    """Describe the data or an attribute of a builder for `json.dumps`, naming the builders it refers to by path."""
+    if isinstance(value, DataIO):
+        return _describe_builder_value(value=value.data)
+    if isinstance(value, ReferenceBuilder):
+        return dict(reference=value.builder.path)
+    if isinstance(value, BaseBuilder):
+        return dict(reference=value.path)
+    if isinstance(value, (h5py.Dataset, AbstractDataChunkIterator)):
+        # A source that cannot be identified without reading it is described by its representation, which differs
+        # from one conversion to the next, so that a file holding one is never resumed
+        return dict(source=get_source_fingerprint(data=value) or repr(value))
+
+    return describe_value_for_fingerprint(value=value)
+
+
+def _describe_builder(builder: BaseBuilder, skipped_locations: set[str]) -> dict:
+    """Describe a builder and everything under it, but the datasets at `skipped_locations` and the fields set on creation."""
+    if isinstance(builder, LinkBuilder):
+        return dict(link=builder.builder.path)
+
+    attributes = {name: value for name, value in builder.attributes.items() if name not in _FIELDS_SET_ON_CREATION}
+    if isinstance(builder, DatasetBuilder):
+        return dict(attributes=attributes, data=builder.data)
+
+    children = dict()
+    for name, child in {**builder.groups, **builder.datasets, **builder.links}.items():
+        location_in_file = child.path.partition("/")[2]
+        if location_in_file in skipped_locations or name in _FIELDS_SET_ON_CREATION:
+            continue
+        children[name] = _describe_builder(builder=child, skipped_locations=skipped_locations)
+
+    return dict(attributes=attributes, children=children)
+
+
+def _get_rest_of_nwbfile_fingerprint(
+    nwbfile: NWBFile, backend_configuration: BackendConfiguration, checkpoints: list["_Checkpoint"]
+) -> str:
+    """
+    Fingerprint everything the file holds but the checkpointed datasets: its metadata, the data of every other
+    dataset and the storage settings of those configured.
+
+    The data is described as by `get_source_fingerprint`, with arrays held in memory hashed.
+    """
+    checkpointed_locations = {checkpoint.dataset_configuration.location_in_file for checkpoint in checkpoints}
+    nwbfile_builder = _build_nwbfile(nwbfile=nwbfile).get_builder(nwbfile)
+    description = dict(
+        nwbfile=_describe_builder(builder=nwbfile_builder, skipped_locations=checkpointed_locations),
+        storage_fingerprints={
+            location_in_file: dataset_configuration.get_storage_fingerprint()
+            for location_in_file, dataset_configuration in backend_configuration.dataset_configurations.items()
+            if location_in_file not in checkpointed_locations
+        },
+    )
+
+    return hash_text(text=json.dumps(description, sort_keys=True, default=_describe_builder_value))
+
+
+def _can_resume(nwbfile_path: Path, nwbfile_journal_file_path: Path, header: dict, backend: str) -> bool:
+    """Whether the file was written for this content and these datasets, before an interruption, and can be opened."""
+    if not nwbfile_journal_file_path.exists():
+        return False
+
+    try:
+        is_same_file = json.loads(nwbfile_journal_file_path.read_text(encoding="utf-8")) == header
+    except json.JSONDecodeError:
+        is_same_file = False
+    if not is_same_file:
+        warnings.warn(
+            f"The checkpoints in '{nwbfile_journal_file_path.parent}' were written for another file, content, source "
+            "or settings, so the file is written again from its start."
+        )
+        return False
+
+    try:
+        if backend == "hdf5":
+            with h5py.File(name=nwbfile_path, mode="r"):
+                pass
+        else:
+            zarr.open_group(store=str(nwbfile_path), mode="r")
+    except (OSError, ValueError, zarr.errors.GroupNotFoundError):
+        # HDF5 can leave a file interrupted while writing unreadable
+        warnings.warn(f"The file at '{nwbfile_path}' could not be opened, so it is written again from its start.")
+        return False
+
+    return True
+
+
+def prepare_checkpoints(
+    nwbfile: NWBFile,
+    backend_configuration: BackendConfiguration,
+    nwbfile_path: Path,
+    checkpoint_folder_path: Path,
+) -> tuple[list[_Checkpoint], dict, bool]:
+    """
+    Have every dataset fed by a data chunk iterator created empty when the file is written, to be filled by
+    `write_checkpoints`, and find whether an earlier write of the file can be resumed.
+
+    An earlier write is resumed when it got as far as filling the datasets, for the same file, datasets, sources
+    and settings, and for the same rest of the file: its metadata, the data of every other dataset and their storage
+    settings. The file is then not written again, as everything but these datasets is kept as it was written before
+    the interruption. Otherwise the journals are cleared.
+
+    Must be called after `configure_backend`, whose `DataIO` it replaces. Returns the checkpoints, the header of the
+    journal of the file, to be passed to `write_checkpoints`, and whether the file is resumed.
+    """
+    checkpoint_folder_path = Path(checkpoint_folder_path)
+    checkpoint_folder_path.mkdir(parents=True, exist_ok=True)
+
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+    checkpoints = list()
+    for location_in_file, dataset_configuration in backend_configuration.dataset_configurations.items():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        if isinstance(neurodata_object, Data):
+            data_io = neurodata_object.data
+        else:
+            data_io = neurodata_object.fields.get(dataset_configuration.dataset_name)
+        if not isinstance(data_io, DataIO) or not isinstance(data_io.data, HDMFGenericDataChunkIterator):
+            continue
+
+        checkpoint = _Checkpoint(
+            neurodata_object=neurodata_object,
+            dataset_configuration=dataset_configuration,
+            iterator=data_io.data,
+            journal_file_path=checkpoint_folder_path / f"{hash_text(text=location_in_file)}.journal",
+        )
+        checkpoints.append(checkpoint)
+        _replace_dataset(
+            neurodata_object=neurodata_object,
+            dataset_name=dataset_configuration.dataset_name,
+            data=_get_empty_data_io(
+                data_io_class=backend_configuration.data_io_class,
+                iterator=checkpoint.iterator,
+                dataset_configuration=dataset_configuration,
+            ),
+        )
+
+    nwbfile_journal_header = dict(
+        nwbfile_path=str(Path(nwbfile_path).resolve()),
+        rest_of_nwbfile_fingerprint=_get_rest_of_nwbfile_fingerprint(
+            nwbfile=nwbfile, backend_configuration=backend_configuration, checkpoints=checkpoints
+        ),
+        datasets=[checkpoint.get_journal_header() for checkpoint in checkpoints],
+    )
+    is_resumed = _can_resume(
+        nwbfile_path=Path(nwbfile_path),
+        nwbfile_journal_file_path=checkpoint_folder_path / _NWBFILE_JOURNAL_NAME,
+        header=nwbfile_journal_header,
+        backend=backend_configuration.backend,
+    )
+    if not is_resumed:
+        for journal_file_path in checkpoint_folder_path.glob("*.journal"):
+            journal_file_path.unlink()
+
+    return checkpoints, nwbfile_journal_header, is_resumed
+
+
+def _record_buffer(journal, buffer_selection: tuple[slice, ...]) -> None:
+    """Append the bounds of a buffer to its journal, on disk before returning."""
+    buffer_bounds = tuple((axis.start, axis.stop) for axis in buffer_selection)
+    journal.write(f"{json.dumps(buffer_bounds)}\n")
+    journal.flush()
+    os.fsync(journal.fileno())
+
+
+def _fill_zarr_array(checkpoint: _Checkpoint, array: zarr.Array, completed_buffers: set) -> None:
+    """
+    Write the buffers of one iterator that its journal does not record into its array, journaling each as it lands.
+
+    Zarr writes each chunk as it is assigned, and each array is a folder of its own, so the threads write their
+    arrays themselves. Every buffer is read whole, or, under a memory budget, in pieces of at most its allowance, as
+    the iterator itself would read it.
+    """
+    iterator = checkpoint.iterator
+    # The iterators of neuroconv are taken through the steps of their `__next__` one by one, for their buffer hooks;
+    # other iterators are only read
+    calls_buffer_hooks = isinstance(iterator, GenericDataChunkIterator)
+    if calls_buffer_hooks:
+        iterator._start_buffer_hooks()
+    with open(checkpoint.journal_file_path, mode="a", encoding="utf-8") as journal:
+        for buffer_selection in _get_buffer_selections(shape=iterator.maxshape, buffer_shape=iterator.buffer_shape):
+            buffer_bounds = tuple((axis.start, axis.stop) for axis in buffer_selection)
+            if buffer_bounds in completed_buffers:
+                if calls_buffer_hooks:
+                    iterator._record_buffer_written(selection=buffer_selection, was_resumed=True)
+                continue
+
+            pieces = iterator._split_buffer(selection=buffer_selection) if calls_buffer_hooks else [buffer_selection]
+            for piece in pieces:
+                data = iterator._read_buffer(selection=piece) if calls_buffer_hooks else iterator._get_data(piece)
+                array[piece] = data
+
+            _record_buffer(journal=journal, buffer_selection=buffer_selection)
+            if calls_buffer_hooks:
+                iterator._record_buffer_written(selection=buffer_selection)
+    if calls_buffer_hooks:
+        iterator._finish_buffer_hooks()
+
+
+def write_checkpoints(
+    nwbfile_path: Path,
+    checkpoints: list[_Checkpoint],
+    checkpoint_folder_path: Path,
+    nwbfile_journal_header: dict,
+    backend: str,
+    is_resumed: bool = False,
+    max_workers: int = 1,
+) -> None:
+    """
+    Fill the datasets `prepare_checkpoints` had created empty in the file just written, or resumed, in place.
+
+    Each buffer of an iterator is recorded in a journal in `checkpoint_folder_path` once it is on disk, and the
+    buffers the journals record are skipped, so a write resumed after an interruption reads and writes only the
+    unfinished buffers. Every buffer is written once, into the file itself. HDF5 datasets are filled by one writer
+    from up to `max_workers` reading threads, as by `write_staged_datasets`, which flushes the file before each buffer
+    is journaled; Zarr arrays are filled by up to `max_workers` threads, each writing its own.
+    """
+    checkpoint_folder_path = Path(checkpoint_folder_path)
+    if not is_resumed:
+        # Journaled only once the rest of the file is written, so that a write interrupted before then starts over
+        (checkpoint_folder_path / _NWBFILE_JOURNAL_NAME).write_text(
+            json.dumps(nwbfile_journal_header), encoding="utf-8"
+        )
+
+    completed_buffers = [_read_completed_buffers(checkpoint=checkpoint) for checkpoint in checkpoints]
+
+    if backend == "hdf5":
+        staged_datasets = [
+            StagedDataset(
+                iterator=checkpoint.iterator,
+                location_in_file=checkpoint.dataset_configuration.location_in_file,
+                completed_buffers=checkpoint_completed_buffers,
+            )
+            for checkpoint, checkpoint_completed_buffers in zip(checkpoints, completed_buffers)
+        ]
+        journals_by_location = {
+            checkpoint.dataset_configuration.location_in_file: open(
+                checkpoint.journal_file_path, mode="a", encoding="utf-8"
+            )
+            for checkpoint in checkpoints
+        }
+
+        def record_buffer(staged_dataset: StagedDataset, buffer_selection: tuple[slice, ...]) -> None:
+            _record_buffer(
+                journal=journals_by_location[staged_dataset.location_in_file], buffer_selection=buffer_selection
+            )
+
+        try:
+            write_staged_datasets(
+                nwbfile_path=nwbfile_path,
+                staged_datasets=staged_datasets,
+                max_workers=max_workers,
+                on_buffer_written=record_buffer,
+            )
+        finally:
+            for journal in journals_by_location.values():
+                journal.close()
+        return
+
+    nwbfile = zarr.open_group(store=str(nwbfile_path), mode="r+")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _fill_zarr_array,
+                checkpoint=checkpoint,
+                array=nwbfile[checkpoint.dataset_configuration.location_in_file],
+                completed_buffers=checkpoint_completed_buffers,
+            )
+            for checkpoint, checkpoint_completed_buffers in zip(checkpoints, completed_buffers)
+        ]
+        for future in futures:
+            future.result()
+
+
+def _build_nwbfile(nwbfile: NWBFile) -> BuildManager:
+    """Build an NWBFile without writing it, with a manager of its own."""
+    # As `_get_nwbfile_builder`, the manager of a file read from disk carries the namespaces cached in that file
+    build_manager = BuildManager(nwbfile.read_io.manager.type_map) if nwbfile.read_io is not None else get_manager()
+    build_manager.build(nwbfile, export=nwbfile.read_io is not None)
+    return build_manager
+
+
+def build_resumed_nwbfile(nwbfile: NWBFile) -> BuildManager:
+    """
+    Build the NWBFile as it was written before the interruption, without writing it again.
+
+    The manager returned locates its datasets in the file for the dataset cache and the integrity manifest, as the
+    manager that wrote it would have.
+    """
+    return _build_nwbfile(nwbfile=nwbfile)
+
+
+def remove_checkpoints(checkpoint_folder_path: Path) -> None:
+    """Remove the journals of a conversion that completed, and their folder once it is empty."""
+    checkpoint_folder_path = Path(checkpoint_folder_path)
+    for journal_file_path in checkpoint_folder_path.glob("*.journal"):
+        journal_file_path.unlink()
+    if checkpoint_folder_path.exists() and not any(checkpoint_folder_path.iterdir()):
+        checkpoint_folder_path.rmdir()
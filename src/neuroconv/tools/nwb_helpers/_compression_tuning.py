@@ -0,0 +1,255 @@
+"""Helpers for measuring compression candidates on samples of a dataset and choosing between them."""
+
+import math
+import time
+import uuid
+from typing import Any, Literal
+
+import h5py
+import numpy as np
+from hdmf.data_utils import AbstractDataChunkIterator
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+
+from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configuration_models._compression_benchmark import CompressionBenchmark
+from ._configuration_models._hdf5_dataset_io import HDF5DatasetIOConfiguration
+from ..importing import is_package_installed
+
+CompressionPolicy = Literal["fastest_write", "smallest_file", "balanced"]
+
+# Failures a filter raises on input it cannot encode, such as a floating point codec handed integers
+_CANDIDATE_ERRORS = (ValueError, TypeError, OSError, RuntimeError)
+
+
+def get_default_compression_candidates(
+    backend: Literal["hdf5", "zarr"],
+) -> list[tuple[str, dict[str, Any] | None]]:
+    """
+    The compression methods and options measured by default when tuning compression for a backend.
+
+    Byte shuffling is measured both on and off for Blosc, since integer electrophysiology traces and
+    imaging frames tend to gain from it while already noisy floating point data can lose.
+
+    Parameters
+    ----------
+    backend : "hdf5" or "zarr"
+        The backend whose compression methods are listed.
+
+    Returns
+    -------
+    list of tuple
+        Pairs of compression method name and compression options, in the order they are measured.
+    """
+    if backend == "hdf5":
+        candidates = [("gzip", None), ("lzf", None)]
+        if is_package_installed(package_name="hdf5plugin"):
+            candidates += [
+                ("Blosc", dict(cname="lz4", clevel=5, shuffle=1)),
+                ("Blosc", dict(cname="lz4", clevel=5, shuffle=0)),
+                ("Blosc", dict(cname="zstd", clevel=5, shuffle=1)),
+                ("Blosc", dict(cname="zstd", clevel=5, shuffle=0)),
+                ("Zstd", None),
+                ("LZ4", None),
+            ]
+        return candidates
+    elif backend == "zarr":
+        return [
+            ("gzip", None),
+            ("blosc", dict(cname="lz4", clevel=5, shuffle=1)),
+            ("blosc", dict(cname="lz4", clevel=5, shuffle=0)),
+            ("blosc", dict(cname="zstd", clevel=5, shuffle=1)),
+            ("blosc", dict(cname="zstd", clevel=5, shuffle=0)),
+            ("zstd", None),
+            ("lz4", None),
+        ]
+
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def _get_sample_selections(
+    chunk_shape: tuple[int, ...], full_shape: tuple[int, ...], number_of_samples: int
+) -> list[tuple[slice, ...]]:
+    """
+    Select chunk-shaped regions spread evenly along the first axis of a dataset.
+
+    A chunk is the unit every filter compresses, so sampling whole chunks measures what the file will hold.
+    The first, last and evenly spaced chunks in between are chosen so that a recording whose start differs from
+    its middle, such as one opening on a stretch of zeros, does not decide on its start alone.
+    """
+    number_of_chunks_along_first_axis = math.ceil(full_shape[0] / chunk_shape[0])
+    chunk_indices = np.unique(
+        np.linspace(start=0, stop=number_of_chunks_along_first_axis - 1, num=number_of_samples).round().astype(int)
+    )
+
+    selections = list()
+    for chunk_index in chunk_indices:
+        start = int(chunk_index) * chunk_shape[0]
+        first_axis_selection = slice(start, min(start + chunk_shape[0], full_shape[0]))
+        other_axes_selection = tuple(
+            slice(0, min(chunk_axis, full_axis)) for chunk_axis, full_axis in zip(chunk_shape[1:], full_shape[1:])
+        )
+        selections.append((first_axis_selection,) + other_axes_selection)
+
+    return selections
+
+
+def _read_sample(data: Any, selection: tuple[slice, ...]) -> np.ndarray:
+    """Read a selection from the source of a dataset, using the iterator's own reader when the source is one."""
+    if isinstance(data, HDMFGenericDataChunkIterator):
+        return np.ascontiguousarray(data._get_data(selection=selection))
+    if isinstance(data, list):
+        return np.ascontiguousarray(np.asarray(data)[selection])
+
+    return np.ascontiguousarray(data[selection])
+
+
+def _measure_hdf5_candidate(
+    dataset_configuration: HDF5DatasetIOConfiguration, samples: list[np.ndarray]
+) -> tuple[int, float]:
+    """Write the samples through the HDF5 filter pipeline of an in-memory file and return bytes stored and seconds."""
+    data_io_kwargs = dataset_configuration.get_data_io_kwargs()
+    filter_kwargs = {
+        key: value for key, value in data_io_kwargs.items() if key not in ("chunks", "allow_plugin_filters")
+    }
+
+    stored_bytes = 0
+    elapsed_seconds = 0.0
+    with h5py.File(name=str(uuid.uuid4()), mode="w", driver="core", backing_store=False) as file:
+        for sample_index, sample in enumerate(samples):
+            dataset = file.create_dataset(
+                name=str(sample_index), shape=sample.shape, dtype=sample.dtype, chunks=sample.shape, **filter_kwargs
+            )
+            start_time = time.perf_counter()
+            dataset[...] = sample
+            file.flush()  # Chunks are only passed through the filters when they leave the chunk cache
+            elapsed_seconds += time.perf_counter() - start_time
+            stored_bytes += dataset.id.get_storage_size()
+
+    return stored_bytes, elapsed_seconds
+
+
+def _measure_zarr_candidate(
+    dataset_configuration: DatasetIOConfiguration, samples: list[np.ndarray]
+) -> tuple[int, float]:
+    """Encode the samples through the Zarr filters and compressor of a configuration and return bytes and seconds."""
+    data_io_kwargs = dataset_configuration.get_data_io_kwargs()
+    filters = data_io_kwargs["filters"] or list()
+    compressor = data_io_kwargs["compressor"]
+
+    stored_bytes = 0
+    elapsed_seconds = 0.0
+    for sample in samples:
+        start_time = time.perf_counter()
+        encoded = sample
+        for filter_ in filters:
+            encoded = filter_.encode(encoded)
+        if compressor:
+            encoded = compressor.encode(encoded)
+        elapsed_seconds += time.perf_counter() - start_time
+        stored_bytes += len(memoryview(encoded).cast("B"))
+
+    return stored_bytes, elapsed_seconds
+
+
+def benchmark_dataset_compression(
+    dataset_configuration: DatasetIOConfiguration,
+    data: Any,
+    compression_candidates: list[tuple[str, dict[str, Any] | None]],
+    number_of_samples: int = 3,
+) -> list[CompressionBenchmark]:
+    """
+    Measure the compression ratio and throughput of each candidate on chunk-shaped samples of a dataset.
+
+    Parameters
+    ----------
+    dataset_configuration : DatasetIOConfiguration
+        The configuration of the dataset, whose chunk shape and backend decide how samples are compressed.
+    data : numpy.ndarray, list, h5py.Dataset, zarr.Array or GenericDataChunkIterator
+        The source of the dataset, as it is held by its neurodata object in the in-memory NWBFile.
+    compression_candidates : list of tuple
+        Pairs of compression method name and compression options to measure.
+    number_of_samples : int, default: 3
+        The number of chunks to sample along the first axis of the dataset.
+
+    Returns
+    -------
+    list of CompressionBenchmark
+        One entry per candidate that could encode the data, in the order the candidates were given.
+        Empty when the data cannot be sampled, which is the case for strings, for datasets without chunking,
+        and for sources such as `DataChunkIterator` that can only be read once.
+    """
+    if isinstance(data, AbstractDataChunkIterator) and not isinstance(data, HDMFGenericDataChunkIterator):
+        return list()
+    if dataset_configuration.dtype.kind not in "biuf" or dataset_configuration.chunk_shape is None:
+        return list()
+
+    selections = _get_sample_selections(
+        chunk_shape=dataset_configuration.chunk_shape,
+        full_shape=dataset_configuration.full_shape,
+        number_of_samples=number_of_samples,
+    )
+    samples = [_read_sample(data=data, selection=selection) for selection in selections]
+    uncompressed_bytes = sum(sample.nbytes for sample in samples)
+
+    is_hdf5 = isinstance(dataset_configuration, HDF5DatasetIOConfiguration)
+    measure_candidate = _measure_hdf5_candidate if is_hdf5 else _measure_zarr_candidate
+
+    benchmarks = list()
+    for compression_method, compression_options in compression_candidates:
+        candidate_configuration = dataset_configuration.model_copy(
+            update=dict(compression_method=compression_method, compression_options=compression_options)
+        )
+        try:
+            stored_bytes, elapsed_seconds = measure_candidate(
+                dataset_configuration=candidate_configuration, samples=samples
+            )
+        except _CANDIDATE_ERRORS:
+            continue
+
+        throughput_in_mb_per_second = uncompressed_bytes / 1e6 / elapsed_seconds if elapsed_seconds > 0 else math.inf
+        benchmarks.append(
+            CompressionBenchmark(
+                compression_method=compression_method,
+                compression_options=compression_options,
+                compression_ratio=uncompressed_bytes / max(stored_bytes, 1),
+                throughput_in_mb_per_second=throughput_in_mb_per_second,
+            )
+        )
+
+    return benchmarks
+
+
+def select_compression_benchmark(
+    benchmarks: list[CompressionBenchmark], policy: CompressionPolicy = "balanced"
+) -> CompressionBenchmark:
+    """
+    Choose one of the measured candidates according to a policy.
+
+    Parameters
+    ----------
+    benchmarks : list of CompressionBenchmark
+        The measurements to choose between; must not be empty.
+    policy : "fastest_write", "smallest_file" or "balanced", default: "balanced"
+        "fastest_write" picks the highest throughput and "smallest_file" the highest compression ratio.
+        "balanced" picks the highest compression ratio among the candidates that compress at least half as fast
+        as the fastest one, so that a slightly smaller file is not paid for with a much slower conversion.
+
+    Returns
+    -------
+    CompressionBenchmark
+        The chosen measurement; ties are resolved in favor of the earliest candidate.
+    """
+    if policy == "fastest_write":
+        return max(benchmarks, key=lambda benchmark: benchmark.throughput_in_mb_per_second)
+    elif policy == "smallest_file":
+        return max(benchmarks, key=lambda benchmark: benchmark.compression_ratio)
+    elif policy == "balanced":
+        fastest_throughput = max(benchmark.throughput_in_mb_per_second for benchmark in benchmarks)
+        fast_enough = [
+            benchmark for benchmark in benchmarks if benchmark.throughput_in_mb_per_second >= fastest_throughput / 2
+        ]
+        return max(fast_enough, key=lambda benchmark: benchmark.compression_ratio)
+
+    raise ValueError(
+        f"Unknown compression policy '{policy}'! Choose one of 'fastest_write', 'smallest_file' or 'balanced'."
+    )
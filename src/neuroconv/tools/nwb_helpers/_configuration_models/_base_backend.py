@@ -9,6 +9,7 @@ from typing_extensions import Self
 
 from ._base_dataset_io import DatasetIOConfiguration
 from ._pydantic_pure_json_schema_generator import PureJSONSchemaGenerator
+from ._read_pattern import ReadPattern
 from .._dataset_configuration import (
     get_default_dataset_io_configurations,
     get_existing_dataset_io_configurations,
@@ -31,6 +32,13 @@ class BackendConfiguration(BaseModel):
             "for writing the datasets to disk using the specific backend."
         )
     )
+    linked_timestamps: dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "A mapping from the location of each timestamps written as a link (e.g. `acquisition/B/timestamps`) "
+            "to the location of the identical timestamps it links to, as set by `apply_timestamp_linking`."
+        ),
+    )
 
     def __str__(self) -> str:
         """Not overriding __repr__ as this is intended to render only when wrapped in print()."""
@@ -41,6 +49,11 @@ class BackendConfiguration(BaseModel):
         for dataset_configuration in self.dataset_configurations.values():
             string += f"\n{dataset_configuration}"
 
+        if self.linked_timestamps:
+            string += "\n\nLinked timestamps\n-----------------"
+            for location_in_file, linked_location_in_file in self.linked_timestamps.items():
+                string += f"\n{location_in_file} -> {linked_location_in_file}"
+
         return string
 
     # Pydantic models have several API calls for retrieving the schema - override all of them to work
@@ -84,7 +97,9 @@ class BackendConfiguration(BaseModel):
         return cls(dataset_configurations=dataset_configurations)
 
     @classmethod
-    def from_nwbfile_with_defaults(cls, nwbfile: NWBFile) -> Self:
+    def from_nwbfile_with_defaults(
+        cls, nwbfile: NWBFile, read_patterns: dict[str, list[ReadPattern]] | None = None
+    ) -> Self:
         """
         Create a backend configuration from an NWBFile with default chunking and compression settings.
 
@@ -92,13 +107,18 @@ class BackendConfiguration(BaseModel):
         ----------
         nwbfile : pynwb.NWBFile
             The NWBFile object to extract the backend configuration from.
+        read_patterns : dict, optional
+            A mapping from the location of a dataset in the file to the ways it is expected to be read after it is
+            written, used to choose the chunk shape of that dataset.
 
         Returns
         -------
         Self
             The backend configuration with default chunking and compression settings for each neurodata object in the NWBFile.
         """
-        dataset_io_configurations = get_default_dataset_io_configurations(nwbfile=nwbfile, backend=cls.backend)
+        dataset_io_configurations = get_default_dataset_io_configurations(
+            nwbfile=nwbfile, backend=cls.backend, read_patterns=read_patterns
+        )
         dataset_configurations = {
             default_dataset_configuration.location_in_file: default_dataset_configuration
             for default_dataset_configuration in dataset_io_configurations
@@ -272,3 +292,116 @@ class BackendConfiguration(BaseModel):
         for dataset_configuration in self.dataset_configurations.values():
             dataset_configuration.compression_method = compression_method
             dataset_configuration.compression_options = compression_options
+
+    def apply_tuned_compression(
+        self,
+        nwbfile: NWBFile,
+        policy: Literal["fastest_write", "smallest_file", "balanced"] = "balanced",
+        compression_candidates: list[tuple[str, dict[str, Any] | None]] | None = None,
+        number_of_samples: int = 3,
+    ) -> None:
+        """
+        Choose a compression method for each dataset by measuring the candidates on samples of its data.
+
+        For each dataset, a few chunks spread along its first axis are read from the source the in-memory NWBFile
+        holds and compressed with every candidate, measuring the compression ratio and throughput. The candidate
+        the `policy` prefers is applied to the dataset and the measurements are kept on its configuration under
+        `compression_benchmarks`. Datasets that cannot be sampled, such as strings or sources that can only be
+        read once, keep their current settings.
+
+        This method modifies the backend configuration in-place.
+
+        Parameters
+        ----------
+        nwbfile : pynwb.NWBFile
+            The in-memory NWBFile this backend configuration was derived from.
+        policy : "fastest_write", "smallest_file" or "balanced", default: "balanced"
+            "fastest_write" picks the highest throughput and "smallest_file" the highest compression ratio.
+            "balanced" picks the highest compression ratio among the candidates that compress at least half as fast
+            as the fastest one.
+        compression_candidates : list of tuple, optional
+            Pairs of compression method name and compression options to measure.
+            Defaults to gzip and, where installed, Blosc with and without shuffling, Zstd and LZ4.
+        number_of_samples : int, default: 3
+            The number of chunks to sample from each dataset.
+
+        Raises
+        ------
+        ValueError
+            If a candidate compression method is not available for this backend type.
+
+        Examples
+        --------
+        >>> backend_config = get_default_backend_configuration(nwbfile, backend="hdf5")
+        >>> backend_config.apply_tuned_compression(nwbfile=nwbfile, policy="smallest_file")
+        """
+        # Import here to avoid circular imports
+        from ._hdf5_dataset_io import AVAILABLE_HDF5_COMPRESSION_METHODS
+        from ._zarr_dataset_io import AVAILABLE_ZARR_COMPRESSION_METHODS
+        from .._compression_tuning import (
+            benchmark_dataset_compression,
+            get_default_compression_candidates,
+            select_compression_benchmark,
+        )
+
+        if policy not in ("fastest_write", "smallest_file", "balanced"):
+            raise ValueError(
+                f"Unknown compression policy '{policy}'! Choose one of 'fastest_write', 'smallest_file' or 'balanced'."
+            )
+        available_methods = (
+            AVAILABLE_HDF5_COMPRESSION_METHODS if self.backend == "hdf5" else AVAILABLE_ZARR_COMPRESSION_METHODS
+        )
+        compression_candidates = compression_candidates or get_default_compression_candidates(backend=self.backend)
+        for compression_method, _ in compression_candidates:
+            if compression_method not in available_methods:
+                raise ValueError(
+                    f"Compression method '{compression_method}' is not available for backend "
+                    f"'{self.backend}'. Available methods: {list(available_methods.keys())}"
+                )
+
+        neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+        for dataset_configuration in self.dataset_configurations.values():
+            neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+            data = getattr(neurodata_object, dataset_configuration.dataset_name)
+
+            benchmarks = benchmark_dataset_compression(
+                dataset_configuration=dataset_configuration,
+                data=data,
+                compression_candidates=compression_candidates,
+                number_of_samples=number_of_samples,
+            )
+            if not benchmarks:
+                continue
+
+            selected_benchmark = select_compression_benchmark(benchmarks=benchmarks, policy=policy)
+            dataset_configuration.compression_method = selected_benchmark.compression_method
+            dataset_configuration.compression_options = selected_benchmark.compression_options
+            dataset_configuration.compression_benchmarks = benchmarks
+
+    def apply_timestamp_linking(self, nwbfile: NWBFile) -> None:
+        """
+        Write each distinct timestamps array of the file once, linking every other series holding it to that copy.
+
+        The timestamps of the series are compared by shape, type and a hash of their bytes, then byte for byte. The
+        first series of the file holding an array keeps it, and the others are turned into links to its timestamps,
+        as for a series built with `timestamps=` another series. Their dataset configurations stay, as for any
+        linked timestamps, and are skipped when the configuration is applied; the links made are recorded under
+        `linked_timestamps`.
+
+        This method modifies both the NWBFile and the backend configuration in-place.
+
+        Parameters
+        ----------
+        nwbfile : pynwb.NWBFile
+            The in-memory NWBFile this backend configuration was derived from.
+
+        Examples
+        --------
+        >>> backend_config = get_default_backend_configuration(nwbfile, backend="hdf5")
+        >>> backend_config.apply_timestamp_linking(nwbfile=nwbfile)
+        """
+        # Import here to avoid circular imports
+        from .._timestamp_linking import link_identical_timestamps
+
+        linked_timestamps = link_identical_timestamps(nwbfile=nwbfile)
+        self.linked_timestamps = dict(self.linked_timestamps, **linked_timestamps)
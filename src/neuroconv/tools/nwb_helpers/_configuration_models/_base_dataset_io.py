@@ -1,5 +1,6 @@
 """Base Pydantic models for DatasetInfo and DatasetConfiguration."""
 
+import json
 import math
 from abc import ABC, abstractmethod
 from typing import Any, Literal
@@ -26,11 +27,17 @@ from pynwb.ecephys import ElectricalSeries
 from pynwb.image import ImageSeries
 from typing_extensions import Self
 
+from neuroconv.tools._dataset_fingerprint import hash_text
 from neuroconv.tools.hdmf import get_full_data_shape
-from neuroconv.tools.iterative_write import get_electrical_series_chunk_shape
+from neuroconv.tools.iterative_write import (
+    get_electrical_series_chunk_shape,
+    get_read_pattern_chunk_shape,
+)
 from neuroconv.utils.str_utils import human_readable_size
 
+from ._compression_benchmark import CompressionBenchmark
 from ._pydantic_pure_json_schema_generator import PureJSONSchemaGenerator
+from ._read_pattern import ReadPattern
 from ...hdmf import SliceableDataChunkIterator
 
 
@@ -96,6 +103,16 @@ def _infer_dtype(dataset: h5py.Dataset | zarr.Array) -> np.dtype:
     return data_type
 
 
+def _describe_storage_setting(value: Any) -> Any:
+    """Render the compression and filter objects a configuration may hold as JSON, for fingerprinting it."""
+    if isinstance(value, h5py._hl.filters.FilterRefBase):
+        return dict(filter_id=value.filter_id, filter_options=list(value.filter_options))
+    if isinstance(value, numcodecs.abc.Codec):
+        return value.get_config()
+
+    return str(value)
+
+
 class DatasetIOConfiguration(BaseModel, ABC):
     """A data model for configuring options about an object that will become a HDF5 or Zarr Dataset in the file."""
 
@@ -135,6 +152,14 @@ class DatasetIOConfiguration(BaseModel, ABC):
     compression_options: dict[str, Any] | None = Field(
         default=None, description="The optional parameters to use for the specified compression method."
     )
+    compression_benchmarks: list[CompressionBenchmark] | None = Field(
+        default=None,
+        repr=False,  # Evidence rather than a setting; keeps the repr readable inside iterables of configurations
+        description=(
+            "The measurements the compression method was chosen from, when it was chosen by "
+            "`BackendConfiguration.apply_tuned_compression`."
+        ),
+    )
 
     @abstractmethod
     def get_data_io_kwargs(self) -> dict[str, Any]:
@@ -145,6 +170,19 @@ class DatasetIOConfiguration(BaseModel, ABC):
         """
         raise NotImplementedError
 
+    def get_storage_fingerprint(self) -> str:
+        """
+        Digest the settings that decide how this dataset is stored, so that equal digests store identical bytes.
+
+        Where the dataset sits in the file, which object holds it and how it is buffered while writing do not
+        change what is stored and are left out.
+        """
+        storage_settings = self.model_dump(
+            exclude={"object_id", "location_in_file", "dataset_name", "buffer_shape", "compression_benchmarks"}
+        )
+        storage_settings["backend"] = type(self).__name__
+        return hash_text(text=json.dumps(storage_settings, sort_keys=True, default=_describe_storage_setting))
+
     def __str__(self) -> str:
         """
         Not overriding __repr__ as this is intended to render only when wrapped in print().
@@ -179,9 +217,22 @@ class DatasetIOConfiguration(BaseModel, ABC):
             string += f"\n  compression method : {self.compression_method}"
         if self.compression_options is not None:
             string += f"\n  compression options : {self.compression_options}"
+        measured_benchmark = next(
+            (
+                benchmark
+                for benchmark in self.compression_benchmarks or list()
+                if benchmark.compression_method == self.compression_method
+                and benchmark.compression_options == self.compression_options
+            ),
+            None,
+        )
+        if measured_benchmark is not None:
+            string += (
+                f"\n  measured compression ratio : {measured_benchmark.compression_ratio:.2f}"
+                f"\n  measured throughput : {measured_benchmark.throughput_in_mb_per_second:.1f} MB/s"
+            )
         if self.compression_method is not None or self.compression_options is not None:
             string += "\n"
-        # TODO: would be cool to include estimate of ratio too (determined via stub file perhaps?)
 
         return string
 
@@ -390,6 +441,7 @@ class DatasetIOConfiguration(BaseModel, ABC):
         neurodata_object: Container,
         dataset_name: Literal["data", "timestamps"],
         builder: BaseBuilder | None = None,
+        read_patterns: list[ReadPattern] | None = None,
     ) -> Self:
         """
         Construct an instance of a DatasetIOConfiguration with default settings for a dataset in a neurodata object in an NWBFile.
@@ -405,6 +457,12 @@ class DatasetIOConfiguration(BaseModel, ABC):
         builder : hdmf.build.builders.BaseBuilder, optional
             The builder object that would be used to construct the NWBFile object. If None, the dataset is assumed to
             NOT have a compound dtype.
+        read_patterns : list of ReadPattern, optional
+            The ways the dataset is expected to be read after it is written. When given, the chunk shape is the one
+            minimizing the expected cost of these reads (see
+            :py:func:`~neuroconv.tools.iterative_write.get_read_pattern_chunk_shape`) instead of the shape-based
+            default, and the buffer shape is regrown around it at the same size. A data chunk iterator is made to
+            read buffers of that shape when the backend is configured.
         """
         location_in_file = _find_location_in_memory_nwbfile(neurodata_object=neurodata_object, field_name=dataset_name)
         candidate_dataset = getattr(neurodata_object, dataset_name)
@@ -482,6 +540,18 @@ class DatasetIOConfiguration(BaseModel, ABC):
                 #     f"Consider manually specifying DatasetIOConfiguration for dataset at '{location_in_file}'."
                 # )
 
+        if read_patterns is not None:
+            chunk_shape = get_read_pattern_chunk_shape(
+                full_shape=full_shape, dtype=np.dtype(dtype), read_patterns=read_patterns
+            )
+            # The buffers keep the size chosen above, regrown around the new chunks; an iterator is made to read
+            # these by `configure_backend`
+            if buffer_shape != full_shape:
+                buffer_gb = max(math.prod(buffer_shape), math.prod(chunk_shape)) * np.dtype(dtype).itemsize / 1e9
+                buffer_shape = SliceableDataChunkIterator.estimate_default_buffer_shape(
+                    buffer_gb=buffer_gb, chunk_shape=chunk_shape, maxshape=full_shape, dtype=np.dtype(dtype)
+                )
+
         return cls(
             object_id=neurodata_object.object_id,
             object_name=neurodata_object.name,
@@ -0,0 +1,22 @@
+"""Pydantic model recording the measurements behind a tuned compression choice."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, PositiveFloat
+
+
+class CompressionBenchmark(BaseModel):
+    """The measured performance of one compression candidate on samples of a single dataset."""
+
+    model_config = ConfigDict(frozen=True)
+
+    compression_method: str = Field(description="The name of the compression method that was measured.")
+    compression_options: dict[str, Any] | None = Field(
+        default=None, description="The parameters the compression method was measured with."
+    )
+    compression_ratio: PositiveFloat = Field(
+        description="The number of uncompressed bytes sampled divided by the number of bytes they compressed into."
+    )
+    throughput_in_mb_per_second: NonNegativeFloat = Field(
+        description="The number of uncompressed megabytes the method compressed per second of wall time."
+    )
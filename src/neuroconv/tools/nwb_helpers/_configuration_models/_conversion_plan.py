@@ -0,0 +1,116 @@
+"""Pydantic models reporting the projected size, time and memory of writing an NWB file, without writing it."""
+
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, NonNegativeInt, PositiveFloat
+
+from neuroconv.utils.str_utils import human_readable_size
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f} min"
+
+    return f"{seconds / 3600:.1f} h"
+
+
+class DatasetWritePlan(BaseModel):
+    """The projected cost of writing one dataset, measured on samples read through its own source."""
+
+    model_config = ConfigDict(frozen=True)
+
+    location_in_file: str = Field(description="The location of the dataset in the file, e.g. `acquisition/A/data`.")
+    uncompressed_size_in_bytes: NonNegativeInt = Field(
+        description="The size of the full dataset before compression, from its shape and data type."
+    )
+    projected_size_in_bytes: NonNegativeInt = Field(
+        description=(
+            "The projected size of the dataset in the file: the uncompressed size divided by the measured "
+            "compression ratio, or the uncompressed size when the dataset could not be sampled."
+        )
+    )
+    compression_ratio: PositiveFloat | None = Field(
+        default=None,
+        description="The number of uncompressed bytes sampled divided by the number of bytes they compressed into.",
+    )
+    read_throughput_in_mb_per_second: NonNegativeFloat | None = Field(
+        default=None, description="The number of uncompressed megabytes read from the source per second."
+    )
+    compression_throughput_in_mb_per_second: NonNegativeFloat | None = Field(
+        default=None, description="The number of uncompressed megabytes compressed per second."
+    )
+    projected_write_time_in_seconds: NonNegativeFloat | None = Field(
+        default=None,
+        description="The projected time to read and compress the full dataset, or None when it could not be sampled.",
+    )
+    buffer_size_in_bytes: NonNegativeInt = Field(
+        description=(
+            "The memory the write reads into at once for this dataset beyond what the NWBFile already holds: the "
+            "buffer of a data chunk iterator, or zero for data already in memory."
+        )
+    )
+    is_iterative: bool = Field(description="Whether the dataset is fed by a data chunk iterator.")
+
+    @property
+    def is_sampled(self) -> bool:
+        return self.compression_ratio is not None
+
+
+class ConversionPlan(BaseModel):
+    """The projected size, wall time and peak memory of writing an NWB file, dataset by dataset and in total."""
+
+    model_config = ConfigDict(frozen=True)
+
+    backend: str = Field(description="The backend the file would be written with.")
+    dataset_plans: dict[str, DatasetWritePlan] = Field(
+        description="A mapping from the location of each dataset written to its plan."
+    )
+    linked_locations: list[str] = Field(
+        default_factory=list, description="The locations written as links to another dataset, which cost nothing."
+    )
+    projected_size_in_bytes: NonNegativeInt = Field(description="The projected size of all datasets in the file.")
+    projected_write_time_in_seconds: NonNegativeFloat = Field(
+        description=(
+            "The projected wall time of reading and compressing the datasets that could be sampled, the iterative "
+            "datasets shared among the write workers."
+        )
+    )
+    resident_memory_in_bytes: NonNegativeInt = Field(
+        description="The resident memory of the process once the in-memory NWBFile was built, before writing."
+    )
+    projected_peak_memory_in_bytes: NonNegativeInt = Field(
+        description=(
+            "The resident memory of the process plus the largest buffers that are read at once while writing, one "
+            "per write worker."
+        )
+    )
+
+    def __str__(self) -> str:
+        """Not overriding __repr__ as this is intended to render only when wrapped in print()."""
+        title = f"Conversion plan for the {self.backend} backend"
+        string = (
+            f"\n{title}"
+            f"\n{'-' * len(title)}"
+            f"\n  projected file size : {human_readable_size(self.projected_size_in_bytes)}"
+            f"\n  projected write time : {_format_seconds(self.projected_write_time_in_seconds)}"
+            f"\n  projected peak memory : {human_readable_size(self.projected_peak_memory_in_bytes)}"
+            "\n"
+        )
+        for dataset_plan in self.dataset_plans.values():
+            string += (
+                f"\n{dataset_plan.location_in_file}"
+                f"\n  uncompressed size : {human_readable_size(dataset_plan.uncompressed_size_in_bytes)}"
+                f"\n  projected size : {human_readable_size(dataset_plan.projected_size_in_bytes)}"
+            )
+            if dataset_plan.is_sampled:
+                string += (
+                    f"\n  compression ratio : {dataset_plan.compression_ratio:.2f}"
+                    f"\n  projected write time : {_format_seconds(dataset_plan.projected_write_time_in_seconds)}"
+                )
+            else:
+                string += "\n  not sampled, projected as stored uncompressed"
+            string += f"\n  buffer size : {human_readable_size(dataset_plan.buffer_size_in_bytes)}\n"
+        for location_in_file in self.linked_locations:
+            string += f"\n{location_in_file}\n  written as a link\n"
+
+        return string
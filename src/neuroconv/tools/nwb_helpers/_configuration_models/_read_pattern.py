@@ -0,0 +1,23 @@
+"""Pydantic model describing how a dataset is expected to be read after it is written."""
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat, PositiveInt
+
+
+class ReadPattern(BaseModel):
+    """
+    A way a dataset is expected to be read after it is written, used to choose its chunk shape.
+
+    For example, on an ElectricalSeries of shape (frames, channels) sampled at 30 kHz, reading one channel over the
+    whole session is `ReadPattern(selection_shape=(None, 1))` and reading all channels over one second is
+    `ReadPattern(selection_shape=(30_000, None))`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    selection_shape: tuple[PositiveInt | None, ...] = Field(
+        description="The extent of a single read along each axis of the dataset; `None` reads the whole axis."
+    )
+    weight: PositiveFloat = Field(
+        default=1.0, description="How often this pattern occurs relative to the other patterns declared with it."
+    )
+    name: str | None = Field(default=None, description="An optional label for reporting, e.g. 'single channel'.")
@@ -0,0 +1,43 @@
+"""Pydantic model of one step in writing a dataset fed by a data chunk iterator."""
+
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, NonNegativeInt, PositiveFloat
+
+
+class WriteProgressEvent(BaseModel):
+    """The progress of writing one dataset fed by a data chunk iterator, as of the buffer just written."""
+
+    model_config = ConfigDict(frozen=True)
+
+    nwbfile_path: str | None = Field(
+        default=None, description="The NWB file being written, when the dataset is written by a whole file write."
+    )
+    location_in_file: str = Field(description="The location of the dataset in the file, e.g. `acquisition/A/data`.")
+    number_of_buffers_written: NonNegativeInt = Field(
+        description="The number of buffers of the iterator written so far, including any a resumed write skipped."
+    )
+    number_of_buffers: NonNegativeInt = Field(description="The number of buffers the iterator reads in all.")
+    read_size_in_bytes: NonNegativeInt = Field(
+        description="The uncompressed size of the buffers read and written so far in this run."
+    )
+    written_size_in_bytes: NonNegativeInt | None = Field(
+        default=None,
+        description=(
+            "The size the dataset takes on disk so far, in the file or in the store it is written to ahead of the "
+            "file, less what it took before the iterator started; None when not known."
+        ),
+    )
+    compression_ratio: PositiveFloat | None = Field(
+        default=None, description="The size read divided by the size written, when both are known."
+    )
+    throughput_in_mb_per_second: NonNegativeFloat = Field(
+        description="The uncompressed megabytes of the buffer just written divided by the seconds it took to read "
+        "and write."
+    )
+    remaining_time_in_seconds: NonNegativeFloat | None = Field(
+        default=None,
+        description=(
+            "The time the remaining buffers would take at the mean throughput of those written so far, or None "
+            "before any was written in this run."
+        ),
+    )
+    timestamp: float = Field(description="When the buffer was written, in seconds since the epoch.")
@@ -2,9 +2,13 @@
 
 import importlib
 import math
+from typing import Any
 
+import h5py
+import zarr
 from hdmf.common import Data
-from hdmf.data_utils import AbstractDataChunkIterator, DataChunkIterator
+from hdmf.data_utils import DataChunkIterator
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
 from packaging import version
 from pynwb import NWBFile, TimeSeries
 from pynwb.core import NWBData
@@ -12,10 +16,29 @@ from pynwb.core import NWBData
 from ._configuration_models._base_dataset_io import _find_location_in_memory_nwbfile
 from ._configuration_models._hdf5_backend import HDF5BackendConfiguration
 from ._configuration_models._zarr_backend import ZarrBackendConfiguration
-from ..hdmf import _get_nwbfile_builder, has_compound_dtype
+from ._memory_budget import get_active_memory_budget
+from ._write_progress import track_write_progress
+from ..hdmf import GenericDataChunkIterator, _get_nwbfile_builder, has_compound_dtype
 from ..importing import get_package_version, is_package_installed
 
 
+def _get_dataset(neurodata_object: Any, dataset_name: str) -> Any:
+    """The data a neurodata object holds for one of its datasets, unwrapping the reader HDMF puts around compounds."""
+    data = neurodata_object.data if isinstance(neurodata_object, Data) else neurodata_object.fields.get(dataset_name)
+    return getattr(data, "dataset", data)
+
+
+def _replace_dataset(neurodata_object: Any, dataset_name: str, data: Any) -> None:
+    """Swap the data held by a neurodata object for another source, the way `set_data_io` wraps it."""
+    if isinstance(neurodata_object, Data):
+        neurodata_object._Data__data = data
+        if isinstance(neurodata_object, NWBData):
+            # `NWBData` shadows the data of `Data`, as explained where `configure_backend` re-syncs the two
+            neurodata_object._NWBData__data = data
+    else:
+        neurodata_object.fields[dataset_name] = data
+
+
 def configure_backend(
     nwbfile: NWBFile, backend_configuration: HDF5BackendConfiguration | ZarrBackendConfiguration
 ) -> None:
@@ -32,19 +55,21 @@ def configure_backend(
     is_ndx_events_installed = is_package_installed(package_name="ndx_events")
     ndx_events = importlib.import_module("ndx_events") if is_ndx_events_installed else None
 
-    nwbfile_is_on_disk = nwbfile.read_io is not None
-
     # A remapping of the object IDs in the backend configuration might necessary
     locations_to_remap = backend_configuration.find_locations_requiring_remapping(nwbfile=nwbfile)
     if any(locations_to_remap):
         backend_configuration = backend_configuration.build_remapped_backend(locations_to_remap=locations_to_remap)
 
-    builder = _get_nwbfile_builder(nwbfile=nwbfile)
+    # Building the file is a walk over every object in it, so it is only done when a dataset read from a file needs it
+    builder = None
 
     # `nwbfile.objects` is built on its first read and never invalidated, so it does not hold anything added
     # to the file afterwards. `all_children` recomputes the walk.
     neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
 
+    # The iterators read their buffers within the memory budget of the conversion, when one is in effect
+    memory_budget = get_active_memory_budget()
+
     # Set all DataIO based on the configuration
     data_io_class = backend_configuration.data_io_class
     for dataset_configuration in backend_configuration.dataset_configurations.values():
@@ -52,20 +77,38 @@ def configure_backend(
         dataset_name = dataset_configuration.dataset_name
         data_io_kwargs = dataset_configuration.get_data_io_kwargs()
 
-        # TODO: update buffer shape in iterator, if present
-
         neurodata_object = neurodata_objects_by_id[object_id]
         is_dataset_linked = isinstance(neurodata_object.fields.get(dataset_name), TimeSeries)
+        # Only data held in a file needs re-reading; data added in memory, which is all a configuration built while
+        # appending holds, is written as it is.
+        dataset = _get_dataset(neurodata_object=neurodata_object, dataset_name=dataset_name)
+        dataset_is_on_disk = isinstance(dataset, (h5py.Dataset, zarr.Array))
+        # An iterator writes the buffers it was built with, so it is made to read those of the configuration, which
+        # cover whole chunks; otherwise a chunk spanning two buffers is read back and compressed again for the second
+        if isinstance(dataset, HDMFGenericDataChunkIterator) and dataset_configuration.buffer_shape is not None:
+            chunk_shape = dataset_configuration.chunk_shape or dataset_configuration.full_shape
+            if not isinstance(dataset, GenericDataChunkIterator):
+                if dataset.buffer_shape != dataset_configuration.buffer_shape:
+                    raise ValueError(
+                        f"The dataset at '{dataset_configuration.location_in_file}' is read by an iterator of type "
+                        f"{type(dataset).__name__}, whose buffer shape {dataset.buffer_shape} cannot be changed to "
+                        f"the configured {dataset_configuration.buffer_shape}. Build the iterator with the configured "
+                        "chunk and buffer shapes, or wrap its data in a neuroconv `GenericDataChunkIterator`."
+                    )
+            elif (dataset.chunk_shape, dataset.buffer_shape) != (chunk_shape, dataset_configuration.buffer_shape):
+                dataset._set_buffer_shape(chunk_shape=chunk_shape, buffer_shape=dataset_configuration.buffer_shape)
+        # Only the iterators of neuroconv call buffer hooks
+        if isinstance(dataset, GenericDataChunkIterator):
+            track_write_progress(iterator=dataset, location_in_file=dataset_configuration.location_in_file)
+        if memory_budget is not None and isinstance(dataset, GenericDataChunkIterator):
+            memory_budget.govern(iterator=dataset)
+        if dataset_is_on_disk and builder is None:
+            builder = _get_nwbfile_builder(nwbfile=nwbfile)
         location_in_file = _find_location_in_memory_nwbfile(neurodata_object=neurodata_object, field_name=dataset_name)
-        dtype_is_compound = has_compound_dtype(builder=builder, location_in_file=location_in_file)
-        if (
-            isinstance(neurodata_object.fields.get(dataset_name), AbstractDataChunkIterator)
-            or dtype_is_compound
-            or not nwbfile_is_on_disk
-        ):
+        if not dataset_is_on_disk or has_compound_dtype(builder=builder, location_in_file=location_in_file):
             data_chunk_iterator_class = None
             data_chunk_iterator_kwargs = dict()
-        else:  # If the dataset has been written to disk and it is not compound and it is not already an iterator,
+        else:  # If the dataset has been written to disk and it is not compound,
             # we wrap each neurodata_object in a DataChunkIterator in order to support changes to the I/O settings.
             # For more detail, see https://github.com/hdmf-dev/hdmf/issues/1170.
             data_chunk_iterator_class = DataChunkIterator
@@ -0,0 +1,183 @@
+"""Project the size, wall time and peak memory of writing an in-memory NWBFile, from samples of each dataset."""
+
+import math
+import time
+
+import numpy as np
+import psutil
+from hdmf.container import DataIO
+from hdmf.data_utils import AbstractDataChunkIterator
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from pynwb import NWBFile, TimeSeries
+
+from ._compression_tuning import (
+    _CANDIDATE_ERRORS,
+    _get_sample_selections,
+    _measure_hdf5_candidate,
+    _measure_zarr_candidate,
+    _read_sample,
+)
+from ._configuration_models._base_backend import BackendConfiguration
+from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configuration_models._conversion_plan import ConversionPlan, DatasetWritePlan
+from ._configuration_models._hdf5_dataset_io import HDF5DatasetIOConfiguration
+from ._memory_budget import get_active_memory_budget
+
+
+def _plan_dataset_write(
+    dataset_configuration: DatasetIOConfiguration, data, number_of_samples: int, number_of_concurrent_buffers: int
+) -> DatasetWritePlan:
+    """Read chunk-shaped samples of one dataset through its source and compress them as the configuration would."""
+    itemsize = dataset_configuration.dtype.itemsize
+    uncompressed_size_in_bytes = math.prod(dataset_configuration.full_shape) * itemsize
+    is_iterative = isinstance(data, AbstractDataChunkIterator)
+
+    buffer_size_in_bytes = 0
+    if is_iterative:
+        buffer_size_in_bytes = math.prod(dataset_configuration.buffer_shape) * itemsize
+        memory_budget = get_active_memory_budget()
+        if memory_budget is not None and dataset_configuration.chunk_shape is not None:
+            # The budget splits each buffer into whole chunks of at most its share
+            chunk_size_in_bytes = math.prod(dataset_configuration.chunk_shape) * itemsize
+            share_in_bytes = memory_budget.budget_in_bytes // number_of_concurrent_buffers
+            buffer_size_in_bytes = min(buffer_size_in_bytes, max(chunk_size_in_bytes, share_in_bytes))
+
+    unsampled_plan = DatasetWritePlan(
+        location_in_file=dataset_configuration.location_in_file,
+        uncompressed_size_in_bytes=uncompressed_size_in_bytes,
+        projected_size_in_bytes=uncompressed_size_in_bytes,
+        buffer_size_in_bytes=buffer_size_in_bytes,
+        is_iterative=is_iterative,
+    )
+    # As for compression tuning, a source that can only be read once is left for the write
+    if is_iterative and not isinstance(data, HDMFGenericDataChunkIterator):
+        return unsampled_plan
+    if dataset_configuration.dtype.kind not in "biuf" or dataset_configuration.chunk_shape is None:
+        return unsampled_plan
+    if uncompressed_size_in_bytes == 0:
+        return unsampled_plan
+
+    selections = _get_sample_selections(
+        chunk_shape=dataset_configuration.chunk_shape,
+        full_shape=dataset_configuration.full_shape,
+        number_of_samples=number_of_samples,
+    )
+    start_time = time.perf_counter()
+    samples = [_read_sample(data=data, selection=selection) for selection in selections]
+    read_seconds = time.perf_counter() - start_time
+    sampled_bytes = sum(sample.nbytes for sample in samples)
+
+    is_hdf5 = isinstance(dataset_configuration, HDF5DatasetIOConfiguration)
+    measure_compression = _measure_hdf5_candidate if is_hdf5 else _measure_zarr_candidate
+    try:
+        stored_bytes, compression_seconds = measure_compression(
+            dataset_configuration=dataset_configuration, samples=samples
+        )
+    except _CANDIDATE_ERRORS:
+        return unsampled_plan
+
+    read_throughput_in_mb_per_second = sampled_bytes / 1e6 / read_seconds if read_seconds > 0 else math.inf
+    compression_throughput_in_mb_per_second = (
+        sampled_bytes / 1e6 / compression_seconds if compression_seconds > 0 else math.inf
+    )
+    compression_ratio = sampled_bytes / max(stored_bytes, 1)
+    seconds_per_byte = (read_seconds + compression_seconds) / sampled_bytes
+
+    return DatasetWritePlan(
+        location_in_file=dataset_configuration.location_in_file,
+        uncompressed_size_in_bytes=uncompressed_size_in_bytes,
+        projected_size_in_bytes=math.ceil(uncompressed_size_in_bytes / compression_ratio),
+        compression_ratio=compression_ratio,
+        read_throughput_in_mb_per_second=read_throughput_in_mb_per_second,
+        compression_throughput_in_mb_per_second=compression_throughput_in_mb_per_second,
+        projected_write_time_in_seconds=uncompressed_size_in_bytes * seconds_per_byte,
+        buffer_size_in_bytes=buffer_size_in_bytes,
+        is_iterative=is_iterative,
+    )
+
+
+def plan_nwbfile_write(
+    nwbfile: NWBFile,
+    backend_configuration: BackendConfiguration,
+    number_of_samples: int = 3,
+    max_workers: int = 1,
+) -> ConversionPlan:
+    """
+    Project the size, wall time and peak memory of writing an in-memory NWBFile, without writing it.
+
+    A few chunks spread along the first axis of each dataset are read through the source the write will read, the
+    data chunk iterators included, and passed through the compression of its configuration, which measures the
+    compression ratio and the throughput of reading and of compressing. These are extrapolated to the full dataset.
+    Datasets that cannot be sampled, such as strings or sources that can only be read once, are projected as stored
+    uncompressed and left out of the projected time.
+
+    The peak memory is the resident memory of the process, which already holds every array of the NWBFile, plus the
+    largest buffers of the data chunk iterators read at once: one, or one per write worker.
+
+    Parameters
+    ----------
+    nwbfile : pynwb.NWBFile
+        The in-memory NWBFile the backend configuration was derived from.
+    backend_configuration : HDF5BackendConfiguration or ZarrBackendConfiguration
+        The configuration the file would be written with.
+    number_of_samples : int, default: 3
+        The number of chunks to sample from each dataset.
+    max_workers : int, default: 1
+        The number of threads the iterative datasets would be written with. See `configure_and_write_nwbfile`.
+
+    Returns
+    -------
+    ConversionPlan
+        The projection for each dataset and for the file.
+    """
+    # As in `configure_backend`, a configuration derived from an earlier build of the file is remapped to this one
+    locations_to_remap = backend_configuration.find_locations_requiring_remapping(nwbfile=nwbfile)
+    if any(locations_to_remap):
+        backend_configuration = backend_configuration.build_remapped_backend(locations_to_remap=locations_to_remap)
+
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    dataset_plans = dict()
+    linked_locations = list()
+    for location_in_file, dataset_configuration in backend_configuration.dataset_configurations.items():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        # Linked to the dataset of another series, and written as a link by `configure_backend`
+        if isinstance(neurodata_object.fields.get(dataset_configuration.dataset_name), TimeSeries):
+            linked_locations.append(location_in_file)
+            continue
+
+        data = getattr(neurodata_object, dataset_configuration.dataset_name)
+        if isinstance(data, DataIO):
+            data = data.data
+        dataset_plans[location_in_file] = _plan_dataset_write(
+            dataset_configuration=dataset_configuration,
+            data=data,
+            number_of_samples=number_of_samples,
+            number_of_concurrent_buffers=max_workers,
+        )
+
+    iterative_seconds = [
+        plan.projected_write_time_in_seconds for plan in dataset_plans.values() if plan.is_iterative and plan.is_sampled
+    ]
+    in_memory_seconds = [
+        plan.projected_write_time_in_seconds
+        for plan in dataset_plans.values()
+        if not plan.is_iterative and plan.is_sampled
+    ]
+    # The workers share the iterative datasets, and none finishes before the longest of them
+    projected_write_time_in_seconds = sum(in_memory_seconds) + max(
+        sum(iterative_seconds) / max_workers, max(iterative_seconds, default=0.0)
+    )
+
+    largest_buffers_in_bytes = sorted((plan.buffer_size_in_bytes for plan in dataset_plans.values()), reverse=True)
+    resident_memory_in_bytes = psutil.Process().memory_info().rss
+
+    return ConversionPlan(
+        backend=backend_configuration.backend,
+        dataset_plans=dataset_plans,
+        linked_locations=linked_locations,
+        projected_size_in_bytes=sum(plan.projected_size_in_bytes for plan in dataset_plans.values()),
+        projected_write_time_in_seconds=projected_write_time_in_seconds,
+        resident_memory_in_bytes=resident_memory_in_bytes,
+        projected_peak_memory_in_bytes=resident_memory_in_bytes + int(np.sum(largest_buffers_in_bytes[:max_workers])),
+    )
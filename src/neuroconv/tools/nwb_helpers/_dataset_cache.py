@@ -0,0 +1,145 @@
+"""A local cache of written datasets, addressed by the fingerprint of their source and storage settings."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import h5py
+from hdmf.build import BuildManager
+from hdmf.common import Data
+from pynwb import H5DataIO, NWBFile, TimeSeries
+
+from ._configuration_models._base_backend import BackendConfiguration
+from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configure_backend import _get_dataset, _replace_dataset
+from .._dataset_fingerprint import get_source_fingerprint, hash_text
+
+
+@dataclass
+class _CachedDataset:
+    neurodata_object: Any
+    dataset_name: str
+    cache_file_path: Path
+
+
+def get_dataset_cache_key(data: Any, dataset_configuration: DatasetIOConfiguration) -> str | None:
+    """
+    The key of a dataset in the cache: the fingerprint of its source together with that of its storage settings.
+
+    Parameters
+    ----------
+    data : numpy.ndarray, h5py.Dataset or GenericDataChunkIterator
+        The data a neurodata object holds for the dataset, before it is wrapped for writing.
+    dataset_configuration : DatasetIOConfiguration
+        The configuration the dataset is written with.
+
+    Returns
+    -------
+    str or None
+        None when the source cannot be identified without reading it, in which case the dataset is not cached.
+    """
+    source_fingerprint = get_source_fingerprint(data=data)
+    if source_fingerprint is None:
+        return None
+
+    return hash_text(text=source_fingerprint + dataset_configuration.get_storage_fingerprint())
+
+
+def _get_path_in_file(build_manager: BuildManager, neurodata_object: Any, dataset_name: str) -> str | None:
+    """The path of a dataset in the file just written, as the manager that wrote it placed it."""
+    builder = build_manager.get_builder(neurodata_object)
+    if builder is None:
+        return None
+
+    path_in_file = builder.path.split("/", maxsplit=1)[1]  # Builder paths start at the root builder
+    # A table column is itself the dataset, where a TimeSeries is the group holding it
+    if not isinstance(neurodata_object, Data):
+        path_in_file += f"/{dataset_name}"
+
+    return path_in_file
+
+
+def find_cached_datasets(
+    nwbfile: NWBFile, backend_configuration: BackendConfiguration, dataset_cache_folder_path: Path
+) -> tuple[list[_CachedDataset], list[_CachedDataset]]:
+    """
+    Look every configured dataset up in the cache, splitting them into those already cached and those to cache.
+
+    Must be called before `configure_backend`, which wraps the sources this fingerprints.
+    """
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    cached_datasets = list()
+    datasets_to_cache = list()
+    for location_in_file, dataset_configuration in backend_configuration.dataset_configurations.items():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        dataset_name = dataset_configuration.dataset_name
+
+        # Links are written as links; there is nothing to cache
+        if isinstance(neurodata_object.fields.get(dataset_name), TimeSeries):
+            continue
+
+        data = _get_dataset(neurodata_object=neurodata_object, dataset_name=dataset_name)
+        cache_key = get_dataset_cache_key(data=data, dataset_configuration=dataset_configuration)
+        if cache_key is None:
+            continue
+
+        cached_dataset = _CachedDataset(
+            neurodata_object=neurodata_object,
+            dataset_name=dataset_name,
+            cache_file_path=Path(dataset_cache_folder_path) / f"{cache_key}.h5",
+        )
+        if cached_dataset.cache_file_path.exists():
+            cached_datasets.append(cached_dataset)
+        else:
+            datasets_to_cache.append(cached_dataset)
+
+    return cached_datasets, datasets_to_cache
+
+
+def use_cached_datasets(cached_datasets: list[_CachedDataset]) -> list[h5py.File]:
+    """
+    Point each neurodata object at its cached dataset, to be copied into the file as stored.
+
+    An `h5py.Dataset` wrapped with `link_data=False` is copied by HDMF with `H5Ocopy`, which moves the compressed
+    chunks without passing them through the filters. Returns the open cache files, to be closed after writing.
+    """
+    cache_files = list()
+    for cached_dataset in cached_datasets:
+        cache_file = h5py.File(name=cached_dataset.cache_file_path, mode="r")
+        cache_files.append(cache_file)
+        _replace_dataset(
+            neurodata_object=cached_dataset.neurodata_object,
+            dataset_name=cached_dataset.dataset_name,
+            data=H5DataIO(data=cache_file["data"], link_data=False),
+        )
+
+    return cache_files
+
+
+def cache_written_datasets(
+    nwbfile_path: Path, datasets_to_cache: list[_CachedDataset], build_manager: BuildManager
+) -> None:
+    """Copy datasets just written to an HDF5 file into the cache, each to a file of its own."""
+    if not datasets_to_cache:
+        return
+
+    with h5py.File(name=nwbfile_path, mode="r") as written_file:
+        for dataset_to_cache in datasets_to_cache:
+            path_in_file = _get_path_in_file(
+                build_manager=build_manager,
+                neurodata_object=dataset_to_cache.neurodata_object,
+                dataset_name=dataset_to_cache.dataset_name,
+            )
+            if path_in_file is None or path_in_file not in written_file:
+                continue
+
+            cache_file_path = dataset_to_cache.cache_file_path
+            cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Written aside and renamed, so that an interrupted run never leaves a partial entry behind
+            partial_file_path = cache_file_path.with_suffix(f".{os.getpid()}.partial")
+            with h5py.File(name=partial_file_path, mode="w") as cache_file:
+                written_file.copy(source=written_file[path_in_file], dest=cache_file, name="data", without_attrs=True)
+            os.replace(partial_file_path, cache_file_path)
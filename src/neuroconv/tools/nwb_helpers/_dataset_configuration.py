@@ -7,7 +7,7 @@ import h5py
 import numpy as np
 import zarr
 from hdmf import Container
-from hdmf.data_utils import DataIO
+from hdmf.data_utils import AbstractDataChunkIterator, DataIO
 from hdmf.utils import get_data_shape
 from hdmf_zarr import NWBZarrIO
 from pynwb import NWBHDF5IO, NWBFile
@@ -15,7 +15,11 @@ from pynwb.base import DynamicTable, Image, TimeSeriesReferenceVectorData
 from pynwb.file import NWBContainer
 
 from ._configuration_models import DATASET_IO_CONFIGURATIONS
-from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configuration_models._base_dataset_io import (
+    DatasetIOConfiguration,
+    _find_location_in_memory_nwbfile,
+)
+from ._configuration_models._read_pattern import ReadPattern
 from ..hdmf import _get_nwbfile_builder
 
 
@@ -72,6 +76,7 @@ def _is_dataset_written_to_file(
 def get_default_dataset_io_configurations(
     nwbfile: NWBFile,
     backend: None | Literal["hdf5", "zarr"] = None,  # None for auto-detect from append mode, otherwise required
+    read_patterns: dict[str, list[ReadPattern]] | None = None,
 ) -> Generator[DatasetIOConfiguration, None, None]:
     """
     Generate DatasetIOConfiguration objects for wrapping NWB file objects with a specific backend.
@@ -86,12 +91,17 @@ def get_default_dataset_io_configurations(
         An in-memory NWBFile object, either generated from the base class or read from an existing file of any backend.
     backend : "hdf5" or "zarr"
         Which backend format type you would like to use in configuring each dataset's compression methods and options.
+    read_patterns : dict, optional
+        A mapping from the location of a dataset in the file (e.g. 'acquisition/ElectricalSeries/data') to the ways
+        it is expected to be read after it is written. Datasets named here are chunked to minimize the expected cost
+        of those reads; all others keep the default chunk shape.
 
     Yields
     ------
     DatasetIOConfiguration
         A summary of each detected object that can be wrapped in a hdmf.DataIO.
     """
+    read_patterns = read_patterns or dict()
 
     DatasetIOConfigurationClass = DATASET_IO_CONFIGURATIONS[backend]
 
@@ -143,8 +153,10 @@ def get_default_dataset_io_configurations(
                 if isinstance(candidate_dataset, DataIO):
                     continue  # Skip
 
-                # Skip over columns whose values are links, such as the 'group' of an ElectrodesTable
-                if any(isinstance(value, Container) for value in candidate_dataset):
+                # Skip over columns whose values are links, such as the 'group' of an ElectrodesTable. A column
+                # written from an iterator holds data rather than links, and iterating it here would consume it
+                is_iterator = isinstance(candidate_dataset, AbstractDataChunkIterator)
+                if not is_iterator and any(isinstance(value, Container) for value in candidate_dataset):
                     continue  # Skip
 
                 # Skip when columns whose values are a reference type
@@ -158,8 +170,12 @@ def get_default_dataset_io_configurations(
                 if any(axis_length == 0 for axis_length in full_shape):
                     continue
 
+                location_in_file = _find_location_in_memory_nwbfile(neurodata_object=column, field_name=dataset_name)
                 dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object_with_defaults(
-                    neurodata_object=column, dataset_name=dataset_name, builder=builder
+                    neurodata_object=column,
+                    dataset_name=dataset_name,
+                    builder=builder,
+                    read_patterns=read_patterns.get(location_in_file),
                 )
 
                 yield dataset_io_configuration
@@ -192,8 +208,14 @@ def get_default_dataset_io_configurations(
                 if any(axis_length == 0 for axis_length in full_shape):
                     continue
 
+                location_in_file = _find_location_in_memory_nwbfile(
+                    neurodata_object=neurodata_object, field_name=known_dataset_field
+                )
                 dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object_with_defaults(
-                    neurodata_object=neurodata_object, dataset_name=known_dataset_field, builder=builder
+                    neurodata_object=neurodata_object,
+                    dataset_name=known_dataset_field,
+                    builder=builder,
+                    read_patterns=read_patterns.get(location_in_file),
                 )
 
                 yield dataset_io_configuration
@@ -222,8 +244,14 @@ def get_default_dataset_io_configurations(
             if any(axis_length == 0 for axis_length in full_shape):
                 continue
 
+            location_in_file = _find_location_in_memory_nwbfile(
+                neurodata_object=neurodata_object, field_name=dataset_name
+            )
             dataset_io_configuration = DatasetIOConfigurationClass.from_neurodata_object_with_defaults(
-                neurodata_object=neurodata_object, dataset_name=dataset_name, builder=builder
+                neurodata_object=neurodata_object,
+                dataset_name=dataset_name,
+                builder=builder,
+                read_patterns=read_patterns.get(location_in_file),
             )
 
             yield dataset_io_configuration
@@ -263,8 +291,10 @@ def get_existing_dataset_io_configurations(nwbfile: NWBFile) -> Generator[Datase
             for column in dynamic_table.columns:
                 candidate_dataset = column.data  # VectorData object
 
-                # Skip over columns whose values are links, such as the 'group' of an ElectrodesTable
-                if any(isinstance(value, Container) for value in candidate_dataset):
+                # Skip over columns whose values are links, such as the 'group' of an ElectrodesTable. A column
+                # written from an iterator holds data rather than links, and iterating it here would consume it
+                is_iterator = isinstance(candidate_dataset, AbstractDataChunkIterator)
+                if not is_iterator and any(isinstance(value, Container) for value in candidate_dataset):
                     continue  # Skip
 
                 # Skip when columns whose values are a reference type
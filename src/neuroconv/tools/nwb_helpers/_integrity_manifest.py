@@ -0,0 +1,297 @@
+"""A manifest of content hashes for every dataset of an NWB file, computed as the file is written."""
+
+import hashlib
+import itertools
+import json
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import h5py
+import numpy as np
+import zarr
+from hdmf.build import BuildManager
+from hdmf.common import Data
+from hdmf.data_utils import DataIO
+from pynwb import NWBFile, TimeSeries
+
+from ._configuration_models._base_backend import BackendConfiguration
+from ._dataset_cache import _get_path_in_file
+from ..hdmf import BufferHook, GenericDataChunkIterator
+
+_HASH_ALGORITHM = "blake2b-160"
+
+
+def _hash_bytes(data: Any) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _hash_chunk(chunk_data: np.ndarray, dtype: np.dtype) -> str:
+    """The hash of the values of a chunk, laid out in C order and little-endian whatever the machine reading them."""
+    return _hash_bytes(np.ascontiguousarray(chunk_data, dtype=np.dtype(dtype).newbyteorder("<")))
+
+
+def _get_chunk_key(chunk_index: tuple[int, ...]) -> str:
+    return ".".join(str(index) for index in chunk_index)
+
+
+def _iterate_chunks(
+    selection: tuple[slice, ...], chunk_shape: tuple[int, ...]
+) -> Iterator[tuple[tuple[int, ...], tuple[slice, ...]]]:
+    """The index on the chunk grid and the selection of every chunk within a chunk-aligned selection."""
+    chunk_starts_per_axis = [
+        range(axis.start, axis.stop, chunk_axis) for axis, chunk_axis in zip(selection, chunk_shape)
+    ]
+    for chunk_starts in itertools.product(*chunk_starts_per_axis):
+        chunk_index = tuple(start // chunk_axis for start, chunk_axis in zip(chunk_starts, chunk_shape))
+        chunk_selection = tuple(
+            slice(start, min(start + chunk_axis, axis.stop))
+            for start, chunk_axis, axis in zip(chunk_starts, chunk_shape, selection)
+        )
+        yield chunk_index, chunk_selection
+
+
+def _get_dataset_hash(chunk_hashes: dict[str, str]) -> str:
+    """The hash of a whole dataset, from those of its chunks taken in the order of the chunk grid."""
+    chunk_indices = sorted(tuple(int(index) for index in chunk_key.split(".")) for chunk_key in chunk_hashes)
+    return _hash_bytes("".join(chunk_hashes[_get_chunk_key(chunk_index)] for chunk_index in chunk_indices).encode())
+
+
+class _IteratorHasher(BufferHook):
+    """Hashes the chunks of each buffer a data chunk iterator reads, as the writer receives it."""
+
+    def __init__(self, iterator: GenericDataChunkIterator, chunk_shape: tuple[int, ...]):
+        self.chunk_shape = tuple(chunk_shape)
+        self.shape = tuple(iterator.maxshape)
+        self.dtype = np.dtype(iterator.dtype)
+        self.chunk_hashes: dict[str, str] = dict()
+        # A buffer not aligned to the chunks of the file cannot be hashed chunk by chunk; the dataset is then
+        # hashed from the file once written
+        self.is_aligned = True
+        self._lock = threading.Lock()
+        iterator.add_buffer_hook(buffer_hook=self)
+
+    def buffer_read(self, iterator: GenericDataChunkIterator, selection: tuple[slice, ...], data: np.ndarray) -> None:
+        self._hash_buffer(data=data, selection=selection)
+
+    def _hash_buffer(self, data: np.ndarray, selection: tuple[slice, ...]) -> None:
+        is_aligned = all(
+            axis.start % chunk_axis == 0 and (axis.stop % chunk_axis == 0 or axis.stop == axis_length)
+            for axis, chunk_axis, axis_length in zip(selection, self.chunk_shape, self.shape)
+        )
+        if not is_aligned:
+            self.is_aligned = False
+            return
+
+        data = np.asarray(data)
+        chunk_hashes = dict()
+        for chunk_index, chunk_selection in _iterate_chunks(selection=selection, chunk_shape=self.chunk_shape):
+            chunk_data = data[
+                tuple(
+                    slice(chunk.start - axis.start, chunk.stop - axis.start)
+                    for chunk, axis in zip(chunk_selection, selection)
+                )
+            ]
+            chunk_hashes[_get_chunk_key(chunk_index)] = _hash_chunk(chunk_data=chunk_data, dtype=self.dtype)
+        with self._lock:
+            self.chunk_hashes.update(chunk_hashes)
+
+    def is_complete(self, dataset: h5py.Dataset | zarr.Array) -> bool:
+        """Whether every chunk of the dataset as written was hashed, with the type it was written with."""
+        number_of_chunks = math.prod(
+            math.ceil(axis_length / chunk_axis) for axis_length, chunk_axis in zip(dataset.shape, self.chunk_shape)
+        )
+        return (
+            self.is_aligned
+            and tuple(dataset.shape) == self.shape
+            and _get_chunk_shape(dataset=dataset) == self.chunk_shape
+            and np.dtype(dataset.dtype) == self.dtype
+            and len(self.chunk_hashes) == number_of_chunks
+        )
+
+
+def _get_chunk_shape(dataset: h5py.Dataset | zarr.Array) -> tuple[int, ...]:
+    """The chunk shape of a dataset, a contiguous one counting as a single chunk."""
+    return tuple(dataset.chunks) if dataset.chunks is not None else tuple(dataset.shape)
+
+
+def _is_hashable(dataset: h5py.Dataset | zarr.Array) -> bool:
+    """Whether the values of a dataset are numbers, whose bytes are the same however the file is read."""
+    return np.dtype(dataset.dtype).kind in "biufc" and len(dataset.shape) > 0
+
+
+def _hash_dataset(dataset: h5py.Dataset | zarr.Array) -> dict[str, str]:
+    """Hash a dataset from the file chunk by chunk, so that each chunk is decompressed once."""
+    chunk_shape = _get_chunk_shape(dataset=dataset)
+    selection = tuple(slice(0, axis_length) for axis_length in dataset.shape)
+    return {
+        _get_chunk_key(chunk_index): _hash_chunk(chunk_data=dataset[chunk_selection], dtype=dataset.dtype)
+        for chunk_index, chunk_selection in _iterate_chunks(selection=selection, chunk_shape=chunk_shape)
+    }
+
+
+@contextmanager
+def _open_nwbfile(nwbfile_path: Path) -> Iterator[h5py.File | zarr.Group]:
+    """Open an NWB file for reading its datasets directly, a Zarr file being a folder."""
+    if Path(nwbfile_path).is_dir():
+        yield zarr.open(store=str(nwbfile_path), mode="r")
+        return
+
+    with h5py.File(name=nwbfile_path, mode="r") as file:
+        yield file
+
+
+def hash_iterative_datasets(
+    nwbfile: NWBFile, backend_configuration: BackendConfiguration
+) -> dict[tuple[str, str], _IteratorHasher]:
+    """
+    Hash the chunks of every dataset fed by a data chunk iterator as the iterator reads them.
+
+    Must be called after `configure_backend`, whose `DataIO` it looks inside, and before the file is written or its
+    datasets are staged. Returns the hashers, keyed by the object ID and name of their dataset.
+    """
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    hashers = dict()
+    for dataset_configuration in backend_configuration.dataset_configurations.values():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        dataset_name = dataset_configuration.dataset_name
+        if isinstance(neurodata_object, Data):
+            data_io = neurodata_object.data
+        else:
+            data_io = neurodata_object.fields.get(dataset_name)
+        if (
+            isinstance(data_io, DataIO)
+            and isinstance(data_io.data, GenericDataChunkIterator)
+            and dataset_configuration.chunk_shape is not None
+        ):
+            hashers[(dataset_configuration.object_id, dataset_name)] = _IteratorHasher(
+                iterator=data_io.data, chunk_shape=dataset_configuration.chunk_shape
+            )
+
+    return hashers
+
+
+def write_integrity_manifest(
+    nwbfile_path: Path,
+    manifest_file_path: Path,
+    nwbfile: NWBFile,
+    backend_configuration: BackendConfiguration,
+    hashers: dict[tuple[str, str], _IteratorHasher],
+    build_manager: BuildManager,
+) -> None:
+    """
+    Write the manifest of a file just written: the shape, type, chunk grid and hashes of each of its datasets.
+
+    The hashes of the datasets fed by data chunk iterators were taken as they were written. Every other dataset,
+    such as an array held in memory or one copied from the dataset cache, is hashed from the file.
+    """
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    datasets = dict()
+    with _open_nwbfile(nwbfile_path=nwbfile_path) as written_file:
+        for dataset_configuration in backend_configuration.dataset_configurations.values():
+            neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+            dataset_name = dataset_configuration.dataset_name
+
+            # Links point to a dataset written elsewhere in the file, which has its own entry
+            if isinstance(neurodata_object.fields.get(dataset_name), TimeSeries):
+                continue
+
+            path_in_file = _get_path_in_file(
+                build_manager=build_manager, neurodata_object=neurodata_object, dataset_name=dataset_name
+            )
+            if path_in_file is None or path_in_file not in written_file:
+                continue
+
+            dataset = written_file[path_in_file]
+            if not _is_hashable(dataset=dataset):
+                continue
+
+            hasher = hashers.get((dataset_configuration.object_id, dataset_name))
+            if hasher is not None and hasher.is_complete(dataset=dataset):
+                chunk_hashes = hasher.chunk_hashes
+            else:
+                chunk_hashes = _hash_dataset(dataset=dataset)
+
+            datasets[path_in_file] = dict(
+                shape=list(dataset.shape),
+                dtype=str(dataset.dtype),
+                chunk_shape=list(_get_chunk_shape(dataset=dataset)),
+                hash=_get_dataset_hash(chunk_hashes=chunk_hashes),
+                chunk_hashes=chunk_hashes,
+            )
+
+    manifest = dict(nwbfile=Path(nwbfile_path).name, hash_algorithm=_HASH_ALGORITHM, datasets=datasets)
+    Path(manifest_file_path).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def _verify_dataset(nwbfile_path: str, path_in_file: str, entry: dict) -> list[str]:
+    """Check one dataset against its entry in the manifest, returning what does not match."""
+    with _open_nwbfile(nwbfile_path=Path(nwbfile_path)) as file:
+        if path_in_file not in file:
+            return [path_in_file]
+
+        dataset = file[path_in_file]
+        # A dataset of another shape or type differs wherever it is read
+        if list(dataset.shape) != entry["shape"] or str(dataset.dtype) != entry["dtype"]:
+            return [path_in_file]
+
+        selection = tuple(slice(0, axis_length) for axis_length in dataset.shape)
+        mismatches = list()
+        for chunk_index, chunk_selection in _iterate_chunks(selection=selection, chunk_shape=entry["chunk_shape"]):
+            chunk_key = _get_chunk_key(chunk_index)
+            chunk_hash = _hash_chunk(chunk_data=dataset[chunk_selection], dtype=dataset.dtype)
+            if chunk_hash != entry["chunk_hashes"].get(chunk_key):
+                mismatches.append(f"{path_in_file}[{chunk_key}]")
+
+        return mismatches
+
+
+def verify_integrity_manifest(
+    nwbfile_path: str | Path, manifest_file_path: str | Path, max_workers: int = 1
+) -> list[str]:
+    """
+    Check the datasets of an NWB file against the integrity manifest written with it.
+
+    Each dataset is read a chunk at a time over the chunk grid of its manifest entry, which is the chunking of the
+    file, so each chunk is decompressed once and no more than one chunk of a dataset is held at a time. A dataset
+    whose shape or type differs from its entry is reported without reading it.
+
+    Parameters
+    ----------
+    nwbfile_path : str or Path
+        The NWB file to check.
+    manifest_file_path : str or Path
+        The manifest written with it by ``configure_and_write_nwbfile`` or ``run_conversion``.
+    max_workers : int, default: 1
+        The number of processes checking datasets at once.
+
+    Returns
+    -------
+    list of str
+        The path of every dataset that is missing or differs in shape or type, and the path and chunk index of
+        every chunk whose hash differs, as ``path[index]``. Empty when the file matches its manifest.
+    """
+    manifest = json.loads(Path(manifest_file_path).read_text(encoding="utf-8"))
+    if manifest["hash_algorithm"] != _HASH_ALGORITHM:
+        raise ValueError(
+            f"The manifest was written with the '{manifest['hash_algorithm']}' hash, but only '{_HASH_ALGORITHM}' "
+            "is supported!"
+        )
+
+    worker_kwargs = [
+        dict(nwbfile_path=str(nwbfile_path), path_in_file=path_in_file, entry=entry)
+        for path_in_file, entry in manifest["datasets"].items()
+    ]
+    if max_workers > 1 and len(worker_kwargs) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_verify_dataset, **kwargs) for kwargs in worker_kwargs]
+            mismatches_per_dataset = [future.result() for future in futures]
+    else:
+        mismatches_per_dataset = [_verify_dataset(**kwargs) for kwargs in worker_kwargs]
+
+    return [mismatch for mismatches in mismatches_per_dataset for mismatch in mismatches]
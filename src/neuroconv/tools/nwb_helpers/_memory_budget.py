@@ -0,0 +1,179 @@
+"""A memory budget shared by every chunk iterator written during a conversion."""
+
+import math
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+import psutil
+
+from ..hdmf import BufferHook, GenericDataChunkIterator
+
+_MEMORY_BUDGET_ENVIRONMENT_VARIABLE = "NEUROCONV_MEMORY_BUDGET_GB"
+
+# The share of the memory the system reports available that one buffer may take, so that a buffer read while
+# another process is growing does not take the last of it
+_MAXIMUM_FRACTION_OF_AVAILABLE_MEMORY = 0.5
+
+_active_memory_budgets: list["MemoryBudget"] = []
+
+
+class MemoryBudget(BufferHook):
+    """
+    A limit on the memory the buffers of all chunk iterators may hold at once, and a record of how much they held.
+
+    Each `GenericDataChunkIterator` sizes its buffer on its own, by default to 1 GB, knowing nothing of the other
+    iterators of the conversion nor of what else runs on the machine. While a budget is active, every iterator
+    configured for writing reads its buffers in pieces of at most its share of the budget: the budget divided by
+    the number of iterators being read at that moment, and never more than half of the memory the system reports
+    available when the buffer is read. The pieces are whole numbers of chunks, so the chunks written are unchanged.
+
+    Use it as a context manager around the conversion, or pass ``memory_budget_gb`` to ``run_conversion``. When
+    neither is given, the ``NEUROCONV_MEMORY_BUDGET_GB`` environment variable sets one.
+
+    Parameters
+    ----------
+    budget_gb : float
+        The memory, in gigabytes, the buffers of all iterators may hold at once.
+
+    Examples
+    --------
+    >>> with MemoryBudget(budget_gb=4.0) as memory_budget:
+    ...     converter.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata)
+    >>> memory_budget.high_water_mark_in_bytes
+    """
+
+    def __init__(self, budget_gb: float):
+        if budget_gb <= 0:
+            raise ValueError(f"The memory budget must be greater than zero, but {budget_gb=}.")
+
+        self.budget_in_bytes = int(budget_gb * 1e9)
+        self.high_water_mark_in_bytes = 0
+        self.peak_resident_memory_in_bytes = 0
+
+        self._lock = threading.Lock()
+        self._buffered_bytes_by_iterator: dict[int, int] = dict()
+        self._process = psutil.Process()
+
+    def __enter__(self) -> "MemoryBudget":
+        _active_memory_budgets.append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_memory_budgets.remove(self)
+
+    def get_buffer_allowance_in_bytes(self) -> int:
+        """The most one iterator may read at once: its share of the budget, bounded by the memory available."""
+        with self._lock:
+            number_of_active_iterators = max(1, len(self._buffered_bytes_by_iterator))
+        share_in_bytes = self.budget_in_bytes // number_of_active_iterators
+        available_in_bytes = int(psutil.virtual_memory().available * _MAXIMUM_FRACTION_OF_AVAILABLE_MEMORY)
+
+        return min(share_in_bytes, available_in_bytes)
+
+    def govern(self, iterator: GenericDataChunkIterator) -> None:
+        """Make the iterator read each of its buffers in pieces that fit its share of the budget."""
+        iterator.add_buffer_hook(buffer_hook=self)
+
+    def iteration_started(self, iterator: GenericDataChunkIterator) -> None:
+        iterator_id = id(iterator)
+        with self._lock:
+            self._buffered_bytes_by_iterator[iterator_id] = 0
+        # An iterator abandoned before it is exhausted stops counting once it is collected
+        weakref.finalize(iterator, self._forget, iterator_id)
+
+    def split_buffer(self, iterator: GenericDataChunkIterator, selection: tuple[slice, ...]) -> list[tuple[slice, ...]]:
+        return _split_selection(
+            selection=selection,
+            chunk_shape=iterator.chunk_shape,
+            itemsize=iterator.dtype.itemsize,
+            maximum_bytes=self.get_buffer_allowance_in_bytes(),
+        )
+
+    def buffer_read(self, iterator: GenericDataChunkIterator, selection: tuple[slice, ...], data: np.ndarray) -> None:
+        piece_bytes = math.prod(axis.stop - axis.start for axis in selection) * iterator.dtype.itemsize
+        self._record(iterator_id=id(iterator), buffered_bytes=piece_bytes)
+
+    def iteration_finished(self, iterator: GenericDataChunkIterator) -> None:
+        self._forget(iterator_id=id(iterator))
+
+    def _forget(self, iterator_id: int) -> None:
+        with self._lock:
+            self._buffered_bytes_by_iterator.pop(iterator_id, None)
+
+    def _record(self, iterator_id: int, buffered_bytes: int) -> None:
+        with self._lock:
+            self._buffered_bytes_by_iterator[iterator_id] = buffered_bytes
+            total_buffered_bytes = sum(self._buffered_bytes_by_iterator.values())
+            self.high_water_mark_in_bytes = max(self.high_water_mark_in_bytes, total_buffered_bytes)
+        resident_memory_in_bytes = self._process.memory_info().rss
+        self.peak_resident_memory_in_bytes = max(self.peak_resident_memory_in_bytes, resident_memory_in_bytes)
+
+
+def _split_selection(
+    selection: tuple[slice, ...], chunk_shape: tuple[int, ...], itemsize: int, maximum_bytes: int
+) -> list[tuple[slice, ...]]:
+    """
+    Tile a buffer selection with pieces of at most `maximum_bytes`, each a whole number of chunks along every axis.
+
+    The pieces are narrowed along the first axis first, which for every series is time, so they stay as wide as
+    the buffer was along the others. A piece is never smaller than one chunk, whatever the allowance.
+    """
+    piece_shape = [axis.stop - axis.start for axis in selection]
+    for axis_index, chunk_axis in enumerate(chunk_shape):
+        piece_bytes = math.prod(piece_shape) * itemsize
+        if piece_bytes <= maximum_bytes:
+            break
+
+        bytes_per_chunk_along_axis = piece_bytes // piece_shape[axis_index] * chunk_axis
+        chunks_that_fit = max(1, maximum_bytes // bytes_per_chunk_along_axis)
+        piece_shape[axis_index] = min(piece_shape[axis_index], chunks_that_fit * chunk_axis)
+
+    axis_starts = [range(axis.start, axis.stop, piece_axis) for axis, piece_axis in zip(selection, piece_shape)]
+    pieces = [[]]
+    for axis, piece_axis, starts in zip(selection, piece_shape, axis_starts):
+        pieces = [piece + [slice(start, min(start + piece_axis, axis.stop))] for piece in pieces for start in starts]
+
+    return [tuple(piece) for piece in pieces]
+
+
+def get_active_memory_budget() -> MemoryBudget | None:
+    """The innermost memory budget in effect, if any."""
+    return _active_memory_budgets[-1] if _active_memory_budgets else None
+
+
+def get_available_memory_in_bytes() -> int:
+    """The memory the system reports available, or the budget in effect when that is smaller."""
+    available_memory_in_bytes = psutil.virtual_memory().available
+    memory_budget = get_active_memory_budget()
+    if memory_budget is not None:
+        available_memory_in_bytes = min(available_memory_in_bytes, memory_budget.budget_in_bytes)
+
+    return available_memory_in_bytes
+
+
+@contextmanager
+def use_memory_budget(budget_gb: float | None = None) -> Iterator[MemoryBudget | None]:
+    """
+    Apply a memory budget for the duration of a conversion, unless the caller already applies one.
+
+    Without `budget_gb`, the budget already in effect is kept, or else one is read from ``NEUROCONV_MEMORY_BUDGET_GB``;
+    with neither, the iterators size their buffers as they always have and this yields None.
+    """
+    if budget_gb is None:
+        active_memory_budget = get_active_memory_budget()
+        if active_memory_budget is not None:
+            yield active_memory_budget
+            return
+
+        environment_value = os.environ.get(_MEMORY_BUDGET_ENVIRONMENT_VARIABLE, "").strip()
+        if not environment_value:
+            yield None
+            return
+        budget_gb = float(environment_value)
+
+    with MemoryBudget(budget_gb=budget_gb) as memory_budget:
+        yield memory_budget
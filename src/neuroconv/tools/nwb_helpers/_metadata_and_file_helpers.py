@@ -19,13 +19,24 @@ from . import (
     configure_backend,
     get_default_backend_configuration,
 )
+from ._checkpointed_write import (
+    build_resumed_nwbfile,
+    prepare_checkpoints,
+    remove_checkpoints,
+    write_checkpoints,
+)
+from ._dataset_cache import cache_written_datasets, find_cached_datasets, use_cached_datasets
 from ._device_types import (
     _DEVICE_MODEL_TYPE_SOURCES,
     _DEVICE_TYPE_SOURCES,
     _build_inline_containers,
     _resolve_type,
 )
+from ._integrity_manifest import hash_iterative_datasets, write_integrity_manifest
 from ._provenance import describe_source_script
+from ._repack import repack_hdf5_nwbfile
+from ._staged_write import stage_iterative_datasets, write_staged_datasets
+from ._write_progress import set_write_progress_destinations
 from ...utils.dict import DeepDict, load_dict_from_file
 from ...utils.json_schema import _validate_device_registry_names, validate_metadata
 
@@ -564,6 +575,10 @@ def configure_and_write_nwbfile(
     nwbfile_path: FilePath | None = None,
     backend: Literal["hdf5", "zarr"] | None = None,
     backend_configuration: BackendConfiguration | None = None,
+    dataset_cache_folder_path: str | Path | None = None,
+    max_workers: int = 1,
+    integrity_manifest_file_path: str | Path | None = None,
+    checkpoint_folder_path: str | Path | None = None,
 ) -> None:
     """
     Write an NWB file using a specific backend or backend configuration.
@@ -581,7 +596,37 @@ def configure_and_write_nwbfile(
         specified backend. If no ``backend`` is specified, the ``backend_configuration`` is used.
     backend_configuration: BackendConfiguration, optional
         Specifies the backend type and the chunking and compression parameters of each dataset. If no
-        ``backend_configuration`` is specified, the default configuration for the specified ``backend`` is used.
+        ``backend_configuration`` is specified, the default configuration for the specified ``backend`` is used,
+        and series whose timestamps are identical share one copy of them (see
+        ``BackendConfiguration.apply_timestamp_linking``).
+    dataset_cache_folder_path: str or Path, optional
+        A folder in which to keep every dataset written, addressed by a fingerprint of its source and its storage
+        settings, so that writing the same dataset again copies it from there as stored rather than reading and
+        compressing it anew. A source is identified without reading it where it is held in a file (an
+        ``h5py.Dataset``, a ``numpy.memmap``, a video or a recording SpikeInterface can describe), and by hashing
+        its values where it is held in memory; datasets with any other source are written as usual.
+        Only supported for the HDF5 backend.
+    max_workers: int, default: 1
+        The number of threads reading and compressing the datasets fed by data chunk iterators, such as the series
+        of each probe or each segment of a recording, at once. Each is created empty when the file is written, and
+        filled afterwards by one writer from the buffers the threads pass it through a bounded queue. The chunks of
+        datasets compressed with GZIP alone are compressed on the threads, outside of HDF5, which would otherwise
+        hold its lock for the whole of each chunk, and written as stored. Only supported for the HDF5 backend.
+    integrity_manifest_file_path: str or Path, optional
+        Where to write a JSON manifest of the file: the path, shape, type and chunk shape of each numeric dataset,
+        with a hash of each of its chunks and of the whole. The datasets fed by data chunk iterators are hashed
+        as their buffers are written, rather than read back; the others are hashed from the file. Check the file
+        against it later with `verify_integrity_manifest`.
+    checkpoint_folder_path: str or Path, optional
+        A folder in which to checkpoint the datasets fed by data chunk iterators, so that a write interrupted part
+        way, by running out of memory or by the preemption of its node, resumes where it stopped. The datasets are
+        created empty when the file is written, and filled afterwards in place, every buffer of their iterators
+        recorded in a journal in the folder once on disk. Writing again with the same folder, the same file,
+        sources and settings keeps the file as it was written and writes only the buffers not recorded, so each
+        buffer is written once, into the file itself. The journal also holds a fingerprint of the rest of the file,
+        its metadata and the data and settings of every other dataset, and a file whose rest differs, such as one
+        with corrected metadata, is written again from its start with a warning. The journals are removed once the
+        file is complete. With ``max_workers``, that many datasets are read at once.
     """
 
     if nwbfile_path is None:
@@ -595,17 +640,93 @@ def configure_and_write_nwbfile(
 
     if backend_configuration is None:
         backend_configuration = get_default_backend_configuration(nwbfile, backend=backend or "hdf5")
+        backend_configuration.apply_timestamp_linking(nwbfile=nwbfile)
+
+    cached_datasets, datasets_to_cache = list(), list()
+    if dataset_cache_folder_path is not None:
+        if backend_configuration.backend != "hdf5":
+            raise ValueError(
+                f"The dataset cache is only supported for the HDF5 backend, not '{backend_configuration.backend}'!"
+            )
+        # The sources are fingerprinted before `configure_backend` wraps them
+        cached_datasets, datasets_to_cache = find_cached_datasets(
+            nwbfile=nwbfile,
+            backend_configuration=backend_configuration,
+            dataset_cache_folder_path=Path(dataset_cache_folder_path),
+        )
+
+    if max_workers > 1 and backend_configuration.backend != "hdf5":
+        raise ValueError(
+            f"Writing with several workers is only supported for the HDF5 backend, not '{backend_configuration.backend}'!"
+        )
 
     configure_backend(nwbfile=nwbfile, backend_configuration=backend_configuration)
+    set_write_progress_destinations(
+        nwbfile=nwbfile, backend_configuration=backend_configuration, nwbfile_path=Path(nwbfile_path)
+    )
+    cache_files = use_cached_datasets(cached_datasets=cached_datasets)
+    checkpoints, nwbfile_journal_header, is_resumed = list(), dict(), False
+    if checkpoint_folder_path is not None:
+        checkpoints, nwbfile_journal_header, is_resumed = prepare_checkpoints(
+            nwbfile=nwbfile,
+            backend_configuration=backend_configuration,
+            nwbfile_path=Path(nwbfile_path),
+            checkpoint_folder_path=Path(checkpoint_folder_path),
+        )
+    hashers = dict()
+    if integrity_manifest_file_path is not None:
+        hashers = hash_iterative_datasets(nwbfile=nwbfile, backend_configuration=backend_configuration)
 
     IO = BACKEND_NWB_IO[backend_configuration.backend]
 
-    with IO(nwbfile_path, mode="w") as io:
-        if nwbfile.read_io is not None:  # i.e. in the case of exporting
-            nwbfile.set_modified()
-            io.export(nwbfile=nwbfile, src_io=nwbfile.read_io, write_args=dict(link_data=False))
+    # The checkpointed datasets are filled by `write_checkpoints` instead
+    staged_datasets = list()
+    if max_workers > 1 and checkpoint_folder_path is None:
+        staged_datasets = stage_iterative_datasets(nwbfile=nwbfile, backend_configuration=backend_configuration)
+
+    try:
+        if is_resumed:
+            # Everything but the checkpointed datasets was written before the interruption
+            build_manager = build_resumed_nwbfile(nwbfile=nwbfile)
         else:
-            io.write(nwbfile)
+            with IO(nwbfile_path, mode="w") as io:
+                if nwbfile.read_io is not None:  # i.e. in the case of exporting
+                    nwbfile.set_modified()
+                    io.export(nwbfile=nwbfile, src_io=nwbfile.read_io, write_args=dict(link_data=False))
+                else:
+                    io.write(nwbfile)
+            build_manager = io.manager
+    finally:
+        for file in cache_files:
+            file.close()
+
+    if staged_datasets:
+        write_staged_datasets(nwbfile_path=Path(nwbfile_path), staged_datasets=staged_datasets, max_workers=max_workers)
+
+    if checkpoint_folder_path is not None:
+        write_checkpoints(
+            nwbfile_path=Path(nwbfile_path),
+            checkpoints=checkpoints,
+            checkpoint_folder_path=Path(checkpoint_folder_path),
+            nwbfile_journal_header=nwbfile_journal_header,
+            backend=backend_configuration.backend,
+            is_resumed=is_resumed,
+            max_workers=max_workers,
+        )
+        remove_checkpoints(checkpoint_folder_path=Path(checkpoint_folder_path))
+
+    cache_written_datasets(
+        nwbfile_path=Path(nwbfile_path), datasets_to_cache=datasets_to_cache, build_manager=build_manager
+    )
+    if integrity_manifest_file_path is not None:
+        write_integrity_manifest(
+            nwbfile_path=Path(nwbfile_path),
+            manifest_file_path=Path(integrity_manifest_file_path),
+            nwbfile=nwbfile,
+            backend_configuration=backend_configuration,
+            hashers=hashers,
+            build_manager=build_manager,
+        )
 
 
 def repack_nwbfile(
@@ -613,10 +734,16 @@ def repack_nwbfile(
     nwbfile_path: Path,
     export_nwbfile_path: Path,
     export_backend: Literal["hdf5", "zarr", None] = None,
+    backend_configuration: BackendConfiguration | None = None,
+    max_workers: int = 1,
 ):
     """
     Repack an NWBFile with a new backend configuration.
 
+    When both files are HDF5, datasets whose chunking and filters already match the new configuration are copied
+    without being decompressed, and only the others are recompressed, by up to `max_workers` processes at once.
+    Any other combination of backends rewrites every dataset.
+
     Parameters
     ----------
     nwbfile_path : Path
@@ -625,16 +752,39 @@ def repack_nwbfile(
         Path to export the repacked NWB file.
     export_backend : {"hdf5", "zarr", None}, default: None
         The type of backend used to write the repacked file. If None, the same backend as the input file is used.
+    backend_configuration : BackendConfiguration, optional
+        The configuration of the datasets in the repacked file, built from the file at `nwbfile_path` as read with
+        `read_nwb`. If None, the default configuration of `export_backend` is used.
+    max_workers : int, default: 1
+        The number of processes recompressing datasets at once when repacking HDF5 to HDF5.
     """
+    source_backend = _fetch_backend_from_nwbfile_on_disk(nwbfile_path=nwbfile_path)
     # The backend of the source file is a property of the file; the export backend is an independent
     # choice that defaults to it.
     if export_backend is None:
-        export_backend = _fetch_backend_from_nwbfile_on_disk(nwbfile_path=nwbfile_path)
+        export_backend = backend_configuration.backend if backend_configuration is not None else source_backend
+    if backend_configuration is not None and backend_configuration.backend != export_backend:
+        raise ValueError(
+            f"The export backend ('{export_backend}') does not match the backend of the "
+            f"backend configuration ('{backend_configuration.backend}')!"
+        )
 
     # Read the file using read_nwb (automatically detects backend)
     nwbfile = read_nwb(nwbfile_path)
 
-    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend=export_backend)
+    if backend_configuration is None:
+        backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend=export_backend)
+
+    if source_backend == "hdf5" and export_backend == "hdf5":
+        repack_hdf5_nwbfile(
+            nwbfile=nwbfile,
+            nwbfile_path=nwbfile_path,
+            export_nwbfile_path=export_nwbfile_path,
+            backend_configuration=backend_configuration,
+            max_workers=max_workers,
+        )
+        return
+
     configure_and_write_nwbfile(
         nwbfile=nwbfile,
         backend_configuration=backend_configuration,
@@ -0,0 +1,51 @@
+"""Lookup of the neurodata objects of an in-memory NWBFile by type and name, indexed once per file."""
+
+import threading
+import weakref
+
+from pynwb import NWBFile
+
+_type_indices: "weakref.WeakKeyDictionary[NWBFile, dict[str, dict[str, object]]]" = weakref.WeakKeyDictionary()
+_type_indices_lock = threading.Lock()
+
+
+def _build_type_index(nwbfile: NWBFile) -> dict[str, dict[str, object]]:
+    type_index = dict()
+    for neurodata_object in nwbfile.all_children():
+        type_index.setdefault(type(neurodata_object).__name__, dict())[neurodata_object.name] = neurodata_object
+    return type_index
+
+
+def get_neurodata_objects_by_name(
+    nwbfile: NWBFile, neurodata_type: str, required_name: str | None = None
+) -> dict[str, object]:
+    """
+    Return the objects of the file whose class is named ``neurodata_type``, keyed by their names.
+
+    The whole file is walked once and the result is kept for as long as the NWBFile lives, so that the interfaces
+    linking to objects written before them do not each walk it again. Objects are only ever added to an in-memory
+    file, so the index is rebuilt only when it misses ``required_name``, which may have been added since.
+
+    Parameters
+    ----------
+    nwbfile : pynwb.NWBFile
+        The in-memory NWBFile to search.
+    neurodata_type : str
+        The exact class name of the objects, e.g. ``"ImageSeries"``; subclasses are not included.
+    required_name : str, optional
+        The name being looked up. When absent from the index, the file is walked again before returning.
+
+    Returns
+    -------
+    dict[str, object]
+        The objects of that type keyed by name; empty when the file holds none.
+    """
+    with _type_indices_lock:
+        type_index = _type_indices.get(nwbfile)
+        objects_by_name = type_index.get(neurodata_type, dict()) if type_index is not None else None
+        if objects_by_name is None or (required_name is not None and required_name not in objects_by_name):
+            type_index = _build_type_index(nwbfile=nwbfile)
+            _type_indices[nwbfile] = type_index
+            objects_by_name = type_index.get(neurodata_type, dict())
+
+    return dict(objects_by_name)
@@ -45,7 +45,7 @@ def describe_source_script() -> tuple[str, str]:
         The provenance record and the name of the script that is running it. See
         ``docs/developer_guide/provenance.rst`` for the format of the record.
     """
-    neuroconv_version = importlib.metadata.version("neuroconv")
+    neuroconv_version = _get_neuroconv_version()
     script = _resolve_script()
 
     keys = {
@@ -72,6 +72,16 @@ def describe_source_script() -> tuple[str, str]:
     return _render(keys), script.name
 
 
+@functools.cache
+def _get_neuroconv_version() -> str:
+    """
+    The installed version of NeuroConv.
+
+    Cached because reading it scans the installed distributions, once per interface asked for its metadata.
+    """
+    return importlib.metadata.version("neuroconv")
+
+
 def _render(keys: dict[str, str]) -> str:
     """Render the record: a header naming it, the keys, then the format it is written in."""
     lines = [RECORD_HEADER]
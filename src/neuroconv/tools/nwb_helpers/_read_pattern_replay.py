@@ -0,0 +1,112 @@
+"""Benchmark harness replaying declared read patterns against a dataset in a written NWB file."""
+
+import math
+import time
+from pathlib import Path
+
+import h5py
+import numpy as np
+import zarr
+from pydantic import FilePath
+
+from ._configuration_models._read_pattern import ReadPattern
+from ..iterative_write import _get_expected_chunks_per_axis, estimate_read_pattern_cost
+
+
+def replay_read_patterns(
+    nwbfile_path: FilePath,
+    location_in_file: str,
+    read_patterns: list[ReadPattern],
+    number_of_reads: int = 10,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Time reads drawn from each declared pattern against a dataset of a written NWB file.
+
+    Reads start at positions drawn uniformly from those that keep the selection inside the dataset, the same
+    assumption `get_read_pattern_chunk_shape` makes, so the measured times can be set against the modelled ones to
+    check the chunk shape chosen for a dataset, or to compare files written with different chunk shapes.
+
+    Parameters
+    ----------
+    nwbfile_path : FilePath
+        The path to the NWB file, HDF5 or Zarr; a directory is opened as Zarr.
+    location_in_file : str
+        The location of the dataset within the file, e.g. 'acquisition/ElectricalSeries/data'.
+    read_patterns : list of ReadPattern
+        The patterns to replay.
+    number_of_reads : int, default: 10
+        The number of reads drawn from each pattern.
+    seed : int, default: 0
+        The seed of the random read positions, so that files can be compared on identical reads.
+
+    Returns
+    -------
+    list of dict
+        One entry per pattern holding its `name`, `selection_shape` and `weight`, the dataset's `chunk_shape`, the
+        `number_of_reads`, the `mean_read_time_in_seconds` measured, the `expected_chunks_per_read` under the model,
+        and the `modelled_read_time_in_seconds` the chunk shape optimizer scored it with.
+    """
+    nwbfile_path = Path(nwbfile_path)
+    random_number_generator = np.random.default_rng(seed=seed)
+
+    if nwbfile_path.is_dir():
+        file = zarr.open(store=str(nwbfile_path), mode="r")
+        dataset = file[location_in_file]
+        chunk_shape = dataset.chunks
+    else:
+        file = h5py.File(name=nwbfile_path, mode="r")
+        dataset = file[location_in_file]
+        chunk_shape = dataset.chunks or dataset.shape
+
+    try:
+        full_shape = dataset.shape
+        results = list()
+        for read_pattern in read_patterns:
+            selection_shape = tuple(
+                axis_length if read_length is None else min(read_length, axis_length)
+                for read_length, axis_length in zip(read_pattern.selection_shape, full_shape)
+            )
+
+            elapsed_seconds = 0.0
+            for _ in range(number_of_reads):
+                starts = [
+                    int(random_number_generator.integers(low=0, high=axis_length - read_length + 1))
+                    for read_length, axis_length in zip(selection_shape, full_shape)
+                ]
+                selection = tuple(slice(start, start + length) for start, length in zip(starts, selection_shape))
+
+                start_time = time.perf_counter()
+                dataset[selection]
+                elapsed_seconds += time.perf_counter() - start_time
+
+            expected_chunks_per_read = math.prod(
+                float(
+                    _get_expected_chunks_per_axis(
+                        read_length=read_length, chunk_lengths=np.array(chunk_length), axis_length=axis_length
+                    )
+                )
+                for read_length, chunk_length, axis_length in zip(selection_shape, chunk_shape, full_shape)
+            )
+            results.append(
+                dict(
+                    name=read_pattern.name,
+                    selection_shape=read_pattern.selection_shape,
+                    weight=read_pattern.weight,
+                    chunk_shape=tuple(chunk_shape),
+                    number_of_reads=number_of_reads,
+                    mean_read_time_in_seconds=elapsed_seconds / number_of_reads,
+                    expected_chunks_per_read=expected_chunks_per_read,
+                    modelled_read_time_in_seconds=estimate_read_pattern_cost(
+                        chunk_shape=tuple(chunk_shape),
+                        full_shape=full_shape,
+                        dtype=np.dtype(dataset.dtype),
+                        read_patterns=[read_pattern],
+                    ),
+                )
+            )
+    finally:
+        if isinstance(file, h5py.File):
+            file.close()
+
+    return results
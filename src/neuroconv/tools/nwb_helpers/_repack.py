@@ -0,0 +1,215 @@
+"""Engine repacking an HDF5 NWB file dataset by dataset, copying unchanged datasets without decompressing them."""
+
+import itertools
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import h5py
+from hdmf.common import Data
+from pynwb import NWBHDF5IO, H5DataIO, NWBFile, TimeSeries
+from pynwb.core import NWBData
+
+from ._configuration_models._hdf5_backend import HDF5BackendConfiguration
+from ._configuration_models._hdf5_dataset_io import HDF5DatasetIOConfiguration
+from ._configure_backend import _get_dataset, _replace_dataset
+
+
+def _get_h5py_storage_kwargs(dataset_configuration: HDF5DatasetIOConfiguration) -> dict[str, Any]:
+    """The keyword arguments of `h5py.Group.create_dataset` that reproduce the chunking and filters of a dataset."""
+    data_io_kwargs = dataset_configuration.get_data_io_kwargs()
+    data_io_kwargs.pop("allow_plugin_filters", None)
+
+    # `H5DataIO` reads `compression=False` as no compression, but h5py takes any integer as a gzip level
+    if data_io_kwargs.get("compression") is False:
+        data_io_kwargs.pop("compression")
+        data_io_kwargs.pop("compression_opts", None)
+
+    return data_io_kwargs
+
+
+def _get_hdf5_storage_layout(dataset: h5py.Dataset) -> tuple:
+    """The chunk shape and filter pipeline (identifier, flags and parameters of each filter) of an HDF5 dataset."""
+    dataset_creation_property_list = dataset.id.get_create_plist()
+    filter_pipeline = tuple(
+        dataset_creation_property_list.get_filter(filter_index)[:3]
+        for filter_index in range(dataset_creation_property_list.get_nfilters())
+    )
+
+    return dataset.chunks, filter_pipeline
+
+
+def _has_target_storage_layout(dataset: h5py.Dataset, dataset_configuration: HDF5DatasetIOConfiguration) -> bool:
+    """
+    Whether a dataset on disk is already chunked and filtered as its configuration asks.
+
+    An empty dataset is created with the configured settings in an in-memory file and its pipeline compared with the
+    one on disk; filters such as Blosc derive some of their parameters from the data type and chunk shape, which only
+    HDF5 itself fills in the same way.
+    """
+    with h5py.File(name=str(uuid.uuid4()), mode="w", driver="core", backing_store=False) as file:
+        target_dataset = file.create_dataset(
+            name="target",
+            shape=dataset.shape,
+            dtype=dataset.dtype,
+            **_get_h5py_storage_kwargs(dataset_configuration=dataset_configuration),
+        )
+        return _get_hdf5_storage_layout(dataset=dataset) == _get_hdf5_storage_layout(dataset=target_dataset)
+
+
+def _iterate_buffer_selections(full_shape: tuple[int, ...], buffer_shape: tuple[int, ...]):
+    """Yield the selections tiling a dataset of `full_shape` with buffers of at most `buffer_shape`."""
+    starts_per_axis = [
+        range(0, axis_length, buffer_length) for axis_length, buffer_length in zip(full_shape, buffer_shape)
+    ]
+    for starts in itertools.product(*starts_per_axis):
+        yield tuple(
+            slice(start, min(start + buffer_length, axis_length))
+            for start, buffer_length, axis_length in zip(starts, buffer_shape, full_shape)
+        )
+
+
+def _recompress_hdf5_dataset(
+    nwbfile_path: str,
+    location_in_file: str,
+    scratch_file_path: str,
+    storage_kwargs: dict[str, Any],
+    buffer_shape: tuple[int, ...],
+) -> str:
+    """
+    Copy one dataset of an HDF5 file into a scratch file of its own, with new chunking and filters.
+
+    Runs in a worker process; each worker holds its own read-only handle of the source file and writes its own
+    scratch file, so datasets are decompressed and compressed in parallel without sharing an HDF5 handle.
+    """
+    with h5py.File(name=nwbfile_path, mode="r") as source_file, h5py.File(name=scratch_file_path, mode="w") as file:
+        source_dataset = source_file[location_in_file]
+        target_dataset = file.create_dataset(
+            name="data",
+            shape=source_dataset.shape,
+            dtype=source_dataset.dtype,
+            maxshape=source_dataset.maxshape if storage_kwargs.get("chunks") is not None else None,
+            **storage_kwargs,
+        )
+        for selection in _iterate_buffer_selections(full_shape=source_dataset.shape, buffer_shape=buffer_shape):
+            target_dataset[selection] = source_dataset[selection]
+
+    return scratch_file_path
+
+
+def _set_data_io(neurodata_object: Any, dataset_name: str, data_io_kwargs: dict[str, Any]) -> None:
+    """Wrap the data held by a neurodata object in an `H5DataIO`, as `configure_backend` does."""
+    if isinstance(neurodata_object, Data):
+        neurodata_object.set_data_io(data_io_class=H5DataIO, data_io_kwargs=data_io_kwargs)
+        if isinstance(neurodata_object, NWBData):
+            neurodata_object._NWBData__data = neurodata_object._Data__data
+    else:
+        neurodata_object.set_data_io(dataset_name=dataset_name, data_io_class=H5DataIO, data_io_kwargs=data_io_kwargs)
+
+
+def repack_hdf5_nwbfile(
+    *,
+    nwbfile: NWBFile,
+    nwbfile_path: Path,
+    export_nwbfile_path: Path,
+    backend_configuration: HDF5BackendConfiguration,
+    max_workers: int = 1,
+) -> dict[str, list[str]]:
+    """
+    Export an HDF5 NWB file read from disk to a new HDF5 file, recompressing only the datasets whose settings change.
+
+    Exporting an `h5py.Dataset` with `link_data=False` makes HDMF copy it with `H5Ocopy`, which moves the compressed
+    chunks as they are stored without passing them through the filters. Datasets whose chunking and filters already
+    match the configuration are left as they were read, so they are copied this way. Every other dataset is first
+    rewritten with its new settings into a scratch file, by up to `max_workers` processes at once, and its neurodata
+    object pointed at the scratch copy, so that it too is copied raw by the export.
+
+    Parameters
+    ----------
+    nwbfile : pynwb.NWBFile
+        The NWBFile as read from `nwbfile_path`.
+    nwbfile_path : Path
+        The path of the HDF5 file being repacked, opened again by each worker process.
+    export_nwbfile_path : Path
+        The path of the repacked file.
+    backend_configuration : HDF5BackendConfiguration
+        The configuration of the datasets in the repacked file.
+    max_workers : int, default: 1
+        The number of processes recompressing datasets at once.
+
+    Returns
+    -------
+    dict
+        The locations of the datasets copied raw under "copied" and of those recompressed under "recompressed".
+    """
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    datasets_to_recompress = list()
+    compound_datasets_to_rewrite = list()
+    copied_locations = list()
+    recompressed_locations = list()
+    for location_in_file, dataset_configuration in backend_configuration.dataset_configurations.items():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        dataset_name = dataset_configuration.dataset_name
+
+        # Links are written as links by the export; there is nothing to copy
+        if isinstance(neurodata_object.fields.get(dataset_name), TimeSeries):
+            continue
+
+        source_dataset = _get_dataset(neurodata_object=neurodata_object, dataset_name=dataset_name)
+
+        # HDMF writes compound datasets field by field rather than copying them, so they take the usual DataIO path
+        if source_dataset.dtype.names is not None:
+            compound_datasets_to_rewrite.append((neurodata_object, dataset_configuration))
+            recompressed_locations.append(location_in_file)
+        elif _has_target_storage_layout(dataset=source_dataset, dataset_configuration=dataset_configuration):
+            copied_locations.append(location_in_file)
+        else:
+            datasets_to_recompress.append((neurodata_object, source_dataset.name, dataset_configuration))
+            recompressed_locations.append(location_in_file)
+
+    with tempfile.TemporaryDirectory(dir=Path(export_nwbfile_path).parent) as scratch_folder:
+        worker_kwargs = [
+            dict(
+                nwbfile_path=str(nwbfile_path),
+                location_in_file=location_in_file,
+                scratch_file_path=str(Path(scratch_folder) / f"{index}.h5"),
+                storage_kwargs=_get_h5py_storage_kwargs(dataset_configuration=dataset_configuration),
+                buffer_shape=dataset_configuration.buffer_shape,
+            )
+            for index, (_, location_in_file, dataset_configuration) in enumerate(datasets_to_recompress)
+        ]
+        if max_workers > 1 and len(worker_kwargs) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_recompress_hdf5_dataset, **kwargs) for kwargs in worker_kwargs]
+                scratch_file_paths = [future.result() for future in futures]
+        else:
+            scratch_file_paths = [_recompress_hdf5_dataset(**kwargs) for kwargs in worker_kwargs]
+
+        scratch_files = [h5py.File(name=scratch_file_path, mode="r") for scratch_file_path in scratch_file_paths]
+        try:
+            for (neurodata_object, _, dataset_configuration), scratch_file in zip(
+                datasets_to_recompress, scratch_files
+            ):
+                _replace_dataset(
+                    neurodata_object=neurodata_object,
+                    dataset_name=dataset_configuration.dataset_name,
+                    data=scratch_file["data"],
+                )
+            for neurodata_object, dataset_configuration in compound_datasets_to_rewrite:
+                _set_data_io(
+                    neurodata_object=neurodata_object,
+                    dataset_name=dataset_configuration.dataset_name,
+                    data_io_kwargs=dataset_configuration.get_data_io_kwargs(),
+                )
+
+            with NWBHDF5IO(path=str(export_nwbfile_path), mode="w") as io:
+                nwbfile.set_modified()
+                io.export(nwbfile=nwbfile, src_io=nwbfile.read_io, write_args=dict(link_data=False))
+        finally:
+            for scratch_file in scratch_files:
+                scratch_file.close()
+
+    return dict(copied=copied_locations, recompressed=recompressed_locations)
@@ -0,0 +1,287 @@
+"""Read and compress the iterative datasets of an NWB file concurrently, ahead of the single writer of the file."""
+
+import itertools
+import queue
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import h5py
+import numpy as np
+from hdmf.common import Data
+from hdmf.container import DataIO
+from hdmf.data_utils import DataChunkIterator
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from pynwb import H5DataIO, NWBFile
+
+from ._configuration_models._base_dataset_io import DatasetIOConfiguration
+from ._configuration_models._hdf5_backend import HDF5BackendConfiguration
+from ._configure_backend import _replace_dataset
+from ..hdmf import GenericDataChunkIterator
+
+# The buffers each reading thread may have waiting for the writer, so that reading runs at most that far ahead of it
+_MAXIMUM_QUEUED_BUFFERS_PER_WORKER = 2
+
+
+def _get_deflate_level(dataset: h5py.Dataset) -> int | None:
+    """The level of a dataset compressed with GZIP alone, whose chunks `zlib` can therefore compress in its place."""
+    if dataset.chunks is None:
+        return None
+
+    dataset_creation_property_list = dataset.id.get_create_plist()
+    if dataset_creation_property_list.get_nfilters() != 1:
+        return None
+
+    filter_identifier, _, filter_parameters, _ = dataset_creation_property_list.get_filter(0)
+    if filter_identifier != h5py.h5z.FILTER_DEFLATE:
+        return None
+
+    return filter_parameters[0]
+
+
+def _is_chunk_aligned(selection: tuple[slice, ...], chunk_shape: tuple[int, ...], shape: tuple[int, ...]) -> bool:
+    """Whether a selection covers whole chunks only, those at the end of an axis counting as whole."""
+    return all(
+        axis.start % chunk_axis == 0 and (axis.stop % chunk_axis == 0 or axis.stop == axis_length)
+        for axis, chunk_axis, axis_length in zip(selection, chunk_shape, shape)
+    )
+
+
+def _compress_chunks(
+    data: np.ndarray,
+    selection: tuple[slice, ...],
+    chunk_shape: tuple[int, ...],
+    dtype: np.dtype,
+    fillvalue,
+    deflate_level: int,
+) -> list[tuple[tuple[int, ...], bytes]]:
+    """
+    Compress each chunk of a chunk-aligned selection with `zlib`, as HDF5 would store it with GZIP alone.
+
+    HDF5 holds a lock for as long as it filters a chunk, so compressing through it leaves every other thread waiting;
+    `zlib` releases it, so the chunks of different datasets are compressed at once. Returns the offset of each chunk
+    in the dataset with its compressed bytes.
+    """
+    chunk_starts_per_axis = [
+        range(axis.start, axis.stop, chunk_axis) for axis, chunk_axis in zip(selection, chunk_shape)
+    ]
+    compressed_chunks = list()
+    for chunk_starts in itertools.product(*chunk_starts_per_axis):
+        chunk_data = data[
+            tuple(
+                slice(start - axis.start, start - axis.start + chunk_axis)
+                for start, axis, chunk_axis in zip(chunk_starts, selection, chunk_shape)
+            )
+        ]
+        # HDF5 stores the chunks at the end of an axis whole, padded with the fill value
+        if chunk_data.shape != chunk_shape:
+            padding = [(0, chunk_axis - data_axis) for chunk_axis, data_axis in zip(chunk_shape, chunk_data.shape)]
+            chunk_data = np.pad(chunk_data, pad_width=padding, constant_values=fillvalue)
+
+        compressed_chunks.append(
+            (chunk_starts, zlib.compress(np.ascontiguousarray(chunk_data, dtype=dtype), deflate_level))
+        )
+
+    return compressed_chunks
+
+
+def _get_buffer_selections(shape: tuple[int, ...], buffer_shape: tuple[int, ...]) -> list[tuple[slice, ...]]:
+    """The buffers of a `GenericDataChunkIterator`, in the order it reads them."""
+    starts_per_axis = [range(0, axis_length, buffer_axis) for axis_length, buffer_axis in zip(shape, buffer_shape)]
+    return [
+        tuple(
+            slice(start, min(start + buffer_axis, axis_length))
+            for start, buffer_axis, axis_length in zip(starts, buffer_shape, shape)
+        )
+        for starts in itertools.product(*starts_per_axis)
+    ]
+
+
+def _get_empty_data_io(
+    data_io_class: type[DataIO], iterator: HDMFGenericDataChunkIterator, dataset_configuration: DatasetIOConfiguration
+) -> DataIO:
+    """A `DataIO` that has the dataset of an iterator created as configured, chunked and compressed, but left empty."""
+    empty_iterator = DataChunkIterator(data=None, maxshape=tuple(iterator.maxshape), dtype=np.dtype(iterator.dtype))
+    return data_io_class(data=empty_iterator, **dataset_configuration.get_data_io_kwargs())
+
+
+@dataclass
+class StagedDataset:
+    """A dataset fed by a data chunk iterator, created empty in the file and filled by `write_staged_datasets`."""
+
+    iterator: HDMFGenericDataChunkIterator
+    location_in_file: str
+    # The bounds of the buffers the dataset already holds, which are not read again
+    completed_buffers: set[tuple[tuple[int, int], ...]] = field(default_factory=set)
+
+
+def stage_iterative_datasets(nwbfile: NWBFile, backend_configuration: HDF5BackendConfiguration) -> list[StagedDataset]:
+    """
+    Have every dataset fed by a data chunk iterator created empty when the file is written, to be filled afterwards.
+
+    HDMF writes the datasets of a file one after another, so a session of several probes, or of several segments,
+    is read and compressed one series at a time even though each comes from a file of its own. Here each dataset is
+    created as configured, chunked and compressed, but without its data, which `write_staged_datasets` then reads
+    and compresses on several threads into the file. Nothing is staged when fewer than two datasets would be.
+
+    Must be called after `configure_backend`, whose `H5DataIO` it replaces.
+    """
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+
+    datasets_to_stage = list()
+    for dataset_configuration in backend_configuration.dataset_configurations.values():
+        neurodata_object = neurodata_objects_by_id[dataset_configuration.object_id]
+        dataset_name = dataset_configuration.dataset_name
+        if isinstance(neurodata_object, Data):
+            data_io = neurodata_object.data
+        else:
+            data_io = neurodata_object.fields.get(dataset_name)
+        if isinstance(data_io, H5DataIO) and isinstance(data_io.data, HDMFGenericDataChunkIterator):
+            datasets_to_stage.append((neurodata_object, data_io.data, dataset_configuration))
+
+    if len(datasets_to_stage) < 2:
+        return []
+
+    staged_datasets = list()
+    for neurodata_object, iterator, dataset_configuration in datasets_to_stage:
+        _replace_dataset(
+            neurodata_object=neurodata_object,
+            dataset_name=dataset_configuration.dataset_name,
+            data=_get_empty_data_io(
+                data_io_class=H5DataIO, iterator=iterator, dataset_configuration=dataset_configuration
+            ),
+        )
+        staged_datasets.append(
+            StagedDataset(iterator=iterator, location_in_file=dataset_configuration.location_in_file)
+        )
+
+    return staged_datasets
+
+
+def write_staged_datasets(
+    nwbfile_path: Path,
+    staged_datasets: list[StagedDataset],
+    max_workers: int,
+    on_buffer_written: Callable[[StagedDataset, tuple[slice, ...]], None] | None = None,
+) -> None:
+    """
+    Fill the staged datasets of a file just written, reading and compressing up to `max_workers` of them at once.
+
+    Each thread reads the buffers of one iterator and compresses their chunks with `zlib` where the dataset is
+    compressed with GZIP alone, then passes them through a bounded queue to the one thread writing the file, which
+    writes the compressed chunks as stored with `write_direct_chunk`. Buffers not aligned to the chunks, and datasets
+    compressed otherwise, are written through HDF5, which compresses them in the writing thread. The queue holds a few
+    buffers per thread, so reading never runs far ahead of the disk, and each chunk is written once, into the file.
+
+    The buffers in the `completed_buffers` of a dataset are skipped. `on_buffer_written` is called by the writing
+    thread with each buffer once it is written and the file flushed, so that what it records is on disk.
+    """
+    with h5py.File(name=nwbfile_path, mode="r+") as nwbfile:
+        datasets = [nwbfile[staged_dataset.location_in_file] for staged_dataset in staged_datasets]
+        deflate_levels = [_get_deflate_level(dataset=dataset) for dataset in datasets]
+        chunk_layouts = [
+            dict(chunk_shape=dataset.chunks, dtype=dataset.dtype, fillvalue=dataset.fillvalue) for dataset in datasets
+        ]
+
+        buffers = queue.Queue(maxsize=_MAXIMUM_QUEUED_BUFFERS_PER_WORKER * max_workers)
+        stop_reading = threading.Event()
+
+        def read_selection(dataset_index: int, selection: tuple[slice, ...], data: np.ndarray) -> None:
+            deflate_level = deflate_levels[dataset_index]
+            chunk_layout = chunk_layouts[dataset_index]
+            is_chunk_aligned = deflate_level is not None and _is_chunk_aligned(
+                selection=selection, chunk_shape=chunk_layout["chunk_shape"], shape=datasets[dataset_index].shape
+            )
+            if is_chunk_aligned:
+                compressed_chunks = _compress_chunks(
+                    data=data, selection=selection, deflate_level=deflate_level, **chunk_layout
+                )
+                buffers.put(("chunks", dataset_index, compressed_chunks))
+            else:
+                buffers.put(("data", dataset_index, selection, data))
+
+        def read_dataset(dataset_index: int) -> None:
+            staged_dataset = staged_datasets[dataset_index]
+            iterator = staged_dataset.iterator
+            # The buffers are chosen here rather than by iterating, so the iterators of neuroconv are taken through
+            # the steps of their `__next__` one by one, for their buffer hooks, and a buffer is marked written once
+            # the writer has written it rather than once it is queued; other iterators are only read
+            calls_buffer_hooks = isinstance(iterator, GenericDataChunkIterator)
+            try:
+                if calls_buffer_hooks:
+                    iterator._start_buffer_hooks()
+                for buffer_selection in _get_buffer_selections(
+                    shape=iterator.maxshape, buffer_shape=iterator.buffer_shape
+                ):
+                    buffer_bounds = tuple((axis.start, axis.stop) for axis in buffer_selection)
+                    if buffer_bounds in staged_dataset.completed_buffers:
+                        buffers.put(("resumed", dataset_index, buffer_selection))
+                        continue
+
+                    selections = (
+                        iterator._split_buffer(selection=buffer_selection) if calls_buffer_hooks else [buffer_selection]
+                    )
+                    for selection in selections:
+                        if stop_reading.is_set():
+                            return
+                        if calls_buffer_hooks:
+                            data = iterator._read_buffer(selection=selection)
+                        else:
+                            data = iterator._get_data(selection=selection)
+                        read_selection(dataset_index=dataset_index, selection=selection, data=data)
+                    buffers.put(("written", dataset_index, buffer_selection))
+                buffers.put(("finished", dataset_index))
+            except Exception as exception:
+                buffers.put(("failed", exception))
+            finally:
+                buffers.put(("done",))
+
+        failure = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for dataset_index in range(len(staged_datasets)):
+                executor.submit(read_dataset, dataset_index)
+
+            # Every thread reports when it is done, so that the queue is drained, and none left waiting, even after
+            # a failure
+            number_of_datasets_done = 0
+            while number_of_datasets_done < len(staged_datasets):
+                kind, *content = buffers.get()
+                if kind == "done":
+                    number_of_datasets_done += 1
+                    continue
+                if failure is not None:
+                    continue
+
+                try:
+                    if kind == "failed":
+                        raise content[0]
+                    if kind == "chunks":
+                        dataset_index, compressed_chunks = content
+                        for chunk_starts, compressed_chunk in compressed_chunks:
+                            datasets[dataset_index].id.write_direct_chunk(offsets=chunk_starts, data=compressed_chunk)
+                        continue
+                    if kind == "data":
+                        dataset_index, selection, data = content
+                        datasets[dataset_index][selection] = data
+                        continue
+
+                    staged_dataset = staged_datasets[content[0]]
+                    calls_buffer_hooks = isinstance(staged_dataset.iterator, GenericDataChunkIterator)
+                    if kind == "written" and on_buffer_written is not None:
+                        nwbfile.flush()
+                        on_buffer_written(staged_dataset, content[1])
+                    if calls_buffer_hooks and kind in ("written", "resumed"):
+                        staged_dataset.iterator._record_buffer_written(
+                            selection=content[1], was_resumed=kind == "resumed"
+                        )
+                    elif calls_buffer_hooks and kind == "finished":
+                        staged_dataset.iterator._finish_buffer_hooks()
+                except Exception as exception:
+                    failure = exception
+                    stop_reading.set()
+
+        if failure is not None:
+            raise failure
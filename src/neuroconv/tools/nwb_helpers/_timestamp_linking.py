@@ -0,0 +1,86 @@
+"""Write each distinct timestamps array of a file once, and link every series sharing it to that one copy."""
+
+import hashlib
+
+import numpy as np
+from pynwb import NWBFile, TimeSeries
+
+from ._configuration_models._base_dataset_io import _find_location_in_memory_nwbfile
+
+
+def _get_timestamps_fingerprint(timestamps: np.ndarray) -> tuple:
+    """The shape, type and a digest of the bytes of a timestamps array, which identical arrays share."""
+    digest = hashlib.blake2b(np.ascontiguousarray(timestamps).tobytes(), digest_size=20).hexdigest()
+    return timestamps.shape, timestamps.dtype.str, digest
+
+
+def link_identical_timestamps(nwbfile: NWBFile) -> dict[str, str]:
+    """
+    Turn the timestamps of every series that repeat those of an earlier series into a link to them.
+
+    Interfaces give each of their series its own timestamps, even when one clock times all of them: the keypoints of
+    a pose estimation, the channels of a photometry recording. Written as they are, each copy is chunked, compressed
+    and stored again. Here the timestamps held in memory are grouped by their shape, type and a hash of their bytes,
+    and confirmed identical byte for byte; the first series of each group, by location in the file, keeps its
+    timestamps and the others link to them, which both HDF5 and Zarr write as a link to the one dataset.
+
+    Timestamps that are not in memory, such as data chunk iterators, DataIO wrappers or datasets already in a file,
+    are left as they are.
+
+    Parameters
+    ----------
+    nwbfile : pynwb.NWBFile
+        The in-memory NWBFile, modified in place.
+
+    Returns
+    -------
+    dict
+        A mapping from the location of each timestamps turned into a link (e.g. 'acquisition/B/timestamps') to the
+        location of the timestamps it links to.
+    """
+    canonical_series_by_fingerprint: dict[tuple, list[TimeSeries]] = dict()
+    fingerprints_by_array_id: dict[int, tuple] = dict()
+    linked_locations = dict()
+    # In the order of their locations, so that the same file always keeps the same copy
+    all_series = sorted(
+        (neurodata_object for neurodata_object in nwbfile.all_children() if isinstance(neurodata_object, TimeSeries)),
+        key=lambda series: _find_location_in_memory_nwbfile(neurodata_object=series, field_name="timestamps"),
+    )
+    for neurodata_object in all_series:
+        held_timestamps = neurodata_object.fields.get("timestamps")
+        if not isinstance(held_timestamps, (np.ndarray, list)):
+            continue
+        timestamps = np.asarray(held_timestamps)
+        if timestamps.size == 0 or timestamps.dtype == object:
+            continue
+
+        # Interfaces often hand the very same array to each of their series, which only needs hashing once
+        if id(held_timestamps) not in fingerprints_by_array_id:
+            fingerprints_by_array_id[id(held_timestamps)] = _get_timestamps_fingerprint(timestamps=timestamps)
+        fingerprint = fingerprints_by_array_id[id(held_timestamps)]
+
+        # A shared hash is confirmed byte for byte before linking
+        canonical_series_candidates = canonical_series_by_fingerprint.setdefault(fingerprint, list())
+        canonical_series = next(
+            (
+                candidate
+                for candidate in canonical_series_candidates
+                if candidate.fields["timestamps"] is held_timestamps
+                or np.asarray(candidate.fields["timestamps"]).tobytes() == timestamps.tobytes()
+            ),
+            None,
+        )
+        if canonical_series is None:
+            canonical_series_candidates.append(neurodata_object)
+            continue
+
+        # What `TimeSeries(timestamps=canonical_series)` sets; the timestamps are fixed once the series is built
+        neurodata_object.fields["timestamps"] = canonical_series
+        canonical_series.fields.setdefault("timestamp_link", list()).append(neurodata_object)
+
+        location_in_file = _find_location_in_memory_nwbfile(neurodata_object=neurodata_object, field_name="timestamps")
+        linked_locations[location_in_file] = _find_location_in_memory_nwbfile(
+            neurodata_object=canonical_series, field_name="timestamps"
+        )
+
+    return linked_locations
@@ -0,0 +1,368 @@
+"""Structured events on the progress of every chunk iterator written during a conversion."""
+
+import math
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Iterator
+
+import h5py
+from hdmf.common import Data
+from hdmf.data_utils import DataIO
+from pynwb import NWBFile
+
+from ._configuration_models._base_backend import BackendConfiguration
+from ._configuration_models._write_progress_event import WriteProgressEvent
+from ..hdmf import BufferHook, GenericDataChunkIterator
+
+_PROGRESS_EVENTS_ENVIRONMENT_VARIABLE = "NEUROCONV_PROGRESS_EVENTS_FILE_PATH"
+
+_active_write_progress_monitors: list["WriteProgressMonitor"] = []
+
+# The progress of each iterator tracked, for the writers that read its buffers themselves rather than iterating it
+_write_progress_by_iterator: "weakref.WeakKeyDictionary[GenericDataChunkIterator, _WriteProgress]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# The Prometheus name and help of the gauge exposing each field of the latest event of every dataset
+_METRICS = dict(
+    number_of_buffers_written=("neuroconv_write_buffers_written", "The buffers of the dataset written so far."),
+    number_of_buffers=("neuroconv_write_buffers", "The buffers of the dataset in all."),
+    read_size_in_bytes=("neuroconv_write_read_bytes", "The uncompressed bytes of the dataset written so far."),
+    written_size_in_bytes=("neuroconv_write_written_bytes", "The bytes the dataset takes on disk so far."),
+    compression_ratio=("neuroconv_write_compression_ratio", "The bytes read per byte written so far."),
+    throughput_in_mb_per_second=(
+        "neuroconv_write_throughput_megabytes_per_second",
+        "The uncompressed megabytes per second the last buffer was read and written at.",
+    ),
+    remaining_time_in_seconds=(
+        "neuroconv_write_remaining_seconds",
+        "The time the remaining buffers would take at the mean throughput so far.",
+    ),
+    timestamp=(
+        "neuroconv_write_last_buffer_timestamp_seconds",
+        "When the last buffer was written; a write that stalls stops advancing it.",
+    ),
+)
+
+
+def _get_size_on_disk_in_bytes(storage_path: Path, path_in_storage: str | None) -> int | None:
+    """
+    The size on disk of a dataset being written, or None when it does not exist yet.
+
+    An HDF5 dataset is looked up among the datasets held open, as HDF5 keeps chunks in its cache, not yet in the file,
+    until they are evicted, and the storage size it reports counts them. A Zarr store or array is a folder of chunks.
+    """
+    if path_in_storage is None:
+        if not storage_path.is_dir():
+            return None
+        return sum(file_path.stat().st_size for file_path in storage_path.rglob("*") if file_path.is_file())
+
+    for dataset_id in h5py.h5f.get_obj_ids(types=h5py.h5f.OBJ_DATASET):
+        is_dataset = h5py.h5i.get_name(dataset_id).decode() == path_in_storage
+        if is_dataset and Path(h5py.h5f.get_name(dataset_id).decode()).resolve() == storage_path.resolve():
+            return dataset_id.get_storage_size()
+
+    return None
+
+
+class _WriteProgress(BufferHook):
+    """The buffers of one iterator written so far, reported to its monitors as each one lands."""
+
+    def __init__(self, iterator: GenericDataChunkIterator, location_in_file: str):
+        self.location_in_file = location_in_file
+        self.monitors: list["WriteProgressMonitor"] = []
+        self.number_of_buffers = iterator.num_buffers
+        self.itemsize = iterator.dtype.itemsize
+        self.total_size_in_bytes = math.prod(iterator.maxshape) * self.itemsize
+
+        # Set by the writer: the file written, and where the dataset is written to, which is the file itself or a
+        # store of its own written ahead of the file; the path of an HDF5 dataset within it, None for a Zarr folder
+        self.nwbfile_path: Path | None = None
+        self.storage_path: Path | None = None
+        self.path_in_storage: str | None = None
+
+        self.number_of_buffers_written = 0
+        self.read_size_in_bytes = 0
+        self._completed_size_in_bytes = 0
+        self._initial_storage_size_in_bytes = 0
+        self._start_time = None
+        self._last_time = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Mark the start of the write, just before the first buffer is read."""
+        self._start_time = self._last_time = time.monotonic()
+        if self.storage_path is not None:
+            self._initial_storage_size_in_bytes = (
+                _get_size_on_disk_in_bytes(storage_path=self.storage_path, path_in_storage=self.path_in_storage) or 0
+            )
+
+    def record_buffer(self, selection: tuple[slice, ...], was_resumed: bool = False) -> None:
+        """
+        Record a buffer as written, and report it to the monitors.
+
+        A buffer a resumed write skips, having written it before it was interrupted, is counted but not reported.
+        """
+        buffer_size_in_bytes = math.prod(axis.stop - axis.start for axis in selection) * self.itemsize
+        current_time = time.monotonic()
+        with self._lock:
+            self.number_of_buffers_written += 1
+            self._completed_size_in_bytes += buffer_size_in_bytes
+            if was_resumed:
+                return
+
+            self.read_size_in_bytes += buffer_size_in_bytes
+            buffer_seconds = current_time - self._last_time
+            self._last_time = current_time
+
+            written_size_in_bytes = None
+            if self.storage_path is not None:
+                storage_size_in_bytes = _get_size_on_disk_in_bytes(
+                    storage_path=self.storage_path, path_in_storage=self.path_in_storage
+                )
+                if storage_size_in_bytes is not None:
+                    written_size_in_bytes = max(0, storage_size_in_bytes - self._initial_storage_size_in_bytes)
+
+            mean_bytes_per_second = self.read_size_in_bytes / max(current_time - self._start_time, 1e-9)
+            remaining_size_in_bytes = max(0, self.total_size_in_bytes - self._completed_size_in_bytes)
+            event = WriteProgressEvent(
+                nwbfile_path=str(self.nwbfile_path) if self.nwbfile_path is not None else None,
+                location_in_file=self.location_in_file,
+                number_of_buffers_written=self.number_of_buffers_written,
+                number_of_buffers=self.number_of_buffers,
+                read_size_in_bytes=self.read_size_in_bytes,
+                written_size_in_bytes=written_size_in_bytes,
+                compression_ratio=self.read_size_in_bytes / written_size_in_bytes if written_size_in_bytes else None,
+                throughput_in_mb_per_second=buffer_size_in_bytes / 1e6 / max(buffer_seconds, 1e-9),
+                remaining_time_in_seconds=remaining_size_in_bytes / mean_bytes_per_second,
+                timestamp=time.time(),
+            )
+
+        for monitor in self.monitors:
+            monitor._report(event=event)
+
+    def iteration_started(self, iterator: GenericDataChunkIterator) -> None:
+        self.start()
+
+    def buffer_written(
+        self, iterator: GenericDataChunkIterator, selection: tuple[slice, ...], was_resumed: bool = False
+    ) -> None:
+        self.record_buffer(selection=selection, was_resumed=was_resumed)
+
+
+class WriteProgressMonitor:
+    """
+    Reports the progress of every chunk iterator written while it is active, as a `WriteProgressEvent` per buffer.
+
+    Each event gives the dataset, the buffers written of its total, the bytes read and the bytes the dataset has
+    taken on disk, their ratio, the throughput of the buffer and the time the rest would take. Unlike the progress
+    bar of an iterator, which only a terminal can read, the events go to a callable, to a JSON-lines file, or to a
+    local endpoint in the Prometheus text format, so that an orchestrator running many conversions can tell which
+    are slow or stalled.
+
+    Use it as a context manager around the conversion, or pass ``progress_callback`` to ``run_conversion``. When
+    neither is given, the ``NEUROCONV_PROGRESS_EVENTS_FILE_PATH`` environment variable names a JSON-lines file to
+    append the events to.
+
+    Parameters
+    ----------
+    callbacks : callable or list of callables, optional
+        Called with each event, in the thread that wrote the buffer.
+    events_file_path : str or Path, optional
+        A JSON-lines file to append each event to, one line each.
+    metrics_port : int, optional
+        Serve the latest event of each dataset at ``http://127.0.0.1:<metrics_port>/metrics`` while active.
+        A port of 0 picks a free one, which `metrics_port` then holds.
+
+    Examples
+    --------
+    >>> with WriteProgressMonitor(events_file_path="progress.jsonl", metrics_port=9464) as write_progress_monitor:
+    ...     converter.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata)
+    >>> write_progress_monitor.latest_events
+    """
+
+    def __init__(
+        self,
+        callbacks: Callable[[WriteProgressEvent], None] | list[Callable[[WriteProgressEvent], None]] | None = None,
+        events_file_path: str | Path | None = None,
+        metrics_port: int | None = None,
+    ):
+        if callable(callbacks):
+            callbacks = [callbacks]
+        self.callbacks = list(callbacks or [])
+        self.events_file_path = Path(events_file_path) if events_file_path is not None else None
+        self.metrics_port = metrics_port
+        self.latest_events: dict[tuple[str | None, str], WriteProgressEvent] = dict()
+
+        self._lock = threading.Lock()
+        self._events_file = None
+        self._metrics_server = None
+
+    def __enter__(self) -> "WriteProgressMonitor":
+        if self.events_file_path is not None:
+            self.events_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._events_file = open(self.events_file_path, mode="a", encoding="utf-8")
+        if self.metrics_port is not None:
+            self._metrics_server = _serve_metrics(write_progress_monitor=self, port=self.metrics_port)
+            self.metrics_port = self._metrics_server.server_address[1]
+        _active_write_progress_monitors.append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_write_progress_monitors.remove(self)
+        if self._events_file is not None:
+            self._events_file.close()
+            self._events_file = None
+        if self._metrics_server is not None:
+            self._metrics_server.shutdown()
+            self._metrics_server.server_close()
+            self._metrics_server = None
+
+    def track(self, iterator: GenericDataChunkIterator, location_in_file: str) -> None:
+        """
+        Report the buffers of an iterator as they are written.
+
+        `configure_backend` does this for every iterator it configures while the monitor is active; call it for an
+        iterator written otherwise. It must be called before the iterator is first read.
+        """
+        write_progress = _write_progress_by_iterator.get(iterator)
+        if write_progress is None:
+            write_progress = _WriteProgress(iterator=iterator, location_in_file=location_in_file)
+            iterator.add_buffer_hook(buffer_hook=write_progress)
+            _write_progress_by_iterator[iterator] = write_progress
+        if self not in write_progress.monitors:
+            write_progress.monitors.append(self)
+
+    def _report(self, event: WriteProgressEvent) -> None:
+        with self._lock:
+            self.latest_events[(event.nwbfile_path, event.location_in_file)] = event
+            if self._events_file is not None:
+                # A line written whole by one call, so that several processes can append to the same file
+                self._events_file.write(f"{event.model_dump_json()}\n")
+                self._events_file.flush()
+        for callback in self.callbacks:
+            callback(event)
+
+    def format_metrics(self) -> str:
+        """The latest event of each dataset as gauges in the Prometheus text format, as the endpoint serves them."""
+        with self._lock:
+            latest_events = list(self.latest_events.values())
+
+        lines = list()
+        for field_name, (metric_name, metric_help) in _METRICS.items():
+            lines.extend([f"# HELP {metric_name} {metric_help}", f"# TYPE {metric_name} gauge"])
+            for event in latest_events:
+                value = getattr(event, field_name)
+                if value is None:
+                    continue
+                labels = f'dataset="{_escape_label_value(event.location_in_file)}"'
+                if event.nwbfile_path is not None:
+                    labels += f',nwbfile="{_escape_label_value(event.nwbfile_path)}"'
+                lines.append(f"{metric_name}{{{labels}}} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _serve_metrics(write_progress_monitor: WriteProgressMonitor, port: int) -> ThreadingHTTPServer:
+    """Serve the metrics of a monitor on the loopback interface from a daemon thread."""
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body = write_progress_monitor.format_metrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            # Scrapes every few seconds would otherwise fill the log of the conversion
+            pass
+
+    metrics_server = ThreadingHTTPServer(("127.0.0.1", port), MetricsRequestHandler)
+    metrics_server.daemon_threads = True
+    threading.Thread(target=metrics_server.serve_forever, daemon=True).start()
+
+    return metrics_server
+
+
+def track_write_progress(iterator: GenericDataChunkIterator, location_in_file: str) -> None:
+    """Report the buffers of an iterator to every monitor in effect, if any."""
+    for write_progress_monitor in _active_write_progress_monitors:
+        write_progress_monitor.track(iterator=iterator, location_in_file=location_in_file)
+
+
+def get_write_progress(iterator: GenericDataChunkIterator) -> _WriteProgress | None:
+    """The progress of an iterator tracked by a monitor, for a writer that reads its buffers itself."""
+    return _write_progress_by_iterator.get(iterator)
+
+
+def set_write_progress_destinations(
+    nwbfile: NWBFile, backend_configuration: BackendConfiguration, nwbfile_path: Path
+) -> None:
+    """
+    Point the progress of every tracked iterator of a file at the dataset it writes, whose size on disk is reported.
+
+    A writer that writes a dataset to a store of its own ahead of the file points its progress at that store instead.
+    """
+    if not _write_progress_by_iterator:
+        return
+
+    neurodata_objects_by_id = {child.object_id: child for child in nwbfile.all_children()}
+    for dataset_configuration in backend_configuration.dataset_configurations.values():
+        neurodata_object = neurodata_objects_by_id.get(dataset_configuration.object_id)
+        if neurodata_object is None:
+            continue
+        if isinstance(neurodata_object, Data):
+            data_io = neurodata_object.data
+        else:
+            data_io = neurodata_object.fields.get(dataset_configuration.dataset_name)
+        if not isinstance(data_io, DataIO) or not isinstance(data_io.data, GenericDataChunkIterator):
+            continue
+
+        write_progress = get_write_progress(iterator=data_io.data)
+        if write_progress is None:
+            continue
+
+        write_progress.nwbfile_path = Path(nwbfile_path)
+        if backend_configuration.backend == "hdf5":
+            write_progress.storage_path = Path(nwbfile_path)
+            write_progress.path_in_storage = f"/{dataset_configuration.location_in_file}"
+        else:
+            write_progress.storage_path = Path(nwbfile_path) / dataset_configuration.location_in_file
+            write_progress.path_in_storage = None
+
+
+@contextmanager
+def use_write_progress_monitor(
+    progress_callback: Callable[[WriteProgressEvent], None] | None = None,
+) -> Iterator[WriteProgressMonitor | None]:
+    """
+    Report the progress of a conversion to `progress_callback`, and to the monitors already in effect.
+
+    When no monitor is in effect, the events are also appended to the JSON-lines file named by
+    ``NEUROCONV_PROGRESS_EVENTS_FILE_PATH``, if set; with neither, this yields None.
+    """
+    events_file_path = None
+    if not _active_write_progress_monitors:
+        events_file_path = os.environ.get(_PROGRESS_EVENTS_ENVIRONMENT_VARIABLE, "").strip() or None
+
+    if progress_callback is None and events_file_path is None:
+        yield None
+        return
+
+    with WriteProgressMonitor(callbacks=progress_callback, events_file_path=events_file_path) as write_progress_monitor:
+        yield write_progress_monitor
@@ -110,9 +110,15 @@ def _build_ethogram_from_labels(
         source_video=source_video,
         ethogram=catalogue,
     )
-    for start_time, stop_time, label in _run_length_encode_labels(labels, timestamps, frame_period):
-        # check_ragged=False: hdmf rescans the whole column on every add_row, making this quadratic in the
-        # number of bouts. Every cell here is a scalar, so the check can only ever return False.
-        bouts.add_row(start_time=start_time, stop_time=stop_time, label=str(label), check_ragged=False)
+    # The bouts fill the columns at once: adding them row by row validates and appends every cell of every bout
+    start_times, stop_times, bout_labels = _run_length_encode_labels(labels, timestamps, frame_period)
+    bout_columns = dict(
+        start_time=start_times.tolist(),
+        stop_time=stop_times.tolist(),
+        label=[str(label) for label in bout_labels.tolist()],
+    )
+    bouts.id.data.extend(range(len(start_times)))
+    for column_name, column_data in bout_columns.items():
+        bouts[column_name].data.extend(column_data)
 
     return bouts, catalogue
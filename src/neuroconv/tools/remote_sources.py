@@ -0,0 +1,462 @@
+"""Read source files held in object stores or on web servers through a local block cache, as if they were on disk."""
+
+import io
+import itertools
+import json
+import math
+import os
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Annotated
+
+import h5py
+import numpy as np
+from numpy.typing import DTypeLike
+from pydantic import AfterValidator
+
+from ._dataset_fingerprint import hash_text
+from .importing import get_package
+
+_REMOTE_CACHE_FOLDER_ENVIRONMENT_VARIABLE = "NEUROCONV_REMOTE_CACHE_FOLDER"
+
+_active_remote_block_caches: list["RemoteBlockCache"] = []
+
+# h5py names a file opened from a file object by the representation of that object, which is how the datasets of
+# a file read through a `RemoteFile` find it again to fetch their selections ahead of reading them
+_open_remote_files: "weakref.WeakValueDictionary[str, RemoteFile]" = weakref.WeakValueDictionary()
+
+
+def is_remote_path(path: str | Path) -> bool:
+    """Whether a path is a URL naming a file on a remote filesystem, such as ``s3://bucket/session/file.doric``."""
+    if not isinstance(path, str):
+        return False
+
+    protocol, separator, _ = path.partition("://")
+    return separator != "" and protocol not in ("", "file", "local")
+
+
+def _validate_remote_path(path: str) -> str:
+    if not is_remote_path(path=path):
+        raise ValueError(f"'{path}' is neither an existing local path nor a URL such as 's3://bucket/file'.")
+
+    return path
+
+
+RemoteFilePath = Annotated[str, AfterValidator(_validate_remote_path)]
+"""A URL naming a file on a remote filesystem fsspec can read, for the source arguments of interfaces."""
+
+
+class RemoteBlockCache:
+    """
+    Where and how the files of a remote filesystem are cached locally while they are read.
+
+    A remote file is read in blocks of ``block_size_mb``, each fetched with one range request the first time any
+    byte of it is read and kept in a sparse file in ``cache_folder_path`` from then on, so a conversion run again
+    over the same session reads the blocks it already fetched from disk. A read spanning many missing blocks, such
+    as the buffer of a data chunk iterator, fetches them with up to ``max_concurrent_requests`` range requests at
+    once, each of consecutive blocks, so the requests grow with the buffer.
+
+    Use it as a context manager around the conversion. When none is active, the blocks are cached in the folder
+    named by the ``NEUROCONV_REMOTE_CACHE_FOLDER`` environment variable, or in the temporary directory of the
+    system. The cache is never cleaned up by NeuroConv; delete the folder to reclaim its space.
+
+    Parameters
+    ----------
+    cache_folder_path : DirectoryPath, optional
+        The folder the blocks are cached in.
+    block_size_mb : float, default: 4.0
+        The size, in megabytes, of the blocks a remote file is fetched and cached in.
+    max_concurrent_requests : int, default: 8
+        The most range requests made at once for one read.
+    """
+
+    def __init__(
+        self, cache_folder_path: str | Path | None = None, block_size_mb: float = 4.0, max_concurrent_requests: int = 8
+    ):
+        if block_size_mb <= 0:
+            raise ValueError(f"The block size must be greater than zero, but {block_size_mb=}.")
+        if max_concurrent_requests < 1:
+            raise ValueError(f"At least one request must be allowed at once, but {max_concurrent_requests=}.")
+
+        if cache_folder_path is None:
+            cache_folder_path = os.environ.get(
+                _REMOTE_CACHE_FOLDER_ENVIRONMENT_VARIABLE, Path(tempfile.gettempdir()) / "neuroconv_remote_cache"
+            )
+        self.cache_folder_path = Path(cache_folder_path)
+        self.block_size_in_bytes = max(1, int(block_size_mb * 1e6))
+        self.max_concurrent_requests = max_concurrent_requests
+
+    def __enter__(self) -> "RemoteBlockCache":
+        _active_remote_block_caches.append(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_remote_block_caches.remove(self)
+
+
+def get_active_remote_block_cache() -> RemoteBlockCache:
+    """The innermost `RemoteBlockCache` entered, or the default one when none is."""
+    if _active_remote_block_caches:
+        return _active_remote_block_caches[-1]
+
+    return RemoteBlockCache()
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    A read-only file object over a file on a remote filesystem, read through a local block cache.
+
+    Any URL fsspec resolves is supported, such as ``s3://`` for Amazon S3 and S3-compatible object stores (with
+    ``s3fs``) or ``https://`` (with ``aiohttp``). Credentials and endpoints are passed as ``storage_options``, or
+    set through the configuration of fsspec, e.g. the ``FSSPEC_S3_ENDPOINT_URL`` environment variable.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    block_cache : RemoteBlockCache, optional
+        Where and how to cache the file. Defaults to the active one.
+    storage_options : dict, optional
+        Keyword arguments for the fsspec filesystem of the URL.
+    """
+
+    def __init__(self, url: str, block_cache: RemoteBlockCache | None = None, storage_options: dict | None = None):
+        fsspec = get_package(package_name="fsspec", installation_instructions="pip install neuroconv[remote]")
+        super().__init__()
+
+        self.url = url
+        self.block_cache = block_cache or get_active_remote_block_cache()
+        self._filesystem, self._path = fsspec.core.url_to_fs(url, **(storage_options or dict()))
+        self.size = self._filesystem.size(self._path)
+        # A digest of what the filesystem reports of the file, its ETag on S3, so a file replaced at the same URL is
+        # not read from the blocks of the one it replaced
+        self.version = self._filesystem.ukey(self._path)
+
+        block_size_in_bytes = self.block_cache.block_size_in_bytes
+        cache_name = hash_text(text=json.dumps([url, self.version, block_size_in_bytes]))
+        self.block_cache.cache_folder_path.mkdir(parents=True, exist_ok=True)
+        cache_file_path = self.block_cache.cache_folder_path / f"{cache_name}.blocks"
+        index_file_path = self.block_cache.cache_folder_path / f"{cache_name}.index"
+
+        # A block is recorded in the index only once it is written to the cache, so a conversion interrupted while
+        # fetching leaves no block recorded that is not there
+        self._cached_blocks = set()
+        if index_file_path.exists():
+            index_lines = index_file_path.read_text(encoding="utf-8").splitlines()
+            self._cached_blocks = {int(line) for line in index_lines if line.isdigit()}
+        if not cache_file_path.exists():
+            with open(cache_file_path, mode="wb") as cache_file:
+                cache_file.truncate(self.size)
+        self._cache_file = open(cache_file_path, mode="r+b")
+        self._index_file = open(index_file_path, mode="a", encoding="utf-8")
+
+        self._lock = threading.Lock()
+        self._position = 0
+        _open_remote_files[repr(self)] = self
+
+    def __repr__(self) -> str:
+        return f"RemoteFile({self.url!r}, version={self.version!r})"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        stop = min(self._position + len(buffer), self.size)
+        if stop <= self._position:
+            return 0
+
+        number_of_bytes = self._read_range_into(buffer=buffer, start=self._position, stop=stop)
+        self._position += number_of_bytes
+        return number_of_bytes
+
+    def read_range(self, start: int, stop: int) -> bytearray:
+        """Read the bytes from `start` up to `stop`, fetching the blocks that hold them in parallel, if missing."""
+        stop = min(stop, self.size)
+        buffer = bytearray(max(0, stop - start))
+        self._read_range_into(buffer=buffer, start=start, stop=stop)
+        return buffer
+
+    def _read_range_into(self, buffer, start: int, stop: int) -> int:
+        self.fetch(byte_ranges=[(start, stop)])
+        with self._lock:
+            self._cache_file.seek(start)
+            return self._cache_file.readinto(memoryview(buffer)[: stop - start])
+
+    def fetch(self, byte_ranges: list[tuple[int, int]]) -> None:
+        """
+        Fetch the blocks holding the byte ranges that are not cached yet.
+
+        The missing blocks are fetched in runs of consecutive blocks, one range request per run, with the runs cut so
+        that the requests made at once share the blocks evenly.
+        """
+        block_size_in_bytes = self.block_cache.block_size_in_bytes
+        missing_blocks = sorted(
+            {
+                block
+                for start, stop in byte_ranges
+                for block in range(start // block_size_in_bytes, math.ceil(min(stop, self.size) / block_size_in_bytes))
+            }
+            - self._cached_blocks
+        )
+        if not missing_blocks:
+            return
+
+        max_concurrent_requests = self.block_cache.max_concurrent_requests
+        maximum_blocks_per_request = math.ceil(len(missing_blocks) / max_concurrent_requests)
+        block_runs = list()
+        for block in missing_blocks:
+            is_next_block_of_run = block_runs and block_runs[-1][-1] == block - 1
+            if is_next_block_of_run and len(block_runs[-1]) < maximum_blocks_per_request:
+                block_runs[-1].append(block)
+            else:
+                block_runs.append([block])
+
+        if len(block_runs) == 1:
+            self._fetch_blocks(blocks=block_runs[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(len(block_runs), max_concurrent_requests)) as executor:
+            for _ in executor.map(lambda blocks: self._fetch_blocks(blocks=blocks), block_runs):
+                pass
+
+    def _fetch_blocks(self, blocks: list[int]) -> None:
+        block_size_in_bytes = self.block_cache.block_size_in_bytes
+        start = blocks[0] * block_size_in_bytes
+        stop = min((blocks[-1] + 1) * block_size_in_bytes, self.size)
+        content = self._filesystem.cat_file(self._path, start=start, end=stop)
+
+        with self._lock:
+            self._cache_file.seek(start)
+            self._cache_file.write(content)
+            self._cache_file.flush()
+            self._index_file.write("".join(f"{block}\n" for block in blocks))
+            self._index_file.flush()
+            self._cached_blocks.update(blocks)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._cache_file.close()
+            self._index_file.close()
+        super().close()
+
+
+def open_hdf5_file(file_path: str | Path) -> h5py.File:
+    """
+    Open an HDF5 file for reading, from a local path or, through a `RemoteFile`, from the URL of a remote file.
+
+    Reads of the datasets of a remote file go through the active `RemoteBlockCache`, and a data chunk iterator
+    wrapping one fetches each of its buffers with parallel range requests before reading it.
+    """
+    if not is_remote_path(path=file_path):
+        return h5py.File(name=file_path, mode="r")
+
+    return h5py.File(name=RemoteFile(url=file_path), mode="r")
+
+
+def _get_hdf5_byte_ranges(dataset: h5py.Dataset, selection: tuple[slice, ...]) -> list[tuple[int, int]]:
+    """The byte ranges of the file a selection of a dataset is stored in, one per chunk, or one when contiguous."""
+    if dataset.chunks is None:
+        offset = dataset.id.get_offset()
+        if offset is None:  # Compact, or never written
+            return list()
+        row_size_in_bytes = math.prod(dataset.shape[1:]) * dataset.dtype.itemsize
+        first_axis = selection[0]
+        return [(offset + first_axis.start * row_size_in_bytes, offset + first_axis.stop * row_size_in_bytes)]
+
+    chunk_starts_per_axis = [
+        range(axis.start // chunk_axis * chunk_axis, axis.stop, chunk_axis)
+        for axis, chunk_axis in zip(selection, dataset.chunks)
+    ]
+    byte_ranges = list()
+    for chunk_start in itertools.product(*chunk_starts_per_axis):
+        chunk_info = dataset.id.get_chunk_info_by_coord(chunk_start)
+        if chunk_info.byte_offset is not None:  # Chunks never written hold no bytes
+            byte_ranges.append((chunk_info.byte_offset, chunk_info.byte_offset + chunk_info.size))
+
+    return byte_ranges
+
+
+def prefetch_selection(data, selection: tuple[slice, ...]) -> None:
+    """
+    Fetch every block a selection of an HDF5 dataset read through a `RemoteFile` spans, with parallel requests.
+
+    HDF5 reads a selection chunk by chunk, which against a remote file would be one request after another. Does
+    nothing for data of any other kind.
+    """
+    if not isinstance(data, h5py.Dataset) or data.file.driver != "fileobj":
+        return
+    if not all(isinstance(axis, slice) and axis.step in (None, 1) for axis in selection):
+        return
+    remote_file = _open_remote_files.get(data.file.filename)
+    if remote_file is None:
+        return
+
+    selection = tuple(slice(*axis.indices(axis_length)[:2]) for axis, axis_length in zip(selection, data.shape))
+    remote_file.fetch(byte_ranges=_get_hdf5_byte_ranges(dataset=data, selection=selection))
+
+
+class RemoteBinaryArray:
+    """
+    A read-only array over a flat binary file on a remote filesystem, standing in for a `numpy.memmap` of it.
+
+    Suited to the raw ``.bin`` and ``.dat`` files of acquisition systems, which hold samples by channels in C
+    order after an optional header. Only the rows along the first axis that a selection spans are fetched, with
+    parallel range requests through the active `RemoteBlockCache`, so wrapping one in a
+    `SliceableDataChunkIterator` fetches the file a buffer at a time.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    dtype : numpy.typing.DTypeLike
+        The data type of the samples.
+    shape : tuple of int, optional
+        The shape of the array. Defaults to one dimension spanning the file after `offset`.
+    offset : int, default: 0
+        The number of bytes before the first sample, such as those of a header.
+    block_cache : RemoteBlockCache, optional
+        Where and how to cache the file. Defaults to the active one.
+    storage_options : dict, optional
+        Keyword arguments for the fsspec filesystem of the URL.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        dtype: DTypeLike,
+        shape: tuple[int, ...] | None = None,
+        offset: int = 0,
+        block_cache: RemoteBlockCache | None = None,
+        storage_options: dict | None = None,
+    ):
+        self.file = RemoteFile(url=url, block_cache=block_cache, storage_options=storage_options)
+        self.dtype = np.dtype(dtype)
+        self.offset = offset
+        if shape is None:
+            shape = ((self.file.size - offset) // self.dtype.itemsize,)
+        self.shape = tuple(shape)
+
+        if offset + self.nbytes > self.file.size:
+            raise ValueError(
+                f"An array of shape {self.shape} and dtype {self.dtype} from byte {offset} does not fit in "
+                f"'{url}', which holds {self.file.size} bytes."
+            )
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = self[:]
+        return array if dtype is None else array.astype(dtype)
+
+    def __getitem__(self, selection) -> np.ndarray:
+        if not isinstance(selection, tuple):
+            selection = (selection,)
+        if selection and selection[0] is Ellipsis:
+            selection = (slice(None),) + selection
+        first_axis, other_axes = (selection[0], selection[1:]) if selection else (slice(None), tuple())
+
+        if isinstance(first_axis, slice):
+            rows = range(*first_axis.indices(self.shape[0]))
+            if len(rows) == 0:
+                return np.empty(shape=(0,) + self.shape[1:], dtype=self.dtype)[(slice(None),) + other_axes]
+            first_row, stop_row = min(rows), max(rows) + 1
+            first_axis_in_rows = slice(rows.start - first_row, None, rows.step) if rows.step > 0 else rows
+        else:
+            first_axis = np.asarray(first_axis)
+            first_axis = np.where(first_axis < 0, first_axis + self.shape[0], first_axis)
+            first_row, stop_row = int(first_axis.min()), int(first_axis.max()) + 1
+            first_axis_in_rows = first_axis - first_row
+
+        row_size_in_bytes = math.prod(self.shape[1:]) * self.dtype.itemsize
+        content = self.file.read_range(
+            start=self.offset + first_row * row_size_in_bytes, stop=self.offset + stop_row * row_size_in_bytes
+        )
+        rows_read = np.frombuffer(content, dtype=self.dtype).reshape((stop_row - first_row,) + self.shape[1:])
+
+        if isinstance(first_axis_in_rows, range):
+            first_axis_in_rows = np.asarray(first_axis_in_rows) - first_row
+        return rows_read[(first_axis_in_rows,) + other_axes]
+
+    def _get_source_fingerprint(self) -> str:
+        description = dict(file=repr(self.file), offset=self.offset, shape=list(self.shape), dtype=str(self.dtype))
+        return hash_text(text=json.dumps(description, sort_keys=True))
+
+
+def _mirror_remote_folder(
+    url: str,
+    placeholder_suffixes: tuple[str, ...],
+    block_cache: RemoteBlockCache | None = None,
+    storage_options: dict | None = None,
+) -> Path:
+    """
+    Mirror the layout of a remote folder locally, for the readers that walk a folder and memory-map its files.
+
+    The files whose names end with one of `placeholder_suffixes`, the large binaries of samples, are mirrored as
+    sparse placeholders of their size, which take no space on disk and are to be read with `RemoteBinaryArray`
+    instead. Every other file, the headers and indices a reader parses, is downloaded. The mirror is kept in the
+    folder of the block cache, and a file replaced at the same URL is downloaded anew.
+    """
+    fsspec = get_package(package_name="fsspec", installation_instructions="pip install neuroconv[remote]")
+
+    block_cache = block_cache or get_active_remote_block_cache()
+    filesystem, folder_path_in_filesystem = fsspec.core.url_to_fs(url, **(storage_options or dict()))
+    folder_path_in_filesystem = folder_path_in_filesystem.rstrip("/")
+    file_sizes = {path: info["size"] for path, info in filesystem.find(folder_path_in_filesystem, detail=True).items()}
+    if not file_sizes:
+        raise FileNotFoundError(f"No files were found in the remote folder '{url}'.")
+
+    mirror_name = hash_text(text=url)
+    mirror_folder_path = block_cache.cache_folder_path / "folders" / mirror_name
+    versions_file_path = block_cache.cache_folder_path / "folders" / f"{mirror_name}.versions"
+    versions = json.loads(versions_file_path.read_text(encoding="utf-8")) if versions_file_path.exists() else dict()
+    for path, size in file_sizes.items():
+        relative_path = path[len(folder_path_in_filesystem) :].lstrip("/")
+        local_file_path = mirror_folder_path / relative_path
+        local_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if relative_path.endswith(placeholder_suffixes):
+            if not local_file_path.exists() or local_file_path.stat().st_size != size:
+                with open(local_file_path, mode="wb") as placeholder_file:
+                    placeholder_file.truncate(size)
+            continue
+
+        version = filesystem.ukey(path)
+        if not local_file_path.exists() or versions.get(relative_path) != version:
+            filesystem.get_file(path, str(local_file_path))
+            versions[relative_path] = version
+    versions_file_path.write_text(json.dumps(versions), encoding="utf-8")
+
+    return mirror_folder_path
@@ -1,7 +1,9 @@
 """General purpose iterator for all ImagingExtractor data."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from roiextractors import ImagingExtractor
+from roiextractors import ImagingExtractor, MultiImagingExtractor
 from tqdm import tqdm
 
 from neuroconv.tools.hdmf import GenericDataChunkIterator
@@ -24,6 +26,7 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         display_progress: bool = False,
         progress_bar_class: tqdm | None = None,
         progress_bar_options: dict | None = None,
+        max_read_workers: int = 1,
     ):
         """
         Initialize an Iterable object which returns DataChunks with data and their selections on each iteration.
@@ -60,8 +63,14 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         progress_bar_options : dict, optional
             Dictionary of keyword arguments to be passed directly to tqdm.
             See https://github.com/tqdm/tqdm#parameters for options.
+        max_read_workers : int, default=1
+            When the imaging extractor concatenates several files, such as the videos of a Miniscope session, the
+            number of the files a buffer spans that are read at once, each in a thread of its own.
+            The default of 1 reads them one after the other.
         """
+        assert max_read_workers >= 1, f"max_read_workers ({max_read_workers}) must be at least 1!"
         self.imaging_extractor = imaging_extractor
+        self.max_read_workers = max_read_workers
 
         assert not (buffer_gb and buffer_shape), "Only one of 'buffer_gb' or 'buffer_shape' can be specified!"
         assert not (chunk_mb and chunk_shape), "Only one of 'chunk_mb' or 'chunk_shape' can be specified!"
@@ -184,16 +193,61 @@ class ImagingExtractorDataChunkIterator(GenericDataChunkIterator):
         Note that get_series always returns full spatial frames, so spatial slicing
         happens in memory after the fetch. This is a roiextractors API limitation.
         """
-        data = self.imaging_extractor.get_series(
-            start_sample=selection[0].start,
-            end_sample=selection[0].stop,
-        )
+        if self.max_read_workers > 1 and self._concatenates_extractors():
+            data = self._get_series_from_files(start_sample=selection[0].start, end_sample=selection[0].stop)
+        else:
+            data = self.imaging_extractor.get_series(
+                start_sample=selection[0].start,
+                end_sample=selection[0].stop,
+            )
 
-        # Transpose from roiextractors (frames, height, width) to NWB (frames, width, height)
-        transpose_axes = (0, 2, 1) if len(data.shape) == 3 else (0, 2, 1, 3)
-        data = data.transpose(transpose_axes)
+            # Transpose from roiextractors (frames, height, width) to NWB (frames, width, height)
+            transpose_axes = (0, 2, 1) if len(data.shape) == 3 else (0, 2, 1, 3)
+            data = data.transpose(transpose_axes)
 
         # get_series returns full spatial frames, so apply spatial slicing after transpose
         num_frames_fetched = selection[0].stop - selection[0].start
         spatial_selection = (slice(0, num_frames_fetched),) + selection[1:]
         return data[spatial_selection]
+
+    def _concatenates_extractors(self) -> bool:
+        """Whether the extractor is a MultiImagingExtractor exposing the extractors it concatenates.
+
+        Those attributes are private to roiextractors, so an extractor lacking any of them is read through
+        ``get_series`` instead.
+        """
+        extractor = self.imaging_extractor
+        return isinstance(extractor, MultiImagingExtractor) and all(
+            hasattr(extractor, attribute_name)
+            for attribute_name in ("_imaging_extractors", "_start_frames", "_end_frames")
+        )
+
+    def _get_series_from_files(self, start_sample: int, end_sample: int) -> np.ndarray:
+        """Read the frames of a MultiImagingExtractor from each of the extractors it concatenates at once.
+
+        Each extractor fills its own span of the buffer, already transposed to the NWB (frames, width, height).
+        """
+        extractor = self.imaging_extractor
+        data = np.empty(shape=(end_sample - start_sample,) + self._get_sample_shape(), dtype=self._get_dtype())
+
+        spans = list()
+        for sub_extractor, sub_start_frame, sub_end_frame in zip(
+            extractor._imaging_extractors, extractor._start_frames, extractor._end_frames
+        ):
+            span_start, span_end = max(start_sample, sub_start_frame), min(end_sample, sub_end_frame)
+            if span_start < span_end:
+                spans.append((sub_extractor, sub_start_frame, span_start, span_end))
+
+        def read_span(span: tuple) -> None:
+            sub_extractor, sub_start_frame, span_start, span_end = span
+            series = sub_extractor.get_series(
+                start_sample=span_start - sub_start_frame, end_sample=span_end - sub_start_frame
+            )
+            transpose_axes = (0, 2, 1) if len(series.shape) == 3 else (0, 2, 1, 3)
+            data[span_start - start_sample : span_end - start_sample] = series.transpose(transpose_axes)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_read_workers, len(spans))) as executor:
+            # Consume the results so that an error reading any of the files is raised here
+            list(executor.map(read_span, spans))
+
+        return data
@@ -3,7 +3,6 @@ import warnings
 from typing import Literal
 
 import numpy as np
-import psutil
 from pydantic import FilePath
 from pynwb import NWBFile
 from pynwb.base import Images
@@ -42,6 +41,7 @@ from ..nwb_helpers import (
     make_nwbfile_from_metadata,
 )
 from ..nwb_helpers._device_types import _build_inline_containers
+from ..nwb_helpers._memory_budget import get_available_memory_in_bytes
 from ..nwb_helpers._metadata_and_file_helpers import (
     _add_device_to_nwbfile,
     _fetch_backend_from_nwbfile_on_disk,
@@ -977,6 +977,8 @@ def _check_if_imaging_fits_into_memory(imaging: ImagingExtractor) -> None:
     """
     Raise an error if the full traces of an imaging extractor are larger than available memory.
 
+    The memory available is that the system reports, or the memory budget of the conversion when that is smaller.
+
     Parameters
     ----------
     imaging : ImagingExtractor
@@ -991,7 +993,7 @@ def _check_if_imaging_fits_into_memory(imaging: ImagingExtractor) -> None:
     num_samples = imaging.get_num_samples()
 
     traces_size_in_bytes = num_samples * math.prod(sample_shape) * element_size_in_bytes
-    available_memory_in_bytes = psutil.virtual_memory().available
+    available_memory_in_bytes = get_available_memory_in_bytes()
 
     if traces_size_in_bytes > available_memory_in_bytes:
         message = (
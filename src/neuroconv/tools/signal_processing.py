@@ -353,7 +353,7 @@ def _run_length_encode_labels(
     labels: np.ndarray,
     timestamps: np.ndarray,
     frame_period: float | None = None,
-) -> list[tuple[float, float, int]]:
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Run-length-encode a per-frame integer label array into labeled time intervals.
 
@@ -374,8 +374,9 @@ def _run_length_encode_labels(
 
     Returns
     -------
-    list of tuple of (float, float, int)
-        One ``(start_time, stop_time, label)`` tuple per run, in time order.
+    tuple of numpy.ndarray
+        ``(start_times, stop_times, labels)``, each with one value per run in time order, so that
+        the intervals can fill the columns of a table at once.
     """
     labels = np.asarray(labels)
     timestamps = np.asarray(timestamps)
@@ -383,13 +384,8 @@ def _run_length_encode_labels(
         frame_period = float(np.median(np.diff(timestamps)))
 
     boundaries = np.flatnonzero(np.diff(labels)) + 1
-    run_starts = np.concatenate(([0], boundaries))
-    run_ends = np.concatenate((boundaries, [labels.size]))  # exclusive frame index
-    return [
-        (
-            float(timestamps[start_index]),
-            float(timestamps[end_index - 1] + frame_period),
-            int(labels[start_index]),
-        )
-        for start_index, end_index in zip(run_starts, run_ends)
-    ]
+    run_starts = np.concatenate(([0], boundaries)).astype("int64")
+    run_ends = np.concatenate((boundaries, [labels.size])).astype("int64")  # exclusive frame index
+    start_times = timestamps[run_starts].astype("float64")
+    stop_times = timestamps[run_ends - 1].astype("float64") + frame_period
+    return start_times, stop_times, labels[run_starts].astype("int64")
@@ -0,0 +1,171 @@
+"""A SpikeInterface recording of a Neo format held in a remote folder, read from its URL."""
+
+from pathlib import Path
+
+import numpy as np
+from spikeinterface import BaseRecording, BaseRecordingSegment
+
+from ..remote_sources import RemoteBinaryArray, _mirror_remote_folder
+
+
+class RemoteNeoRecording(BaseRecording):
+    """
+    A recording of a remote folder in a format Neo reads with its buffer API, such as SpikeGLX or Open Ephys binary.
+
+    The folder is parsed by the SpikeInterface extractor of the format from a local mirror of it, in which the flat
+    binary files of the signals are sparse placeholders. The samples are read from those files at the URL with a
+    `RemoteBinaryArray`, where Neo describes them, so only the frames read are fetched.
+
+    The URL is what the recording is built from, so a copy of it loaded from its dictionary or unpickled, as in the
+    workers of a parallel job, also reads from the URL, through the active block cache of its process.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the folder.
+    extractor_name : str
+        The name of the SpikeInterface extractor of the format, such as ``"SpikeGLXRecordingExtractor"``.
+    extractor_kwargs : dict
+        The keyword arguments of the extractor other than its ``folder_path``.
+    placeholder_suffixes : list of str
+        The suffixes of the binary files of the signals, which are not downloaded to the mirror.
+    storage_options : dict, optional
+        Keyword arguments for the fsspec filesystem of the URL.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        extractor_name: str,
+        extractor_kwargs: dict,
+        placeholder_suffixes: list[str],
+        storage_options: dict | None = None,
+    ):
+        from spikeinterface.extractors import extractor_classes
+
+        mirror_folder_path = _mirror_remote_folder(
+            url=url, placeholder_suffixes=tuple(placeholder_suffixes), storage_options=storage_options
+        )
+        extractor_class = getattr(extractor_classes, extractor_name)
+        neo_recording = extractor_class(folder_path=mirror_folder_path, **extractor_kwargs)
+
+        BaseRecording.__init__(
+            self,
+            sampling_frequency=neo_recording.get_sampling_frequency(),
+            channel_ids=neo_recording.get_channel_ids(),
+            dtype=neo_recording.get_dtype(),
+        )
+        neo_recording.copy_metadata(self)
+        self.extra_requirements.extend(["neo", "fsspec"])
+
+        self.neo_reader = neo_recording.neo_reader
+        self.stream_id = neo_recording.stream_id
+        self.stream_name = neo_recording.stream_name
+        self.block_index = neo_recording.block_index
+
+        # The columns of a buffer are the channels of the streams it holds, in the order of the header
+        signal_streams = self.neo_reader.header["signal_streams"]
+        buffer_id = signal_streams["buffer_id"][signal_streams["id"] == self.stream_id][0]
+        signal_channels = self.neo_reader.header["signal_channels"]
+        buffer_channels = signal_channels[signal_channels["buffer_id"] == buffer_id]
+        stream_columns = np.flatnonzero(buffer_channels["stream_id"] == self.stream_id)
+        stream_index = neo_recording.stream_index
+
+        for segment_index in range(neo_recording.get_num_segments()):
+            buffer_description = self.neo_reader.get_analogsignal_buffer_description(
+                block_index=self.block_index, seg_index=segment_index, buffer_id=buffer_id
+            )
+            if buffer_description["type"] != "raw" or buffer_description.get("time_axis", 0) != 0:
+                raise NotImplementedError(
+                    f"The signals of the stream '{self.stream_id}' in '{url}' are not stored as a flat binary file "
+                    "of frames, which is the only layout read from a remote folder."
+                )
+            if len(buffer_channels) != buffer_description["shape"][1]:
+                raise NotImplementedError(
+                    f"The channels of the stream '{self.stream_id}' in '{url}' cannot be located in the columns of "
+                    "its binary file."
+                )
+
+            relative_file_path = Path(buffer_description["file_path"]).relative_to(mirror_folder_path)
+            time_kwargs = dict(sampling_frequency=self.get_sampling_frequency())
+            if neo_recording.has_time_vector(segment_index=segment_index):
+                time_kwargs = dict(time_vector=neo_recording.get_times(segment_index=segment_index))
+            else:
+                time_kwargs["t_start"] = self.neo_reader.get_signal_t_start(
+                    block_index=self.block_index, seg_index=segment_index, stream_index=stream_index
+                )
+            recording_segment = _RemoteBinaryRecordingSegment(
+                url=f"{url.rstrip('/')}/{relative_file_path.as_posix()}",
+                dtype=buffer_description["dtype"],
+                shape=tuple(buffer_description["shape"]),
+                offset=buffer_description["file_offset"],
+                columns=stream_columns,
+                inverted_gain=neo_recording.inverted_gain,
+                storage_options=storage_options,
+                **time_kwargs,
+            )
+            self.add_recording_segment(recording_segment)
+
+        self._kwargs = dict(
+            url=url,
+            extractor_name=extractor_name,
+            extractor_kwargs=extractor_kwargs,
+            placeholder_suffixes=list(placeholder_suffixes),
+            storage_options=storage_options,
+        )
+
+
+class _RemoteBinaryRecordingSegment(BaseRecordingSegment):
+    """A segment read from the columns of a flat binary file of frames on a remote filesystem."""
+
+    def __init__(
+        self,
+        url: str,
+        dtype: np.dtype,
+        shape: tuple[int, int],
+        offset: int,
+        columns: np.ndarray,
+        inverted_gain: bool,
+        storage_options: dict | None = None,
+        sampling_frequency: float | None = None,
+        t_start: float | None = None,
+        time_vector: np.ndarray | None = None,
+    ):
+        BaseRecordingSegment.__init__(
+            self, sampling_frequency=sampling_frequency, t_start=t_start, time_vector=time_vector
+        )
+        self.url = url
+        self.dtype = dtype
+        self.shape = shape
+        self.offset = offset
+        self.columns = columns
+        self.inverted_gain = inverted_gain
+        self.storage_options = storage_options
+        # Opened on the first read, through the block cache active then
+        self._array = None
+
+    def get_num_samples(self) -> int:
+        return self.shape[0]
+
+    def get_traces(
+        self,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        channel_indices: list | np.ndarray | slice | None = None,
+    ) -> np.ndarray:
+        if self._array is None:
+            self._array = RemoteBinaryArray(
+                url=self.url,
+                dtype=self.dtype,
+                shape=self.shape,
+                offset=self.offset,
+                storage_options=self.storage_options,
+            )
+
+        traces = self._array[start_frame or 0 : end_frame][:, self.columns]
+        if channel_indices is not None:
+            traces = traces[:, channel_indices]
+        if self.inverted_gain:
+            traces = -traces
+
+        return traces
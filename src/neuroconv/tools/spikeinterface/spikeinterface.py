@@ -3,7 +3,6 @@ from collections import defaultdict
 from typing import Any, Literal
 
 import numpy as np
-import psutil
 import pynwb
 from hdmf.common.table import VectorIndex
 from hdmf.data_utils import AbstractDataChunkIterator
@@ -24,6 +23,7 @@ from ..nwb_helpers import (
     get_module,
     make_nwbfile_from_metadata,
 )
+from ..nwb_helpers._memory_budget import get_available_memory_in_bytes
 from ..nwb_helpers._metadata_and_file_helpers import (
     _add_device_to_nwbfile,
     _fetch_backend_from_nwbfile_on_disk,
@@ -1605,7 +1605,9 @@ def add_electrodes_to_nwbfile(
 
 def _check_if_recording_traces_fit_into_memory(recording: BaseRecording, segment_index: int = 0) -> None:
     """
-    Raises an error if the full traces of a recording extractor are larger than psutil.virtual_memory().available.
+    Raises an error if the full traces of a recording extractor are larger than the memory available.
+
+    The memory available is that the system reports, or the memory budget of the conversion when that is smaller.
 
     Parameters
     ----------
@@ -1623,7 +1625,7 @@ def _check_if_recording_traces_fit_into_memory(recording: BaseRecording, segment
     num_frames = recording.get_num_samples(segment_index=segment_index)
 
     traces_size_in_bytes = element_size_in_bytes * num_channels * num_frames
-    available_memory_in_bytes = psutil.virtual_memory().available
+    available_memory_in_bytes = get_available_memory_in_bytes()
 
     if traces_size_in_bytes > available_memory_in_bytes:
         message = (
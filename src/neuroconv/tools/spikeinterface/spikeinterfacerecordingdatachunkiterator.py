@@ -1,9 +1,15 @@
+import json
 from typing import Iterable
 
 import numpy as np
 from spikeinterface import BaseRecording
 from tqdm import tqdm
 
+from neuroconv.tools._dataset_fingerprint import (
+    describe_value_for_fingerprint,
+    get_file_identities_in_description,
+    hash_text,
+)
 from neuroconv.tools.hdmf import GenericDataChunkIterator
 from neuroconv.tools.iterative_write import get_electrical_series_chunk_shape
 
@@ -80,6 +86,22 @@ class SpikeInterfaceRecordingDataChunkIterator(GenericDataChunkIterator):
             progress_bar_options=progress_bar_options,
         )
 
+    def _get_source_fingerprint(self) -> str | None:
+        # A recording that serializes to JSON is rebuilt from its description alone, which names every file it reads
+        if not self.recording.check_serializability("json"):
+            return None
+
+        recording_description = self.recording.to_dict(
+            include_annotations=True, include_properties=True, recursive=True
+        )
+        description = dict(
+            recording=recording_description,
+            files=get_file_identities_in_description(description=recording_description),
+            segment_index=self.segment_index,
+            return_in_uV=self.return_in_uV,
+        )
+        return hash_text(text=json.dumps(description, sort_keys=True, default=describe_value_for_fingerprint))
+
     def _get_default_chunk_shape(self, chunk_mb: float = 10.0) -> tuple[int, int]:
         assert chunk_mb > 0, f"chunk_mb ({chunk_mb}) must be greater than zero!"
 
@@ -37,7 +37,11 @@ from ...tools.events import (
     _resolve_detection_plan,
     _validate_detection_configuration,
 )
-from ...tools.icephys import _RESPONSE_CLASS, _add_intracellular_electrode_to_nwbfile
+from ...tools.icephys import (
+    _RESPONSE_CLASS,
+    _add_intracellular_electrode_to_nwbfile,
+    _add_intracellular_recordings_to_nwbfile,
+)
 from ...tools.signal_processing import (
     _condition_signal,
     _detect_events,
@@ -1726,31 +1730,15 @@ class MockIcephysInterface(BaseDataInterface):
         response_series = _RESPONSE_CLASS[self.mode](**series_kwargs)
         nwbfile.add_acquisition(response_series)
 
-        # The run-level columns, denormalized onto every row exactly as a real interface writes them: the
+        # The run-level columns are denormalized onto every row by the same writer the real interfaces use: the
         # always-present run identity, plus the optional ones only when the caller asked for them.
-        columns = {"sequence": self.sequence}
-        if self.stimulus_type is not None:
-            columns["stimulus_type"] = self.stimulus_type
-        if self.repetition is not None:
-            columns["repetition"] = self.repetition
-        if self.condition is not None:
-            columns["condition"] = self.condition
-        column_descriptions = {
-            "sequence": "Run identity grouping rows into a sequential recording.",
-            "stimulus_type": "Stimulus type of the run, carried up to its sequential recording when aggregated.",
-            "repetition": "Repetition label grouping sequential recordings into a repetition.",
-            "condition": "Experimental condition label grouping repetitions.",
-        }
-        table = nwbfile.get_intracellular_recordings()
-        for column_name in columns:
-            if column_name not in table.colnames:
-                table.add_column(name=column_name, description=column_descriptions[column_name])
-
-        for start_index, count in sweep_sample_ranges:
-            nwbfile.add_intracellular_recording(
-                electrode=electrode,
-                response=response_series,
-                response_start_index=start_index,
-                response_index_count=count,
-                **columns,
-            )
+        _add_intracellular_recordings_to_nwbfile(
+            nwbfile=nwbfile,
+            electrode=electrode,
+            response_series=response_series,
+            sweep_sample_ranges=sweep_sample_ranges,
+            sequence=self.sequence,
+            stimulus_type=self.stimulus_type,
+            repetition=self.repetition,
+            condition=self.condition,
+        )
@@ -1,8 +1,54 @@
 import numpy as np
 import pandas as pd
+from hdmf.common import VectorData, VectorIndex
 from pynwb.epoch import TimeIntervals
 
 
+def _is_sequence(value) -> bool:
+    return isinstance(value, (list, tuple, np.ndarray))
+
+
+def _get_column_data(column: pd.Series) -> np.ndarray | list:
+    """
+    The values of a DataFrame column as one array, or as a list of native Python values where NumPy has no type.
+
+    Numeric and boolean columns keep their NumPy arrays. Categorical columns are written as their values, in the
+    type of their categories. Everything else, strings among them, becomes a list of native Python values, which
+    HDMF writes as it would values added row by row (see https://github.com/hdmf-dev/hdmf/issues/1384).
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        categories_dtype = column.cat.categories.dtype
+        column = column.astype(object if column.isna().any() else categories_dtype)
+
+    if column.dtype.kind in "biuf":
+        return column.to_numpy()
+
+    return column.tolist()
+
+
+def _get_columns(name: str, description: str, column: pd.Series) -> list[VectorData | VectorIndex]:
+    """
+    Build the table columns holding a DataFrame column in one step: one column, or a column and its index.
+
+    A column whose cells are all lists or arrays of one length becomes a multidimensional column, as adding them
+    row by row makes it; cells of different lengths become a ragged column, flattened once and indexed by where
+    each cell ends.
+    """
+    data = _get_column_data(column=column)
+    if isinstance(data, np.ndarray) or len(data) == 0 or not all(_is_sequence(cell) for cell in data):
+        return [VectorData(name=name, description=description, data=data)]
+
+    cell_lengths = np.fromiter((len(cell) for cell in data), dtype="int64", count=len(data))
+    if np.all(cell_lengths == cell_lengths[0]):
+        return [VectorData(name=name, description=description, data=np.asarray(data))]
+
+    flattened_data = VectorData(
+        name=name, description=description, data=[value for cell in data for value in np.asarray(cell).tolist()]
+    )
+    index = VectorIndex(name=f"{name}_index", data=np.cumsum(cell_lengths), target=flattened_data)
+    return [flattened_data, index]
+
+
 def convert_df_to_time_intervals(
     df: pd.DataFrame,
     table_name: str = "trials",
@@ -94,18 +140,30 @@ def convert_df_to_time_intervals(
     else:
         column_descriptions = dict(default_column_descriptions, **column_descriptions)
 
-    time_intervals = TimeIntervals(name=table_name, description=table_description)
     if "start_time" not in df:
         raise ValueError(f"df must contain a column named 'start_time'. Existing columns: {df.columns.to_list()}")
     if "stop_time" not in df:
         df["stop_time"] = np.r_[df["start_time"][1:].to_numpy(), np.nan]
-    for col in df:
-        if col not in ("start_time", "stop_time"):
-            time_intervals.add_column(col, column_descriptions.get(col, col))
-    for i, row in df.iterrows():
-        # Convert to native Python types for HDMF compatibility with pandas 3.0+
-        # See https://github.com/hdmf-dev/hdmf/issues/1384
-        row_dict = {k: (v.item() if hasattr(v, "item") else v) for k, v in row.items()}
-        time_intervals.add_row(row_dict)
-
-    return time_intervals
+
+    # Each column is built from the arrays of the DataFrame at once, where adding the rows one at a time made a
+    # Series of every row and converted each of its cells
+    columns = list()
+    for column_name in ("start_time", "stop_time"):
+        columns.append(
+            VectorData(
+                name=column_name,
+                description=column_descriptions[column_name],
+                data=df[column_name].to_numpy(dtype="float64"),
+            )
+        )
+    for column_name in df:
+        if column_name not in ("start_time", "stop_time"):
+            columns.extend(
+                _get_columns(
+                    name=column_name,
+                    description=column_descriptions.get(column_name, column_name),
+                    column=df[column_name],
+                )
+            )
+
+    return TimeIntervals(name=table_name, description=table_description, columns=columns)
@@ -1,5 +1,6 @@
 import json
 import os
+from contextlib import nullcontext
 from importlib import import_module
 from pathlib import Path
 
@@ -8,9 +9,11 @@ from jsonschema import validate
 from pydantic import DirectoryPath, FilePath
 from referencing import Registry, Resource
 
-from ..data_transfers import automatic_dandi_upload
+from ..data_transfers import DandiUploadPipeline, automatic_dandi_upload
+from ..nwb_helpers import ConversionPlan
 from ...nwbconverter import NWBConverter
 from ...utils import dict_deep_update, load_dict_from_file
+from ...utils.str_utils import human_readable_size
 
 
 @click.command()
@@ -27,11 +30,36 @@ from ...utils import dict_deep_update, load_dict_from_file
     type=click.Path(writable=True),
 )
 @click.option("--overwrite", help="Overwrite an existing NWBFile at the location.", is_flag=True)
+@click.option(
+    "--dry-run",
+    help="Print the projected size, write time and peak memory of each file instead of writing it.",
+    is_flag=True,
+)
+@click.option(
+    "--pipelined-upload",
+    help="Upload each file to the Dandiset in the background as soon as it is written.",
+    is_flag=True,
+)
+@click.option(
+    "--max-queued-uploads",
+    default=1,
+    help="With --pipelined-upload, the most written files waiting to be uploaded.",
+    type=int,
+)
+@click.option(
+    "--remove-uploaded-files",
+    help="With --pipelined-upload, remove each file once it is uploaded.",
+    is_flag=True,
+)
 def run_conversion_from_yaml_cli(
     specification_file_path: str,
     data_folder_path: str | None = None,
     output_folder_path: str | None = None,
     overwrite: bool = False,
+    dry_run: bool = False,
+    pipelined_upload: bool = False,
+    max_queued_uploads: int = 1,
+    remove_uploaded_files: bool = False,
 ):
     """
     Run the tool function 'run_conversion_from_yaml' via the command line.
@@ -39,11 +67,31 @@ def run_conversion_from_yaml_cli(
     specification-file-path :
     Path to the .yml specification file.
     """
-    run_conversion_from_yaml(
+    conversion_plans = run_conversion_from_yaml(
         specification_file_path=specification_file_path,
         data_folder_path=data_folder_path,
         output_folder_path=output_folder_path,
         overwrite=overwrite,
+        dry_run=dry_run,
+        pipelined_upload=pipelined_upload,
+        max_queued_uploads=max_queued_uploads,
+        remove_uploaded_files=remove_uploaded_files,
+    )
+    if not dry_run:
+        return
+
+    for nwbfile_name, conversion_plan in conversion_plans.items():
+        print(f"\n{nwbfile_name}{conversion_plan}")
+
+    total_size_in_bytes = sum(plan.projected_size_in_bytes for plan in conversion_plans.values())
+    total_write_time_in_seconds = sum(plan.projected_write_time_in_seconds for plan in conversion_plans.values())
+    maximum_peak_memory_in_bytes = max(
+        (plan.projected_peak_memory_in_bytes for plan in conversion_plans.values()), default=0
+    )
+    print(
+        f"\n{len(conversion_plans)} files: {human_readable_size(total_size_in_bytes)} in total, "
+        f"{total_write_time_in_seconds:.1f} s of writing, "
+        f"at most {human_readable_size(maximum_peak_memory_in_bytes)} of memory per file"
     )
 
 
@@ -52,7 +100,11 @@ def run_conversion_from_yaml(
     data_folder_path: DirectoryPath | None = None,
     output_folder_path: DirectoryPath | None = None,
     overwrite: bool = False,
-) -> None:
+    dry_run: bool = False,
+    pipelined_upload: bool = False,
+    max_queued_uploads: int = 1,
+    remove_uploaded_files: bool = False,
+) -> dict[str, ConversionPlan] | None:
     """
     Run conversion to NWB given a yaml specification file.
 
@@ -69,6 +121,22 @@ def run_conversion_from_yaml(
     overwrite : bool, default: False
         If True, replaces any existing NWBFile at the nwbfile_path location, if save_to_file is True.
         If False, appends the existing NWBFile at the nwbfile_path location, if save_to_file is True.
+    dry_run : bool, default: False
+        If True, nothing is written nor uploaded: the conversion of each session is planned instead, with
+        `NWBConverter.plan_conversion`, and the plans are returned. The command line prints them.
+    pipelined_upload : bool, default: False
+        With 'upload_to_dandiset' in the specification, upload each file in the background as soon as it is
+        written, while the later sessions convert, instead of uploading the whole folder once all are written.
+        See `DandiUploadPipeline`.
+    max_queued_uploads : int, default: 1
+        With `pipelined_upload`, the most written files waiting to be uploaded; the conversion waits for room.
+    remove_uploaded_files : bool, default: False
+        With `pipelined_upload`, whether to remove each file once it is uploaded, to limit the disk it takes.
+
+    Returns
+    -------
+    dict of ConversionPlan, optional
+        With `dry_run`, the plan of each file, by the name it would be written under.
     """
     from dandi.organize import create_unique_filenames_from_metadata
     from dandi.pynwb_utils import _get_pynwb_metadata
@@ -103,6 +171,8 @@ def run_conversion_from_yaml(
     )
 
     upload_to_dandiset = "upload_to_dandiset" in specification
+    if pipelined_upload and not upload_to_dandiset:
+        raise ValueError("A pipelined upload requires 'upload_to_dandiset' in the YAML specification.")
     if upload_to_dandiset:
         dandiset_id = specification["upload_to_dandiset"]
         sandbox = (
@@ -110,7 +180,7 @@ def run_conversion_from_yaml(
         )  # This is a heuristic for determining sandboxed Dandiset from the ID alone -- see https://github.com/catalystneuro/neuroconv/pull/1588 for more details
         # Check for the appropriate API key based on whether this is a sandbox upload
         expected_env_var = "DANDI_SANDBOX_API_KEY" if sandbox else "DANDI_API_KEY"
-        if not os.getenv(expected_env_var):
+        if not os.getenv(expected_env_var) and not dry_run:
             message = (
                 "The 'upload_to_dandiset' prompt was found in the YAML specification, "
                 f"but the environment variable '{expected_env_var}' was not set."
@@ -127,50 +197,75 @@ def run_conversion_from_yaml(
         "CustomNWBConverter", (NWBConverter,), dict(data_interface_classes=data_interface_classes)
     )
 
+    conversion_plans = dict()
     file_counter = 0
-    for experiment in specification["experiments"].values():
-        experiment_metadata = experiment.get("metadata", dict())
-        for session in experiment["sessions"]:
-            file_counter += 1
-
-            source_data = session["source_data"]
-            for interface_name, interface_source_data in session["source_data"].items():
-                for key, value in interface_source_data.items():
-                    if key == "file_paths":
-                        source_data[interface_name].update({key: [str(Path(data_folder_path) / x) for x in value]})
-                    elif key in ("file_path", "folder_path"):
-                        source_data[interface_name].update({key: str(Path(data_folder_path) / value)})
-
-            converter = CustomNWBConverter(source_data=source_data)
-
-            metadata = converter.get_metadata()
-            for metadata_source in [global_metadata, experiment_metadata, session.get("metadata", dict())]:
-                metadata = dict_deep_update(metadata, metadata_source)
-
-            session_id = session.get("metadata", dict()).get("NWBFile", dict()).get("session_id", None)
-            if upload_to_dandiset and session_id is None:
-                message = (
-                    "The 'upload_to_dandiset' prompt was found in the YAML specification, "
-                    "but the 'session_id' was not found for session with info block: "
-                    f"\n\n {json.dumps(obj=session, indent=2)}\n\n"
-                    "File intended for DANDI upload must include a session ID."
+    # Uploading in the background while the later sessions convert
+    upload_pipeline = None
+    if upload_to_dandiset and pipelined_upload and not dry_run:
+        upload_pipeline = DandiUploadPipeline(
+            dandiset_id=specification["upload_to_dandiset"],
+            sandbox=int(specification["upload_to_dandiset"]) >= 200_000,
+            max_queued_files=max_queued_uploads,
+            remove_uploaded_files=remove_uploaded_files,
+        )
+    with upload_pipeline or nullcontext():
+        for experiment in specification["experiments"].values():
+            experiment_metadata = experiment.get("metadata", dict())
+            for session in experiment["sessions"]:
+                file_counter += 1
+
+                source_data = session["source_data"]
+                for interface_name, interface_source_data in session["source_data"].items():
+                    for key, value in interface_source_data.items():
+                        if key == "file_paths":
+                            source_data[interface_name].update({key: [str(Path(data_folder_path) / x) for x in value]})
+                        elif key in ("file_path", "folder_path"):
+                            source_data[interface_name].update({key: str(Path(data_folder_path) / value)})
+
+                converter = CustomNWBConverter(source_data=source_data)
+
+                metadata = converter.get_metadata()
+                for metadata_source in [global_metadata, experiment_metadata, session.get("metadata", dict())]:
+                    metadata = dict_deep_update(metadata, metadata_source)
+
+                session_id = session.get("metadata", dict()).get("NWBFile", dict()).get("session_id", None)
+                if upload_to_dandiset and session_id is None:
+                    message = (
+                        "The 'upload_to_dandiset' prompt was found in the YAML specification, "
+                        "but the 'session_id' was not found for session with info block: "
+                        f"\n\n {json.dumps(obj=session, indent=2)}\n\n"
+                        "File intended for DANDI upload must include a session ID."
+                    )
+                    raise ValueError(message)
+
+                session_conversion_options = session.get("conversion_options", dict())
+                conversion_options = dict()
+                for key in converter.data_interface_objects:
+                    conversion_options[key] = dict(
+                        session_conversion_options.get(key, dict()), **global_conversion_options
+                    )
+
+                nwbfile_name = session.get("nwbfile_name", f"temp_nwbfile_name_{file_counter}").strip(".nwb")
+                if dry_run:
+                    conversion_plan = converter.plan_conversion(
+                        metadata=metadata, conversion_options=conversion_options
+                    )
+                    conversion_plans[f"{nwbfile_name}.nwb"] = conversion_plan
+                    continue
+
+                converter.run_conversion(
+                    nwbfile_path=output_folder_path / f"{nwbfile_name}.nwb",
+                    metadata=metadata,
+                    overwrite=overwrite,
+                    conversion_options=conversion_options,
                 )
-                raise ValueError(message)
-
-            session_conversion_options = session.get("conversion_options", dict())
-            conversion_options = dict()
-            for key in converter.data_interface_objects:
-                conversion_options[key] = dict(session_conversion_options.get(key, dict()), **global_conversion_options)
-
-            nwbfile_name = session.get("nwbfile_name", f"temp_nwbfile_name_{file_counter}").strip(".nwb")
-            converter.run_conversion(
-                nwbfile_path=output_folder_path / f"{nwbfile_name}.nwb",
-                metadata=metadata,
-                overwrite=overwrite,
-                conversion_options=conversion_options,
-            )
+                if upload_pipeline is not None:
+                    upload_pipeline.submit(nwbfile_path=output_folder_path / f"{nwbfile_name}.nwb")
 
-    if upload_to_dandiset:
+    if dry_run:
+        return conversion_plans
+
+    if upload_to_dandiset and not pipelined_upload:
         dandiset_id = specification["upload_to_dandiset"]
         sandbox = (
             int(dandiset_id) >= 200_000
@@ -181,6 +276,7 @@ def run_conversion_from_yaml(
             sandbox=sandbox,
         )
 
+    if upload_to_dandiset:
         return None  # We can early return since organization below will occur within the upload step
 
     # To properly mimic a true dandi organization, the full directory must be populated with NWBFiles.
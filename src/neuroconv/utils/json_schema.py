@@ -1,4 +1,6 @@
 import collections.abc
+import copy
+import functools
 import inspect
 import json
 import typing
@@ -12,7 +14,9 @@ import hdmf.data_utils
 import numpy as np
 import pydantic
 import pynwb
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from pynwb.device import Device
 from pynwb.icephys import IntracellularElectrode
 
@@ -202,12 +206,35 @@ def get_base_schema(
     return base_schema
 
 
+# Schemas already generated from a method signature, by method and excluded arguments
+_method_signature_schemas: dict[tuple, dict[str, Any]] = dict()
+
+
+def _get_method_signature_cache_key(method: Callable, exclude: list[str]) -> tuple | None:
+    """
+    The key of the schema of a method in the cache, or None for a method that cannot be hashed.
+
+    A method bound to an instance is keyed by its function: the instance it is bound to does not change its
+    signature, and keying by the bound method would keep every instance it was asked for alive.
+    """
+    function = method.__func__ if inspect.ismethod(method) and not inspect.isclass(method.__self__) else method
+    try:
+        hash(function)
+    except TypeError:
+        return None
+
+    return function, tuple(sorted(exclude))
+
+
 def get_json_schema_from_method_signature(method: Callable, exclude: list[str] | None = None) -> dict[str, Any]:
     """
     Get the equivalent JSON schema for a signature of a method.
 
     Also uses `docstring_parser` (NumPy style) to attempt to find descriptions for the arguments.
 
+    The schema of each method is generated once and a copy of it returned on every later call, so that schemas
+    asked for repeatedly (on every validation of source data or conversion options) cost only the copy.
+
     Parameters
     ----------
     method : callable
@@ -221,8 +248,22 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
     json_schema : dict
         The JSON schema corresponding to the method signature.
     """
-    exclude = exclude or []
-    exclude += ["self", "cls"]
+    exclude = list(exclude or []) + ["self", "cls"]
+
+    cache_key = _get_method_signature_cache_key(method=method, exclude=exclude)
+    if cache_key is None:
+        return _generate_json_schema_from_method_signature(method=method, exclude=exclude)
+
+    if cache_key not in _method_signature_schemas:
+        _method_signature_schemas[cache_key] = _generate_json_schema_from_method_signature(
+            method=method, exclude=exclude
+        )
+
+    return copy.deepcopy(_method_signature_schemas[cache_key])
+
+
+def _generate_json_schema_from_method_signature(method: Callable, exclude: list[str]) -> dict[str, Any]:
+    """Generate the JSON schema of a method signature; see `get_json_schema_from_method_signature`."""
 
     split_qualname = method.__qualname__.split(".")[-2:]
     method_display = ".".join(split_qualname) if "<" not in split_qualname[0] else method.__name__
@@ -295,7 +336,7 @@ def get_json_schema_from_method_signature(method: Callable, exclude: list[str] |
                 f"The argument_name '{parameter_in_docstring.arg_name}' from the docstring of method "
                 f"'{method_display}' does not occur in the signature, possibly due to a typo."
             )
-            warnings.warn(message=message, stacklevel=2)
+            warnings.warn(message=message, stacklevel=3)
             continue
 
         if parameter_in_docstring.description is not None:
@@ -507,14 +548,97 @@ def get_metadata_schema_for_icephys() -> dict[str, Any]:
     return schema
 
 
+def _to_json_types(obj: Any, encoder: json.JSONEncoder) -> Any:
+    """
+    Convert an object to the types JSON decodes to, as encoding it with `encoder` and decoding it back would.
+
+    Only the values the encoder has to handle itself (datetimes, paths, NumPy values and so on) are converted, so
+    the dictionaries to validate are not serialized to a string and parsed again as a whole.
+    """
+    if isinstance(obj, dict):
+        return {_to_json_key(key): _to_json_types(obj=value, encoder=encoder) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_types(obj=value, encoder=encoder) for value in obj]
+    if obj is None or isinstance(obj, (str, int, float)):  # bool is a subclass of int
+        return obj
+
+    return _to_json_types(obj=encoder.default(obj), encoder=encoder)
+
+
+def _to_json_key(key: Any) -> str:
+    """The string a key of a dictionary becomes in JSON."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, (bool, type(None))):
+        return json.dumps(key)
+
+    return str(key)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_validator_for_schema_text(schema_text: str) -> Validator:
+    schema = json.loads(schema_text)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+# Keywords that annotate a schema without constraining what it accepts
+_ANNOTATION_KEYWORDS = ("default", "description", "title", "examples")
+# Keywords mapping names of the user's choosing to subschemas
+_SUBSCHEMA_MAPPING_KEYWORDS = ("properties", "patternProperties", "$defs", "definitions", "dependentSchemas")
+# Keywords holding instances rather than subschemas
+_INSTANCE_KEYWORDS = ("enum", "const")
+
+
+def _strip_annotations(schema: Any) -> Any:
+    """A copy of a schema without its annotations, which accepts exactly what the schema accepts."""
+    if isinstance(schema, list):
+        return [_strip_annotations(schema=subschema) for subschema in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    stripped_schema = dict()
+    for keyword, value in schema.items():
+        if keyword in _ANNOTATION_KEYWORDS:
+            continue
+        if keyword in _INSTANCE_KEYWORDS:
+            stripped_schema[keyword] = value
+        elif keyword in _SUBSCHEMA_MAPPING_KEYWORDS and isinstance(value, dict):
+            stripped_schema[keyword] = {name: _strip_annotations(schema=subschema) for name, subschema in value.items()}
+        else:
+            stripped_schema[keyword] = _strip_annotations(schema=value)
+
+    return stripped_schema
+
+
+def _get_validator(schema: dict[str, Any]) -> Validator:
+    """
+    The validator of a schema, checked against its meta-schema and compiled once per distinct schema.
+
+    Schemas are usually assembled anew on each call (from the interfaces of a converter, say), and metadata schemas
+    carry defaults that differ from one call to the next (a new identifier, for one), so validators are keyed by
+    what the schema accepts rather than by the dictionary holding it.
+    """
+    schema_text = json.dumps(_strip_annotations(schema=schema), sort_keys=True, cls=_GenericNeuroconvEncoder)
+    return _get_validator_for_schema_text(schema_text)
+
+
+def _validate_instance(instance: Any, schema: dict[str, Any], encoder: json.JSONEncoder) -> None:
+    """
+    Validate an instance against a schema, as `jsonschema.validate` does, with a validator compiled once per schema.
+
+    Values JSON cannot hold are first converted by the encoder the instance would be serialized with.
+    """
+    validator = _get_validator(schema=schema)
+    error = best_match(validator.iter_errors(_to_json_types(obj=instance, encoder=encoder)))
+    if error is not None:
+        raise error
+
+
 def validate_metadata(metadata: dict[str, dict], schema: dict[str, dict], verbose: bool = False):
     """Validate metadata against a schema."""
-    encoder = _NWBMetaDataEncoder()
-    # The encoder produces a serialized object, so we deserialized it for comparison
-
-    serialized_metadata = encoder.encode(metadata)
-    decoded_metadata = json.loads(serialized_metadata)
-    validate(instance=decoded_metadata, schema=schema)
+    _validate_instance(instance=metadata, schema=schema, encoder=_NWBMetaDataEncoder())
     _validate_device_registry_names(metadata)
     if verbose:
         print("Metadata is valid!")
@@ -1,3 +1,5 @@
+import inspect
+import time
 import unittest
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,7 @@ from neuroconv import (
     ConverterPipe,
     NWBConverter,
 )
+from neuroconv.converters import converter_list
 from neuroconv.tools.testing.mock_interfaces import MockInterface
 from neuroconv.utils import DeepDict
 
@@ -260,3 +263,48 @@ def test_nested_converter_receives_its_conversion_options():
     )
 
     assert nwbfile.subject is not None
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_concurrent_metadata_merges_in_interface_order(max_workers):
+    """Interfaces answering out of order are still merged in their own order, so later ones win as before."""
+
+    class SlowMetadataInterface(BaseDataInterface):
+        def __init__(self, session_description: str, delay: float):
+            super().__init__(session_description=session_description, delay=delay)
+
+        def get_metadata(self, *, use_new_metadata_format: bool = True) -> DeepDict:
+            time.sleep(self.source_data["delay"])
+            metadata = super().get_metadata()
+            metadata["NWBFile"]["session_description"] = self.source_data["session_description"]
+            return metadata
+
+        def add_to_nwbfile(self, nwbfile: NWBFile, metadata: dict | None = None):
+            pass
+
+    data_interfaces = dict(
+        First=SlowMetadataInterface(session_description="first", delay=0.0),
+        Second=SlowMetadataInterface(session_description="second", delay=0.2),
+        Third=SlowMetadataInterface(session_description="third", delay=0.0),
+    )
+    converter = ConverterPipe(data_interfaces=data_interfaces)
+
+    metadata = converter.get_metadata(max_workers=max_workers)
+
+    assert metadata["NWBFile"]["session_description"] == "third"
+    assert list(converter.metadata_latencies) == ["First", "Second", "Third"]
+    assert converter.metadata_latencies["Second"] >= 0.2
+
+
+@pytest.mark.parametrize("converter_class", converter_list, ids=lambda converter_class: converter_class.__name__)
+def test_every_converter_gathers_metadata_on_threads(converter_class):
+    assert "max_workers" in inspect.signature(converter_class.get_metadata).parameters
+
+
+def test_run_conversion_gathers_metadata_on_threads(tmp_path):
+    converter = ConverterPipe(data_interfaces=dict(First=MockInterface(), Second=MockInterface()))
+    assert converter.metadata_latencies == dict()
+
+    converter.run_conversion(nwbfile_path=tmp_path / "converted.nwb", max_metadata_workers=2)
+
+    assert list(converter.metadata_latencies) == ["First", "Second"]
@@ -1,10 +1,13 @@
 from datetime import datetime
 
+import pytest
+from jsonschema.exceptions import ValidationError
 from pynwb import NWBFile
 
-from neuroconv import ConverterPipe
+from neuroconv import ConverterPipe, NWBConverter
 from neuroconv.tools.testing.mock_interfaces import (
     MockInterface,
+    MockRecordingInterface,
 )
 
 
@@ -81,3 +84,16 @@ def test_conversion_options_validation_with_type_and_callable(tmp_path):
 
     nwbfile_path = tmp_path / "converter_test.nwb"
     converter.run_conversion(nwbfile_path=nwbfile_path, overwrite=True, conversion_options=conversion_options)
+
+
+def test_validate_source():
+    MockRecordingInterface.validate_source(source_data=dict(num_channels=4, durations=(1.0,)))
+    with pytest.raises(ValidationError, match="'not_an_argument' was unexpected"):
+        MockRecordingInterface.validate_source(source_data=dict(not_an_argument=1))
+
+    class MockConverter(NWBConverter):
+        data_interface_classes = dict(Recording=MockRecordingInterface)
+
+    MockConverter.validate_source(source_data=dict(Recording=dict(num_channels=4)))
+    with pytest.raises(ValidationError, match="'four' is not of type 'integer'"):
+        MockConverter.validate_source(source_data=dict(Recording=dict(num_channels="four")))
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 
+import h5py
 import pytest
 from numpy.testing import assert_array_equal
 from pynwb import read_nwb
@@ -59,6 +60,45 @@ def test_base_data_interface_append_on_disk(tmp_path, backend):
     nwbfile.read_io.close()
 
 
+def _get_size_on_disk(path) -> int:
+    return path.stat().st_size if path.is_file() else sum(file.stat().st_size for file in path.rglob("*"))
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_append_on_disk_cost_follows_the_new_data(tmp_path, backend):
+    """Appending the same interface grows a file by the same amount whatever the file already holds.
+
+    The file first written holds one TimeSeries whose size differs a hundredfold between the two files.
+    """
+    suffix = ".nwb" if backend == "hdf5" else ".nwb.zarr"
+    growth_by_duration = dict()
+    for duration in (0.1, 10.0):
+        nwbfile_path = tmp_path / f"existing_{duration}{suffix}"
+        interface = MockTimeSeriesInterface(num_channels=8, duration=duration, metadata_key="Existing")
+        metadata = interface.get_metadata()
+        interface.run_conversion(nwbfile_path=nwbfile_path, metadata=metadata, backend=backend)
+
+        if backend == "hdf5":
+            with h5py.File(nwbfile_path, mode="r") as file:
+                existing_chunk_offset = file["acquisition/Existing/data"].id.get_chunk_info(0).byte_offset
+        size_before_append = _get_size_on_disk(nwbfile_path)
+
+        appended_interface = MockTimeSeriesInterface(num_channels=2, duration=0.1, metadata_key="Appended")
+        appended_metadata = appended_interface.get_metadata()
+        appended_interface.run_conversion(
+            nwbfile_path=nwbfile_path, metadata=appended_metadata, append_on_disk_nwbfile=True
+        )
+        growth_by_duration[duration] = _get_size_on_disk(nwbfile_path) - size_before_append
+
+        # The existing data stays where it was written rather than being rewritten
+        if backend == "hdf5":
+            with h5py.File(nwbfile_path, mode="r") as file:
+                assert file["acquisition/Existing/data"].id.get_chunk_info(0).byte_offset == existing_chunk_offset
+
+    size_of_larger_existing_data = 8 * 30_000 * 10 * 8
+    assert abs(growth_by_duration[10.0] - growth_by_duration[0.1]) < size_of_larger_existing_data / 100
+
+
 class TestBackendConfigurationRequiresTheFileItDescribes:
     """`run_conversion` adds this conversion's data after a caller could have built a configuration.
 
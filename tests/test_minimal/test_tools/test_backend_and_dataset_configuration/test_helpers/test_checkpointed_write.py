@@ -0,0 +1,175 @@
+"""Tests for resuming an interrupted write from the checkpoints of its iterative datasets."""
+
+import numpy as np
+import pytest
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import BACKEND_NWB_IO, configure_and_write_nwbfile
+
+
+class InterruptedConversion(Exception):
+    pass
+
+
+class CountingDataChunkIterator(SliceableDataChunkIterator):
+    """Counts the selections read, and raises on reading the one after `maximum_reads` when that is set."""
+
+    def __init__(self, *args, maximum_reads: int | None = None, **kwargs):
+        self.maximum_reads = maximum_reads
+        self.read_selections = []
+        super().__init__(*args, **kwargs)
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        if self.maximum_reads is not None and len(self.read_selections) == self.maximum_reads:
+            raise InterruptedConversion()
+        self.read_selections.append(selection)
+        return super()._get_data(selection=selection)
+
+
+@pytest.fixture
+def data() -> np.ndarray:
+    return np.random.default_rng(seed=0).integers(low=-100, high=100, size=(1_000, 4), dtype="int16")
+
+
+def create_test_nwbfile(
+    data: np.ndarray,
+    maximum_reads: int | None = None,
+    identifier: str = "checkpointed-session",
+    in_memory_data: np.ndarray | None = None,
+) -> "NWBFile":
+    iterator = CountingDataChunkIterator(
+        data=data, chunk_shape=(100, 4), buffer_shape=(200, 4), maximum_reads=maximum_reads
+    )
+    # A resumed write keeps the rest of the file, so it is only resumed for the same identifier and in-memory data
+    nwbfile = mock_NWBFile(identifier=identifier)
+    nwbfile.add_acquisition(mock_TimeSeries(name="Iterative", data=iterator))
+    in_memory_data = np.arange(100, dtype="float64") if in_memory_data is None else in_memory_data
+    nwbfile.add_acquisition(mock_TimeSeries(name="InMemory", data=in_memory_data))
+    return nwbfile
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_interrupted_write_resumes_from_the_unfinished_buffers(tmp_path, data, backend):
+    nwbfile_path = tmp_path / f"resumed.nwb{'.zarr' if backend == 'zarr' else ''}"
+    checkpoint_folder_path = tmp_path / "checkpoints"
+
+    with pytest.raises(InterruptedConversion):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(data=data, maximum_reads=3),
+            nwbfile_path=nwbfile_path,
+            backend=backend,
+            checkpoint_folder_path=checkpoint_folder_path,
+        )
+    assert any(checkpoint_folder_path.glob("*.journal"))
+
+    nwbfile = create_test_nwbfile(data=data)
+    iterator = nwbfile.acquisition["Iterative"].data
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile,
+        nwbfile_path=nwbfile_path,
+        backend=backend,
+        checkpoint_folder_path=checkpoint_folder_path,
+    )
+
+    # Five buffers in all, of which the first three were written before the interruption
+    assert [selection[0] for selection in iterator.read_selections] == [slice(600, 800), slice(800, 1_000)]
+    assert not checkpoint_folder_path.exists()
+    with BACKEND_NWB_IO[backend](nwbfile_path, mode="r") as io:
+        read_nwbfile = io.read()
+        np.testing.assert_array_equal(read_nwbfile.acquisition["Iterative"].data[:], data)
+        if backend == "hdf5":
+            assert read_nwbfile.acquisition["Iterative"].data.chunks == (100, 4)
+
+
+def test_checkpoint_for_other_settings_is_written_again(tmp_path, data):
+    nwbfile_path = tmp_path / "resumed.nwb"
+    checkpoint_folder_path = tmp_path / "checkpoints"
+    with pytest.raises(InterruptedConversion):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(data=data, maximum_reads=3),
+            nwbfile_path=nwbfile_path,
+            backend="hdf5",
+            checkpoint_folder_path=checkpoint_folder_path,
+        )
+
+    shifted_data = data + 1
+    nwbfile = create_test_nwbfile(data=shifted_data)
+    iterator = nwbfile.acquisition["Iterative"].data
+    with pytest.warns(UserWarning, match="written again from its start"):
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend="hdf5", checkpoint_folder_path=checkpoint_folder_path
+        )
+
+    assert len(iterator.read_selections) == 5
+    with BACKEND_NWB_IO["hdf5"](nwbfile_path, mode="r") as io:
+        np.testing.assert_array_equal(io.read().acquisition["Iterative"].data[:], shifted_data)
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_checkpointed_datasets_are_written_once_into_the_file(tmp_path, data, backend):
+    nwbfile_path = tmp_path / f"resumed.nwb{'.zarr' if backend == 'zarr' else ''}"
+    checkpoint_folder_path = tmp_path / "checkpoints"
+    with pytest.raises(InterruptedConversion):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(data=data, maximum_reads=3),
+            nwbfile_path=nwbfile_path,
+            backend=backend,
+            checkpoint_folder_path=checkpoint_folder_path,
+        )
+
+    # The buffers written before the interruption are in the file itself, and the folder holds only journals
+    assert all(path.suffix == ".journal" for path in checkpoint_folder_path.iterdir())
+    with BACKEND_NWB_IO[backend](nwbfile_path, mode="r") as io:
+        np.testing.assert_array_equal(io.read().acquisition["Iterative"].data[:600], data[:600])
+
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(data=data),
+        nwbfile_path=nwbfile_path,
+        backend=backend,
+        checkpoint_folder_path=checkpoint_folder_path,
+    )
+
+    with BACKEND_NWB_IO[backend](nwbfile_path, mode="r") as io:
+        read_nwbfile = io.read()
+        assert read_nwbfile.identifier == "checkpointed-session"
+        np.testing.assert_array_equal(read_nwbfile.acquisition["Iterative"].data[:], data)
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+@pytest.mark.parametrize(
+    "changes",
+    [dict(identifier="corrected-session"), dict(in_memory_data=np.arange(100, dtype="float64") + 1)],
+    ids=["metadata", "in_memory_data"],
+)
+def test_checkpoint_for_another_rest_of_the_file_is_written_again(tmp_path, data, backend, changes):
+    nwbfile_path = tmp_path / f"resumed.nwb{'.zarr' if backend == 'zarr' else ''}"
+    checkpoint_folder_path = tmp_path / "checkpoints"
+    with pytest.raises(InterruptedConversion):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(data=data, maximum_reads=3),
+            nwbfile_path=nwbfile_path,
+            backend=backend,
+            checkpoint_folder_path=checkpoint_folder_path,
+        )
+
+    corrected_nwbfile = create_test_nwbfile(data=data, **changes)
+    iterator = corrected_nwbfile.acquisition["Iterative"].data
+    with pytest.warns(UserWarning, match="written again from its start"):
+        configure_and_write_nwbfile(
+            nwbfile=corrected_nwbfile,
+            nwbfile_path=nwbfile_path,
+            backend=backend,
+            checkpoint_folder_path=checkpoint_folder_path,
+        )
+
+    # The metadata and in-memory data of the interrupted run are not kept
+    assert len(iterator.read_selections) == 5
+    with BACKEND_NWB_IO[backend](nwbfile_path, mode="r") as io:
+        read_nwbfile = io.read()
+        assert read_nwbfile.identifier == corrected_nwbfile.identifier
+        np.testing.assert_array_equal(
+            read_nwbfile.acquisition["InMemory"].data[:], corrected_nwbfile.acquisition["InMemory"].data
+        )
+        np.testing.assert_array_equal(read_nwbfile.acquisition["Iterative"].data[:], data)
@@ -0,0 +1,83 @@
+"""Tests for projecting the size, time and memory of a conversion without writing the file."""
+
+import h5py
+import numpy as np
+import pytest
+from hdmf.data_utils import DataChunkIterator
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv import ConverterPipe
+from neuroconv.tools.nwb_helpers import (
+    MemoryBudget,
+    get_default_backend_configuration,
+    plan_nwbfile_write,
+)
+from neuroconv.tools.testing.mock_interfaces import (
+    MockPoseEstimationInterface,
+    MockRecordingInterface,
+)
+
+
+def test_plan_matches_the_written_file(tmp_path):
+    interface = MockRecordingInterface(num_channels=8, durations=(2.0,))
+
+    conversion_plan = interface.plan_conversion()
+    assert not any(tmp_path.iterdir())
+
+    dataset_plan = conversion_plan.dataset_plans["acquisition/ElectricalSeries/data"]
+    assert dataset_plan.is_iterative
+    assert dataset_plan.uncompressed_size_in_bytes == 8 * 60_000 * 4
+    assert dataset_plan.compression_ratio > 0
+    assert dataset_plan.buffer_size_in_bytes > 0
+    assert conversion_plan.projected_peak_memory_in_bytes >= (
+        conversion_plan.resident_memory_in_bytes + dataset_plan.buffer_size_in_bytes
+    )
+    assert "acquisition/ElectricalSeries/data" in str(conversion_plan)
+
+    # The random traces of the mock compress much as their samples do
+    nwbfile_path = tmp_path / "planned.nwb"
+    interface.run_conversion(nwbfile_path=nwbfile_path)
+    with h5py.File(nwbfile_path, mode="r") as file:
+        stored_size_in_bytes = file["acquisition/ElectricalSeries/data"].id.get_storage_size()
+    assert dataset_plan.projected_size_in_bytes == pytest.approx(stored_size_in_bytes, rel=0.1)
+
+
+def test_plan_of_a_converter_lists_linked_timestamps():
+    pose_interface = MockPoseEstimationInterface(num_samples=50, num_nodes=2)
+    pose_interface.set_aligned_timestamps(
+        aligned_timestamps=np.cumsum(np.random.default_rng(seed=0).uniform(low=0.02, high=0.04, size=50))
+    )
+    converter = ConverterPipe(data_interfaces=dict(Recording=MockRecordingInterface(), Pose=pose_interface))
+
+    conversion_plan = converter.plan_conversion(backend="zarr")
+
+    assert conversion_plan.backend == "zarr"
+    assert len(conversion_plan.linked_locations) == 1
+    assert conversion_plan.linked_locations[0] not in conversion_plan.dataset_plans
+    assert "acquisition/ElectricalSeries/data" in conversion_plan.dataset_plans
+
+
+def test_plan_nwbfile_write():
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="InMemory", data=np.zeros(shape=(10_000, 4), dtype="int16")))
+    nwbfile.add_acquisition(mock_TimeSeries(name="ReadOnce", data=DataChunkIterator(data=np.ones(1_000))))
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+
+    with MemoryBudget(budget_gb=1e-6):
+        conversion_plan = plan_nwbfile_write(nwbfile=nwbfile, backend_configuration=backend_configuration)
+
+    in_memory_plan = conversion_plan.dataset_plans["acquisition/InMemory/data"]
+    assert in_memory_plan.buffer_size_in_bytes == 0
+    assert in_memory_plan.compression_ratio > 10
+    assert in_memory_plan.projected_size_in_bytes < in_memory_plan.uncompressed_size_in_bytes
+
+    # An iterator that can only be read once is not sampled, and stays whole for the write
+    read_once_plan = conversion_plan.dataset_plans["acquisition/ReadOnce/data"]
+    assert not read_once_plan.is_sampled
+    assert read_once_plan.projected_size_in_bytes == read_once_plan.uncompressed_size_in_bytes
+    assert read_once_plan.projected_write_time_in_seconds is None
+
+    # Under a budget, the buffer is read in pieces of at most its share, and of at least one chunk
+    chunk_shape = backend_configuration.dataset_configurations["acquisition/ReadOnce/data"].chunk_shape
+    assert read_once_plan.buffer_size_in_bytes == max(1_000, chunk_shape[0] * 8)
@@ -0,0 +1,163 @@
+"""Tests for reusing datasets already written, through a cache addressed by their source and storage settings."""
+
+import numpy as np
+import pytest
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import (
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+)
+from neuroconv.tools.testing.mock_interfaces import MockRecordingInterface
+
+
+def create_test_nwbfile(memmap: np.memmap) -> "NWBFile":
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="InMemory", data=np.arange(1_000, dtype="int32").reshape(-1, 4)))
+    nwbfile.add_acquisition(mock_TimeSeries(name="Memmapped", data=SliceableDataChunkIterator(data=memmap)))
+    nwbfile.add_trial(start_time=0.0, stop_time=1.0)
+    nwbfile.add_trial(start_time=1.0, stop_time=2.0)
+    return nwbfile
+
+
+@pytest.fixture
+def memmap(tmp_path) -> np.memmap:
+    memmap = np.memmap(tmp_path / "source.dat", dtype="int16", mode="w+", shape=(2_000, 8))
+    memmap[:] = np.random.default_rng(seed=0).integers(low=-100, high=100, size=memmap.shape)
+    memmap.flush()
+    return np.memmap(tmp_path / "source.dat", dtype="int16", mode="r", shape=(2_000, 8))
+
+
+def test_dataset_cache_reuses_unchanged_datasets(tmp_path, memmap, monkeypatch):
+    cache_folder_path = tmp_path / "cache"
+
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(memmap=memmap),
+        nwbfile_path=tmp_path / "first.nwb",
+        backend="hdf5",
+        dataset_cache_folder_path=cache_folder_path,
+    )
+    cache_entries = sorted(cache_folder_path.iterdir())
+    assert len(cache_entries) == 4  # Two series and two trial columns
+
+    # A cache hit copies the stored dataset, so the source is never read again
+    def fail_on_read(self, selection):
+        raise AssertionError("The cached source was read!")
+
+    monkeypatch.setattr(SliceableDataChunkIterator, "_get_data", fail_on_read)
+
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(memmap=memmap),
+        nwbfile_path=tmp_path / "second.nwb",
+        backend="hdf5",
+        dataset_cache_folder_path=cache_folder_path,
+    )
+    assert sorted(cache_folder_path.iterdir()) == cache_entries
+
+    with NWBHDF5IO(tmp_path / "second.nwb", mode="r") as io:
+        nwbfile = io.read()
+        memmapped_data = nwbfile.acquisition["Memmapped"].data
+        np.testing.assert_array_equal(memmapped_data[:], memmap[:])
+        assert memmapped_data.compression == "gzip"
+        np.testing.assert_array_equal(nwbfile.acquisition["InMemory"].data[:], np.arange(1_000).reshape(-1, 4))
+        np.testing.assert_array_equal(nwbfile.trials["start_time"][:], [0.0, 1.0])
+        # Table columns are still expandable once copied from the cache
+        assert nwbfile.trials.start_time.data.maxshape == (None,)
+
+
+def test_dataset_cache_misses_on_changed_settings(tmp_path, memmap):
+    cache_folder_path = tmp_path / "cache"
+
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(memmap=memmap),
+        nwbfile_path=tmp_path / "first.nwb",
+        backend="hdf5",
+        dataset_cache_folder_path=cache_folder_path,
+    )
+    cache_entries = set(cache_folder_path.iterdir())
+
+    nwbfile = create_test_nwbfile(memmap=memmap)
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.dataset_configurations["acquisition/Memmapped/data"].compression_method = "lzf"
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile,
+        nwbfile_path=tmp_path / "second.nwb",
+        backend_configuration=backend_configuration,
+        dataset_cache_folder_path=cache_folder_path,
+    )
+
+    new_cache_entries = set(cache_folder_path.iterdir()) - cache_entries
+    assert len(new_cache_entries) == 1
+
+    with NWBHDF5IO(tmp_path / "second.nwb", mode="r") as io:
+        nwbfile = io.read()
+        assert nwbfile.acquisition["Memmapped"].data.compression == "lzf"
+        np.testing.assert_array_equal(nwbfile.acquisition["Memmapped"].data[:], memmap[:])
+
+
+def test_dataset_cache_across_conversions(tmp_path, monkeypatch):
+    """A second run with edited metadata reuses the recording, which SpikeInterface identifies by its description."""
+    from neuroconv.tools.spikeinterface.spikeinterfacerecordingdatachunkiterator import (
+        SpikeInterfaceRecordingDataChunkIterator,
+    )
+
+    cache_folder_path = tmp_path / "cache"
+    interface = MockRecordingInterface(num_channels=4, durations=[1.0])
+    metadata = interface.get_metadata()
+    interface.run_conversion(
+        nwbfile_path=tmp_path / "first.nwb", metadata=metadata, dataset_cache_folder_path=cache_folder_path
+    )
+
+    def fail_on_read(self, selection):
+        raise AssertionError("The cached recording was read!")
+
+    monkeypatch.setattr(SpikeInterfaceRecordingDataChunkIterator, "_get_data", fail_on_read)
+
+    metadata["NWBFile"]["session_description"] = "A corrected description."
+    interface.run_conversion(
+        nwbfile_path=tmp_path / "second.nwb", metadata=metadata, dataset_cache_folder_path=cache_folder_path
+    )
+
+    with NWBHDF5IO(tmp_path / "first.nwb", mode="r") as first_io, NWBHDF5IO(tmp_path / "second.nwb", mode="r") as io:
+        first_nwbfile = first_io.read()
+        nwbfile = io.read()
+        assert nwbfile.session_description == "A corrected description."
+        np.testing.assert_array_equal(
+            nwbfile.acquisition["ElectricalSeries"].data[:], first_nwbfile.acquisition["ElectricalSeries"].data[:]
+        )
+
+
+def test_dataset_cache_rejects_zarr(tmp_path, memmap):
+    with pytest.raises(ValueError, match="only supported for the HDF5 backend"):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(memmap=memmap),
+            nwbfile_path=tmp_path / "file.nwb.zarr",
+            backend="zarr",
+            dataset_cache_folder_path=tmp_path / "cache",
+        )
+
+
+def test_recording_fingerprint_follows_its_source_only(tmp_path, monkeypatch):
+    from spikeinterface.core.generate import generate_recording
+
+    from neuroconv.tools.spikeinterface.spikeinterfacerecordingdatachunkiterator import (
+        SpikeInterfaceRecordingDataChunkIterator,
+    )
+
+    monkeypatch.chdir(tmp_path)
+    recording = generate_recording(num_channels=4, durations=[1.0])
+    weights = np.zeros(shape=(4, 500))
+    recording.set_property(key="weights", values=weights)
+    fingerprint = SpikeInterfaceRecordingDataChunkIterator(recording=recording)._get_source_fingerprint()
+
+    # A file in the working directory named like a channel id is not a file of the recording
+    (tmp_path / str(recording.get_channel_ids()[0])).write_text("unrelated", encoding="utf-8")
+    assert SpikeInterfaceRecordingDataChunkIterator(recording=recording)._get_source_fingerprint() == fingerprint
+
+    # A change deep inside a property too large for numpy to print in full
+    weights[2, 250] = 1.0
+    recording.set_property(key="weights", values=weights)
+    assert SpikeInterfaceRecordingDataChunkIterator(recording=recording)._get_source_fingerprint() != fingerprint
@@ -0,0 +1,172 @@
+"""Tests for the integrity manifest computed while writing, and for checking a file against it."""
+
+import json
+
+import h5py
+import numpy as np
+import pytest
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import (
+    MemoryBudget,
+    WriteProgressMonitor,
+    _integrity_manifest,
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+    verify_integrity_manifest,
+)
+from neuroconv.tools.testing.mock_interfaces import MockRecordingInterface
+
+
+@pytest.fixture
+def iterative_data() -> np.ndarray:
+    return np.random.default_rng(seed=0).integers(low=-100, high=100, size=(1_050, 8), dtype="int16")
+
+
+def create_test_nwbfile(iterative_data: np.ndarray) -> "NWBFile":
+    nwbfile = mock_NWBFile()
+    iterator = SliceableDataChunkIterator(data=iterative_data, chunk_shape=(100, 4), buffer_shape=(300, 8))
+    nwbfile.add_acquisition(mock_TimeSeries(name="Iterative", data=iterator))
+    nwbfile.add_acquisition(mock_TimeSeries(name="InMemory", data=np.arange(500, dtype="float64")))
+    return nwbfile
+
+
+@pytest.fixture
+def datasets_hashed_from_file(monkeypatch) -> list[str]:
+    """The datasets hashed by reading the file back, rather than as they were written."""
+    datasets_hashed_from_file = []
+    hash_dataset = _integrity_manifest._hash_dataset
+
+    def recording_hash_dataset(dataset):
+        datasets_hashed_from_file.append(dataset.name)
+        return hash_dataset(dataset=dataset)
+
+    monkeypatch.setattr(_integrity_manifest, "_hash_dataset", recording_hash_dataset)
+    return datasets_hashed_from_file
+
+
+def test_manifest_is_computed_while_writing(tmp_path, iterative_data, datasets_hashed_from_file):
+    nwbfile_path = tmp_path / "hashed.nwb"
+    manifest_file_path = tmp_path / "hashed.manifest.json"
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(iterative_data=iterative_data),
+        nwbfile_path=nwbfile_path,
+        backend="hdf5",
+        integrity_manifest_file_path=manifest_file_path,
+    )
+
+    manifest = json.loads(manifest_file_path.read_text(encoding="utf-8"))
+    entry = manifest["datasets"]["acquisition/Iterative/data"]
+    assert entry["shape"] == [1_050, 8]
+    assert entry["dtype"] == "int16"
+    assert entry["chunk_shape"] == [100, 4]
+    assert len(entry["chunk_hashes"]) == 11 * 2
+
+    # Only the array held in memory was read back to be hashed
+    assert "/acquisition/Iterative/data" not in datasets_hashed_from_file
+    assert "/acquisition/InMemory/data" in datasets_hashed_from_file
+
+    # The hashes taken in flight are those of the data as written
+    with h5py.File(nwbfile_path, mode="r") as file:
+        assert entry["chunk_hashes"] == _integrity_manifest._hash_dataset(dataset=file["acquisition/Iterative/data"])
+
+    assert verify_integrity_manifest(nwbfile_path=nwbfile_path, manifest_file_path=manifest_file_path) == []
+
+
+def test_manifest_budget_and_progress_share_the_buffer_hooks(tmp_path, iterative_data, datasets_hashed_from_file):
+    nwbfile = create_test_nwbfile(iterative_data=iterative_data)
+    iterator = nwbfile.acquisition["Iterative"].data
+    nwbfile_path = tmp_path / "hashed.nwb"
+    manifest_file_path = tmp_path / "hashed.manifest.json"
+
+    events = list()
+    # Each buffer of 4.8 kB is read in pieces of 1.6 kB, two chunks by eight channels
+    with MemoryBudget(budget_gb=2e-6), WriteProgressMonitor(callbacks=events.append):
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile,
+            nwbfile_path=nwbfile_path,
+            backend="hdf5",
+            integrity_manifest_file_path=manifest_file_path,
+        )
+
+    # Each registers a hook rather than replacing the methods or the buffers of the iterator
+    assert len(iterator._buffer_hooks) == 3
+    assert "_get_data" not in vars(iterator)
+    assert [event.number_of_buffers_written for event in events] == [1, 2, 3, 4]
+    assert "/acquisition/Iterative/data" not in datasets_hashed_from_file
+    assert verify_integrity_manifest(nwbfile_path=nwbfile_path, manifest_file_path=manifest_file_path) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_verification_finds_changed_chunks(tmp_path, iterative_data, max_workers):
+    nwbfile_path = tmp_path / "hashed.nwb"
+    manifest_file_path = tmp_path / "hashed.manifest.json"
+    configure_and_write_nwbfile(
+        nwbfile=create_test_nwbfile(iterative_data=iterative_data),
+        nwbfile_path=nwbfile_path,
+        backend="hdf5",
+        integrity_manifest_file_path=manifest_file_path,
+    )
+
+    with h5py.File(nwbfile_path, mode="r+") as file:
+        file["acquisition/Iterative/data"][150, 5] += 1
+
+    mismatches = verify_integrity_manifest(
+        nwbfile_path=nwbfile_path, manifest_file_path=manifest_file_path, max_workers=max_workers
+    )
+    assert mismatches == ["acquisition/Iterative/data[1.1]"]
+
+
+def test_buffers_are_aligned_to_the_configured_chunks_and_hashed_while_writing(
+    tmp_path, iterative_data, datasets_hashed_from_file
+):
+    nwbfile = create_test_nwbfile(iterative_data=iterative_data)
+    iterator = nwbfile.acquisition["Iterative"].data
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    dataset_configuration = backend_configuration.dataset_configurations["acquisition/Iterative/data"]
+    # The iterator was built to read buffers of 300 frames, which the file's chunks of 200 would not divide
+    dataset_configuration.buffer_shape = (400, 8)
+    dataset_configuration.chunk_shape = (200, 8)
+
+    nwbfile_path = tmp_path / "hashed.nwb"
+    manifest_file_path = tmp_path / "hashed.manifest.json"
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile,
+        nwbfile_path=nwbfile_path,
+        backend_configuration=backend_configuration,
+        integrity_manifest_file_path=manifest_file_path,
+    )
+
+    assert iterator.buffer_shape == (400, 8)
+    assert "/acquisition/Iterative/data" not in datasets_hashed_from_file
+    manifest = json.loads(manifest_file_path.read_text(encoding="utf-8"))
+    assert manifest["datasets"]["acquisition/Iterative/data"]["chunk_shape"] == [200, 8]
+    assert verify_integrity_manifest(nwbfile_path=nwbfile_path, manifest_file_path=manifest_file_path) == []
+
+
+def test_run_conversion_with_staged_write(tmp_path, datasets_hashed_from_file):
+    interface = MockRecordingInterface(num_channels=4, durations=(0.5, 0.5))
+    nwbfile_path = tmp_path / "segments.nwb"
+    manifest_file_path = tmp_path / "segments.manifest.json"
+
+    interface.run_conversion(
+        nwbfile_path=nwbfile_path,
+        max_write_workers=2,
+        integrity_manifest_file_path=manifest_file_path,
+        overwrite=True,
+    )
+
+    manifest = json.loads(manifest_file_path.read_text(encoding="utf-8"))
+    series_paths = [path for path in manifest["datasets"] if path.startswith("acquisition/ElectricalSeries")]
+    assert len([path for path in series_paths if path.endswith("/data")]) == 2
+    assert not any(f"/{path}" in datasets_hashed_from_file for path in series_paths if path.endswith("/data"))
+    assert verify_integrity_manifest(nwbfile_path=nwbfile_path, manifest_file_path=manifest_file_path) == []
+
+    with pytest.raises(ValueError, match="Cannot write an integrity manifest while appending"):
+        interface.run_conversion(
+            nwbfile_path=nwbfile_path,
+            append_on_disk_nwbfile=True,
+            integrity_manifest_file_path=manifest_file_path,
+        )
@@ -0,0 +1,125 @@
+"""Tests for the memory budget shared by the chunk iterators of a conversion."""
+
+import numpy as np
+import pytest
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import MemoryBudget, configure_and_write_nwbfile
+from neuroconv.tools.nwb_helpers._memory_budget import (
+    _split_selection,
+    get_active_memory_budget,
+    use_memory_budget,
+)
+from neuroconv.tools.testing.mock_interfaces import MockRecordingInterface
+
+
+class RecordingSelectionsIterator(SliceableDataChunkIterator):
+    """Keeps the shape of every buffer it is asked for."""
+
+    def _get_data(self, selection: tuple[slice]) -> np.ndarray:
+        self.buffer_shapes_read.append(tuple(axis.stop - axis.start for axis in selection))
+        return super()._get_data(selection=selection)
+
+
+def create_iterator(data: np.ndarray) -> RecordingSelectionsIterator:
+    iterator = RecordingSelectionsIterator(data=data, chunk_shape=(100, 4), buffer_shape=(1_000, 8))
+    iterator.buffer_shapes_read = []
+    return iterator
+
+
+def test_split_selection_keeps_whole_chunks():
+    selection = (slice(1_000, 2_000), slice(0, 8))
+
+    pieces = _split_selection(selection=selection, chunk_shape=(100, 4), itemsize=2, maximum_bytes=3_500)
+
+    # 3,500 bytes fit two chunk rows of 100 frames by 8 channels of two bytes each
+    assert pieces[0] == (slice(1_000, 1_200), slice(0, 8))
+    assert pieces[-1] == (slice(1_800, 2_000), slice(0, 8))
+    assert len(pieces) == 5
+
+
+def test_split_selection_narrows_later_axes_once_the_first_is_one_chunk():
+    selection = (slice(0, 1_000), slice(0, 8))
+
+    pieces = _split_selection(selection=selection, chunk_shape=(100, 4), itemsize=2, maximum_bytes=1)
+
+    assert pieces[:2] == [(slice(0, 100), slice(0, 4)), (slice(0, 100), slice(4, 8))]
+    assert len(pieces) == 20
+
+
+def test_iterators_read_within_the_budget(tmp_path):
+    data = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(2_000, 8), dtype="int16")
+    iterator = create_iterator(data=data)
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="Governed", data=iterator))
+
+    # Each buffer of 1,000 frames holds 16 kB; the budget allows 4 kB
+    with MemoryBudget(budget_gb=4e-6) as memory_budget:
+        configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=tmp_path / "governed.nwb", backend="hdf5")
+
+    assert set(iterator.buffer_shapes_read) == {(200, 8)}
+    assert memory_budget.high_water_mark_in_bytes == 200 * 8 * 2
+    assert memory_budget.peak_resident_memory_in_bytes > 0
+    assert get_active_memory_budget() is None
+
+    with NWBHDF5IO(tmp_path / "governed.nwb", mode="r") as io:
+        written_nwbfile = io.read()
+        np.testing.assert_array_equal(written_nwbfile.acquisition["Governed"].data[:], data)
+
+
+def test_budget_is_divided_among_active_iterators():
+    data = np.zeros(shape=(2_000, 8), dtype="int16")
+    first_iterator = create_iterator(data=data)
+    second_iterator = create_iterator(data=data)
+
+    memory_budget = MemoryBudget(budget_gb=8e-6)
+    memory_budget.govern(iterator=first_iterator)
+    memory_budget.govern(iterator=second_iterator)
+
+    # Alone, an iterator has the whole budget
+    next(first_iterator)
+    assert first_iterator.buffer_shapes_read == [(500, 8)]
+
+    # Read at the same time, each has half of it
+    next(second_iterator)
+    assert second_iterator.buffer_shapes_read == [(200, 8)]
+    assert memory_budget.high_water_mark_in_bytes == 500 * 8 * 2 + 200 * 8 * 2
+
+    # An exhausted iterator no longer counts against the others
+    list(second_iterator)
+    assert sum(shape[0] for shape in second_iterator.buffer_shapes_read) == 2_000
+
+
+def test_budget_from_environment(monkeypatch):
+    monkeypatch.setenv("NEUROCONV_MEMORY_BUDGET_GB", "2.5")
+    with use_memory_budget() as memory_budget:
+        assert memory_budget.budget_in_bytes == 2_500_000_000
+
+    # A budget already in effect is kept over the environment
+    with MemoryBudget(budget_gb=1.0) as outer_memory_budget:
+        with use_memory_budget() as memory_budget:
+            assert memory_budget is outer_memory_budget
+
+    monkeypatch.delenv("NEUROCONV_MEMORY_BUDGET_GB")
+    with use_memory_budget() as memory_budget:
+        assert memory_budget is None
+
+
+def test_non_positive_budget_raises():
+    with pytest.raises(ValueError, match="must be greater than zero"):
+        MemoryBudget(budget_gb=0)
+
+
+def test_run_conversion_with_memory_budget(tmp_path, capsys):
+    interface = MockRecordingInterface(num_channels=4, durations=(1.0,), verbose=True)
+
+    interface.run_conversion(nwbfile_path=tmp_path / "recording.nwb", memory_budget_gb=1e-4, overwrite=True)
+
+    assert "GB budget" in capsys.readouterr().out
+    with NWBHDF5IO(tmp_path / "recording.nwb", mode="r") as io:
+        written_nwbfile = io.read()
+        expected_traces = interface.recording_extractor.get_traces()
+        np.testing.assert_array_equal(written_nwbfile.acquisition["ElectricalSeries"].data[:], expected_traces)
@@ -0,0 +1,173 @@
+"""Tests for choosing chunk shapes from declared read patterns and replaying those patterns against a file."""
+
+import numpy as np
+import pytest
+from hdmf.data_utils import GenericDataChunkIterator as HDMFGenericDataChunkIterator
+from hdmf_zarr import NWBZarrIO
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import BufferHook, SliceableDataChunkIterator
+from neuroconv.tools.iterative_write import (
+    estimate_read_pattern_cost,
+    get_read_pattern_chunk_shape,
+)
+from neuroconv.tools.nwb_helpers import (
+    ReadPattern,
+    configure_and_write_nwbfile,
+    configure_backend,
+    get_default_backend_configuration,
+    replay_read_patterns,
+)
+
+NEUROPIXELS_SHAPE = (30_000 * 3_600, 384)  # One hour of a v1 Neuropixels probe
+
+
+def test_single_channel_reads_chunk_along_time():
+    read_patterns = [ReadPattern(selection_shape=(None, 1))]
+    chunk_shape = get_read_pattern_chunk_shape(
+        full_shape=NEUROPIXELS_SHAPE, dtype=np.dtype("int16"), read_patterns=read_patterns
+    )
+
+    assert chunk_shape[1] == 1
+    assert np.prod(chunk_shape) * 2 <= 10e6
+
+
+def test_time_window_reads_chunk_across_channels():
+    read_patterns = [ReadPattern(selection_shape=(30_000, None))]
+    chunk_shape = get_read_pattern_chunk_shape(
+        full_shape=NEUROPIXELS_SHAPE, dtype=np.dtype("int16"), read_patterns=read_patterns
+    )
+
+    assert chunk_shape[1] == 384
+    assert np.prod(chunk_shape) * 2 <= 10e6
+
+
+def test_chosen_chunk_shape_is_no_worse_than_default():
+    read_patterns = [
+        ReadPattern(selection_shape=(None, 1), weight=1.0),
+        ReadPattern(selection_shape=(30_000, None), weight=10.0),
+    ]
+    dtype = np.dtype("int16")
+    chosen_chunk_shape = get_read_pattern_chunk_shape(
+        full_shape=NEUROPIXELS_SHAPE, dtype=dtype, read_patterns=read_patterns
+    )
+
+    chosen_cost = estimate_read_pattern_cost(
+        chunk_shape=chosen_chunk_shape, full_shape=NEUROPIXELS_SHAPE, dtype=dtype, read_patterns=read_patterns
+    )
+    default_cost = estimate_read_pattern_cost(
+        chunk_shape=(78_125, 64), full_shape=NEUROPIXELS_SHAPE, dtype=dtype, read_patterns=read_patterns
+    )
+    assert chosen_cost <= default_cost
+
+
+def test_read_pattern_axis_mismatch():
+    with pytest.raises(ValueError, match="has 1 axes but the dataset of shape"):
+        get_read_pattern_chunk_shape(
+            full_shape=(100, 4), dtype=np.dtype("float32"), read_patterns=[ReadPattern(selection_shape=(10,))]
+        )
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_read_patterns_in_default_backend_configuration_and_replay(tmp_path, backend):
+    nwbfile = mock_NWBFile()
+    data = np.arange(20_000 * 16, dtype="int16").reshape(20_000, 16)
+    nwbfile.add_acquisition(mock_TimeSeries(name="TimeSeries", data=data))
+
+    location_in_file = "acquisition/TimeSeries/data"
+    read_patterns = [ReadPattern(selection_shape=(None, 1), name="single channel")]
+    backend_configuration = get_default_backend_configuration(
+        nwbfile=nwbfile, backend=backend, read_patterns={location_in_file: read_patterns}
+    )
+
+    dataset_configuration = backend_configuration.dataset_configurations[location_in_file]
+    assert dataset_configuration.chunk_shape == (20_000, 1)
+
+    nwbfile_path = tmp_path / ("patterns.nwb" if backend == "hdf5" else "patterns.nwb.zarr")
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend_configuration=backend_configuration, backend=backend
+    )
+
+    results = replay_read_patterns(
+        nwbfile_path=nwbfile_path, location_in_file=location_in_file, read_patterns=read_patterns, number_of_reads=3
+    )
+    assert len(results) == 1
+    result = results[0]
+    assert result["name"] == "single channel"
+    assert result["chunk_shape"] == (20_000, 1)
+    assert result["expected_chunks_per_read"] == 1.0
+    assert result["mean_read_time_in_seconds"] > 0
+    assert result["modelled_read_time_in_seconds"] > 0
+
+
+class HDMFSliceableIterator(HDMFGenericDataChunkIterator):
+    def __init__(self, data, **kwargs):
+        self.data = data
+        super().__init__(**kwargs)
+
+    def _get_data(self, selection):
+        return self.data[selection]
+
+    def _get_maxshape(self):
+        return self.data.shape
+
+    def _get_dtype(self):
+        return self.data.dtype
+
+
+class SelectionRecordingHook(BufferHook):
+    def __init__(self):
+        self.selections = list()
+
+    def buffer_written(self, iterator, selection, was_resumed=False):
+        self.selections.append(selection)
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_read_patterns_rebuffer_an_iterator_to_whole_chunks(tmp_path, backend):
+    nwbfile = mock_NWBFile()
+    data = np.arange(20_000 * 16, dtype="int16").reshape(20_000, 16)
+    iterator = SliceableDataChunkIterator(data=data, chunk_shape=(1_000, 4), buffer_shape=(5_000, 4))
+    nwbfile.add_acquisition(mock_TimeSeries(name="TimeSeries", data=iterator))
+
+    location_in_file = "acquisition/TimeSeries/data"
+    read_patterns = [ReadPattern(selection_shape=(None, 1))]
+    backend_configuration = get_default_backend_configuration(
+        nwbfile=nwbfile, backend=backend, read_patterns={location_in_file: read_patterns}
+    )
+    dataset_configuration = backend_configuration.dataset_configurations[location_in_file]
+    assert dataset_configuration.chunk_shape == (20_000, 1)
+
+    selection_recording_hook = SelectionRecordingHook()
+    iterator.add_buffer_hook(buffer_hook=selection_recording_hook)
+    nwbfile_path = tmp_path / ("rebuffered.nwb" if backend == "hdf5" else "rebuffered.nwb.zarr")
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend_configuration=backend_configuration, backend=backend
+    )
+
+    assert iterator.chunk_shape == dataset_configuration.chunk_shape
+    assert iterator.buffer_shape == dataset_configuration.buffer_shape
+    assert len(selection_recording_hook.selections) == iterator.num_buffers
+    for selection in selection_recording_hook.selections:
+        for axis, chunk_axis, full_axis in zip(selection, dataset_configuration.chunk_shape, data.shape):
+            assert axis.start % chunk_axis == 0
+            assert axis.stop % chunk_axis == 0 or axis.stop == full_axis
+
+    with NWBHDF5IO(nwbfile_path, mode="r") if backend == "hdf5" else NWBZarrIO(nwbfile_path, mode="r") as io:
+        np.testing.assert_array_equal(io.read().acquisition["TimeSeries"].data[:], data)
+
+
+def test_configured_buffer_shape_is_rejected_for_an_iterator_that_cannot_be_rebuffered():
+    nwbfile = mock_NWBFile()
+    data = np.arange(20_000 * 16, dtype="int16").reshape(20_000, 16)
+    iterator = HDMFSliceableIterator(data=data, chunk_shape=(1_000, 4), buffer_shape=(5_000, 4))
+    nwbfile.add_acquisition(mock_TimeSeries(name="TimeSeries", data=iterator))
+
+    location_in_file = "acquisition/TimeSeries/data"
+    backend_configuration = get_default_backend_configuration(
+        nwbfile=nwbfile, backend="hdf5", read_patterns={location_in_file: [ReadPattern(selection_shape=(None, 1))]}
+    )
+    with pytest.raises(ValueError, match="cannot be changed to the configured"):
+        configure_backend(nwbfile=nwbfile, backend_configuration=backend_configuration)
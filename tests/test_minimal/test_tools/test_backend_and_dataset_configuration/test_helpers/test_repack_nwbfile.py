@@ -261,3 +261,47 @@ def test_repack_nwbfile_zarr_to_hdf5(zarr_nwbfile_path: str, tmp_path: Path):
             assert nwbfile_hdf5.intervals["trials"].compressed_start_time.data.compression_opts == 4
             assert nwbfile_hdf5.processing["ecephys"]["ProcessedTimeSeries"].data.compression_opts == 4
             assert nwbfile_hdf5.processing["ophys"]["PlaneSegmentation"].pixel_mask.data.dataset.compression_opts == 4
+
+
+def test_repack_nwbfile_hdf5_parallel_recompression(hdf5_nwbfile_path: str, tmp_path: Path):
+    export_nwbfile_path = tmp_path / "repacked_in_parallel.nwb"
+    repack_nwbfile(nwbfile_path=hdf5_nwbfile_path, export_nwbfile_path=export_nwbfile_path, max_workers=2)
+
+    with NWBHDF5IO(hdf5_nwbfile_path, mode="r") as source_io, NWBHDF5IO(export_nwbfile_path, mode="r") as export_io:
+        source_nwbfile = source_io.read()
+        nwbfile = export_io.read()
+
+        for name in ("RawTimeSeries", "CompressedRawTimeSeries"):
+            assert nwbfile.acquisition[name].data.compression_opts == 4
+            np.testing.assert_array_equal(nwbfile.acquisition[name].data[:], source_nwbfile.acquisition[name].data[:])
+        np.testing.assert_array_equal(
+            nwbfile.intervals["trials"]["compressed_start_time"][:],
+            source_nwbfile.intervals["trials"]["compressed_start_time"][:],
+        )
+        # Table columns stay expandable
+        assert nwbfile.intervals["trials"].start_time.data.maxshape == (None,)
+
+
+def test_repack_nwbfile_hdf5_copies_unchanged_datasets(hdf5_nwbfile_path: str, tmp_path: Path, monkeypatch):
+    from neuroconv.tools.nwb_helpers import _repack
+
+    first_export_path = tmp_path / "repacked_once.nwb"
+    repack_nwbfile(nwbfile_path=hdf5_nwbfile_path, export_nwbfile_path=first_export_path)
+
+    # The file is already repacked with the default settings, so no dataset has to pass through the filters again
+    def fail_on_recompression(**kwargs):
+        raise AssertionError(f"Dataset '{kwargs['location_in_file']}' was recompressed!")
+
+    monkeypatch.setattr(_repack, "_recompress_hdf5_dataset", fail_on_recompression)
+
+    second_export_path = tmp_path / "repacked_twice.nwb"
+    repack_nwbfile(nwbfile_path=first_export_path, export_nwbfile_path=second_export_path)
+
+    with NWBHDF5IO(first_export_path, mode="r") as first_io, NWBHDF5IO(second_export_path, mode="r") as second_io:
+        first_nwbfile = first_io.read()
+        second_nwbfile = second_io.read()
+
+        data = second_nwbfile.acquisition["RawTimeSeries"].data
+        assert data.compression_opts == 4
+        assert data.chunks == first_nwbfile.acquisition["RawTimeSeries"].data.chunks
+        np.testing.assert_array_equal(data[:], first_nwbfile.acquisition["RawTimeSeries"].data[:])
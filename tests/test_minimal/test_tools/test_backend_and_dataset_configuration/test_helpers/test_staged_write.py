@@ -0,0 +1,108 @@
+"""Tests for reading and compressing the iterative datasets of a file concurrently, ahead of its single writer."""
+
+import numpy as np
+import pytest
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import (
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+)
+from neuroconv.tools.testing.mock_interfaces import MockRecordingInterface
+
+
+def create_test_nwbfile(series_data: dict[str, np.ndarray]) -> "NWBFile":
+    nwbfile = mock_NWBFile()
+    for name, data in series_data.items():
+        iterator = SliceableDataChunkIterator(data=data, chunk_shape=(100, 4), buffer_shape=(300, 8))
+        nwbfile.add_acquisition(mock_TimeSeries(name=name, data=iterator))
+    return nwbfile
+
+
+@pytest.fixture
+def series_data() -> dict[str, np.ndarray]:
+    random_number_generator = np.random.default_rng(seed=0)
+    return {
+        f"Probe{index}": random_number_generator.integers(low=-100, high=100, size=(1_050, 8), dtype="int16")
+        for index in range(3)
+    }
+
+
+@pytest.mark.parametrize(
+    "compression_method,chunk_shape",
+    [
+        ("gzip", (100, 4)),  # Compressed outside HDF5, chunk by chunk
+        ("gzip", (200, 8)),  # The buffers do not cover whole chunks, so HDF5 compresses them
+        (None, (100, 4)),
+    ],
+)
+def test_staged_write_matches_serial_write(tmp_path, series_data, compression_method, chunk_shape):
+    nwbfile = create_test_nwbfile(series_data=series_data)
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    for dataset_configuration in backend_configuration.dataset_configurations.values():
+        if dataset_configuration.dataset_name == "data":
+            dataset_configuration.compression_method = compression_method
+            dataset_configuration.buffer_shape = chunk_shape
+            dataset_configuration.chunk_shape = chunk_shape
+
+    nwbfile_path = tmp_path / "staged.nwb"
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend_configuration=backend_configuration, max_workers=3
+    )
+
+    # Nothing but the file is left beside it
+    assert list(tmp_path.iterdir()) == [nwbfile_path]
+    with NWBHDF5IO(nwbfile_path, mode="r") as io:
+        written_nwbfile = io.read()
+        for name, data in series_data.items():
+            written_dataset = written_nwbfile.acquisition[name].data
+            np.testing.assert_array_equal(written_dataset[:], data)
+            assert written_dataset.chunks == chunk_shape
+            assert written_dataset.compression == compression_method
+
+
+class FailingDataChunkIterator(SliceableDataChunkIterator):
+    def _get_data(self, selection: tuple[slice, ...]) -> np.ndarray:
+        if selection[0].start >= 600:
+            raise OSError("The source went away.")
+        return super()._get_data(selection=selection)
+
+
+def test_staged_write_raises_the_failure_of_a_reading_thread(tmp_path, series_data):
+    nwbfile = create_test_nwbfile(series_data=series_data)
+    failing_iterator = FailingDataChunkIterator(data=series_data["Probe0"], chunk_shape=(100, 4), buffer_shape=(300, 8))
+    nwbfile.add_acquisition(mock_TimeSeries(name="FailingProbe", data=failing_iterator))
+
+    with pytest.raises(OSError, match="The source went away."):
+        configure_and_write_nwbfile(
+            nwbfile=nwbfile, nwbfile_path=tmp_path / "staged.nwb", backend="hdf5", max_workers=2
+        )
+
+
+def test_run_conversion_writes_segments_concurrently(tmp_path):
+    interface = MockRecordingInterface(num_channels=4, durations=(0.5, 0.5, 0.5))
+
+    interface.run_conversion(nwbfile_path=tmp_path / "segments.nwb", max_write_workers=3, overwrite=True)
+
+    with NWBHDF5IO(tmp_path / "segments.nwb", mode="r") as io:
+        written_nwbfile = io.read()
+        electrical_series = [
+            written_nwbfile.acquisition[name] for name in sorted(written_nwbfile.acquisition) if "Electrical" in name
+        ]
+        assert len(electrical_series) == 3
+        for segment_index, series in enumerate(electrical_series):
+            expected_traces = interface.recording_extractor.get_traces(segment_index=segment_index)
+            np.testing.assert_array_equal(series.data[:], expected_traces)
+
+
+def test_staged_write_is_refused_for_zarr(tmp_path, series_data):
+    with pytest.raises(ValueError, match="only supported for the HDF5 backend"):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(series_data=series_data),
+            nwbfile_path=tmp_path / "staged.nwb.zarr",
+            backend="zarr",
+            max_workers=2,
+        )
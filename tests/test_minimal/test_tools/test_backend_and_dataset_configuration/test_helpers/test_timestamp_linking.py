@@ -0,0 +1,90 @@
+"""Tests for writing the identical timestamps of several series once, the others linking to them."""
+
+import h5py
+import numpy as np
+import pytest
+import zarr
+from hdmf.data_utils import DataChunkIterator
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.nwb_helpers import (
+    BACKEND_NWB_IO,
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+)
+from neuroconv.tools.testing.mock_interfaces import MockPoseEstimationInterface
+
+
+def create_test_nwbfile() -> "NWBFile":
+    timestamps = np.cumsum(np.random.default_rng(seed=0).uniform(low=0.01, high=0.02, size=100))
+    nwbfile = mock_NWBFile()
+    for name, series_timestamps in (
+        ("First", timestamps),
+        ("SameValues", timestamps.copy()),
+        ("SameArray", timestamps),
+        ("Shifted", timestamps + 1.0),
+        ("Iterative", DataChunkIterator(data=timestamps.copy())),
+    ):
+        nwbfile.add_acquisition(
+            mock_TimeSeries(name=name, data=np.arange(100.0), rate=None, timestamps=series_timestamps)
+        )
+    return nwbfile
+
+
+def test_apply_timestamp_linking():
+    nwbfile = create_test_nwbfile()
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+
+    backend_configuration.apply_timestamp_linking(nwbfile=nwbfile)
+
+    assert backend_configuration.linked_timestamps == {
+        "acquisition/SameValues/timestamps": "acquisition/First/timestamps",
+        "acquisition/SameArray/timestamps": "acquisition/First/timestamps",
+    }
+    assert nwbfile.acquisition["SameValues"].fields["timestamps"] is nwbfile.acquisition["First"]
+    assert "acquisition/SameValues/timestamps -> acquisition/First/timestamps" in str(backend_configuration)
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_identical_timestamps_are_written_once(tmp_path, backend):
+    nwbfile = create_test_nwbfile()
+    expected_timestamps = np.asarray(nwbfile.acquisition["First"].timestamps).copy()
+    nwbfile_path = tmp_path / f"linked.nwb{'.zarr' if backend == 'zarr' else ''}"
+
+    configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend=backend)
+
+    if backend == "hdf5":
+        with h5py.File(nwbfile_path, mode="r") as file:
+            link = file["acquisition/SameValues"].get("timestamps", getlink=True)
+            assert isinstance(link, h5py.SoftLink)
+            assert link.path == "/acquisition/First/timestamps"
+            assert isinstance(file["acquisition/Shifted"].get("timestamps", getlink=True), h5py.HardLink)
+    else:
+        links = zarr.open_group(str(nwbfile_path), mode="r")["acquisition/SameValues"].attrs["zarr_link"]
+        assert [link["path"] for link in links] == ["/acquisition/First/timestamps"]
+
+    with BACKEND_NWB_IO[backend](nwbfile_path, mode="r") as io:
+        read_nwbfile = io.read()
+        for name in ("First", "SameValues", "SameArray", "Iterative"):
+            np.testing.assert_array_equal(read_nwbfile.acquisition[name].timestamps[:], expected_timestamps)
+        np.testing.assert_array_equal(read_nwbfile.acquisition["Shifted"].timestamps[:], expected_timestamps + 1.0)
+
+
+def test_pose_estimation_series_share_timestamps(tmp_path):
+    interface = MockPoseEstimationInterface(num_samples=50, num_nodes=3)
+    irregular_timestamps = np.cumsum(np.random.default_rng(seed=0).uniform(low=0.02, high=0.04, size=50))
+    interface.set_aligned_timestamps(aligned_timestamps=irregular_timestamps)
+
+    nwbfile_path = tmp_path / "pose.nwb"
+    interface.run_conversion(nwbfile_path=nwbfile_path, overwrite=True)
+
+    with h5py.File(nwbfile_path, mode="r") as file:
+        pose_estimation = file["processing/behavior/MockPoseEstimation"]
+        series_names = sorted(name for name in pose_estimation if name.startswith("PoseEstimationSeries"))
+        assert len(series_names) == 3
+        canonical_series_name, *linked_series_names = series_names
+        for series_name in linked_series_names:
+            link = pose_estimation[series_name].get("timestamps", getlink=True)
+            assert link.path == f"/processing/behavior/MockPoseEstimation/{canonical_series_name}/timestamps"
+            np.testing.assert_array_equal(pose_estimation[series_name]["timestamps"][:], irregular_timestamps)
@@ -0,0 +1,107 @@
+"""Tests for choosing compression per dataset by measuring candidates on samples of the data."""
+
+import numpy as np
+import pytest
+from hdmf.data_utils import DataChunkIterator
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import (
+    CompressionBenchmark,
+    configure_and_write_nwbfile,
+    get_default_backend_configuration,
+)
+
+
+def create_test_nwbfile():
+    nwbfile = mock_NWBFile()
+
+    # A slowly varying integer trace compresses well, noise barely at all
+    smooth_data = np.repeat(np.arange(1_000, dtype="int16"), 100).reshape(-1, 4)
+    noise_data = np.random.default_rng(seed=0).random(size=(20_000, 4)).astype("float32")
+
+    nwbfile.add_acquisition(mock_TimeSeries(name="SmoothTimeSeries", data=smooth_data))
+    nwbfile.add_acquisition(mock_TimeSeries(name="NoiseTimeSeries", data=SliceableDataChunkIterator(data=noise_data)))
+
+    return nwbfile
+
+
+@pytest.mark.parametrize("backend", ["hdf5", "zarr"])
+def test_apply_tuned_compression_records_evidence(tmp_path, backend):
+    nwbfile = create_test_nwbfile()
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend=backend)
+    backend_configuration.apply_tuned_compression(nwbfile=nwbfile, policy="smallest_file")
+
+    for location in ("acquisition/SmoothTimeSeries/data", "acquisition/NoiseTimeSeries/data"):
+        dataset_configuration = backend_configuration.dataset_configurations[location]
+        benchmarks = dataset_configuration.compression_benchmarks
+
+        assert len(benchmarks) > 1
+        assert all(isinstance(benchmark, CompressionBenchmark) for benchmark in benchmarks)
+
+        best_ratio = max(benchmark.compression_ratio for benchmark in benchmarks)
+        chosen = next(
+            benchmark
+            for benchmark in benchmarks
+            if benchmark.compression_method == dataset_configuration.compression_method
+            and benchmark.compression_options == dataset_configuration.compression_options
+        )
+        assert chosen.compression_ratio == best_ratio
+        assert "measured compression ratio" in str(dataset_configuration)
+
+    smooth_configuration = backend_configuration.dataset_configurations["acquisition/SmoothTimeSeries/data"]
+    assert max(benchmark.compression_ratio for benchmark in smooth_configuration.compression_benchmarks) > 10
+
+    nwbfile_path = tmp_path / ("tuned.nwb" if backend == "hdf5" else "tuned.nwb.zarr")
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend_configuration=backend_configuration, backend=backend
+    )
+    assert nwbfile_path.exists()
+
+
+def test_apply_tuned_compression_fastest_write():
+    nwbfile = create_test_nwbfile()
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.apply_tuned_compression(
+        nwbfile=nwbfile, policy="fastest_write", compression_candidates=[("gzip", dict(level=9)), ("lzf", None)]
+    )
+
+    dataset_configuration = backend_configuration.dataset_configurations["acquisition/SmoothTimeSeries/data"]
+    fastest = max(dataset_configuration.compression_benchmarks, key=lambda b: b.throughput_in_mb_per_second)
+    assert dataset_configuration.compression_method == fastest.compression_method
+    assert [benchmark.compression_method for benchmark in dataset_configuration.compression_benchmarks] == [
+        "gzip",
+        "lzf",
+    ]
+
+
+def test_apply_tuned_compression_skips_single_pass_iterators():
+    nwbfile = mock_NWBFile()
+    data = DataChunkIterator(data=np.arange(1_000, dtype="float64").reshape(-1, 2), buffer_size=100)
+    nwbfile.add_acquisition(mock_TimeSeries(name="TimeSeries", data=data))
+
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.apply_tuned_compression(nwbfile=nwbfile)
+
+    dataset_configuration = backend_configuration.dataset_configurations["acquisition/TimeSeries/data"]
+    assert dataset_configuration.compression_method == "gzip"
+    assert dataset_configuration.compression_benchmarks is None
+
+
+def test_apply_tuned_compression_invalid_candidate():
+    nwbfile = create_test_nwbfile()
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="zarr")
+
+    with pytest.raises(ValueError, match="Compression method 'invalid_method' is not available"):
+        backend_configuration.apply_tuned_compression(
+            nwbfile=nwbfile, compression_candidates=[("invalid_method", None)]
+        )
+
+
+def test_apply_tuned_compression_invalid_policy():
+    nwbfile = create_test_nwbfile()
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+
+    with pytest.raises(ValueError, match="Unknown compression policy 'tiniest'"):
+        backend_configuration.apply_tuned_compression(nwbfile=nwbfile, policy="tiniest")
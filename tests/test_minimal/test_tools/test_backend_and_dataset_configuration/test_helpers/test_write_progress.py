@@ -0,0 +1,116 @@
+"""Tests for the structured progress events of the chunk iterators written during a conversion."""
+
+import json
+import urllib.request
+
+import numpy as np
+import pytest
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.nwb_helpers import (
+    MemoryBudget,
+    WriteProgressEvent,
+    WriteProgressMonitor,
+    configure_and_write_nwbfile,
+)
+from neuroconv.tools.nwb_helpers._write_progress import _active_write_progress_monitors
+from neuroconv.tools.testing.mock_interfaces import MockRecordingInterface
+
+
+def create_test_nwbfile() -> "NWBFile":
+    # 3.2 MB in four buffers, so that the file outgrows the chunk cache of HDF5 while it is written
+    data = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(400_000, 4), dtype="int16")
+    iterator = SliceableDataChunkIterator(data=data, chunk_shape=(10_000, 4), buffer_shape=(100_000, 4))
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="Iterative", data=iterator))
+    return nwbfile
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_every_buffer_is_reported(tmp_path, max_workers):
+    nwbfile = create_test_nwbfile()
+    if max_workers > 1:  # Staged writes need two iterators
+        data = np.zeros(shape=(1_000, 4), dtype="int16")
+        iterator = SliceableDataChunkIterator(data=data, chunk_shape=(100, 4), buffer_shape=(500, 4))
+        nwbfile.add_acquisition(mock_TimeSeries(name="Other", data=iterator))
+    nwbfile_path = tmp_path / "monitored.nwb"
+    events_file_path = tmp_path / "progress.jsonl"
+
+    events = list()
+    with WriteProgressMonitor(callbacks=events.append, events_file_path=events_file_path):
+        configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=nwbfile_path, backend="hdf5", max_workers=max_workers)
+    assert _active_write_progress_monitors == []
+
+    events = [event for event in events if event.location_in_file == "acquisition/Iterative/data"]
+    assert [event.number_of_buffers_written for event in events] == [1, 2, 3, 4]
+    assert all(event.number_of_buffers == 4 for event in events)
+    assert [event.read_size_in_bytes for event in events] == [800_000, 1_600_000, 2_400_000, 3_200_000]
+    assert all(event.nwbfile_path == str(nwbfile_path) for event in events)
+    assert events[-1].remaining_time_in_seconds == 0
+    assert events[-1].written_size_in_bytes > 0
+    assert events[-1].compression_ratio > 1
+
+    written_lines = events_file_path.read_text(encoding="utf-8").splitlines()
+    written_events = [WriteProgressEvent(**json.loads(line)) for line in written_lines]
+    assert events == [event for event in written_events if event.location_in_file == "acquisition/Iterative/data"]
+
+
+def test_buffers_split_by_the_memory_budget_are_reported_whole(tmp_path):
+    events = list()
+    # Each buffer of 800 kB is read in pieces of 200 kB
+    with MemoryBudget(budget_gb=2e-4), WriteProgressMonitor(callbacks=events.append):
+        configure_and_write_nwbfile(nwbfile=create_test_nwbfile(), nwbfile_path=tmp_path / "governed.nwb")
+
+    assert [event.number_of_buffers_written for event in events] == [1, 2, 3, 4]
+
+
+def test_checkpointed_zarr_write_is_reported(tmp_path):
+    events = list()
+    with WriteProgressMonitor(callbacks=events.append):
+        configure_and_write_nwbfile(
+            nwbfile=create_test_nwbfile(),
+            nwbfile_path=tmp_path / "checkpointed.nwb.zarr",
+            backend="zarr",
+            checkpoint_folder_path=tmp_path / "checkpoints",
+        )
+
+    assert [event.number_of_buffers_written for event in events] == [1, 2, 3, 4]
+    assert all(event.written_size_in_bytes > 0 for event in events)
+    assert events[-1].compression_ratio > 1
+
+
+def test_latest_events_are_served_as_metrics(tmp_path):
+    with WriteProgressMonitor(metrics_port=0) as write_progress_monitor:
+        configure_and_write_nwbfile(nwbfile=create_test_nwbfile(), nwbfile_path=tmp_path / "served.nwb")
+
+        url = f"http://127.0.0.1:{write_progress_monitor.metrics_port}/metrics"
+        with urllib.request.urlopen(url) as response:
+            metrics = response.read().decode("utf-8")
+
+    labels = f'dataset="acquisition/Iterative/data",nwbfile="{tmp_path / "served.nwb"}"'
+    assert "# TYPE neuroconv_write_buffers_written gauge" in metrics
+    assert f"neuroconv_write_buffers_written{{{labels}}} 4" in metrics
+    assert f"neuroconv_write_read_bytes{{{labels}}} 3200000" in metrics
+
+
+def test_run_conversion_reports_to_the_progress_callback(tmp_path):
+    interface = MockRecordingInterface(num_channels=4, durations=[1.0])
+
+    events = list()
+    interface.run_conversion(nwbfile_path=tmp_path / "recording.nwb", progress_callback=events.append)
+
+    assert {event.location_in_file for event in events} == {"acquisition/ElectricalSeries/data"}
+    assert events[-1].number_of_buffers_written == events[-1].number_of_buffers
+
+
+def test_progress_events_file_from_the_environment(tmp_path, monkeypatch):
+    events_file_path = tmp_path / "progress.jsonl"
+    monkeypatch.setenv("NEUROCONV_PROGRESS_EVENTS_FILE_PATH", str(events_file_path))
+    interface = MockRecordingInterface(num_channels=4, durations=[1.0])
+
+    interface.run_conversion(nwbfile_path=tmp_path / "recording.nwb")
+
+    last_event = json.loads(events_file_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert last_event["location_in_file"] == "acquisition/ElectricalSeries/data"
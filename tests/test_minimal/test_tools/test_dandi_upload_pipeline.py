@@ -0,0 +1,122 @@
+"""Tests for uploading NWB files to a Dandiset in the background while later sessions convert."""
+
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from pynwb import NWBHDF5IO
+from pynwb.testing.mock.file import mock_NWBFile
+
+from neuroconv.tools.data_transfers import DandiUploadPipeline
+
+
+class LocalDandiArchive(DandiUploadPipeline):
+    """Stands in for DANDI: organizes into a local Dandiset folder and uploads by copying into an archive folder."""
+
+    def __init__(self, archive_folder_path: Path, fail_on: str | None = None, **kwargs):
+        self.archive_folder_path = archive_folder_path
+        self.fail_on = fail_on
+        self.started_uploads = list()
+        self.upload_may_finish = threading.Event()
+        super().__init__(dandiset_id="000000", instance="https://localhost:8000", **kwargs)
+
+    def _download_dandiset(self) -> Path:
+        dandiset_path = self.dandiset_folder_path / self.dandiset_id
+        dandiset_path.mkdir(parents=True)
+        (dandiset_path / "dandiset.yaml").write_text("identifier: DANDI:000000\n", encoding="utf-8")
+        return dandiset_path
+
+    def _organize_nwbfile(self, nwbfile_path: Path) -> list[Path]:
+        organized_nwbfile_path = self._dandiset_path / f"sub-mouse_ses-{nwbfile_path.stem}.nwb"
+        organized_nwbfile_path.hardlink_to(nwbfile_path)
+        return [organized_nwbfile_path]
+
+    def _upload_nwbfiles(self, nwbfile_paths: list[Path]) -> None:
+        for nwbfile_path in nwbfile_paths:
+            self.started_uploads.append(nwbfile_path.name)
+            if nwbfile_path.name == self.fail_on:
+                raise ConnectionError("The archive refused the upload.")
+            assert self.upload_may_finish.wait(timeout=30)
+            shutil.copy(nwbfile_path, self.archive_folder_path / nwbfile_path.name)
+
+
+def write_session(nwbfile_path: Path) -> Path:
+    with NWBHDF5IO(nwbfile_path, mode="w") as io:
+        io.write(mock_NWBFile(session_id=nwbfile_path.stem))
+    return nwbfile_path
+
+
+def wait_for(condition, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "The condition was never met."
+        time.sleep(0.01)
+
+
+def test_sessions_upload_while_later_sessions_convert(tmp_path):
+    archive_folder_path = tmp_path / "archive"
+    archive_folder_path.mkdir()
+    with LocalDandiArchive(
+        archive_folder_path=archive_folder_path,
+        dandiset_folder_path=tmp_path / "dandiset",
+        max_queued_files=2,
+        remove_uploaded_files=True,
+    ) as upload_pipeline:
+        for session_id in ["one", "two", "three"]:
+            upload_pipeline.submit(nwbfile_path=write_session(nwbfile_path=tmp_path / f"{session_id}.nwb"))
+
+        # All three were written while the first was uploading, and the other two wait their turn
+        wait_for(lambda: upload_pipeline.started_uploads)
+        assert upload_pipeline.started_uploads == ["sub-mouse_ses-one.nwb"]
+        upload_pipeline.upload_may_finish.set()
+
+    assert sorted(path.name for path in archive_folder_path.iterdir()) == [
+        "sub-mouse_ses-one.nwb",
+        "sub-mouse_ses-three.nwb",
+        "sub-mouse_ses-two.nwb",
+    ]
+    assert len(upload_pipeline.uploaded_file_paths) == 3
+    assert not any(tmp_path.glob("*.nwb"))
+
+
+def test_a_full_queue_holds_back_the_conversion(tmp_path):
+    with LocalDandiArchive(
+        archive_folder_path=tmp_path, dandiset_folder_path=tmp_path / "dandiset", max_queued_files=1
+    ) as upload_pipeline:
+        upload_pipeline.submit(nwbfile_path=write_session(nwbfile_path=tmp_path / "one.nwb"))
+        wait_for(lambda: upload_pipeline.started_uploads)
+        upload_pipeline.submit(nwbfile_path=write_session(nwbfile_path=tmp_path / "two.nwb"))
+
+        third_submission = threading.Thread(
+            target=upload_pipeline.submit, kwargs=dict(nwbfile_path=write_session(nwbfile_path=tmp_path / "three.nwb"))
+        )
+        third_submission.start()
+        third_submission.join(timeout=0.5)
+        assert third_submission.is_alive()
+
+        upload_pipeline.upload_may_finish.set()
+        third_submission.join(timeout=10)
+        assert not third_submission.is_alive()
+
+    assert len(upload_pipeline.uploaded_file_paths) == 3
+
+
+def test_a_failed_upload_stops_the_conversion(tmp_path):
+    upload_pipeline = LocalDandiArchive(
+        archive_folder_path=tmp_path, dandiset_folder_path=tmp_path / "dandiset", fail_on="sub-mouse_ses-one.nwb"
+    )
+    upload_pipeline.upload_may_finish.set()
+
+    written_sessions = list()
+    with pytest.raises(RuntimeError, match="Uploading to the Dandiset failed") as exception_info:
+        with upload_pipeline:
+            for session_id in ["one", "two", "three"]:
+                upload_pipeline.submit(nwbfile_path=write_session(nwbfile_path=tmp_path / f"{session_id}.nwb"))
+                written_sessions.append(session_id)
+                wait_for(lambda: upload_pipeline._error is not None)
+
+    assert isinstance(exception_info.value.__cause__, ConnectionError)
+    assert written_sessions == ["one"]
+    assert upload_pipeline.uploaded_file_paths == []
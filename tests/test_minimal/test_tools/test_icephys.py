@@ -6,6 +6,9 @@ icephys interface writes. No acquisition file is read. Format behaviour lives in
 on real data.
 """
 
+import time
+
+import numpy as np
 import pytest
 from pynwb import NWBHDF5IO, NWBFile
 from pynwb.testing.mock.file import mock_NWBFile
@@ -14,6 +17,7 @@ from neuroconv import ConverterPipe
 from neuroconv.tools.icephys import (
     _add_sweep_time_intervals_to_nwbfile,
     _build_icephys_hierarchical_tables,
+    _read_sweeps,
 )
 from neuroconv.tools.testing.mock_interfaces import MockIcephysInterface
 
@@ -223,6 +227,54 @@ class TestMockIcephysInterface:
         assert len(nwbfile.intracellular_recordings) == 1
 
 
+class TestManySweeps:
+    """A long protocol writes thousands of rows, which the tools append a column at a time rather than row by row.
+    The tables must read back as the row-by-row path would have written them."""
+
+    def test_tables_are_complete_and_round_trip(self, tmp_path):
+        num_sweeps = 300  # Enough offsets to outgrow the 8-bit index of a ragged column
+        interface = MockIcephysInterface(
+            num_sweeps=num_sweeps, sweep_duration=0.01, stimulus_type="step", repetition="r1", condition="A"
+        )
+        nwbfile = create_finalized_nwbfile([interface])
+        _add_sweep_time_intervals_to_nwbfile(nwbfile)
+
+        nwbfile_path = tmp_path / "test_many_sweeps.nwb"
+        with NWBHDF5IO(path=nwbfile_path, mode="w") as io:
+            io.write(nwbfile)
+
+        with NWBHDF5IO(path=nwbfile_path, mode="r") as io:
+            read_nwbfile = io.read()
+            intracellular_recordings = read_nwbfile.intracellular_recordings
+            assert list(intracellular_recordings.id[:]) == list(range(num_sweeps))
+            responses = intracellular_recordings.category_tables["responses"]["response"][:]
+            assert [(response.idx_start, response.count) for response in responses] == [
+                (sweep_index * 100, 100) for sweep_index in range(num_sweeps)
+            ]
+            stimuli = intracellular_recordings.category_tables["stimuli"]["stimulus"][:]
+            assert all(stimulus.timeseries is None for stimulus in stimuli)  # No stimulus reads back as missing
+            assert set(intracellular_recordings["stimulus_type"][:]) == {"step"}
+
+            simultaneous_recordings = read_nwbfile.icephys_simultaneous_recordings
+            assert list(simultaneous_recordings["recordings"].target.data[:]) == list(range(num_sweeps))
+            assert list(simultaneous_recordings["recordings"].data[:]) == list(range(1, num_sweeps + 1))
+            sequential_recordings = read_nwbfile.icephys_sequential_recordings
+            assert list(sequential_recordings["simultaneous_recordings"][0].index) == list(range(num_sweeps))
+            assert list(sequential_recordings["stimulus_type"][:]) == ["step"]
+            assert len(read_nwbfile.icephys_repetitions) == 1
+            assert len(read_nwbfile.icephys_experimental_conditions) == 1
+            assert len(read_nwbfile.intervals["sweeps"]) == num_sweeps
+
+    def test_sweeps_read_concurrently_come_back_in_order(self):
+        def read_sweep(sweep_index: int) -> np.ndarray:
+            time.sleep(0.001 * (5 - sweep_index))  # The first sweeps finish last
+            return np.full(3, sweep_index)
+
+        sweeps = _read_sweeps(read_sweep=read_sweep, num_sweeps=5, max_workers=5)
+
+        np.testing.assert_array_equal(np.concatenate(sweeps), np.repeat(np.arange(5), 3))
+
+
 class TestGroupingLevels:
     """Aggregation of the ``repetition`` / ``condition`` labels into the ``Repetitions`` and
     ``ExperimentalConditions`` tables. Every method drives the same four runs, varying only the labels to exercise
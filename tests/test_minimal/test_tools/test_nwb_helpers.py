@@ -5,12 +5,17 @@ from zoneinfo import ZoneInfo
 from hdmf.testing import TestCase
 from jsonschema.exceptions import ValidationError
 from pynwb import ProcessingModule
+from pynwb.testing.mock.base import mock_TimeSeries
+from pynwb.testing.mock.file import mock_NWBFile
 
 from neuroconv.tools.nwb_helpers import (
     add_subject_to_nwbfile,
     get_module,
     make_nwbfile_from_metadata,
 )
+from neuroconv.tools.nwb_helpers._neurodata_type_index import (
+    get_neurodata_objects_by_name,
+)
 
 
 class TestNWBHelpers(TestCase):
@@ -102,3 +107,16 @@ class TestNWBHelpers(TestCase):
             ),
         ):
             add_subject_to_nwbfile(nwbfile=nwbfile, metadata=second_metadata)
+
+
+def test_objects_added_after_the_type_index_was_built_are_found():
+    nwbfile = mock_NWBFile()
+    nwbfile.add_acquisition(mock_TimeSeries(name="First"))
+    assert list(get_neurodata_objects_by_name(nwbfile=nwbfile, neurodata_type="TimeSeries")) == ["First"]
+
+    nwbfile.add_acquisition(mock_TimeSeries(name="Second"))
+    time_series = get_neurodata_objects_by_name(nwbfile=nwbfile, neurodata_type="TimeSeries", required_name="Second")
+
+    assert sorted(time_series) == ["First", "Second"]
+    assert time_series["Second"] is nwbfile.acquisition["Second"]
+    assert get_neurodata_objects_by_name(nwbfile=nwbfile, neurodata_type="ImageSeries") == dict()
@@ -0,0 +1,282 @@
+"""Tests for reading sources on a remote filesystem through a local block cache, against an in-memory stand-in."""
+
+import io
+import json
+import pickle
+from pathlib import Path
+
+import fsspec
+import h5py
+import numpy as np
+import pytest
+from fsspec.implementations.memory import MemoryFileSystem
+from pynwb import NWBHDF5IO
+from spikeinterface.core import load
+
+from neuroconv.datainterfaces import (
+    DoricEventsInterface,
+    DoricFiberPhotometryInterface,
+    OpenEphysBinaryRecordingInterface,
+    SpikeGLXRecordingInterface,
+)
+from neuroconv.tools.hdmf import SliceableDataChunkIterator
+from neuroconv.tools.remote_sources import (
+    RemoteBinaryArray,
+    RemoteBlockCache,
+    is_remote_path,
+    open_hdf5_file,
+)
+
+
+class CountingMemoryFileSystem(MemoryFileSystem):
+    """An in-memory object store recording the byte range of every request made of it."""
+
+    protocol = "countingmemory"
+    requested_ranges = []
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        self.requested_ranges.append((start, end))
+        return super().cat_file(path, start=start, end=end, **kwargs)
+
+
+fsspec.register_implementation(name="countingmemory", cls=CountingMemoryFileSystem, clobber=True)
+
+
+@pytest.fixture
+def requested_ranges() -> list:
+    CountingMemoryFileSystem.requested_ranges.clear()
+    yield CountingMemoryFileSystem.requested_ranges
+    CountingMemoryFileSystem.requested_ranges.clear()
+
+
+def test_is_remote_path():
+    assert is_remote_path(path="s3://bucket/session/file.bin")
+    assert is_remote_path(path="https://example.org/file.doric")
+    assert not is_remote_path(path="file:///home/file.bin")
+    assert not is_remote_path(path="C:\\data\\file.bin")
+
+
+def test_buffers_are_fetched_with_parallel_requests_and_cached(tmp_path, requested_ranges):
+    data = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(10_000, 8), dtype="int16")
+    url = f"countingmemory://{tmp_path.name}/session.ap.bin"
+    CountingMemoryFileSystem().pipe_file(url, data.tobytes())
+
+    # Blocks of 10 kB, and buffers of 80 kB shared among four requests at once
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache", block_size_mb=0.01, max_concurrent_requests=4):
+        array = RemoteBinaryArray(url=url, dtype="int16", shape=(10_000, 8))
+        iterator = SliceableDataChunkIterator(data=array, buffer_shape=(5_000, 8), chunk_shape=(1_000, 8))
+        written_data = np.concatenate([chunk.data for chunk in iterator])
+
+        np.testing.assert_array_equal(written_data, data)
+        assert sorted(requested_ranges) == [(start, start + 20_000) for start in range(0, 160_000, 20_000)]
+
+        # Read again, as a conversion run a second time would, the blocks come from the cache
+        requested_ranges.clear()
+        np.testing.assert_array_equal(
+            RemoteBinaryArray(url=url, dtype="int16", shape=(10_000, 8))[::7, 2], data[::7, 2]
+        )
+        assert requested_ranges == []
+
+
+def test_hdf5_buffers_are_fetched_ahead_of_their_chunks(tmp_path, requested_ranges):
+    data = np.arange(200_000, dtype="int32").reshape(20_000, 10)
+    file_content = io.BytesIO()
+    with h5py.File(file_content, mode="w") as file:
+        file.create_dataset(name="data", data=data, chunks=(500, 10))
+    url = f"countingmemory://{tmp_path.name}/session.h5"
+    CountingMemoryFileSystem().pipe_file(url, file_content.getvalue())
+
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache", block_size_mb=0.02, max_concurrent_requests=4):
+        with open_hdf5_file(file_path=url) as file:
+            iterator = SliceableDataChunkIterator(data=file["data"], buffer_shape=(10_000, 10), chunk_shape=(500, 10))
+            np.testing.assert_array_equal(np.concatenate([chunk.data for chunk in iterator]), data)
+
+    # 800 kB of chunks in blocks of 20 kB, fetched a buffer at a time rather than one request per block
+    assert len(requested_ranges) < 800_000 // 20_000
+
+
+def test_doric_file_is_read_from_a_remote_url(tmp_path):
+    file_content = io.BytesIO()
+    with h5py.File(file_content, mode="w") as file:
+        file.attrs["Created"] = "Mon Jan 06 10:00:00 2025"
+        digital_io = file.create_group("DataAcquisition/BBC300/Signals/Series0001/DigitalIO")
+        digital_io["Time"] = np.arange(1_000) / 1_000
+        camera_line = np.zeros(1_000)
+        camera_line[100:110] = 1
+        camera_line[500:520] = 1
+        digital_io["Camera1"] = camera_line
+    url = f"countingmemory://{tmp_path.name}/session.doric"
+    CountingMemoryFileSystem().pipe_file(url, file_content.getvalue())
+
+    nwbfile_path = tmp_path / "remote_doric.nwb"
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache"):
+        with open_hdf5_file(file_path=url) as file:
+            assert file.attrs["Created"] == "Mon Jan 06 10:00:00 2025"
+
+        interface = DoricEventsInterface(file_path=url)
+        interface.run_conversion(nwbfile_path=nwbfile_path)
+
+    with NWBHDF5IO(nwbfile_path, mode="r") as nwb_io:
+        events_table = nwb_io.read().events["Camera1"]
+        np.testing.assert_allclose(events_table["timestamp"][:], [0.1, 0.5])
+        np.testing.assert_allclose(events_table["duration"][:], [0.01, 0.02])
+
+
+def test_doric_file_is_closed_once_the_response_series_is_written(tmp_path):
+    file_path = tmp_path / "session.doric"
+    with h5py.File(file_path, mode="w") as file:
+        file.attrs["Created"] = "Mon Jan 06 10:00:00 2025"
+        lock_in = file.create_group("DataAcquisition/FPConsole/Signals/Series0001/AIN01xAOUT01-LockIn")
+        lock_in["Time"] = np.arange(1_000) / 1_000
+        lock_in["Values"] = np.arange(1_000, dtype="float64")
+
+    interface = DoricFiberPhotometryInterface(
+        file_path=file_path, stream_names=DoricFiberPhotometryInterface.get_available_streams(file_path=file_path)
+    )
+    nwbfile_path = tmp_path / "doric.nwb"
+    interface.run_conversion(nwbfile_path=nwbfile_path)
+
+    # HDF5 refuses to open a file for writing while a handle reading it is still open
+    with h5py.File(file_path, mode="r+"):
+        pass
+    with NWBHDF5IO(nwbfile_path, mode="r") as nwb_io:
+        response_series = next(iter(nwb_io.read().acquisition.values()))
+        np.testing.assert_array_equal(response_series.data[:], np.arange(1_000, dtype="float64"))
+
+
+def upload_folder(folder_path: Path, url: str) -> None:
+    filesystem = CountingMemoryFileSystem()
+    for file_path in folder_path.rglob("*"):
+        if file_path.is_file():
+            filesystem.pipe_file(f"{url}/{file_path.relative_to(folder_path).as_posix()}", file_path.read_bytes())
+
+
+def write_spikeglx_folder(folder_path: Path, traces: np.ndarray) -> None:
+    """A Neuropixels 1.0 probe of 384 channels and a sync channel, as SpikeGLX writes its AP band."""
+    folder_path.mkdir(parents=True)
+    meta = {
+        "acqApLfSy": "384,384,1",
+        "fileCreateTime": "2025-01-06T10:00:00",
+        "fileName": "session_g0_t0.imec0.ap.bin",
+        "fileSizeBytes": str(traces.nbytes),
+        "fileTimeSecs": str(traces.shape[0] / 30_000),
+        "firstSample": "0",
+        "imAiRangeMax": "0.6",
+        "imAiRangeMin": "-0.6",
+        "imMaxInt": "512",
+        "imDatPrb_type": "0",
+        "imDatPrb_pn": "PRB_1_4_0480_1",
+        "imDatPrb_sn": "12345",
+        "imSampRate": "30000",
+        "nSavedChans": "385",
+        "snsApLfSy": "384,0,1",
+        "snsSaveChanSubset": "0:383,768",
+        "typeImEnabled": "1",
+        "typeThis": "imec",
+        "~imroTbl": "(0,384)" + "".join(f"({channel} 0 0 500 250 1)" for channel in range(384)),
+        "~snsShankMap": "(1,2,480)" + "".join(f"(0:{channel % 2}:{channel // 2}:1)" for channel in range(384)),
+        "~snsChanMap": "(384,384,1)"
+        + "".join(f"(AP{channel};{channel}:{channel})" for channel in range(384))
+        + "(SY0;768:768)",
+    }
+    (folder_path / "session_g0_t0.imec0.ap.meta").write_text(
+        "".join(f"{key}={value}\n" for key, value in meta.items()), encoding="utf-8"
+    )
+    (folder_path / "session_g0_t0.imec0.ap.bin").write_bytes(traces.tobytes())
+
+
+def write_open_ephys_binary_folder(folder_path: Path, traces: np.ndarray) -> None:
+    """One Record Node recording one stream, as the Open Ephys GUI writes it from version 0.6."""
+    recording_folder_path = folder_path / "Record Node 101" / "experiment1" / "recording1"
+    stream_folder_path = recording_folder_path / "continuous" / "Acquisition_Board-100.Rhythm Data"
+    stream_folder_path.mkdir(parents=True)
+    (folder_path / "Record Node 101" / "settings.xml").write_text(
+        "<SETTINGS><INFO><DATE>6 Jan 2025 10:00:00</DATE></INFO></SETTINGS>", encoding="utf-8"
+    )
+    channels = [
+        dict(channel_name=f"CH{channel + 1}", description="", identifier="", history="", bit_volts=0.195, units="uV")
+        for channel in range(traces.shape[1])
+    ]
+    structure = dict(
+        GUI_version="0.6.4",
+        continuous=[
+            dict(
+                folder_name="Acquisition_Board-100.Rhythm Data/",
+                sample_rate=30_000.0,
+                source_processor_name="Acquisition Board",
+                source_processor_id=100,
+                stream_name="Rhythm Data",
+                recorded_processor="Acquisition Board",
+                recorded_processor_id=100,
+                num_channels=traces.shape[1],
+                channels=channels,
+            )
+        ],
+        events=[],
+        spikes=[],
+    )
+    (recording_folder_path / "structure.oebin").write_text(json.dumps(structure), encoding="utf-8")
+    (stream_folder_path / "continuous.dat").write_bytes(traces.tobytes())
+    np.save(stream_folder_path / "sample_numbers.npy", np.arange(traces.shape[0], dtype="int64"))
+    np.save(stream_folder_path / "timestamps.npy", np.arange(traces.shape[0]) / 30_000)
+
+
+def test_spikeglx_recording_is_read_from_a_remote_folder(tmp_path):
+    traces = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(3_000, 385), dtype="int16")
+    write_spikeglx_folder(folder_path=tmp_path / "session_g0_imec0", traces=traces)
+    url = f"countingmemory://{tmp_path.name}/session_g0_imec0"
+    upload_folder(folder_path=tmp_path / "session_g0_imec0", url=url)
+
+    nwbfile_path = tmp_path / "remote_spikeglx.nwb"
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache", block_size_mb=0.1):
+        interface = SpikeGLXRecordingInterface(folder_path=url, stream_id="imec0.ap")
+        interface.run_conversion(nwbfile_path=nwbfile_path)
+
+    # The samples are read from the URL, the mirror holding only a placeholder of the .bin file
+    (mirrored_bin_file_path,) = (tmp_path / "cache" / "folders").rglob("*.bin")
+    assert not np.fromfile(mirrored_bin_file_path, dtype="int16").any()
+    with NWBHDF5IO(nwbfile_path, mode="r") as nwb_io:
+        electrical_series = nwb_io.read().acquisition["ElectricalSeriesAP"]
+        np.testing.assert_array_equal(electrical_series.data[:], traces[:, :384])
+        assert electrical_series.electrodes.table["group_name"][0] == "NeuropixelsImec0"
+
+
+def test_remote_spikeglx_recording_is_rebuilt_from_the_url(tmp_path):
+    traces = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(3_000, 385), dtype="int16")
+    write_spikeglx_folder(folder_path=tmp_path / "session_g0_imec0", traces=traces)
+    url = f"countingmemory://{tmp_path.name}/session_g0_imec0"
+    upload_folder(folder_path=tmp_path / "session_g0_imec0", url=url)
+
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache", block_size_mb=0.1):
+        recording = SpikeGLXRecordingInterface(folder_path=url, stream_id="imec0.ap").recording_extractor
+        assert recording.to_dict()["kwargs"]["url"] == url
+
+        # As a worker of a parallel job would, from the dictionary or the pickle of the recording
+        for rebuilt_recording in (load(recording.to_dict()), pickle.loads(pickle.dumps(recording))):
+            np.testing.assert_array_equal(
+                rebuilt_recording.get_traces(start_frame=100, end_frame=200), traces[100:200, :384]
+            )
+            assert rebuilt_recording.get_probe().get_contact_count() == 384
+
+
+def test_open_ephys_binary_recording_is_read_from_a_remote_folder(tmp_path):
+    traces = np.random.default_rng(seed=0).integers(low=-100, high=100, size=(3_000, 4), dtype="int16")
+    write_open_ephys_binary_folder(folder_path=tmp_path / "session", traces=traces)
+    url = f"countingmemory://{tmp_path.name}/session"
+    upload_folder(folder_path=tmp_path / "session", url=url)
+
+    nwbfile_path = tmp_path / "remote_open_ephys.nwb"
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache"):
+        interface = OpenEphysBinaryRecordingInterface(folder_path=url)
+        interface.run_conversion(nwbfile_path=nwbfile_path)
+
+    # The samples are read from the URL, the mirror holding only a placeholder of the continuous.dat file
+    (mirrored_dat_file_path,) = (tmp_path / "cache" / "folders").rglob("continuous.dat")
+    assert not np.fromfile(mirrored_dat_file_path, dtype="int16").any()
+
+    with NWBHDF5IO(nwbfile_path, mode="r") as nwb_io:
+        np.testing.assert_array_equal(nwb_io.read().acquisition["ElectricalSeries"].data[:], traces)
+
+    with RemoteBlockCache(cache_folder_path=tmp_path / "cache"):
+        rebuilt_recording = load(interface.recording_extractor.to_dict())
+        np.testing.assert_array_equal(rebuilt_recording.get_traces(channel_ids=["CH2", "CH3"]), traces[:, [1, 2]])
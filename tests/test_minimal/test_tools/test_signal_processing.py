@@ -7,6 +7,7 @@ from neuroconv.tools.signal_processing import (
     _condition_signal,
     _detect_events,
     _frames_to_seconds,
+    _run_length_encode_labels,
     get_falling_frames_from_ttl,
     get_rising_frames_from_ttl,
 )
@@ -386,3 +387,14 @@ class TestFramesToSeconds:
         _, durations = _frames_to_seconds(*_detect_events(self.LINE, "low_period")[:2], timestamps)
         assert durations[0] == pytest.approx(0.002)
         assert np.isnan(durations[1])
+
+
+def test_run_length_encode_labels():
+    labels = np.array([3, 3, 1, 1, 1, 3, 2])
+    timestamps = np.arange(7) * 0.5
+
+    start_times, stop_times, run_labels = _run_length_encode_labels(labels=labels, timestamps=timestamps)
+
+    assert_array_equal(start_times, [0.0, 1.0, 2.5, 3.0])
+    assert_array_equal(stop_times, [1.0, 2.5, 3.0, 3.5])
+    assert_array_equal(run_labels, [3, 1, 3, 2])
@@ -0,0 +1,111 @@
+"""Tests for the cache of parsed text tables shared by the text-based interfaces."""
+
+import os
+
+import numpy as np
+import pytest
+
+from neuroconv.tools._table_cache import (
+    clear_table_cache,
+    read_csv_columns,
+    read_csv_dataframe,
+)
+from neuroconv.tools.importing import is_package_installed
+
+
+@pytest.fixture
+def csv_file_path(tmp_path):
+    clear_table_cache()
+    file_path = tmp_path / "table.csv"
+    file_path.write_text("time,signal,state\n0.0,1.5,1\n0.1,2.5,2\n0.2,3.5,1\n", encoding="utf-8")
+    yield file_path
+    clear_table_cache()
+
+
+def test_table_is_parsed_once(csv_file_path, monkeypatch):
+    import pandas as pd
+
+    parsed_file_paths = []
+    read_csv = pd.read_csv
+
+    def counting_read_csv(file_path, **read_kwargs):
+        parsed_file_paths.append(file_path)
+        return read_csv(file_path, **read_kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+
+    columns = read_csv_columns(csv_file_path)
+    assert read_csv_columns(csv_file_path) is columns
+    np.testing.assert_array_equal(columns["signal"], [1.5, 2.5, 3.5])
+
+    # Different columns of the same parse
+    dataframe = read_csv_dataframe(csv_file_path, usecols=["state", "time"])
+    assert list(dataframe.columns) == ["time", "state"]
+    assert len(parsed_file_paths) == 1
+
+    # Different arguments parse again
+    read_csv_columns(csv_file_path, nrows=1)
+    assert len(parsed_file_paths) == 2
+
+
+def test_rewritten_file_is_parsed_again(csv_file_path):
+    first_columns = read_csv_columns(csv_file_path)
+
+    csv_file_path.write_text("time,signal,state\n0.0,9.5,1\n", encoding="utf-8")
+    stat = csv_file_path.stat()
+    os.utime(csv_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second_columns = read_csv_columns(csv_file_path)
+    assert second_columns is not first_columns
+    np.testing.assert_array_equal(second_columns["signal"], [9.5])
+
+
+def test_cached_columns_are_read_only(csv_file_path):
+    columns = read_csv_columns(csv_file_path)
+
+    with pytest.raises(ValueError, match="read-only"):
+        columns["signal"][0] = 0.0
+
+    # A DataFrame is the caller's own
+    dataframe = read_csv_dataframe(csv_file_path)
+    dataframe.loc[0, "signal"] = 0.0
+    assert read_csv_columns(csv_file_path)["signal"][0] == 1.5
+
+
+def test_usecols_by_position_and_missing(csv_file_path):
+    dataframe = read_csv_dataframe(csv_file_path, usecols=[1])
+    assert list(dataframe.columns) == ["signal"]
+
+    headerless_dataframe = read_csv_dataframe(csv_file_path, header=None, skiprows=1, usecols=[2, 0])
+    assert list(headerless_dataframe.columns) == [0, 2]
+
+    with pytest.raises(ValueError, match="Usecols do not match columns"):
+        read_csv_dataframe(csv_file_path, usecols=["missing"])
+
+
+def test_pyarrow_parses_only_tables_whose_types_are_stated(tmp_path, monkeypatch):
+    import pandas as pd
+
+    clear_table_cache()
+    file_path = tmp_path / "table.csv"
+    # The C engine infers float64 for an integer column missing a value, and pyarrow a nullable integer
+    file_path.write_text("time,count\n0.0,1\n0.1,\n0.2,3\n", encoding="utf-8")
+
+    engines = []
+    read_csv = pd.read_csv
+
+    def engine_recording_read_csv(file_path, **read_kwargs):
+        engines.append(read_kwargs.get("engine", "c"))
+        return read_csv(file_path, **read_kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", engine_recording_read_csv)
+
+    columns = read_csv_columns(file_path)
+    assert engines == ["c"]
+    assert columns["count"].dtype == np.dtype("float64")
+    np.testing.assert_array_equal(columns["count"], [1.0, np.nan, 3.0])
+
+    typed_columns = read_csv_columns(file_path, dtype="float64")
+    np.testing.assert_array_equal(typed_columns["count"], columns["count"])
+    assert engines[-1] == ("pyarrow" if is_package_installed(package_name="pyarrow") else "c")
+    clear_table_cache()
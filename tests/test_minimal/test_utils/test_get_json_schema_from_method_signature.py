@@ -637,3 +637,33 @@ class TestPEP563Annotations:
         source_schema = pep563_interface.get_source_schema()
         assert source_schema["properties"]["folder_path"] == {"format": "directory-path", "type": "string"}
         assert source_schema["properties"]["verbose"] == {"default": False, "type": "boolean"}
+
+
+def test_get_json_schema_from_method_signature_is_generated_once(monkeypatch):
+    def method(integer: int, string: str = "hi"):
+        pass
+
+    first_json_schema = get_json_schema_from_method_signature(method=method, exclude=["string"])
+
+    def fail_on_inspection(obj):
+        raise AssertionError("The signature was inspected again!")
+
+    monkeypatch.setattr(inspect, "signature", fail_on_inspection)
+    second_json_schema = get_json_schema_from_method_signature(method=method, exclude=["string"])
+    assert second_json_schema == first_json_schema
+
+    # Each call returns a copy of its own, which callers are free to modify
+    second_json_schema["properties"]["integer"]["description"] = "An integer."
+    assert (
+        "description"
+        not in get_json_schema_from_method_signature(method=method, exclude=["string"])["properties"]["integer"]
+    )
+
+
+def test_get_json_schema_from_method_signature_does_not_modify_exclude():
+    def method(integer: int, string: str = "hi"):
+        pass
+
+    exclude = ["string"]
+    get_json_schema_from_method_signature(method=method, exclude=exclude)
+    assert exclude == ["string"]
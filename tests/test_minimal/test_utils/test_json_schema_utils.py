@@ -1,9 +1,12 @@
 import json
 import os
 from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 import pytest
+from jsonschema.exceptions import ValidationError
 from pynwb.ophys import ImagingPlane, TwoPhotonSeries
 
 from neuroconv.utils import (
@@ -12,7 +15,12 @@ from neuroconv.utils import (
     get_schema_from_hdmf_class,
     load_dict_from_file,
 )
-from neuroconv.utils.json_schema import _NWBMetaDataEncoder, validate_metadata
+from neuroconv.utils.json_schema import (
+    _get_validator,
+    _NWBMetaDataEncoder,
+    _to_json_types,
+    validate_metadata,
+)
 
 
 def compare_dicts(a: dict, b: dict):
@@ -246,3 +254,59 @@ def test_validate_metadata_rejects_duplicate_device_names():
 
     with pytest.raises(ValueError, match="Use 1 key to share a device"):
         validate_metadata(metadata=metadata, schema={"type": "object"})
+
+
+def test_validate_metadata_converts_values_json_cannot_hold():
+    schema = {
+        "type": "object",
+        "properties": {
+            "session_start_time": {"type": "string", "format": "date-time"},
+            "file_path": {"type": "string"},
+            "gains": {"type": "array", "items": {"type": "number"}},
+            "num_channels": {"type": "integer"},
+            "keywords": {"type": "array"},
+        },
+        "additionalProperties": False,
+    }
+    metadata = dict(
+        session_start_time=datetime(2020, 1, 1),
+        file_path=Path("data.bin"),
+        gains=np.array([0.5, 1.0]),
+        num_channels=np.int64(4),
+        keywords=("a", "b"),
+    )
+    validate_metadata(metadata=metadata, schema=schema)
+
+    with pytest.raises(ValidationError, match="is not of type 'integer'"):
+        validate_metadata(metadata=dict(num_channels=np.float64(4.5)), schema=schema)
+
+
+def test_to_json_types_matches_a_json_round_trip():
+    instance = {
+        "datetime": datetime(2020, 1, 1, 12, 30),
+        "path": Path("folder") / "file.bin",
+        "array": np.arange(4).reshape(2, 2),
+        "scalar": np.float32(1.5),
+        "tuple": (1, "a", None),
+        1: True,
+        None: [{"nested": np.bool_(False)}],
+    }
+    encoder = _NWBMetaDataEncoder()
+
+    assert _to_json_types(obj=instance, encoder=encoder) == json.loads(encoder.encode(instance))
+
+
+def test_get_validator_is_compiled_once_per_schema():
+    assert _get_validator(schema={"type": "object", "required": ["a"]}) is _get_validator(
+        schema={"required": ["a"], "type": "object"}
+    )
+
+
+def test_get_validator_ignores_annotations():
+    schema = {"type": "object", "properties": {"default": {"type": "string", "default": "a"}}}
+    annotated_schema = deepcopy(schema)
+    annotated_schema["properties"]["default"].update(default="b", description="A property named 'default'.")
+
+    assert _get_validator(schema=schema) is _get_validator(schema=annotated_schema)
+    with pytest.raises(ValidationError):
+        validate_metadata(metadata={"default": 1}, schema=annotated_schema)
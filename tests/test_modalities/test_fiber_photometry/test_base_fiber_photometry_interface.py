@@ -3,6 +3,7 @@
 import re
 from datetime import datetime, timezone
 
+import h5py
 import numpy as np
 import pytest
 from jsonschema.validators import Draft7Validator
@@ -184,6 +185,44 @@ class TestMockFiberPhotometryInterface(FiberPhotometryInterfaceTestMixin):
         assert_array_equal(data[:, :3], interface._get_stream_data(stream_name="470nm"))
         assert_array_equal(data[:, 3:], interface._get_stream_data(stream_name="415nm"))
 
+    def test_streams_are_read_a_buffer_at_a_time(self, tmp_path):
+        # Streams held in a file are sliced per buffer, over the span of the columns kept, never loaded whole.
+        interface = MockFiberPhotometryInterface(
+            excitation_wavelengths_in_nm=[470.0, 415.0], num_fibers=3, num_samples=1_000
+        )
+        interface.stream_indices = [1, 4]  # The second fiber of each wavelength
+        expected_data = interface._read_response_data()
+
+        with h5py.File(tmp_path / "streams.h5", mode="w") as file:
+            for stream_name in interface.stream_names:
+                file.create_dataset(stream_name, data=interface._get_stream_data(stream_name=stream_name))
+
+        selections_read = []
+
+        class SelectionRecordingDataset(h5py.Dataset):
+            def __getitem__(self, selection):
+                selections_read.append((self.name, selection))
+                return super().__getitem__(selection)
+
+        with h5py.File(tmp_path / "streams.h5", mode="r") as file:
+            interface._get_lazy_stream_data = lambda stream_name, stream_file=None: SelectionRecordingDataset(
+                file[stream_name].id
+            )
+            iterator = interface._get_response_data_iterator()
+            data = np.concatenate(
+                [
+                    iterator._get_data(selection=(slice(start, start + 250), slice(0, 2)))
+                    for start in range(0, 1_000, 250)
+                ]
+            )
+
+        assert_array_equal(data, expected_data)
+        assert selections_read[:2] == [
+            ("/470nm", (slice(0, 250), slice(1, 2))),
+            ("/415nm", (slice(0, 250), slice(1, 2))),
+        ]
+        assert len(selections_read) == 8
+
     def test_empty_wavelengths_errors(self):
         expected_error = "excitation_wavelengths_in_nm must name at least one excitation wavelength."
         with pytest.raises(ValueError, match=re.escape(expected_error)):
@@ -198,7 +237,7 @@ class TestMockFiberPhotometryInterface(FiberPhotometryInterfaceTestMixin):
         interface = MockFiberPhotometryInterface()
         nwbfile = interface.create_nwbfile()
 
-        assert nwbfile.acquisition["FiberPhotometryResponseSeries"].data[:].shape == (100,)
+        assert nwbfile.acquisition["FiberPhotometryResponseSeries"].data.maxshape == (100,)
 
     def test_fully_annotated_metadata_round_trips(self, tmp_path, full_metadata):
         # The fully annotated path: a complete provenance chain is supplied, and every piece of it must
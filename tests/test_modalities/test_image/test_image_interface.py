@@ -279,6 +279,108 @@ def test_images_are_chunked_and_compressed(tmp_path):
             assert written_image.chunks == (256, 256, 3)
 
 
+def test_images_decoded_on_threads_match(tmp_path):
+    """Decoding ahead of the writer on a pool of threads writes the same images as decoding each as it is written."""
+    from pynwb.testing.mock.file import mock_NWBFile
+
+    from neuroconv.tools.nwb_helpers import configure_and_write_nwbfile
+
+    generate_random_images(num_images=6, width=32, height=16, mode="LA", seed=0, output_dir_path=tmp_path)
+    interface = ImageInterface(folder_path=tmp_path)
+
+    nwbfile_paths = dict()
+    for max_workers in (1, 3):
+        nwbfile = mock_NWBFile()
+        interface.add_to_nwbfile(nwbfile, max_workers=max_workers)
+        nwbfile_paths[max_workers] = tmp_path / f"images_{max_workers}.nwb"
+        configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=nwbfile_paths[max_workers])
+
+    serial_nwbfile = read_nwb(nwbfile_paths[1])
+    threaded_nwbfile = read_nwb(nwbfile_paths[3])
+    serial_images = serial_nwbfile.acquisition["Images"].images
+    threaded_images = threaded_nwbfile.acquisition["Images"].images
+    assert len(threaded_images) == 6
+    for image_name, image in serial_images.items():
+        np.testing.assert_array_equal(threaded_images[image_name].data[:], image.data[:])
+    serial_nwbfile.read_io.close()
+    threaded_nwbfile.read_io.close()
+
+
+def test_image_decoder_reads_the_same_images_twice(tmp_path):
+    """The memory budget and compression tuning read images already written, or read them in parts."""
+    from neuroconv.datainterfaces.image.imageinterface import _ImageDecoder
+
+    generate_random_images(num_images=8, width=8, height=4, mode="L", seed=0, output_dir_path=tmp_path)
+    file_paths = sorted(tmp_path.iterdir())
+    expected_images = [np.asarray(Image.open(file_path)) for file_path in file_paths]
+
+    decoder = _ImageDecoder(file_paths=file_paths, max_workers=2)
+    for _ in range(2):
+        for start in range(0, 8, 3):
+            images = decoder.read(file_paths=file_paths[start : start + 3])
+            np.testing.assert_array_equal(np.stack(images), np.stack(expected_images[start : start + 3]))
+
+
+def test_images_decoded_on_threads_are_read_again(tmp_path):
+    """Images sampled before the write, as compression tuning does, are decoded again when written."""
+    from pynwb.testing.mock.file import mock_NWBFile
+
+    from neuroconv.tools.nwb_helpers import (
+        configure_and_write_nwbfile,
+        get_default_backend_configuration,
+    )
+
+    generate_random_images(num_images=4, width=32, height=16, mode="RGB", seed=0, output_dir_path=tmp_path / "images")
+    interface = ImageInterface(folder_path=tmp_path / "images")
+
+    nwbfile = mock_NWBFile()
+    interface.add_to_nwbfile(nwbfile, max_workers=2, stack_images=True)
+    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend="hdf5")
+    backend_configuration.apply_tuned_compression(nwbfile=nwbfile, compression_candidates=[("gzip", None)])
+    configure_and_write_nwbfile(
+        nwbfile=nwbfile, nwbfile_path=tmp_path / "images.nwb", backend_configuration=backend_configuration
+    )
+
+    expected_images = [np.asarray(Image.open(file_path)) for file_path in interface.file_paths]
+    with read_nwb(tmp_path / "images.nwb").read_io as io:
+        written_images = io.read().acquisition["Images"]["image"].data[:]
+    np.testing.assert_array_equal(written_images, np.stack(expected_images))
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_stacked_images(tmp_path, max_workers):
+    """Images sharing a shape and data type are written as one stack per group, indexed by file name."""
+    from pynwb.testing.mock.file import mock_NWBFile
+
+    from neuroconv.tools.nwb_helpers import configure_and_write_nwbfile
+
+    generate_random_images(num_images=3, width=32, height=16, mode="RGB", output_dir_path=tmp_path / "rgb")
+    generate_random_images(num_images=2, width=32, height=16, mode="L", output_dir_path=tmp_path / "gray")
+    file_paths = sorted((tmp_path / "rgb").iterdir()) + sorted((tmp_path / "gray").iterdir())
+    interface = ImageInterface(file_paths=file_paths)
+
+    metadata = interface.get_metadata()
+    metadata["Images"]["Images"]["images"][str(file_paths[1])]["resolution"] = 2.5
+
+    nwbfile = mock_NWBFile()
+    interface.add_to_nwbfile(nwbfile, metadata=metadata, stack_images=True, max_workers=max_workers)
+    nwbfile_path = tmp_path / "stacked.nwb"
+    configure_and_write_nwbfile(nwbfile=nwbfile, nwbfile_path=nwbfile_path)
+
+    nwbfile = read_nwb(nwbfile_path)
+    rgb_stack = nwbfile.acquisition["Images_16x32x3_uint8"]
+    gray_stack = nwbfile.acquisition["Images_16x32_uint8"]
+    assert rgb_stack["image"].data.shape == (3, 16, 32, 3)
+    assert gray_stack["image"].data.shape == (2, 16, 32)
+    assert list(rgb_stack["file_name"][:]) == [file_path.name for file_path in file_paths[:3]]
+    assert list(gray_stack["image_name"][:]) == [file_path.stem for file_path in file_paths[3:]]
+    np.testing.assert_array_equal(rgb_stack["resolution"][:], [np.nan, 2.5, np.nan])
+    assert "resolution" not in gray_stack.colnames
+    for index, file_path in enumerate(file_paths[3:]):
+        np.testing.assert_array_equal(gray_stack["image"].data[index], np.asarray(Image.open(file_path)))
+    nwbfile.read_io.close()
+
+
 class TestMixedModeAndFormatImageInterface(DataInterfaceTestMixin):
     """Test suite for ImageInterface with mixed image modes and formats."""
 
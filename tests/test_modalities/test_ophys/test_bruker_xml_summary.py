@@ -0,0 +1,119 @@
+"""Tests for the streaming summary of the Bruker configuration XML shared by the Bruker interfaces."""
+
+import os
+
+import numpy as np
+import pytest
+
+from neuroconv.datainterfaces import BrukerTiffImagingInterface
+from neuroconv.datainterfaces.ophys.brukertiff import _bruker_xml_summary
+from neuroconv.datainterfaces.ophys.brukertiff._bruker_xml_summary import (
+    get_bruker_xml_summary,
+)
+
+DEPTHS = (-10.0, 0.0, 10.0)
+
+
+def make_frame(frame_index: int, relative_time: float, depth: float | None) -> str:
+    files = "".join(
+        f'<File channel="{channel}" channelName="{channel_name}" page="1" '
+        f'filename="TSeries_Cycle{frame_index:05d}_{channel_name}_000001.ome.tif" />'
+        for channel, channel_name in ((2, "Red"), (1, "Green"))
+    )
+    z_state = ""
+    if depth is not None:
+        z_state = (
+            '<PVStateShard><PVStateValue key="positionCurrent"><SubindexedValues index="ZAxis">'
+            f'<SubindexedValue subindex="0" value="100.0" /><SubindexedValue subindex="1" value="{depth}" />'
+            "</SubindexedValues></PVStateValue></PVStateShard>"
+        )
+    return (
+        f'<Frame relativeTime="{relative_time}" absoluteTime="{relative_time + 5.0}" index="{frame_index}">'
+        f"{files}{z_state}</Frame>"
+    )
+
+
+@pytest.fixture
+def folder_path(tmp_path):
+    folder_path = tmp_path / "TSeries"
+    folder_path.mkdir()
+    frames = [
+        make_frame(frame_index=frame_index, relative_time=0.1 * frame_index, depth=DEPTHS[frame_index % 3])
+        for frame_index in range(6)
+    ]
+    sequences = "".join(
+        f'<Sequence type="TSeries ZSeries Element" cycle="{cycle + 1}">{"".join(frames[3 * cycle : 3 * cycle + 3])}'
+        "</Sequence>"
+        for cycle in range(2)
+    )
+    (folder_path / "TSeries.xml").write_text(
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<PVScan version="5.8.64.100" date="3/4/2024 2:15:16 PM">'
+        '<SystemIDs SystemID="0123456789abcdef0123456789abcdef"><SystemID SystemID="4886" Description="Rig A" />'
+        "</SystemIDs>"
+        '<PVStateShard><PVStateValue key="zDevice" value="1" /><PVStateValue key="positionCurrent">'
+        '<SubindexedValues index="XAxis"><SubindexedValue subindex="0" value="1.5" /></SubindexedValues>'
+        '<SubindexedValues index="YAxis"><SubindexedValue subindex="0" value="-2.5" /></SubindexedValues>'
+        '<SubindexedValues index="ZAxis"><SubindexedValue subindex="0" value="100.0" />'
+        '<SubindexedValue subindex="1" value="0.0" /></SubindexedValues>'
+        "</PVStateValue></PVStateShard>"
+        f"{sequences}</PVScan>",
+        encoding="utf-8",
+    )
+    return folder_path
+
+
+def test_summary(folder_path):
+    summary = get_bruker_xml_summary(folder_path=folder_path)
+
+    assert summary.attributes["version"] == "5.8.64.100"
+    assert summary.system_identity == dict(
+        system_id="0123456789abcdef0123456789abcdef", system_number="4886", system_description="Rig A"
+    )
+    # In acquisition order, by channel number, rather than in the order the files are listed
+    assert summary.channel_names == ["Green", "Red"]
+    assert summary.default_positions == dict(XAxis=(1.5,), YAxis=(-2.5,), ZAxis=(100.0, 0.0))
+    assert summary.is_volumetric
+    assert summary.num_planes == 3
+    assert summary.get_plane_depths() == list(DEPTHS)
+
+    np.testing.assert_array_equal(summary.frame_sequence_indices, [0, 0, 0, 1, 1, 1])
+    np.testing.assert_allclose(summary.frame_relative_times, np.arange(6) * 0.1)
+    np.testing.assert_allclose(summary.frame_absolute_times, np.arange(6) * 0.1 + 5.0)
+    assert summary.frame_z_positions.shape == (6, 2)
+    np.testing.assert_array_equal(summary.file_frame_indices, np.repeat(np.arange(6), 2))
+    np.testing.assert_array_equal(summary.file_pages, np.ones(12))
+    assert summary.find_first_frame(file_name_part="Cycle00004") == 4
+    assert summary.find_first_frame(channel_name="Green") == 0
+    assert summary.find_first_frame(channel_name="Blue") is None
+
+    with pytest.raises(ValueError, match="read-only"):
+        summary.frame_relative_times[0] = 1.0
+
+
+def test_summary_is_parsed_once_per_folder(folder_path, monkeypatch):
+    parsed_xml_file_paths = []
+    parse_bruker_xml = _bruker_xml_summary._parse_bruker_xml
+
+    def counting_parse_bruker_xml(xml_file_path):
+        parsed_xml_file_paths.append(xml_file_path)
+        return parse_bruker_xml(xml_file_path=xml_file_path)
+
+    monkeypatch.setattr(_bruker_xml_summary, "_parse_bruker_xml", counting_parse_bruker_xml)
+
+    summary = get_bruker_xml_summary(folder_path=folder_path)
+    assert BrukerTiffImagingInterface.get_available_channels(folder_path=folder_path) == ["Green", "Red"]
+    assert get_bruker_xml_summary(folder_path=str(folder_path)) is summary
+    assert len(parsed_xml_file_paths) == 1
+
+    # A rewritten XML is parsed again
+    xml_file_path = folder_path / "TSeries.xml"
+    stat = xml_file_path.stat()
+    os.utime(xml_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_bruker_xml_summary(folder_path=folder_path) is not summary
+    assert len(parsed_xml_file_paths) == 2
+
+
+def test_missing_xml(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Bruker XML configuration file not found"):
+        BrukerTiffImagingInterface.get_available_channels(folder_path=tmp_path)
@@ -4,7 +4,7 @@ import numpy as np
 from hdmf.testing import TestCase
 from numpy.testing import assert_array_equal
 from parameterized import param, parameterized
-from roiextractors import PoissonNoiseImagingExtractor
+from roiextractors import MultiImagingExtractor, PoissonNoiseImagingExtractor
 from roiextractors.testing import generate_dummy_imaging_extractor
 
 from neuroconv.tools.roiextractors.imagingextractordatachunkiterator import (
@@ -200,3 +200,42 @@ def test_volumetric_default_chunking():
     frame_size_bytes = width * height * dtype.itemsize
     expected_num_samples = int(10e6 / frame_size_bytes)
     assert iterator.chunk_shape == (expected_num_samples, width, height, 1)
+
+
+def test_files_read_at_once_match_files_read_in_turn():
+    imaging_extractor = MultiImagingExtractor(
+        imaging_extractors=[
+            generate_dummy_imaging_extractor(num_samples=num_samples, num_rows=12, num_columns=10, seed=seed)
+            for seed, num_samples in enumerate([7, 3, 11, 5])
+        ]
+    )
+    expected_data = imaging_extractor.get_series().transpose(0, 2, 1)
+
+    # Buffers of 8 frames start and end within the extractors, and one spans three of them
+    iterator = ImagingExtractorDataChunkIterator(
+        imaging_extractor=imaging_extractor, buffer_shape=(8, 10, 12), chunk_shape=(4, 10, 12), max_read_workers=4
+    )
+    data = np.concatenate([buffer.data for buffer in iterator])
+
+    assert_array_equal(data, expected_data)
+    assert_array_equal(iterator[5:13, 2:4], expected_data[5:13, 2:4])
+
+
+def test_files_read_in_turn_when_extractors_are_not_exposed():
+    imaging_extractor = MultiImagingExtractor(
+        imaging_extractors=[
+            generate_dummy_imaging_extractor(num_samples=num_samples, num_rows=12, num_columns=10, seed=seed)
+            for seed, num_samples in enumerate([7, 3, 11])
+        ]
+    )
+    expected_data = imaging_extractor.get_series().transpose(0, 2, 1)
+
+    # Stands in for a roiextractors release renaming the private attributes the concurrent read relies on
+    del imaging_extractor._start_frames
+
+    iterator = ImagingExtractorDataChunkIterator(
+        imaging_extractor=imaging_extractor, buffer_shape=(8, 10, 12), chunk_shape=(4, 10, 12), max_read_workers=4
+    )
+    data = np.concatenate([buffer.data for buffer in iterator])
+
+    assert_array_equal(data, expected_data)
@@ -0,0 +1,48 @@
+"""Tests for the session index the Miniscope interfaces read once per folder."""
+
+import json
+import os
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from neuroconv.datainterfaces.ophys.miniscope._miniscope_readers import (
+    _cached_fused_timestamps,
+    _get_fused_timestamps,
+)
+
+
+def write_recording(folder_path, minute: int, timestamps_in_ms: list[float]) -> None:
+    camera_folder_path = folder_path / "BehavCam_2"
+    camera_folder_path.mkdir(parents=True)
+    start_time = dict(year=2022, month=9, day=19, hour=9, minute=minute, second=41, msec=0)
+    (folder_path / "metaData.json").write_text(json.dumps(dict(recordingStartTime=start_time)), encoding="utf-8")
+    rows = "".join(f"{frame_number},{timestamp},0\n" for frame_number, timestamp in enumerate(timestamps_in_ms))
+    (camera_folder_path / "timeStamps.csv").write_text(
+        "Frame Number,Time Stamp (ms),Buffer Index\n" + rows, encoding="utf-8"
+    )
+
+
+def test_fused_timestamps_are_read_once_per_folder(tmp_path):
+    write_recording(folder_path=tmp_path / "09_18_41", minute=18, timestamps_in_ms=[-10.0, 23.0, 56.0])
+    write_recording(folder_path=tmp_path / "09_19_41", minute=19, timestamps_in_ms=[0.0, 33.0])
+
+    timestamps = _get_fused_timestamps(folder_path=tmp_path, file_pattern="BehavCam*/timeStamps.csv")
+    assert_array_almost_equal(timestamps, [0.0, 0.033, 0.066, 60.0, 60.033])
+    assert len(_cached_fused_timestamps) >= 1
+
+    # Changing the returned array leaves the cached one as it was
+    timestamps[:] = np.nan
+    assert_array_almost_equal(
+        _get_fused_timestamps(folder_path=tmp_path, file_pattern="BehavCam*/timeStamps.csv"),
+        [0.0, 0.033, 0.066, 60.0, 60.033],
+    )
+
+    # A rewritten timestamps file is read again
+    timestamps_file_path = tmp_path / "09_19_41" / "BehavCam_2" / "timeStamps.csv"
+    timestamps_file_path.write_text("Frame Number,Time Stamp (ms),Buffer Index\n0,0.0,0\n", encoding="utf-8")
+    os.utime(timestamps_file_path, ns=(0, 0))
+    assert_array_almost_equal(
+        _get_fused_timestamps(folder_path=tmp_path, file_pattern="BehavCam*/timeStamps.csv"),
+        [0.0, 0.033, 0.066, 60.0],
+    )
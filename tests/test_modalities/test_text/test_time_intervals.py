@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 from numpy.testing import assert_array_equal
 from pynwb import NWBHDF5IO
@@ -42,6 +43,58 @@ def test_convert_df_to_time_intervals_():
     assert time_intervals["condition"].description == "This is a custom description"
 
 
+def test_convert_df_to_time_intervals_column_types(tmp_path):
+    df = pd.DataFrame(
+        dict(
+            start_time=[0.0, 1.0, 2.0],
+            stop_time=[0.5, 1.5, 2.5],
+            correct=[True, False, True],
+            condition=["left", "right", "left"],
+            stimulus=pd.Categorical(["A", "B", "A"]),
+            position=[[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]],
+            lick_times=[[0.1, 0.2], [], [2.1, 2.2, 2.3]],
+        )
+    )
+    time_intervals = convert_df_to_time_intervals(df)
+
+    assert time_intervals.colnames == (
+        "start_time",
+        "stop_time",
+        "correct",
+        "condition",
+        "stimulus",
+        "position",
+        "lick_times",
+    )
+    assert time_intervals["position"].data.shape == (3, 2)
+    assert time_intervals["lick_times"][1] == []
+
+    # The table is still extended row by row afterwards
+    time_intervals.add_row(
+        start_time=3.0,
+        stop_time=3.5,
+        correct=False,
+        condition="right",
+        stimulus="B",
+        position=[6.0, 7.0],
+        lick_times=[3.1],
+    )
+
+    nwbfile = make_nwbfile_from_metadata(dict(NWBFile=dict(session_start_time=datetime.now().astimezone())))
+    nwbfile.add_time_intervals(time_intervals)
+    with NWBHDF5IO(tmp_path / "test.nwb", "w") as io:
+        io.write(nwbfile)
+
+    with NWBHDF5IO(tmp_path / "test.nwb", "r") as io:
+        trials = io.read().intervals["trials"]
+        assert_array_equal(trials["stop_time"][:], [0.5, 1.5, 2.5, 3.5])
+        assert_array_equal(trials["correct"][:], [True, False, True, False])
+        assert list(trials["condition"][:]) == ["left", "right", "left", "right"]
+        assert list(trials["stimulus"][:]) == ["A", "B", "A", "B"]
+        assert_array_equal(trials["position"][:], np.arange(8.0).reshape(4, 2))
+        assert [list(lick_times) for lick_times in trials["lick_times"][:]] == [[0.1, 0.2], [], [2.1, 2.2, 2.3], [3.1]]
+
+
 def test_excel_time_intervals():
     interface = ExcelTimeIntervalsInterface(trials_xls_path)
     metadata = interface.get_metadata()